@@ -0,0 +1,12 @@
+-- Migration: 028_analytics_pipeline_source.sql
+-- Description: Register the analytics pipeline as a data source for resume tracking
+-- Date: 2026-10-16
+--
+-- The season analytics pipeline (expand -> attribute -> save second_snapshots)
+-- records per-game progress in download_progress so interrupted runs resume
+-- where they stopped. download_progress rows need a data_sources entry.
+
+INSERT INTO data_sources (name, source_type, description, rate_limit_ms, max_concurrent)
+VALUES
+    ('analytics_snapshots', 'analytics', 'Second-by-second snapshot pipeline (derived from shifts and PBP)', 0, 1)
+ON CONFLICT (name) DO NOTHING;
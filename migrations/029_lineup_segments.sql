@@ -0,0 +1,55 @@
+-- Migration: 029_lineup_segments.sql
+-- Description: Run-length-encoded lineup segments alongside second_snapshots
+-- Date: 2026-10-16
+--
+-- second_snapshots stores full skater arrays for every second (~94M rows per
+-- season) although lineups change only a few hundred times per game. Each
+-- lineup_segments row covers a contiguous run of seconds within a period
+-- that share the same lineups, goalies, situation and flags, so TOI queries
+-- sum duration_seconds instead of counting seconds. Rows are derived from a
+-- game's second_snapshots and replaced whenever the game is re-expanded.
+
+CREATE TABLE IF NOT EXISTS lineup_segments (
+    game_id BIGINT NOT NULL,
+    season_id INTEGER NOT NULL,
+    period INTEGER NOT NULL,
+
+    -- Inclusive bounds, in period seconds and total elapsed game seconds
+    start_second INTEGER NOT NULL,
+    end_second INTEGER NOT NULL,
+    start_game_second INTEGER NOT NULL,
+    end_game_second INTEGER NOT NULL,
+    duration_seconds INTEGER NOT NULL,
+
+    -- Same state columns as second_snapshots
+    situation_code VARCHAR(10) NOT NULL,
+    home_skater_count INTEGER NOT NULL DEFAULT 5,
+    away_skater_count INTEGER NOT NULL DEFAULT 5,
+    home_skater_ids BIGINT[] NOT NULL DEFAULT '{}',
+    away_skater_ids BIGINT[] NOT NULL DEFAULT '{}',
+    home_goalie_id BIGINT,
+    away_goalie_id BIGINT,
+    is_stoppage BOOLEAN DEFAULT FALSE,
+    is_power_play BOOLEAN DEFAULT FALSE,
+    is_empty_net BOOLEAN DEFAULT FALSE,
+
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+
+    PRIMARY KEY (game_id, start_game_second),
+    CONSTRAINT chk_segment_bounds CHECK (
+        end_game_second >= start_game_second AND
+        duration_seconds = end_game_second - start_game_second + 1
+    )
+);
+
+CREATE INDEX IF NOT EXISTS idx_lineup_segments_season
+    ON lineup_segments(season_id);
+CREATE INDEX IF NOT EXISTS idx_lineup_segments_game_situation
+    ON lineup_segments(game_id, situation_code);
+CREATE INDEX IF NOT EXISTS idx_lineup_segments_home_skaters
+    ON lineup_segments USING GIN(home_skater_ids);
+CREATE INDEX IF NOT EXISTS idx_lineup_segments_away_skaters
+    ON lineup_segments USING GIN(away_skater_ids);
+
+COMMENT ON TABLE lineup_segments IS 'Run-length-encoded second_snapshots: one row per unchanged lineup/situation run';
+COMMENT ON COLUMN lineup_segments.duration_seconds IS 'Seconds covered (end_game_second - start_game_second + 1)';
@@ -0,0 +1,33 @@
+-- Migration: 030_player_pair_toi.sql
+-- Description: Precomputed player-pair on-ice TOI for matchup lookups
+-- Date: 2026-10-16
+--
+-- Teammate/opponent matchups used to unnest the skater arrays of every
+-- matching second_snapshots row on each request. player_pair_toi holds the
+-- same totals per game, pair and situation, refreshed from lineup_segments
+-- whenever a game's snapshots are saved. Each pair is stored in both
+-- directions so a player's matchups are a primary-key range read.
+-- Stoppage seconds are excluded, as in the matchup queries.
+
+CREATE TABLE IF NOT EXISTS player_pair_toi (
+    player_id BIGINT NOT NULL,
+    season_id INTEGER NOT NULL,
+    matchup_type VARCHAR(10) NOT NULL,  -- teammate, opponent
+    game_id BIGINT NOT NULL,
+    other_player_id BIGINT NOT NULL,
+    situation_code VARCHAR(10) NOT NULL,
+    is_empty_net BOOLEAN NOT NULL DEFAULT FALSE,
+    toi_seconds INTEGER NOT NULL,
+
+    PRIMARY KEY (
+        player_id, season_id, matchup_type, game_id,
+        other_player_id, situation_code, is_empty_net
+    ),
+    CONSTRAINT chk_pair_matchup_type CHECK (matchup_type IN ('teammate', 'opponent'))
+);
+
+-- Per-game refresh deletes by game_id
+CREATE INDEX IF NOT EXISTS idx_player_pair_toi_game
+    ON player_pair_toi(game_id);
+
+COMMENT ON TABLE player_pair_toi IS 'Non-stoppage TOI shared by two players per game and situation (both directions)';
@@ -0,0 +1,40 @@
+-- Migration: 031_line_combinations.sql
+-- Description: Canonical line-combination index for season line lookups
+-- Date: 2026-10-16
+--
+-- Season line combinations used to sort every snapshot's skater arrays and
+-- group the result on each request. line_combinations stores each on-ice
+-- unit once per game as a sorted player_ids array (the canonical lineup
+-- key) with its TOI per situation. Besides the full skater group, the
+-- forward and defence subsets of each lineup are stored, so forward lines
+-- and defence pairs are grouped reads too. Positions come from the game's
+-- boxscore (game_skater_stats), falling back to players.primary_position;
+-- skaters with no known position appear only in the full skater group.
+-- Rows are refreshed from lineup_segments whenever a game's snapshots are
+-- saved.
+
+CREATE TABLE IF NOT EXISTS line_combinations (
+    season_id INTEGER NOT NULL,
+    unit VARCHAR(10) NOT NULL,  -- skaters, forwards, defense
+    num_players INTEGER NOT NULL,
+    player_ids BIGINT[] NOT NULL,  -- sorted ascending
+    game_id BIGINT NOT NULL,
+    situation_code VARCHAR(10) NOT NULL,
+    is_empty_net BOOLEAN NOT NULL DEFAULT FALSE,
+    is_stoppage BOOLEAN NOT NULL DEFAULT FALSE,
+    toi_seconds INTEGER NOT NULL,
+
+    PRIMARY KEY (
+        season_id, unit, num_players, player_ids, game_id,
+        situation_code, is_empty_net, is_stoppage
+    ),
+    CONSTRAINT chk_line_unit CHECK (unit IN ('skaters', 'forwards', 'defense')),
+    CONSTRAINT chk_line_num_players CHECK (num_players = cardinality(player_ids))
+);
+
+-- Per-game refresh deletes by game_id
+CREATE INDEX IF NOT EXISTS idx_line_combinations_game
+    ON line_combinations(game_id);
+
+COMMENT ON TABLE line_combinations IS 'TOI per game and situation for each canonical (sorted) on-ice unit';
+COMMENT ON COLUMN line_combinations.unit IS 'skaters = full skater group; forwards/defense = positional subset';
@@ -0,0 +1,42 @@
+-- Migration: 032_backfill_player_pair_toi.sql
+-- Description: Backfill player_pair_toi for games expanded before migration 030
+-- Date: 2026-10-16
+--
+-- player_pair_toi is refreshed only when a game's snapshots are saved, so
+-- games expanded earlier have second_snapshots but no pair rows and return
+-- no teammate/opponent matchups. This derives their rows straight from
+-- second_snapshots (one second per row, so TOI is COUNT(*)), which gives
+-- the same totals refresh_pair_toi() computes from lineup_segments. Games
+-- that already have pair rows are skipped, so the migration can be re-run.
+
+INSERT INTO player_pair_toi (
+    player_id, season_id, matchup_type, game_id,
+    other_player_id, situation_code, is_empty_net, toi_seconds
+)
+SELECT
+    p.player_id,
+    s.season_id,
+    side.matchup_type,
+    s.game_id,
+    o.player_id,
+    s.situation_code,
+    COALESCE(s.is_empty_net, false),
+    COUNT(*)
+FROM second_snapshots s
+CROSS JOIN LATERAL (
+    VALUES
+        (s.home_skater_ids, s.home_skater_ids, 'teammate'),
+        (s.away_skater_ids, s.away_skater_ids, 'teammate'),
+        (s.home_skater_ids, s.away_skater_ids, 'opponent'),
+        (s.away_skater_ids, s.home_skater_ids, 'opponent')
+) AS side(own_ids, other_ids, matchup_type)
+CROSS JOIN LATERAL unnest(side.own_ids) AS p(player_id)
+CROSS JOIN LATERAL unnest(side.other_ids) AS o(player_id)
+WHERE s.is_stoppage = false
+    AND p.player_id <> o.player_id
+    AND NOT EXISTS (
+        SELECT 1 FROM player_pair_toi t WHERE t.game_id = s.game_id
+    )
+GROUP BY p.player_id, s.season_id, side.matchup_type, s.game_id,
+         o.player_id, s.situation_code, COALESCE(s.is_empty_net, false)
+ON CONFLICT DO NOTHING;
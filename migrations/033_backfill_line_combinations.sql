@@ -0,0 +1,82 @@
+-- Migration: 033_backfill_line_combinations.sql
+-- Description: Backfill line_combinations for games expanded before migration 031
+-- Date: 2026-10-16
+--
+-- line_combinations is refreshed only when a game's snapshots are saved, so
+-- games expanded earlier have second_snapshots but no index rows and are
+-- missing from season line lookups. This applies the grouping of
+-- refresh_line_combinations() to second_snapshots instead of
+-- lineup_segments: each snapshot is one second, so TOI is a row count.
+-- Games that already have rows are skipped, so the migration can be re-run.
+
+INSERT INTO line_combinations (
+    season_id, unit, num_players, player_ids, game_id,
+    situation_code, is_empty_net, is_stoppage, toi_seconds
+)
+WITH members AS (
+    SELECT
+        s.season_id,
+        s.game_id,
+        s.game_second,
+        side.is_home,
+        s.situation_code,
+        COALESCE(s.is_empty_net, false) as is_empty_net,
+        COALESCE(s.is_stoppage, false) as is_stoppage,
+        m.player_id,
+        CASE LEFT(COALESCE(gss.position, p.primary_position), 1)
+            WHEN 'D' THEN 'defense'
+            WHEN 'C' THEN 'forwards'
+            WHEN 'L' THEN 'forwards'
+            WHEN 'R' THEN 'forwards'
+        END as unit
+    FROM second_snapshots s
+    CROSS JOIN LATERAL (
+        VALUES (true, s.home_skater_ids), (false, s.away_skater_ids)
+    ) AS side(is_home, skater_ids)
+    CROSS JOIN LATERAL unnest(side.skater_ids) AS m(player_id)
+    LEFT JOIN game_skater_stats gss
+        ON gss.game_id = s.game_id
+        AND gss.season_id = s.season_id
+        AND gss.player_id = m.player_id
+    LEFT JOIN players p ON p.player_id = m.player_id
+    WHERE NOT EXISTS (
+        SELECT 1 FROM line_combinations lc WHERE lc.game_id = s.game_id
+    )
+),
+lineups AS (
+    SELECT
+        season_id,
+        game_id,
+        situation_code,
+        is_empty_net,
+        is_stoppage,
+        array_agg(player_id ORDER BY player_id) as skaters,
+        array_agg(player_id ORDER BY player_id)
+            FILTER (WHERE unit = 'forwards') as forwards,
+        array_agg(player_id ORDER BY player_id)
+            FILTER (WHERE unit = 'defense') as defense
+    FROM members
+    GROUP BY season_id, game_id, game_second, is_home,
+             situation_code, is_empty_net, is_stoppage
+)
+SELECT
+    l.season_id,
+    u.unit,
+    cardinality(u.player_ids),
+    u.player_ids,
+    l.game_id,
+    l.situation_code,
+    l.is_empty_net,
+    l.is_stoppage,
+    COUNT(*)
+FROM lineups l
+CROSS JOIN LATERAL (
+    VALUES
+        ('skaters', l.skaters),
+        ('forwards', l.forwards),
+        ('defense', l.defense)
+) AS u(unit, player_ids)
+WHERE u.player_ids IS NOT NULL
+GROUP BY l.season_id, u.unit, u.player_ids, l.game_id,
+         l.situation_code, l.is_empty_net, l.is_stoppage
+ON CONFLICT DO NOTHING;
@@ -0,0 +1,64 @@
+-- Migration: 034_backfill_lineup_segments.sql
+-- Description: Backfill lineup_segments for games expanded before migration 029
+-- Date: 2026-10-17
+--
+-- lineup_segments rows are written only when a game's snapshots are saved,
+-- so games expanded earlier have second_snapshots but no segments and drop
+-- out of use_segments queries. This run-length encodes their snapshots in
+-- SQL with the same rule as segment_rows(): consecutive seconds of a period
+-- with identical state share a segment. Within one state, game_second minus
+-- its row number is constant across a run of consecutive seconds and
+-- changes at every gap, so it identifies the run. Games that already have
+-- segments are skipped, so the migration can be re-run.
+
+WITH runs AS (
+    SELECT
+        s.*,
+        s.game_second - ROW_NUMBER() OVER (
+            PARTITION BY s.game_id, s.period, s.situation_code,
+                s.home_skater_count, s.away_skater_count,
+                s.home_skater_ids, s.away_skater_ids,
+                s.home_goalie_id, s.away_goalie_id,
+                s.is_stoppage, s.is_power_play, s.is_empty_net
+            ORDER BY s.game_second
+        ) AS run_key
+    FROM second_snapshots s
+    WHERE NOT EXISTS (
+        SELECT 1 FROM lineup_segments l WHERE l.game_id = s.game_id
+    )
+)
+INSERT INTO lineup_segments (
+    game_id, season_id, period,
+    start_second, end_second, start_game_second, end_game_second,
+    duration_seconds,
+    situation_code, home_skater_count, away_skater_count,
+    home_skater_ids, away_skater_ids, home_goalie_id, away_goalie_id,
+    is_stoppage, is_power_play, is_empty_net
+)
+SELECT
+    game_id,
+    season_id,
+    period,
+    MIN(period_second),
+    MAX(period_second),
+    MIN(game_second),
+    MAX(game_second),
+    MAX(game_second) - MIN(game_second) + 1,
+    situation_code,
+    home_skater_count,
+    away_skater_count,
+    home_skater_ids,
+    away_skater_ids,
+    home_goalie_id,
+    away_goalie_id,
+    is_stoppage,
+    is_power_play,
+    is_empty_net
+FROM runs
+GROUP BY game_id, season_id, period, situation_code,
+         home_skater_count, away_skater_count,
+         home_skater_ids, away_skater_ids,
+         home_goalie_id, away_goalie_id,
+         is_stoppage, is_power_play, is_empty_net,
+         run_key
+ON CONFLICT DO NOTHING;
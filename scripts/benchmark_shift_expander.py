@@ -0,0 +1,209 @@
+"""Benchmark the interval-sweep shift expander against per-second expansion.
+
+Loads every game_shifts row for a season (one query), then expands each game
+with both the original per-second algorithm and the interval sweep used by
+ShiftExpander, checks that the per-second output is identical, and reports
+timings (and optionally peak memory) for each engine.
+
+Usage:
+    python scripts/benchmark_shift_expander.py --season 20242025
+    python scripts/benchmark_shift_expander.py --synthetic 1312
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import time
+import tracemalloc
+from collections.abc import Iterable
+from typing import Any
+
+from nhl_api.services.analytics.shift_expander import (
+    PERIOD_SECONDS,
+    parse_game_clock_to_elapsed,
+    sweep_shifts,
+)
+
+# (home_team_id, shifts) per game
+Games = dict[int, tuple[int, list[dict[str, Any]]]]
+
+
+def expand_per_second(
+    shifts: Iterable[dict[str, Any]], home_team_id: int
+) -> dict[tuple[int, int], tuple[frozenset[int], frozenset[int]]]:
+    """Expand shifts by visiting every second of every shift.
+
+    This is the original expansion algorithm, kept here as the baseline
+    the interval sweep is benchmarked against.
+
+    Args:
+        shifts: Shift records (see sweep_shifts).
+        home_team_id: Home team ID.
+
+    Returns:
+        Map of (period, period_second) to (home skaters, away skaters).
+    """
+    presence_map: dict[tuple[int, int], dict[str, set[int]]] = {}
+
+    for shift in shifts:
+        if shift["is_goal_event"]:
+            continue
+
+        period = shift["period"]
+        start_elapsed = parse_game_clock_to_elapsed(shift["start_time"], period)
+        end_elapsed = parse_game_clock_to_elapsed(shift["end_time"], period)
+        if start_elapsed > end_elapsed:
+            start_elapsed, end_elapsed = end_elapsed, start_elapsed
+
+        team_key = (
+            "home_skaters" if shift["team_id"] == home_team_id else "away_skaters"
+        )
+        for sec in range(start_elapsed, end_elapsed + 1):
+            key = (period, sec)
+            if key not in presence_map:
+                presence_map[key] = {"home_skaters": set(), "away_skaters": set()}
+            presence_map[key][team_key].add(shift["player_id"])
+
+    return {
+        key: (frozenset(players["home_skaters"]), frozenset(players["away_skaters"]))
+        for key, players in sorted(presence_map.items())
+    }
+
+
+async def load_season(season_id: int) -> Games:
+    """Load all shifts for a season with a single query."""
+    from nhl_api.services.db import DatabaseService
+
+    async with DatabaseService() as db:
+        rows = await db.fetch(
+            """
+            SELECT s.game_id, g.home_team_id, s.player_id, s.team_id, s.period,
+                   s.start_time, s.end_time, s.is_goal_event
+            FROM game_shifts s
+            JOIN games g ON g.game_id = s.game_id AND g.season_id = $1
+            ORDER BY s.game_id, s.period, s.shift_number
+            """,
+            season_id,
+        )
+
+    games: dict[int, tuple[int, list[dict[str, Any]]]] = {}
+    for row in rows:
+        games.setdefault(row["game_id"], (row["home_team_id"], []))[1].append(dict(row))
+    return games
+
+
+def synthetic_season(num_games: int, seed: int = 0) -> Games:
+    """Generate games where forward lines and defence pairs rotate shifts."""
+    rng = random.Random(seed)
+
+    def clock(elapsed: int) -> str:
+        remaining = PERIOD_SECONDS - elapsed
+        return f"{remaining // 60:02d}:{remaining % 60:02d}"
+
+    games: Games = {}
+    for game_index in range(num_games):
+        shifts: list[dict[str, Any]] = []
+        for period in (1, 2, 3):
+            for team_id, base in ((1, 100), (2, 200)):
+                forwards = [list(range(base + i, base + i + 3)) for i in (0, 3, 6, 9)]
+                pairs = [list(range(base + i, base + i + 2)) for i in (12, 14, 16)]
+                for units, shift_range in ((forwards, (35, 55)), (pairs, (40, 70))):
+                    t, unit = 0, 0
+                    while t < PERIOD_SECONDS:
+                        end = min(PERIOD_SECONDS, t + rng.randint(*shift_range))
+                        for player in units[unit % len(units)]:
+                            # Players in a unit change within a second or two
+                            shifts.append(
+                                {
+                                    "player_id": player,
+                                    "team_id": team_id,
+                                    "period": period,
+                                    "start_time": clock(t),
+                                    "end_time": clock(
+                                        min(PERIOD_SECONDS, end + rng.randint(0, 2))
+                                    ),
+                                    "is_goal_event": False,
+                                }
+                            )
+                        t, unit = end + 1, unit + 1
+        games[2024020001 + game_index] = (1, shifts)
+    return games
+
+
+def to_seconds(intervals: list[Any]) -> dict[tuple[int, int], Any]:
+    """Expand intervals to the per-second mapping for comparison."""
+    seconds: dict[tuple[int, int], Any] = {}
+    for interval in intervals:
+        for sec in range(interval.start_second, interval.end_second + 1):
+            seconds[(interval.period, sec)] = (
+                interval.home_skaters,
+                interval.away_skaters,
+            )
+    return seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--season", type=int, help="Season ID to load from game_shifts")
+    source.add_argument("--synthetic", type=int, help="Number of synthetic games")
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="Also report peak allocations for the largest game",
+    )
+    args = parser.parse_args()
+
+    if args.season:
+        games = asyncio.run(load_season(args.season))
+    else:
+        games = synthetic_season(args.synthetic)
+
+    total_shifts = sum(len(shifts) for _, shifts in games.values())
+    print(f"{len(games)} games, {total_shifts} shifts\n")
+
+    # Games are expanded and compared one at a time; keeping a season of
+    # per-second output in memory is exactly what the sweep avoids.
+    slow = fast = 0.0
+    num_seconds = num_intervals = 0
+    mismatched = []
+    for game_id, (home_team_id, shifts) in games.items():
+        started = time.perf_counter()
+        per_second = expand_per_second(shifts, home_team_id)
+        slow += time.perf_counter() - started
+
+        started = time.perf_counter()
+        intervals = sweep_shifts(shifts, home_team_id)
+        fast += time.perf_counter() - started
+
+        num_seconds += len(per_second)
+        num_intervals += len(intervals)
+        if to_seconds(intervals) != per_second:
+            mismatched.append(game_id)
+
+    print(f"per-second   {slow:8.2f}s")
+    print(f"sweep        {fast:8.2f}s")
+    if args.memory:
+        home_team_id, shifts = max(games.values(), key=lambda game: len(game[1]))
+        for name, engine in (
+            ("per-second", expand_per_second),
+            ("sweep", sweep_shifts),
+        ):
+            tracemalloc.start()
+            engine(shifts, home_team_id)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"{name:<12} peak {peak / 1e6:6.2f} MB for the largest game")
+
+    print(f"\n{num_seconds} snapshot seconds from {num_intervals} intervals")
+    print(f"speedup: {slow / fast:.1f}x")
+    print(f"identical output: {'yes' if not mismatched else 'NO'}")
+    if mismatched:
+        print(f"mismatched games: {mismatched[:10]}")
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,8 +2,11 @@
 
 Usage:
     python -m nhl_api.cli validate --season 20242025
+    python -m nhl_api.cli validate --season 20242025 --workers 8
     python -m nhl_api.cli validate --game 2024020001
     python -m nhl_api.cli validate --report
+    python -m nhl_api.cli analytics --season 20242025
+    python -m nhl_api.cli pack-html --season 20242025
 """
 
 from __future__ import annotations
@@ -46,6 +49,69 @@ def main() -> int:
         default="data/reports/validation",
         help="Output directory for reports (default: data/reports/validation)",
     )
+    validate_parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Games reconciled concurrently for --season (default: 1)",
+    )
+    validate_parser.add_argument(
+        "--prefetch",
+        action="store_true",
+        help="Bulk-load season goal totals and reconcile in memory",
+    )
+
+    # Analytics pipeline command
+    analytics_parser = subparsers.add_parser(
+        "analytics",
+        help="Build second-by-second snapshots for a season",
+    )
+    analytics_parser.add_argument(
+        "--season",
+        type=str,
+        required=True,
+        help="Season to process (e.g., 20242025)",
+    )
+    analytics_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for expansion and attribution (default: CPU count)",
+    )
+    analytics_parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=50,
+        help="Games prefetched per batched query (default: 50)",
+    )
+    analytics_parser.add_argument(
+        "--no-resume",
+        action="store_true",
+        help="Reprocess games already completed by an earlier run",
+    )
+
+    # HTML archive migration command
+    pack_parser = subparsers.add_parser(
+        "pack-html",
+        help="Pack stored .HTM reports into compressed per-season archives",
+    )
+    pack_parser.add_argument(
+        "--season",
+        type=str,
+        default=None,
+        help="Season to pack (default: all seasons)",
+    )
+    pack_parser.add_argument(
+        "--base-dir",
+        type=str,
+        default="data/html",
+        help="HTML storage directory (default: data/html)",
+    )
+    pack_parser.add_argument(
+        "--remove",
+        action="store_true",
+        help="Delete .HTM files once they are archived",
+    )
 
     args = parser.parse_args()
 
@@ -57,7 +123,26 @@ def main() -> int:
             game_id=args.game,
             generate_report=args.report,
             output_dir=args.output_dir,
+            workers=args.workers,
+            prefetch=args.prefetch,
+        )
+    elif args.command == "analytics":
+        from nhl_api.cli.analytics import run_analytics
+
+        return run_analytics(
+            season=args.season,
+            workers=args.workers,
+            batch_size=args.batch_size,
+            resume=not args.no_resume,
+        )
+    elif args.command == "pack-html":
+        from nhl_api.utils.html_storage import migrate_html_directory
+
+        count = migrate_html_directory(
+            args.base_dir, args.season, remove_files=args.remove
         )
+        print(f"Packed {count} HTML reports under {args.base_dir}")
+        return 0
     else:
         parser.print_help()
         return 0
@@ -0,0 +1,82 @@
+"""Analytics pipeline CLI command.
+
+Builds second_snapshots for every completed game in a season by running
+shift expansion and event attribution across a process pool.
+
+Usage:
+    python -m nhl_api.cli analytics --season 20242025
+    python -m nhl_api.cli analytics --season 20242025 --workers 8 --batch-size 100
+    python -m nhl_api.cli analytics --season 20242025 --no-resume
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+async def _run_analytics_async(
+    season: str,
+    workers: int | None = None,
+    batch_size: int = 50,
+    resume: bool = True,
+) -> int:
+    """Run the analytics pipeline asynchronously.
+
+    Args:
+        season: Season to process (e.g., "20242025")
+        workers: Process pool size (None for one per CPU)
+        batch_size: Games prefetched per batched query
+        resume: Whether to skip games completed by an earlier run
+
+    Returns:
+        Exit code (0 for success)
+    """
+    from nhl_api.services.analytics.pipeline import AnalyticsPipeline, PipelineConfig
+    from nhl_api.services.db import DatabaseService
+
+    config = PipelineConfig(
+        season_id=int(season),
+        batch_size=batch_size,
+        workers=workers,
+        resume=resume,
+    )
+
+    async with DatabaseService() as db:
+        print(f"\nRunning analytics pipeline for season {season}...")
+        stats = await AnalyticsPipeline(db, config).run()
+
+    print(f"\nSeason {season} Analytics Summary:")
+    for line in stats.summary().splitlines():
+        print(f"  {line}")
+
+    return 1 if stats.games_failed else 0
+
+
+def run_analytics(
+    season: str,
+    workers: int | None = None,
+    batch_size: int = 50,
+    resume: bool = True,
+) -> int:
+    """Run analytics pipeline command.
+
+    Args:
+        season: Season to process (e.g., "20242025")
+        workers: Process pool size (None for one per CPU)
+        batch_size: Games prefetched per batched query
+        resume: Whether to skip games completed by an earlier run
+
+    Returns:
+        Exit code (0 for success, 1 if any game failed)
+    """
+    return asyncio.run(
+        _run_analytics_async(
+            season=season,
+            workers=workers,
+            batch_size=batch_size,
+            resume=resume,
+        )
+    )
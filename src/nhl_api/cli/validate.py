@@ -2,8 +2,16 @@
 
 Runs data validation and reconciliation, generating text reports.
 
+Season reconciliation runs one game at a time by default. ``--workers N``
+keeps up to N games in flight, each drawing its own connection from the
+DatabaseService pool, and ``--prefetch`` loads the JSON and HTML goal totals
+for the whole season with two bulk queries and reconciles them in memory.
+Per-game results are streamed to the JSON report as they are produced.
+
 Usage:
     python -m nhl_api.cli validate --season 20242025
+    python -m nhl_api.cli validate --season 20242025 --workers 8
+    python -m nhl_api.cli validate --season 20242025 --prefetch --report
     python -m nhl_api.cli validate --game 2024020001
     python -m nhl_api.cli validate --report
 """
@@ -16,9 +24,11 @@ import logging
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import IO, TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Mapping, Sequence
+
     from nhl_api.services.db import DatabaseService
 
 logger = logging.getLogger(__name__)
@@ -52,14 +62,18 @@ class SeasonSummary:
     games_with_warnings: int
     source_accuracy: dict[str, Any]
     common_discrepancies: dict[str, int]
-    results: list[ReconciliationResult]
+    failed_results: list[ReconciliationResult]
+
 
+async def _get_db_connection(workers: int = 1) -> DatabaseService:
+    """Get database connection.
 
-async def _get_db_connection() -> DatabaseService:
-    """Get database connection."""
+    Args:
+        workers: Concurrent games; the pool is sized so each has a connection
+    """
     from nhl_api.services.db import DatabaseService
 
-    db = DatabaseService()
+    db = DatabaseService(max_connections=max(10, workers))
     await db.connect()
     return db
 
@@ -88,7 +102,6 @@ async def _reconcile_game(db: Any, game_id: int) -> ReconciliationResult | None:
         return None
 
     season_id = game["season_id"]
-    discrepancies = []
 
     # Get goals from PBP JSON
     pbp_goals = await db.fetchrow(
@@ -120,6 +133,29 @@ async def _reconcile_game(db: Any, game_id: int) -> ReconciliationResult | None:
     html_home = html_gs["home_goals"] if html_gs else None
     html_away = html_gs["away_goals"] if html_gs else None
 
+    return _compare_goals(game, json_home, json_away, html_home, html_away)
+
+
+def _compare_goals(
+    game: Mapping[str, Any],
+    json_home: int,
+    json_away: int,
+    html_home: int | None,
+    html_away: int | None,
+) -> ReconciliationResult:
+    """Compare a game's PBP goal totals with the HTML summary and record.
+
+    Args:
+        game: Game row with game_id, season_id, home_score and away_score
+        json_home: Home goals counted from PBP JSON
+        json_away: Away goals counted from PBP JSON
+        html_home: Home goals from the HTML Game Summary, if available
+        html_away: Away goals from the HTML Game Summary, if available
+
+    Returns:
+        ReconciliationResult for the game
+    """
+    discrepancies = []
     passed = True
 
     # Compare JSON vs HTML
@@ -145,8 +181,8 @@ async def _reconcile_game(db: Any, game_id: int) -> ReconciliationResult | None:
         passed = False
 
     return ReconciliationResult(
-        game_id=game_id,
-        season_id=season_id,
+        game_id=game["game_id"],
+        season_id=game["season_id"],
         json_home_goals=json_home,
         json_away_goals=json_away,
         html_home_goals=html_home,
@@ -156,12 +192,120 @@ async def _reconcile_game(db: Any, game_id: int) -> ReconciliationResult | None:
     )
 
 
-async def _reconcile_season(db: Any, season: str) -> SeasonSummary:
+async def _iter_game_results(
+    db: Any, game_ids: Sequence[int], workers: int = 1
+) -> AsyncIterator[ReconciliationResult]:
+    """Reconcile games with up to ``workers`` in flight.
+
+    Each in-flight game runs its queries on its own pooled connection.
+    Results are yielded in ``game_ids`` order; games that are not found
+    are skipped. Outstanding tasks are cancelled if the consumer stops.
+
+    Args:
+        db: Database service
+        game_ids: Game IDs to reconcile
+        workers: Maximum games reconciled concurrently
+
+    Yields:
+        ReconciliationResult for each game found
+    """
+    pending: list[asyncio.Task[ReconciliationResult | None]] = []
+    remaining = iter(game_ids)
+    exhausted = False
+
+    try:
+        while True:
+            # Top up the in-flight window
+            while not exhausted and len(pending) < max(1, workers):
+                game_id = next(remaining, None)
+                if game_id is None:
+                    exhausted = True
+                    break
+                pending.append(asyncio.create_task(_reconcile_game(db, game_id)))
+
+            if not pending:
+                return
+
+            result = await pending.pop(0)
+            if result:
+                yield result
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def _iter_prefetched_results(
+    db: Any, season_id: int
+) -> AsyncIterator[ReconciliationResult]:
+    """Reconcile a season from bulk-loaded goal totals.
+
+    Loads PBP goal counts with each game's record, and all HTML Game
+    Summary totals, with one query each, then compares them in memory.
+
+    Args:
+        db: Database service
+        season_id: Season ID
+
+    Yields:
+        ReconciliationResult for each game, in game ID order
+    """
+    games = await db.fetch(
+        """
+        SELECT
+            g.game_id, g.season_id, g.home_score, g.away_score,
+            COUNT(CASE WHEN ge.team_abbrev = g.home_team THEN 1 END) as home_goals,
+            COUNT(CASE WHEN ge.team_abbrev = g.away_team THEN 1 END) as away_goals
+        FROM games g
+        LEFT JOIN game_events ge
+            ON ge.game_id = g.game_id AND ge.event_type = 'GOAL'
+        WHERE g.season_id = $1
+        GROUP BY g.game_id, g.season_id, g.home_score, g.away_score
+        ORDER BY g.game_id
+        """,
+        season_id,
+    )
+    html_rows = await db.fetch(
+        """
+        SELECT game_id, home_goals, away_goals
+        FROM html_game_summary
+        WHERE season_id = $1
+        """,
+        season_id,
+    )
+    html_goals = {row["game_id"]: row for row in html_rows}
+
+    for game in games:
+        html_gs = html_goals.get(game["game_id"])
+        yield _compare_goals(
+            game,
+            game["home_goals"] or 0,
+            game["away_goals"] or 0,
+            html_gs["home_goals"] if html_gs else None,
+            html_gs["away_goals"] if html_gs else None,
+        )
+
+
+async def _reconcile_season(
+    db: Any,
+    season: str,
+    *,
+    workers: int = 1,
+    prefetch: bool = False,
+    on_result: Callable[[ReconciliationResult], None] | None = None,
+) -> SeasonSummary:
     """Reconcile all games in a season.
 
+    Results are tallied as they arrive; only failed games are kept for
+    the summary, and ``on_result`` receives every result as it is produced.
+
     Args:
         db: Database service
         season: Season string (e.g., "20242025")
+        workers: Games reconciled concurrently (ignored with prefetch)
+        prefetch: Bulk-load goal totals for the season and reconcile in memory
+        on_result: Called with each per-game result, in game ID order
 
     Returns:
         SeasonSummary with reconciliation results
@@ -175,65 +319,69 @@ async def _reconcile_season(db: Any, season: str) -> SeasonSummary:
     if not season_id:
         raise ValueError(f"Season {season} not found")
 
-    # Get all game IDs for the season
-    game_ids = await db.fetch(
-        """
-        SELECT game_id FROM games
-        WHERE season_id = $1
-        ORDER BY game_id
-        """,
-        season_id,
-    )
+    if prefetch:
+        results = _iter_prefetched_results(db, season_id)
+    else:
+        # Get all game IDs for the season
+        game_rows = await db.fetch(
+            """
+            SELECT game_id FROM games
+            WHERE season_id = $1
+            ORDER BY game_id
+            """,
+            season_id,
+        )
+        results = _iter_game_results(db, [row["game_id"] for row in game_rows], workers)
 
-    results = []
+    total_games = 0
+    reconciled_games = 0
     total_goals = 0
     games_with_discrepancies = 0
+    total_discrepancies = 0
+    games_with_html = 0
+    html_passed = 0
+    failed_results: list[ReconciliationResult] = []
     discrepancy_counts: dict[str, int] = {}
 
-    for row in game_ids:
-        result = await _reconcile_game(db, row["game_id"])
-        if result:
-            results.append(result)
-            total_goals += result.json_home_goals + result.json_away_goals
-            if result.discrepancies:
-                games_with_discrepancies += 1
-                for disc in result.discrepancies:
-                    disc_type = disc.split(":")[0]
-                    discrepancy_counts[disc_type] = (
-                        discrepancy_counts.get(disc_type, 0) + 1
-                    )
+    async for result in results:
+        if on_result:
+            on_result(result)
+        total_games += 1
+        total_goals += result.json_home_goals + result.json_away_goals
+        total_discrepancies += len(result.discrepancies)
+        if result.html_home_goals is not None:
+            games_with_html += 1
+            html_passed += result.passed
+        if result.passed:
+            reconciled_games += 1
+        else:
+            failed_results.append(result)
+        if result.discrepancies:
+            games_with_discrepancies += 1
+            for disc in result.discrepancies:
+                disc_type = disc.split(":")[0]
+                discrepancy_counts[disc_type] = discrepancy_counts.get(disc_type, 0) + 1
 
-    total_games = len(results)
-    reconciled_games = sum(1 for r in results if r.passed)
     failed_games = total_games - reconciled_games
     reconciliation_percentage = (
         (reconciled_games / total_games * 100) if total_games > 0 else 0
     )
 
     # Source accuracy (simplified)
-    games_with_html = sum(1 for r in results if r.html_home_goals is not None)
-    html_accuracy = (
-        sum(1 for r in results if r.html_home_goals is not None and r.passed)
-        / games_with_html
-        * 100
-        if games_with_html > 0
-        else 0
-    )
+    html_accuracy = html_passed / games_with_html * 100 if games_with_html > 0 else 0
 
     source_accuracy = {
         "json_pbp": {
             "total_games": total_games,
             "accuracy_percentage": 100.0,  # PBP is authoritative
             "average_reconciliation_percentage": reconciliation_percentage,
-            "total_discrepancies": sum(len(r.discrepancies) for r in results),
+            "total_discrepancies": total_discrepancies,
         },
         "html_game_summary": {
             "total_games": games_with_html,
             "accuracy_percentage": html_accuracy,
             "average_reconciliation_percentage": html_accuracy,
-            "total_discrepancies": sum(
-                1 for r in results if r.html_home_goals is not None and not r.passed
-            ),
+            "total_discrepancies": games_with_html - html_passed,
         },
     }
 
@@ -250,7 +398,7 @@ async def _reconcile_season(db: Any, season: str) -> SeasonSummary:
         common_discrepancies=dict(
             sorted(discrepancy_counts.items(), key=lambda x: x[1], reverse=True)
         ),
-        results=results,
+        failed_results=failed_results,
     )
 
 
@@ -323,11 +471,10 @@ def generate_report(summary: SeasonSummary) -> str:
     lines.append("")
 
     # Games with issues (top 10)
-    failed_results = [r for r in summary.results if not r.passed]
-    if failed_results:
+    if summary.failed_results:
         lines.append("GAMES WITH DISCREPANCIES (Top 10)")
         lines.append("-" * 40)
-        for result in failed_results[:10]:
+        for result in summary.failed_results[:10]:
             lines.append(f"Game {result.game_id}:")
             for disc in result.discrepancies:
                 lines.append(f"  - {disc}")
@@ -336,11 +483,72 @@ def generate_report(summary: SeasonSummary) -> str:
     return "\n".join(lines)
 
 
+class _JsonResultsWriter:
+    """Stream per-game results into the JSON report as they are produced.
+
+    The file is written as ``{"results": [...], <summary fields>}``: each
+    result is appended on arrival and the summary fields close the object
+    once the season is done, so results are never held in memory.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Open the report file and start the results array.
+
+        Args:
+            path: File to write the JSON report to (overwritten if present)
+        """
+        self.path = path
+        self._file: IO[str] = path.open("w")
+        self._file.write('{\n  "results": [')
+        self._count = 0
+
+    def write_result(self, result: ReconciliationResult) -> None:
+        """Append one game's result."""
+        record = {
+            "game_id": result.game_id,
+            "passed": result.passed,
+            "json_home": result.json_home_goals,
+            "json_away": result.json_away_goals,
+            "html_home": result.html_home_goals,
+            "html_away": result.html_away_goals,
+            "discrepancies": result.discrepancies,
+        }
+        separator = "," if self._count else ""
+        self._file.write(f"{separator}\n    {json.dumps(record)}")
+        self._count += 1
+
+    def close(self, summary: SeasonSummary | None = None) -> None:
+        """Write the summary fields and close the file.
+
+        Args:
+            summary: Season summary, or None if reconciliation did not finish
+        """
+        self._file.write("\n  ]")
+        if summary is not None:
+            fields = {
+                "season": summary.season,
+                "total_games": summary.total_games,
+                "reconciled_games": summary.reconciled_games,
+                "failed_games": summary.failed_games,
+                "reconciliation_percentage": summary.reconciliation_percentage,
+                "total_goals": summary.total_goals,
+                "games_with_discrepancies": summary.games_with_discrepancies,
+                "source_accuracy": summary.source_accuracy,
+                "common_discrepancies": summary.common_discrepancies,
+            }
+            for key, value in fields.items():
+                self._file.write(f",\n  {json.dumps(key)}: {json.dumps(value)}")
+        self._file.write("\n}\n")
+        self._file.close()
+
+
 async def _run_validate_async(
     season: str | None = None,
     game_id: int | None = None,
     generate_report_flag: bool = False,
     output_dir: str = "data/reports/validation",
+    workers: int = 1,
+    prefetch: bool = False,
 ) -> int:
     """Run validation asynchronously.
 
@@ -349,11 +557,13 @@ async def _run_validate_async(
         game_id: Single game ID to validate
         generate_report_flag: Whether to generate text reports
         output_dir: Output directory for reports
+        workers: Games reconciled concurrently for a season
+        prefetch: Bulk-load season goal totals before reconciling
 
     Returns:
         Exit code (0 for success)
     """
-    db = await _get_db_connection()
+    db = await _get_db_connection(workers)
 
     try:
         if game_id:
@@ -380,7 +590,29 @@ async def _run_validate_async(
         elif season:
             # Validate full season
             print(f"\nValidating season {season}...")
-            summary = await _reconcile_season(db, season)
+
+            writer = None
+            if generate_report_flag:
+                # Create output directory
+                output_path = Path(output_dir)
+                output_path.mkdir(parents=True, exist_ok=True)
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                writer = _JsonResultsWriter(
+                    output_path / f"reconciliation_{season}_{timestamp}.json"
+                )
+
+            summary = None
+            try:
+                summary = await _reconcile_season(
+                    db,
+                    season,
+                    workers=workers,
+                    prefetch=prefetch,
+                    on_result=writer.write_result if writer else None,
+                )
+            finally:
+                if writer:
+                    writer.close(summary)
 
             print(f"\nSeason {season} Reconciliation Summary:")
             print(f"  Total Games: {summary.total_games}")
@@ -388,47 +620,14 @@ async def _run_validate_async(
             print(f"  Failed: {summary.failed_games}")
             print(f"  Percentage: {summary.reconciliation_percentage:.1f}%")
 
-            if generate_report_flag:
-                # Create output directory
-                output_path = Path(output_dir)
-                output_path.mkdir(parents=True, exist_ok=True)
-
+            if writer:
                 # Generate and save text report
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 report_file = (
                     output_path / f"reconciliation_{season}_{timestamp}_report.txt"
                 )
-                report_text = generate_report(summary)
-                report_file.write_text(report_text)
+                report_file.write_text(generate_report(summary))
                 print(f"\nReport saved to: {report_file}")
-
-                # Save JSON results
-                json_file = output_path / f"reconciliation_{season}_{timestamp}.json"
-                json_data = {
-                    "season": summary.season,
-                    "total_games": summary.total_games,
-                    "reconciled_games": summary.reconciled_games,
-                    "failed_games": summary.failed_games,
-                    "reconciliation_percentage": summary.reconciliation_percentage,
-                    "total_goals": summary.total_goals,
-                    "games_with_discrepancies": summary.games_with_discrepancies,
-                    "source_accuracy": summary.source_accuracy,
-                    "common_discrepancies": summary.common_discrepancies,
-                    "results": [
-                        {
-                            "game_id": r.game_id,
-                            "passed": r.passed,
-                            "json_home": r.json_home_goals,
-                            "json_away": r.json_away_goals,
-                            "html_home": r.html_home_goals,
-                            "html_away": r.html_away_goals,
-                            "discrepancies": r.discrepancies,
-                        }
-                        for r in summary.results
-                    ],
-                }
-                json_file.write_text(json.dumps(json_data, indent=2))
-                print(f"JSON saved to: {json_file}")
+                print(f"JSON saved to: {writer.path}")
 
         else:
             print("Please specify --season or --game")
@@ -445,6 +644,8 @@ def run_validate(
     game_id: int | None = None,
     generate_report: bool = False,
     output_dir: str = "data/reports/validation",
+    workers: int = 1,
+    prefetch: bool = False,
 ) -> int:
     """Run validation command.
 
@@ -453,6 +654,8 @@ def run_validate(
         game_id: Single game ID to validate
         generate_report: Whether to generate text reports
         output_dir: Output directory for reports
+        workers: Games reconciled concurrently for a season
+        prefetch: Bulk-load season goal totals before reconciling
 
     Returns:
         Exit code (0 for success)
@@ -463,5 +666,7 @@ def run_validate(
             game_id=game_id,
             generate_report_flag=generate_report,
             output_dir=output_dir,
+            workers=workers,
+            prefetch=prefetch,
         )
     )
@@ -5,8 +5,9 @@ This module provides the foundational components for all downloaders:
 - BaseDownloader abstract base class
 - DownloadResult dataclass
 - DownloadStatus enum
-- RateLimiter for API request throttling
+- RateLimiter for API request throttling, optionally adaptive and shared
 - RetryHandler with exponential backoff
+- RawResponseArchive for archiving and replaying raw responses
 """
 
 from nhl_api.downloaders.base.base_downloader import (
@@ -24,9 +25,15 @@ from nhl_api.downloaders.base.protocol import (
     RateLimitError,
 )
 from nhl_api.downloaders.base.rate_limiter import (
+    AdaptiveRateConfig,
     RateLimiter,
+    RateStats,
     TokenBucket,
+    clear_shared_rate_limiters,
+    shared_rate_limiter,
+    shared_rate_stats,
 )
+from nhl_api.downloaders.base.raw_archive import RawResponseArchive
 from nhl_api.downloaders.base.retry_handler import (
     MaxRetriesExceededError,
     RetryableError,
@@ -36,6 +43,7 @@ from nhl_api.downloaders.base.retry_handler import (
 )
 
 __all__ = [
+    "AdaptiveRateConfig",
     "BaseDownloader",
     "Downloader",
     "DownloaderConfig",
@@ -48,9 +56,14 @@ __all__ = [
     "ProgressCallback",
     "RateLimitError",
     "RateLimiter",
+    "RateStats",
+    "RawResponseArchive",
     "RetryableError",
     "RetryConfig",
     "RetryHandler",
     "RetryResult",
     "TokenBucket",
+    "clear_shared_rate_limiters",
+    "shared_rate_limiter",
+    "shared_rate_stats",
 ]
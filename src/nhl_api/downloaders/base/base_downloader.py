@@ -21,11 +21,14 @@ Example usage:
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING, Any, Protocol
+from typing import TYPE_CHECKING, Any, ClassVar, Protocol, TypeVar
 
 from nhl_api.downloaders.base.protocol import (
     DownloadError,
@@ -33,23 +36,29 @@ from nhl_api.downloaders.base.protocol import (
     DownloadStatus,
     HealthCheckError,
 )
-from nhl_api.downloaders.base.rate_limiter import RateLimiter
+from nhl_api.downloaders.base.rate_limiter import RateLimiter, shared_rate_limiter
+from nhl_api.downloaders.base.raw_archive import RawResponseArchive
 from nhl_api.downloaders.base.retry_handler import (
     RetryableError,
     RetryConfig,
     RetryHandler,
 )
 from nhl_api.utils.http_client import (
+    CachePolicy,
     HTTPClient,
     HTTPClientConfig,
     HTTPResponse,
+    shared_response_cache,
 )
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncGenerator, AsyncIterator, Callable
+    from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
 
 class ProgressCallback(Protocol):
     """Protocol for progress callback functions.
@@ -92,6 +101,19 @@ class DownloaderConfig:
         retry_base_delay: Initial delay between retries in seconds
         http_timeout: HTTP request timeout in seconds
         health_check_url: URL for health check (relative to base_url)
+        max_concurrency: Maximum games in flight during download_season
+            (1 downloads serially; requests still pass the rate limiter)
+        completion_order: If True, concurrent season downloads yield results
+            as games finish rather than in schedule order
+        cache_dir: Directory for the on-disk HTTP response cache
+            (None disables caching)
+        cache_max_bytes: Maximum size of cached response bodies
+        raw_archive_dir: Directory for archiving raw response bytes per
+            source (None disables archiving)
+        replay: If True, serve requests from raw_archive_dir instead of
+            the network
+        adaptive_rate_limit: If True, use the process-wide adaptive limiter
+            for base_url's domain; requests_per_second is its starting rate
     """
 
     base_url: str
@@ -100,6 +122,13 @@ class DownloaderConfig:
     retry_base_delay: float = 1.0
     http_timeout: float = 30.0
     health_check_url: str = ""
+    max_concurrency: int = 1
+    completion_order: bool = False
+    cache_dir: str | None = None
+    cache_max_bytes: int = 1024**3
+    raw_archive_dir: str | None = None
+    replay: bool = False
+    adaptive_rate_limit: bool = False
 
 
 @dataclass
@@ -178,6 +207,9 @@ class BaseDownloader(ABC):
                 ...
     """
 
+    # How cached responses are reused when config.cache_dir is set
+    cache_policy: ClassVar[CachePolicy] = CachePolicy()
+
     def __init__(
         self,
         config: DownloaderConfig,
@@ -203,7 +235,12 @@ class BaseDownloader(ABC):
         # Initialize or use provided components
         self._http_client = http_client
         self._owns_http_client = http_client is None
+        self._raw_archive: RawResponseArchive | None = None
 
+        if rate_limiter is None and config.adaptive_rate_limit:
+            rate_limiter = shared_rate_limiter(
+                config.base_url, config.requests_per_second
+            )
         self._rate_limiter = rate_limiter or RateLimiter(
             requests_per_second=config.requests_per_second,
         )
@@ -264,11 +301,26 @@ class BaseDownloader(ABC):
         """
         ...
 
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        """Rate limiter pacing this downloader's requests.
+
+        Pass it to another downloader to make both share one request budget.
+        """
+        return self._rate_limiter
+
     async def __aenter__(self) -> BaseDownloader:
         """Enter async context and initialize HTTP client."""
         if self._http_client is None:
+            cache = None
+            if self.config.cache_dir is not None:
+                cache = shared_response_cache(
+                    self.config.cache_dir, max_bytes=self.config.cache_max_bytes
+                )
             self._http_client = HTTPClient(
-                HTTPClientConfig(timeout=self.config.http_timeout)
+                HTTPClientConfig(timeout=self.config.http_timeout),
+                cache=cache,
+                cache_policy=self.cache_policy,
             )
             await self._http_client._create_session()
         return self
@@ -280,6 +332,9 @@ class BaseDownloader(ABC):
         exc_tb: Any,
     ) -> None:
         """Exit async context and cleanup resources."""
+        if self._raw_archive is not None:
+            self._raw_archive.close()
+            self._raw_archive = None
         if self._owns_http_client and self._http_client is not None:
             await self._http_client.close()
             self._http_client = None
@@ -318,12 +373,44 @@ class BaseDownloader(ABC):
         Raises:
             DownloadError: If request fails after retries
         """
-        client = await self._ensure_client()
         url = f"{self.config.base_url.rstrip('/')}/{path.lstrip('/')}"
+        archive = self._get_raw_archive()
+
+        if self.config.replay:
+            if archive is None:
+                raise DownloadError(
+                    "Replay requires raw_archive_dir", source=self.source_name
+                )
+            archived = archive.replay(url, params)
+            if archived is None:
+                raise DownloadError(
+                    f"No archived response for {url}", source=self.source_name
+                )
+            return archived
+
+        client = await self._ensure_client()
+
+        # Fresh cache hits skip the rate limiter entirely
+        if self.config.cache_dir is not None:
+            cached = await client.cached_response(url, params=params)
+            if cached is not None:
+                if archive is not None:
+                    archive.record(url, params, cached)
+                return cached
 
         async def do_request() -> HTTPResponse:
-            await self._rate_limiter.wait()
+            # The URL selects a per-domain bucket when the limiter is shared
+            await self._rate_limiter.wait(url)
+            started = time.monotonic()
             response = await client.get(url, params=params)
+            # Cache hits say nothing about server latency or throttling
+            if not response.from_cache:
+                self._rate_limiter.record_response(
+                    url,
+                    throttled=response.is_throttled,
+                    latency=time.monotonic() - started,
+                    retry_after=response.retry_after,
+                )
 
             if response.is_rate_limited:
                 raise RetryableError(
@@ -342,11 +429,22 @@ class BaseDownloader(ABC):
 
             return response
 
-        return await self._retry_handler.execute(
+        response = await self._retry_handler.execute(
             do_request,
             operation_name=f"{self.source_name}:GET:{path}",
             source=self.source_name,
         )
+        if archive is not None and response.is_success:
+            archive.record(url, params, response)
+        return response
+
+    def _get_raw_archive(self) -> RawResponseArchive | None:
+        """Get the raw response archive, opening it on first use."""
+        if self._raw_archive is None and self.config.raw_archive_dir is not None:
+            self._raw_archive = RawResponseArchive(
+                self.config.raw_archive_dir, self.source_name
+            )
+        return self._raw_archive
 
     def _notify_progress(
         self,
@@ -413,70 +511,44 @@ class BaseDownloader(ABC):
     ) -> AsyncIterator[DownloadResult]:
         """Download all data for a season.
 
+        When ``config.max_concurrency`` is greater than 1, up to that many
+        games are downloaded at once. Every request still goes through the
+        shared rate limiter and retry handler, so concurrency only hides
+        round-trip latency; it never exceeds the configured request rate.
+
         Args:
             season_id: NHL season ID (e.g., 20242025)
             force: If True, re-download even if data exists
 
         Yields:
-            DownloadResult for each downloaded game
+            DownloadResult for each downloaded game, in schedule order unless
+            ``config.completion_order`` is set
 
         Raises:
             DownloadError: If a critical error prevents continuation
         """
         logger.info(
-            "%s: Starting season download for %d (force=%s)",
+            "%s: Starting season download for %d (force=%s, concurrency=%d)",
             self.source_name,
             season_id,
             force,
+            self.config.max_concurrency,
         )
 
         # Initialize progress tracking
         self._progress = DownloadProgress(source=self.source_name)
-        current_item = 0
 
         try:
-            async for game_id in self._fetch_season_games(season_id):
-                current_item += 1
-                self._progress.current_game_id = game_id
-
-                # Notify progress
-                self._notify_progress(
-                    current=current_item,
-                    total=self._progress.total_items,
-                    game_id=game_id,
-                    status=DownloadStatus.DOWNLOADING,
-                )
-
-                try:
-                    result = await self.download_game(game_id)
-                    self._update_progress(
-                        completed=result.is_successful,
-                        failed=not result.is_successful,
-                        game_id=game_id,
-                        error=result.error_message,
-                    )
+            if self.config.max_concurrency <= 1:
+                results = self._download_season_serial(season_id)
+            else:
+                results = self._download_season_concurrent(season_id)
+            try:
+                async for result in results:
                     yield result
-
-                except DownloadError as e:
-                    logger.warning(
-                        "%s: Failed to download game %d: %s",
-                        self.source_name,
-                        game_id,
-                        e,
-                    )
-                    self._update_progress(
-                        failed=True,
-                        game_id=game_id,
-                        error=str(e),
-                    )
-                    yield DownloadResult(
-                        source=self.source_name,
-                        season_id=season_id,
-                        game_id=game_id,
-                        data={},
-                        status=DownloadStatus.FAILED,
-                        error_message=str(e),
-                    )
+            finally:
+                # Cancels in-flight games if the consumer stops early
+                await results.aclose()
 
         finally:
             logger.info(
@@ -489,6 +561,177 @@ class BaseDownloader(ABC):
             )
             self._progress = None
 
+    async def _download_season_serial(
+        self, season_id: int
+    ) -> AsyncGenerator[DownloadResult, None]:
+        """Download season games one at a time.
+
+        Args:
+            season_id: NHL season ID
+
+        Yields:
+            DownloadResult for each game in schedule order
+        """
+        current_item = 0
+        async for game_id in self._fetch_season_games(season_id):
+            current_item += 1
+            self._start_season_game(current_item, game_id)
+            yield await self._download_season_game(season_id, game_id)
+
+    async def _download_season_concurrent(
+        self, season_id: int
+    ) -> AsyncGenerator[DownloadResult, None]:
+        """Download season games with bounded concurrency.
+
+        Game IDs are pulled from ``_fetch_season_games`` lazily, so no more
+        than ``config.max_concurrency`` downloads are pending at any time.
+        Outstanding tasks are cancelled if the consumer stops iterating.
+
+        Args:
+            season_id: NHL season ID
+
+        Yields:
+            DownloadResult for each game
+        """
+        current_item = 0
+
+        def start(game_id: int) -> Awaitable[DownloadResult]:
+            nonlocal current_item
+            current_item += 1
+            self._start_season_game(current_item, game_id)
+            return self._download_season_game(season_id, game_id)
+
+        results = self._iter_concurrent(self._fetch_season_games(season_id), start)
+        try:
+            async for result in results:
+                yield result
+        finally:
+            await results.aclose()
+
+    async def _iter_concurrent(
+        self,
+        items: Iterable[_T] | AsyncIterator[_T],
+        worker: Callable[[_T], Awaitable[_R]],
+        *,
+        in_order: bool | None = None,
+    ) -> AsyncGenerator[_R, None]:
+        """Run ``worker`` over ``items`` with bounded concurrency.
+
+        At most ``config.max_concurrency`` workers are in flight; items are
+        pulled lazily as slots free up. Results come back in input order
+        unless ``config.completion_order`` is set. Outstanding tasks are
+        cancelled if the consumer stops iterating.
+
+        Args:
+            items: Items to process
+            worker: Coroutine function run once per item
+            in_order: Override ``config.completion_order`` for callers whose
+                results must stay in input order
+
+        Yields:
+            Worker results
+        """
+        max_in_flight = max(1, self.config.max_concurrency)
+        if in_order is None:
+            in_order = not self.config.completion_order
+        source = aiter(items) if isinstance(items, AsyncIterator) else iter(items)
+        pending: list[asyncio.Task[_R]] = []
+        exhausted = False
+
+        try:
+            while True:
+                # Top up the in-flight window
+                while not exhausted and len(pending) < max_in_flight:
+                    try:
+                        if isinstance(source, AsyncIterator):
+                            item = await anext(source)
+                        else:
+                            item = next(source)
+                    except (StopIteration, StopAsyncIteration):
+                        exhausted = True
+                        break
+                    pending.append(asyncio.ensure_future(worker(item)))
+
+                if not pending:
+                    return
+
+                if in_order:
+                    task = pending.pop(0)
+                    yield await task
+                else:
+                    done, _ = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in pending:
+                        if task in done:
+                            yield task.result()
+                    pending = [task for task in pending if task not in done]
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    def _start_season_game(self, current_item: int, game_id: int) -> None:
+        """Record that a season game download is starting.
+
+        Args:
+            current_item: 1-indexed position of the game in the season
+            game_id: NHL game ID
+        """
+        if self._progress is not None:
+            self._progress.current_game_id = game_id
+
+        self._notify_progress(
+            current=current_item,
+            total=self._progress.total_items if self._progress else None,
+            game_id=game_id,
+            status=DownloadStatus.DOWNLOADING,
+        )
+
+    async def _download_season_game(
+        self, season_id: int, game_id: int
+    ) -> DownloadResult:
+        """Download one game of a season, converting errors to results.
+
+        Args:
+            season_id: NHL season ID
+            game_id: NHL game ID
+
+        Returns:
+            DownloadResult, with FAILED status if the download raised
+        """
+        try:
+            result = await self.download_game(game_id)
+            self._update_progress(
+                completed=result.is_successful,
+                failed=not result.is_successful,
+                game_id=game_id,
+                error=result.error_message,
+            )
+            return result
+
+        except DownloadError as e:
+            logger.warning(
+                "%s: Failed to download game %d: %s",
+                self.source_name,
+                game_id,
+                e,
+            )
+            self._update_progress(
+                failed=True,
+                game_id=game_id,
+                error=str(e),
+            )
+            return DownloadResult(
+                source=self.source_name,
+                season_id=season_id,
+                game_id=game_id,
+                data={},
+                status=DownloadStatus.FAILED,
+                error_message=str(e),
+            )
+
     async def download_game(self, game_id: int) -> DownloadResult:
         """Download data for a specific game.
 
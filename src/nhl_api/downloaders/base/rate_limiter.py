@@ -5,6 +5,8 @@ This module implements a token bucket rate limiter that supports:
 - Per-domain rate limiting
 - Async-compatible (asyncio)
 - Burst capacity for handling request spikes
+- Adaptive (AIMD) rates driven by 429/503 responses and Retry-After
+- Process-wide limiters shared by every downloader hitting a domain
 
 Example usage:
     limiter = RateLimiter(requests_per_second=10.0)
@@ -17,12 +19,20 @@ Example usage:
 
     async with limiter.acquire(domain="api.nhl.com"):
         response = await client.get(url)
+
+    # Adaptive: feed responses back so the rate tracks what the host allows
+    limiter = shared_rate_limiter("https://api-web.nhle.com/v1", 5.0)
+    await limiter.wait()
+    response = await client.get(url)
+    limiter.record_response(url, throttled=response.is_throttled, latency=elapsed)
+    print(shared_rate_stats())
 """
 
 from __future__ import annotations
 
 import asyncio
 import time
+import weakref
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
@@ -31,6 +41,9 @@ from urllib.parse import urlparse
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
 
+# Weight of the newest sample in the latency moving average
+_LATENCY_SMOOTHING = 0.2
+
 
 @dataclass
 class TokenBucket:
@@ -89,6 +102,76 @@ class TokenBucket:
         tokens_needed = 1.0 - self.tokens
         return tokens_needed / self.refill_rate
 
+    def set_rate(self, refill_rate: float) -> None:
+        """Change the refill rate, keeping tokens earned at the old rate.
+
+        Args:
+            refill_rate: New tokens added per second
+        """
+        self.refill()
+        self.refill_rate = refill_rate
+
+    def pause(self, seconds: float) -> None:
+        """Hold back the next token for at least ``seconds``.
+
+        Args:
+            seconds: Time before another request may proceed
+        """
+        self.refill()
+        self.tokens = min(self.tokens, 1.0 - seconds * self.refill_rate)
+
+
+@dataclass(frozen=True, slots=True)
+class AdaptiveRateConfig:
+    """Tuning for adaptive (AIMD) rate limiting.
+
+    While responses stay healthy the rate grows by ``additive_increase``
+    requests per second for each second's worth of requests. A 429 or 503
+    response, or any Retry-After header, multiplies the rate by
+    ``multiplicative_decrease``; further cuts wait ``decrease_cooldown``
+    seconds so one burst of throttled in-flight requests counts once.
+
+    Attributes:
+        min_rate: Lowest rate in requests per second
+        max_rate: Highest rate (None allows 4x the starting rate)
+        additive_increase: Rate added per second of healthy requests
+        multiplicative_decrease: Factor applied to the rate when throttled
+        decrease_cooldown: Minimum seconds between two rate cuts
+    """
+
+    min_rate: float = 0.5
+    max_rate: float | None = None
+    additive_increase: float = 0.5
+    multiplicative_decrease: float = 0.5
+    decrease_cooldown: float = 1.0
+
+    def __post_init__(self) -> None:
+        """Validate configuration values."""
+        if self.min_rate <= 0:
+            raise ValueError("min_rate must be positive")
+        if self.max_rate is not None and self.max_rate < self.min_rate:
+            raise ValueError("max_rate must be at least min_rate")
+        if not 0 < self.multiplicative_decrease < 1:
+            raise ValueError("multiplicative_decrease must be between 0 and 1")
+
+
+@dataclass
+class RateStats:
+    """Observed rate and latency for one bucket.
+
+    Attributes:
+        requests_per_second: Current allowed request rate
+        latency_ms: Moving average response latency (None until measured)
+        requests: Responses recorded
+        throttled: Responses that were 429/503 or carried Retry-After
+    """
+
+    requests_per_second: float
+    latency_ms: float | None = None
+    requests: int = 0
+    throttled: int = 0
+    last_decrease: float = field(default=float("-inf"), repr=False)
+
 
 class RateLimiter:
     """Async-compatible rate limiter using token bucket algorithm.
@@ -107,6 +190,7 @@ class RateLimiter:
         requests_per_second: float = 10.0,
         burst_size: float | None = None,
         per_domain: bool = False,
+        adaptive: AdaptiveRateConfig | None = None,
     ) -> None:
         """Initialize the rate limiter.
 
@@ -115,6 +199,8 @@ class RateLimiter:
             burst_size: Maximum burst capacity. Defaults to requests_per_second,
                         allowing brief bursts up to this limit.
             per_domain: If True, maintain separate rate limits per domain
+            adaptive: If set, requests_per_second is only the starting rate;
+                      record_response() raises or cuts it per bucket
         """
         if requests_per_second <= 0:
             raise ValueError("requests_per_second must be positive")
@@ -126,9 +212,13 @@ class RateLimiter:
             1.0, burst_size if burst_size is not None else requests_per_second
         )
         self.per_domain = per_domain
+        self.adaptive = adaptive
 
-        # Lock to ensure thread-safe bucket access
-        self._lock = asyncio.Lock()
+        # Bucket locks, one per event loop: shared limiters outlive the loop
+        # that first used them (asyncio.run() per CLI command, per test)
+        self._locks: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Lock
+        ] = weakref.WeakKeyDictionary()
 
         # Global bucket (used when per_domain is False)
         self._global_bucket = TokenBucket(
@@ -139,6 +229,18 @@ class RateLimiter:
         # Per-domain buckets (used when per_domain is True)
         self._domain_buckets: dict[str, TokenBucket] = {}
 
+        # Observed rate and latency, keyed like the buckets (None = global)
+        self._stats: dict[str | None, RateStats] = {}
+
+    @property
+    def _lock(self) -> asyncio.Lock:
+        """Get the bucket lock for the running event loop."""
+        loop = asyncio.get_running_loop()
+        lock = self._locks.get(loop)
+        if lock is None:
+            lock = self._locks[loop] = asyncio.Lock()
+        return lock
+
     def _get_bucket(self, domain: str | None = None) -> TokenBucket:
         """Get the appropriate token bucket.
 
@@ -158,6 +260,13 @@ class RateLimiter:
             )
         return self._domain_buckets[domain]
 
+    @staticmethod
+    def _normalize_domain(domain: str | None) -> str | None:
+        """Reduce a URL to its domain; plain domains pass through."""
+        if domain and ("://" in domain or "/" in domain):
+            return RateLimiter.extract_domain(domain)
+        return domain
+
     @staticmethod
     def extract_domain(url: str) -> str:
         """Extract domain from a URL.
@@ -181,12 +290,12 @@ class RateLimiter:
             Time waited in seconds
         """
         # Extract domain from URL if provided
-        if domain and ("://" in domain or "/" in domain):
-            domain = self.extract_domain(domain)
+        domain = self._normalize_domain(domain)
 
         total_wait = 0.0
+        lock = self._lock
 
-        async with self._lock:
+        async with lock:
             bucket = self._get_bucket(domain)
 
             while not bucket.try_consume():
@@ -194,11 +303,11 @@ class RateLimiter:
                 if wait_time > 0:
                     total_wait += wait_time
                     # Release lock while sleeping
-                    self._lock.release()
+                    lock.release()
                     try:
                         await asyncio.sleep(wait_time)
                     finally:
-                        await self._lock.acquire()
+                        await lock.acquire()
                     # Retry consumption after wait
 
         return total_wait
@@ -234,6 +343,91 @@ class RateLimiter:
         """
         return _RateLimitContext(self, domain)
 
+    def record_response(
+        self,
+        domain: str | None = None,
+        *,
+        throttled: bool = False,
+        latency: float | None = None,
+        retry_after: float | None = None,
+    ) -> None:
+        """Record a response so adaptive limiting can adjust the rate.
+
+        Latency and counts are tracked for every limiter; the rate itself
+        only changes when ``adaptive`` is configured.
+
+        Args:
+            domain: Domain name or URL the request went to
+            throttled: Whether the response was a 429/503 or had Retry-After
+            latency: Request duration in seconds
+            retry_after: Retry-After delay from the response, in seconds
+        """
+        domain = self._normalize_domain(domain)
+        bucket = self._get_bucket(domain)
+        stats = self._get_stats(domain, bucket)
+
+        stats.requests += 1
+        if latency is not None:
+            sample = latency * 1000
+            stats.latency_ms = (
+                sample
+                if stats.latency_ms is None
+                else stats.latency_ms + _LATENCY_SMOOTHING * (sample - stats.latency_ms)
+            )
+
+        throttled = throttled or retry_after is not None
+        if throttled:
+            stats.throttled += 1
+
+        if self.adaptive is None:
+            return
+
+        rate = bucket.refill_rate
+        if throttled:
+            now = time.monotonic()
+            if now - stats.last_decrease >= self.adaptive.decrease_cooldown:
+                rate = max(
+                    self.adaptive.min_rate,
+                    rate * self.adaptive.multiplicative_decrease,
+                )
+                stats.last_decrease = now
+            bucket.set_rate(rate)
+            if retry_after is not None:
+                bucket.pause(retry_after)
+        else:
+            max_rate = self.adaptive.max_rate or 4 * self.requests_per_second
+            # One second's worth of requests adds additive_increase
+            rate = min(max_rate, rate + self.adaptive.additive_increase / rate)
+            bucket.set_rate(rate)
+
+        stats.requests_per_second = bucket.refill_rate
+
+    def _get_stats(self, domain: str | None, bucket: TokenBucket) -> RateStats:
+        """Get the stats entry for a bucket, creating it on first use."""
+        key = domain if self.per_domain else None
+        if key not in self._stats:
+            self._stats[key] = RateStats(requests_per_second=bucket.refill_rate)
+        return self._stats[key]
+
+    def get_stats(self, domain: str | None = None) -> RateStats:
+        """Get the current rate and latency for a bucket.
+
+        Args:
+            domain: Domain name or URL for per-domain limiting
+
+        Returns:
+            Snapshot of the bucket's rate statistics
+        """
+        domain = self._normalize_domain(domain)
+        bucket = self._get_bucket(domain)
+        stats = self._get_stats(domain, bucket)
+        return RateStats(
+            requests_per_second=bucket.refill_rate,
+            latency_ms=stats.latency_ms,
+            requests=stats.requests,
+            throttled=stats.throttled,
+        )
+
     @property
     def domain_count(self) -> int:
         """Return the number of tracked domains."""
@@ -274,6 +468,52 @@ class RateLimiter:
             self._global_bucket.last_refill = time.monotonic()
 
 
+# Process-wide adaptive limiters, one per domain
+_shared_limiters: dict[str, RateLimiter] = {}
+
+
+def shared_rate_limiter(
+    url: str,
+    requests_per_second: float,
+    adaptive: AdaptiveRateConfig | None = None,
+) -> RateLimiter:
+    """Get the process-wide adaptive limiter for a URL's domain.
+
+    Every downloader hitting the same host shares one limiter, so throttling
+    seen by one slows all of them down and healthy responses speed all of
+    them up. The first caller for a domain sets its starting rate.
+
+    Args:
+        url: Base URL or domain the downloader requests
+        requests_per_second: Starting rate if the limiter is new
+        adaptive: AIMD tuning if the limiter is new (defaults apply if None)
+
+    Returns:
+        Shared RateLimiter for the domain
+    """
+    domain = RateLimiter._normalize_domain(url) or url
+    if domain not in _shared_limiters:
+        _shared_limiters[domain] = RateLimiter(
+            requests_per_second=requests_per_second,
+            adaptive=adaptive or AdaptiveRateConfig(),
+        )
+    return _shared_limiters[domain]
+
+
+def shared_rate_stats() -> dict[str, RateStats]:
+    """Get the current rate and latency of every shared limiter.
+
+    Returns:
+        Mapping of domain to its rate statistics
+    """
+    return {domain: limiter.get_stats() for domain, limiter in _shared_limiters.items()}
+
+
+def clear_shared_rate_limiters() -> None:
+    """Forget all shared limiters (their rates restart on next use)."""
+    _shared_limiters.clear()
+
+
 class _RateLimitContext:
     """Async context manager wrapper for rate limiter."""
 
@@ -0,0 +1,138 @@
+"""Raw response archive and offline replay for downloaders.
+
+When ``DownloaderConfig.raw_archive_dir`` is set, every successful response
+fetched through ``BaseDownloader._get`` is archived byte-for-byte, keyed by
+source and request URL (which embeds the game ID for game-level endpoints).
+With ``replay=True`` the downloader reads responses back from the archive
+instead of the network, so a whole season can be re-parsed and persisted at
+disk speed after a parser fix. A replayed archive is also a deterministic
+local stand-in for the NHL API in benchmarks and tests.
+
+Storage Structure:
+    {raw_archive_dir}/{source_name}.pack
+
+Each source uses the packed, per-entry compressed archive format shared
+with the HTML report archives (see nhl_api.utils.pack_archive). A response
+whose status and body match the archived copy is not appended again, so
+re-downloading a season does not grow the archive.
+
+Example:
+    config = BoxscoreDownloaderConfig(raw_archive_dir="data/raw")
+    async with BoxscoreDownloader(config) as downloader:
+        await downloader.download_game(2024020500)  # fetched and archived
+
+    replay = BoxscoreDownloaderConfig(raw_archive_dir="data/raw", replay=True)
+    async with BoxscoreDownloader(replay) as downloader:
+        await downloader.download_game(2024020500)  # read from disk
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from nhl_api.utils.http_client import ContentType, HTTPResponse
+from nhl_api.utils.pack_archive import ARCHIVE_SUFFIX, PackArchive
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+class RawResponseArchive:
+    """Archive of raw response bodies for one downloader source."""
+
+    def __init__(self, directory: Path | str, source: str) -> None:
+        """Initialize the archive.
+
+        Args:
+            directory: Directory holding one archive file per source
+            source: Downloader source name (e.g., "nhl_json_boxscore")
+        """
+        self.source = source
+        self.path = Path(directory) / f"{source}{ARCHIVE_SUFFIX}"
+        self._archive = PackArchive(self.path)
+
+    @staticmethod
+    def make_key(url: str, params: Mapping[str, str] | None = None) -> int:
+        """Build the archive key for a request.
+
+        Args:
+            url: Request URL
+            params: Query parameters
+
+        Returns:
+            Stable 63-bit key for the URL and parameters
+        """
+        query = "&".join(f"{k}={v}" for k, v in sorted((params or {}).items()))
+        digest = hashlib.blake2b(f"{url}?{query}".encode(), digest_size=8).digest()
+        return int.from_bytes(digest, "big") >> 1
+
+    def record(
+        self,
+        url: str,
+        params: Mapping[str, str] | None,
+        response: HTTPResponse,
+    ) -> None:
+        """Archive a response's raw bytes.
+
+        Responses identical to the archived copy are skipped; only their
+        headers (e.g. Date) would differ.
+
+        Args:
+            url: Request URL
+            params: Query parameters
+            response: Response to archive
+        """
+        archived = self.replay(url, params)
+        if (
+            archived is not None
+            and archived.status == response.status
+            and archived.content == response.content
+        ):
+            return
+        header = json.dumps(
+            {
+                "url": response.url,
+                "status": response.status,
+                "content_type": response.content_type.value,
+                "headers": response.headers,
+            }
+        ).encode()
+        self._archive.save(
+            self.make_key(url, params), header + b"\n" + response.content
+        )
+
+    def replay(
+        self, url: str, params: Mapping[str, str] | None = None
+    ) -> HTTPResponse | None:
+        """Rebuild an archived response.
+
+        Args:
+            url: Request URL
+            params: Query parameters
+
+        Returns:
+            The archived response, or None if the request was never archived
+        """
+        payload = self._archive.load(self.make_key(url, params))
+        if payload is None:
+            return None
+        header, _, content = payload.partition(b"\n")
+        meta = json.loads(header)
+        return HTTPResponse(
+            status=meta["status"],
+            headers=meta["headers"],
+            content=content,
+            url=meta["url"],
+            content_type=ContentType(meta["content_type"]),
+        )
+
+    def __len__(self) -> int:
+        """Number of archived responses."""
+        return len(self._archive)
+
+    def close(self) -> None:
+        """Close the underlying archive file."""
+        self._archive.close()
@@ -9,6 +9,17 @@ with the database via ProgressRepository. It supports:
 - Real-time callbacks for UI updates
 - Aggregated statistics for monitoring
 - Batch operations for efficient tracking
+- Write-behind mode that buffers state transitions and flushes them in
+  batched statements
+
+With ``write_behind=True`` transitions are applied to the database when
+``flush_size`` updates are buffered, when ``flush_interval`` seconds have
+passed since the last flush, and on ``close()``. A background task flushes
+the buffer once the interval has passed even if no further updates arrive,
+so an idle tracker does not hold its last updates until shutdown. Updates buffered at a crash
+are lost, so the affected items still read as pending or failed in the
+database and are downloaded again on resume; download persistence is
+idempotent, so replaying them is safe.
 
 Example usage:
     from nhl_api.downloaders.progress import ProgressTracker
@@ -39,12 +50,18 @@ Example usage:
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
+import time
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
+from types import TracebackType
 from typing import TYPE_CHECKING, Protocol
 
+from nhl_api.services.db.progress_repo import ProgressUpdate
+
 if TYPE_CHECKING:
     from collections.abc import Callable
 
@@ -52,6 +69,10 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Write-behind flush thresholds
+DEFAULT_FLUSH_SIZE = 100
+DEFAULT_FLUSH_INTERVAL = 5.0
+
 
 class ProgressState(Enum):
     """State of a download item."""
@@ -200,6 +221,9 @@ class ProgressTracker:
         season_id: int | None = None,
         batch_id: int | None = None,
         on_progress: ProgressCallback | Callable[[ProgressEvent], None] | None = None,
+        write_behind: bool = False,
+        flush_size: int = DEFAULT_FLUSH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
     ) -> None:
         """Initialize the progress tracker.
 
@@ -209,6 +233,9 @@ class ProgressTracker:
             season_id: Season identifier (optional).
             batch_id: Batch identifier for grouping (optional).
             on_progress: Callback for progress updates.
+            write_behind: Buffer state transitions and write them in batches.
+            flush_size: Buffered updates that trigger a flush.
+            flush_interval: Seconds since the last flush that trigger a flush.
         """
         self._repo = repository
         self._source_id = source_id
@@ -216,6 +243,15 @@ class ProgressTracker:
         self._batch_id = batch_id
         self._on_progress = on_progress
 
+        # Write-behind buffer, one merged update per progress_id
+        self._write_behind = write_behind
+        self._flush_size = flush_size
+        self._flush_interval = flush_interval
+        self._pending_writes: dict[int, ProgressUpdate] = {}
+        self._last_flush = time.monotonic()
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: asyncio.Task[None] | None = None
+
         # In-memory state
         self._items: dict[str, _ItemState] = {}
         self._stats = ProgressStats()
@@ -247,6 +283,11 @@ class ProgressTracker:
         """Check if all registered items are processed."""
         return self._stats.is_complete
 
+    @property
+    def pending_writes(self) -> int:
+        """Number of buffered updates not yet written to the database."""
+        return len(self._pending_writes)
+
     async def load_state(self) -> int:
         """Load existing progress state from database.
 
@@ -257,6 +298,8 @@ class ProgressTracker:
         Returns:
             Number of entries loaded from database.
         """
+        await self.flush()
+
         # Load incomplete items (pending + failed)
         entries = await self._repo.get_incomplete(self._source_id, self._season_id)
 
@@ -343,13 +386,34 @@ class ProgressTracker:
     async def register_items(self, item_keys: list[str]) -> None:
         """Register multiple items for tracking.
 
-        More efficient than calling register_item individually.
+        Creates all missing database entries in a single statement.
 
         Args:
             item_keys: List of unique identifiers.
         """
-        for item_key in item_keys:
-            await self.register_item(item_key)
+        new_keys = [
+            key
+            for key in item_keys
+            if key not in self._items or self._items[key].progress_id is None
+        ]
+        progress_ids = await self._repo.upsert_progress_many(
+            self._source_id,
+            new_keys,
+            season_id=self._season_id,
+            batch_id=self._batch_id,
+            status="pending",
+        )
+
+        for item_key, progress_id in progress_ids.items():
+            if item_key not in self._items:
+                self._items[item_key] = _ItemState(
+                    key=item_key,
+                    state=ProgressState.PENDING,
+                    progress_id=progress_id,
+                )
+                self._stats.pending += 1
+            else:
+                self._items[item_key].progress_id = progress_id
 
         if self._stats.total is None:
             self._stats.total = len(self._items)
@@ -426,7 +490,10 @@ class ProgressTracker:
 
         # Update database
         if item.progress_id is not None:
-            await self._repo.increment_attempts(item.progress_id)
+            if self._write_behind:
+                await self._buffer(ProgressUpdate(item.progress_id, attempts_added=1))
+            else:
+                await self._repo.increment_attempts(item.progress_id)
 
         # Notify callback
         self._notify(item_key, ProgressState.IN_PROGRESS)
@@ -466,11 +533,21 @@ class ProgressTracker:
 
         # Update database
         if item.progress_id is not None:
-            await self._repo.mark_success(
-                item.progress_id,
-                response_size_bytes=response_size_bytes,
-                response_time_ms=response_time_ms,
-            )
+            if self._write_behind:
+                await self._buffer(
+                    ProgressUpdate(
+                        item.progress_id,
+                        status="success",
+                        response_size_bytes=response_size_bytes,
+                        response_time_ms=response_time_ms,
+                    )
+                )
+            else:
+                await self._repo.mark_success(
+                    item.progress_id,
+                    response_size_bytes=response_size_bytes,
+                    response_time_ms=response_time_ms,
+                )
 
         # Notify callback
         self._notify(item_key, ProgressState.SUCCESS)
@@ -502,7 +579,14 @@ class ProgressTracker:
 
         # Update database
         if item.progress_id is not None:
-            await self._repo.mark_failed(item.progress_id, error_message)
+            if self._write_behind:
+                await self._buffer(
+                    ProgressUpdate(
+                        item.progress_id, status="failed", error_message=error_message
+                    )
+                )
+            else:
+                await self._repo.mark_failed(item.progress_id, error_message)
 
         # Notify callback
         self._notify(item_key, ProgressState.FAILED, message=error_message)
@@ -538,7 +622,14 @@ class ProgressTracker:
 
         # Update database
         if item.progress_id is not None:
-            await self._repo.mark_skipped(item.progress_id, reason)
+            if self._write_behind:
+                await self._buffer(
+                    ProgressUpdate(
+                        item.progress_id, status="skipped", error_message=reason
+                    )
+                )
+            else:
+                await self._repo.mark_skipped(item.progress_id, reason)
 
         # Notify callback
         self._notify(item_key, ProgressState.SKIPPED, message=reason)
@@ -551,6 +642,9 @@ class ProgressTracker:
         Returns:
             Number of items reset.
         """
+        # Buffered failures must land before the reset, not after it
+        await self.flush()
+
         # Reset in database
         count = await self._repo.reset_failed(self._source_id, self._season_id)
 
@@ -568,6 +662,91 @@ class ProgressTracker:
         logger.info("Reset %d failed items to pending", count)
         return count
 
+    async def flush(self) -> int:
+        """Write buffered updates to the database.
+
+        A no-op unless write-behind mode has buffered updates. If the write
+        fails, the updates are kept and retried by the next flush.
+
+        Returns:
+            Number of updates written.
+        """
+        async with self._flush_lock:
+            self._last_flush = time.monotonic()
+            if not self._pending_writes:
+                return 0
+
+            batch = self._pending_writes
+            self._pending_writes = {}
+            try:
+                await self._repo.apply_updates(list(batch.values()))
+            except BaseException:
+                # Put the batch back ahead of anything buffered while writing
+                for progress_id, later in self._pending_writes.items():
+                    batch[progress_id] = (
+                        batch[progress_id].combine(later)
+                        if progress_id in batch
+                        else later
+                    )
+                self._pending_writes = batch
+                raise
+
+        logger.debug("Flushed %d progress updates", len(batch))
+        return len(batch)
+
+    async def close(self) -> None:
+        """Stop the background flush and write buffered updates."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flush_task
+            self._flush_task = None
+        await self.flush()
+
+    async def __aenter__(self) -> ProgressTracker:
+        """Enter async context."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Exit async context, flushing buffered updates."""
+        await self.close()
+
+    async def _buffer(self, update: ProgressUpdate) -> None:
+        """Buffer an update and flush if a threshold is reached.
+
+        Args:
+            update: Update for one progress entry.
+        """
+        earlier = self._pending_writes.get(update.progress_id)
+        self._pending_writes[update.progress_id] = (
+            earlier.combine(update) if earlier is not None else update
+        )
+
+        if (
+            len(self._pending_writes) >= self._flush_size
+            or time.monotonic() - self._last_flush >= self._flush_interval
+        ):
+            await self.flush()
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_when_idle())
+
+    async def _flush_when_idle(self) -> None:
+        """Flush the buffer once the interval passes without another flush."""
+        while self._pending_writes:
+            delay = self._last_flush + self._flush_interval - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+            try:
+                await self.flush()
+            except Exception:
+                logger.warning("Background progress flush failed", exc_info=True)
+
     def get_item_state(self, item_key: str) -> ProgressState | None:
         """Get the current state of an item.
 
@@ -5,6 +5,7 @@ information from DailyFaceoff.com.
 
 Available downloaders:
 - BaseDailyFaceoffDownloader: Base class for all DailyFaceoff downloaders
+- TeamPageCache: Shares fetched team pages between downloaders
 - LineCombinationsDownloader: Forward lines, defense pairs, and goalies
 - PenaltyKillDownloader: Penalty kill unit configurations (PK1, PK2)
 - PowerPlayDownloader: Download power play unit configurations (PP1, PP2)
@@ -44,6 +45,7 @@ from nhl_api.downloaders.sources.dailyfaceoff.base_dailyfaceoff_downloader impor
     DAILYFACEOFF_CONFIG,
     BaseDailyFaceoffDownloader,
     DailyFaceoffConfig,
+    TeamPageCache,
 )
 from nhl_api.downloaders.sources.dailyfaceoff.injuries import (
     InjuryDownloader,
@@ -89,6 +91,7 @@ __all__ = [
     "BaseDailyFaceoffDownloader",
     "DAILYFACEOFF_CONFIG",
     "DailyFaceoffConfig",
+    "TeamPageCache",
     # Injuries
     "InjuryDownloader",
     "InjuryRecord",
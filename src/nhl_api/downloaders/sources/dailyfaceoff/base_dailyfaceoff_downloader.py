@@ -17,9 +17,11 @@ Example usage:
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from abc import abstractmethod
-from collections.abc import AsyncGenerator, Callable
+from collections.abc import AsyncGenerator, Awaitable, Callable
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
@@ -57,6 +59,9 @@ DEFAULT_DAILYFACEOFF_RATE_LIMIT = 1.0
 # User agent for requests
 DEFAULT_USER_AGENT = "NHL-API-Collector/1.0 (Data Research)"
 
+# How long a shared team page is reused before it is fetched again (seconds)
+DEFAULT_PAGE_TTL = 300.0
+
 
 @dataclass
 class DailyFaceoffConfig(DownloaderConfig):
@@ -85,6 +90,59 @@ class DailyFaceoffConfig(DownloaderConfig):
 DAILYFACEOFF_CONFIG = DailyFaceoffConfig()
 
 
+class TeamPageCache:
+    """Shares fetched team pages between DailyFaceoff downloaders.
+
+    Line combinations, power play, penalty kill and injuries are all parsed
+    from the same team page. Downloaders given the same cache fetch each page
+    once; concurrent requests for a page wait on the first fetch. Failed
+    fetches are not cached.
+
+    Example:
+        pages = TeamPageCache()
+        lines = LineCombinationsDownloader(config, page_cache=pages)
+        injuries = InjuryDownloader(config, page_cache=pages)
+    """
+
+    def __init__(self, ttl: float = DEFAULT_PAGE_TTL) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds a fetched page is reused
+        """
+        self.ttl = ttl
+        self._pages: dict[str, tuple[float, asyncio.Future[bytes]]] = {}
+
+    async def get(self, url: str, fetch: Callable[[], Awaitable[bytes]]) -> bytes:
+        """Get a page, fetching it if it is not cached or has expired.
+
+        Args:
+            url: Page URL
+            fetch: Coroutine function that fetches the page
+
+        Returns:
+            Raw page bytes
+        """
+        now = time.monotonic()
+        entry = self._pages.get(url)
+        if entry is None or now - entry[0] > self.ttl:
+            entry = (now, asyncio.ensure_future(fetch()))
+            self._pages[url] = entry
+        future = entry[1]
+
+        try:
+            # Shielded so one cancelled waiter does not cancel the others
+            return await asyncio.shield(future)
+        except Exception:
+            if self._pages.get(url) is entry:
+                del self._pages[url]
+            raise
+
+    def clear(self) -> None:
+        """Drop all cached pages."""
+        self._pages.clear()
+
+
 class BaseDailyFaceoffDownloader(BaseDownloader):
     """Abstract base class for DailyFaceoff downloaders.
 
@@ -96,7 +154,7 @@ class BaseDailyFaceoffDownloader(BaseDownloader):
     Subclasses must implement:
     - data_type: Property returning the type of data being downloaded
     - page_path: Property returning the page path for the data type
-    - _parse_page: Method to parse the HTML into structured data
+    - _parse_page_sync: Method to parse the HTML into structured data
 
     Example:
         class LineCombinationsDownloader(BaseDailyFaceoffDownloader):
@@ -108,7 +166,7 @@ class BaseDailyFaceoffDownloader(BaseDownloader):
             def page_path(self) -> str:
                 return "line-combinations"
 
-            async def _parse_page(
+            def _parse_page_sync(
                 self, soup: BeautifulSoup, team_id: int
             ) -> dict[str, Any]:
                 # Extract line combination data from HTML
@@ -128,6 +186,7 @@ class BaseDailyFaceoffDownloader(BaseDownloader):
         retry_handler: RetryHandler | None = None,
         progress_callback: Callable[..., None] | None = None,
         team_ids: list[int] | None = None,
+        page_cache: TeamPageCache | None = None,
     ) -> None:
         """Initialize the DailyFaceoff downloader.
 
@@ -138,6 +197,7 @@ class BaseDailyFaceoffDownloader(BaseDownloader):
             retry_handler: Optional custom retry handler
             progress_callback: Optional callback for progress updates
             team_ids: Optional list of team IDs to download (default: all active teams)
+            page_cache: Optional cache sharing team pages with other downloaders
         """
         super().__init__(
             config or DailyFaceoffConfig(),
@@ -152,6 +212,7 @@ class BaseDailyFaceoffDownloader(BaseDownloader):
             for tid in TEAM_SLUGS.keys()
             if tid != 53  # Exclude Arizona (relocated)
         ]
+        self._page_cache = page_cache
         self._config: DailyFaceoffConfig  # Type hint for IDE
 
     @property
@@ -189,11 +250,12 @@ class BaseDailyFaceoffDownloader(BaseDownloader):
         return f"dailyfaceoff_{self.data_type}"
 
     @abstractmethod
-    async def _parse_page(self, soup: BeautifulSoup, team_id: int) -> dict[str, Any]:
+    def _parse_page_sync(self, soup: BeautifulSoup, team_id: int) -> dict[str, Any]:
         """Parse the DailyFaceoff page into structured data.
 
         This method should be implemented by subclasses to handle
-        page-specific parsing logic.
+        page-specific parsing logic. It does no I/O, so worker threads
+        call it directly.
 
         Args:
             soup: Parsed BeautifulSoup document
@@ -207,6 +269,18 @@ class BaseDailyFaceoffDownloader(BaseDownloader):
         """
         ...
 
+    async def _parse_page(self, soup: BeautifulSoup, team_id: int) -> dict[str, Any]:
+        """Parse the DailyFaceoff page into structured data.
+
+        Args:
+            soup: Parsed BeautifulSoup document
+            team_id: NHL team ID
+
+        Returns:
+            Parsed page data as a dictionary
+        """
+        return self._parse_page_sync(soup, team_id)
+
     def set_team_ids(self, team_ids: list[int]) -> None:
         """Set team IDs for bulk download.
 
@@ -348,31 +422,12 @@ class BaseDailyFaceoffDownloader(BaseDownloader):
         )
 
         try:
-            # Use relative path for _get() method
-            path = url.replace(self.config.base_url, "")
-            response = await self._get(path)
+            raw_content = await self._fetch_team_page(url)
 
-            if not response.is_success:
-                raise DownloadError(
-                    f"Failed to fetch team page: HTTP {response.status}",
-                    source=self.source_name,
-                )
-
-            # Get raw content
-            raw_content = response.content
-
-            # Validate HTML content
-            if not self._validate_html(raw_content):
-                raise DownloadError(
-                    "Response is not valid HTML",
-                    source=self.source_name,
-                )
-
-            # Parse HTML
-            soup = self._parse_html(raw_content)
-
-            # Call subclass parser
-            parsed_data = await self._parse_page(soup, team_id)
+            # Parse HTML and call subclass parser off the event loop
+            parsed_data = await asyncio.to_thread(
+                self._parse_team_page, raw_content, team_id
+            )
 
             return DownloadResult(
                 source=self.source_name,
@@ -401,11 +456,75 @@ class BaseDailyFaceoffDownloader(BaseDownloader):
                 cause=e,
             ) from e
 
+    async def _fetch_team_page(self, url: str) -> bytes:
+        """Fetch a team page, through the shared page cache if one is set.
+
+        Args:
+            url: Full team page URL
+
+        Returns:
+            Raw HTML bytes
+
+        Raises:
+            DownloadError: If the page cannot be fetched or is not HTML
+        """
+        if self._page_cache is not None:
+            return await self._page_cache.get(url, lambda: self._request_team_page(url))
+        return await self._request_team_page(url)
+
+    async def _request_team_page(self, url: str) -> bytes:
+        """Request a team page from DailyFaceoff.
+
+        Args:
+            url: Full team page URL
+
+        Returns:
+            Raw HTML bytes
+
+        Raises:
+            DownloadError: If the page cannot be fetched or is not HTML
+        """
+        # Use relative path for _get() method
+        path = url.replace(self.config.base_url, "")
+        response = await self._get(path)
+
+        if not response.is_success:
+            raise DownloadError(
+                f"Failed to fetch team page: HTTP {response.status}",
+                source=self.source_name,
+            )
+
+        # Validate HTML content
+        if not self._validate_html(response.content):
+            raise DownloadError(
+                "Response is not valid HTML",
+                source=self.source_name,
+            )
+
+        return response.content
+
+    def _parse_team_page(self, content: bytes, team_id: int) -> dict[str, Any]:
+        """Parse a team page synchronously, for use in a worker thread.
+
+        Args:
+            content: Raw HTML bytes
+            team_id: NHL team ID
+
+        Returns:
+            Parsed page data as a dictionary
+        """
+        soup = self._parse_html(content)
+        return self._parse_page_sync(soup, team_id)
+
     async def download_all_teams(self) -> AsyncGenerator[DownloadResult, None]:
         """Download data for all configured teams.
 
+        Up to ``config.max_concurrency`` teams are fetched at once; every
+        request still passes the rate limiter.
+
         Yields:
-            DownloadResult for each team
+            DownloadResult for each team, in team order unless
+            ``config.completion_order`` is set
 
         Raises:
             DownloadError: If a critical error prevents continuation
@@ -419,41 +538,53 @@ class BaseDailyFaceoffDownloader(BaseDownloader):
         self.set_total_items(len(self._team_ids))
         current_item = 0
 
-        for team_id in self._team_ids:
+        def start(team_id: int) -> Awaitable[DownloadResult]:
+            nonlocal current_item
             current_item += 1
-            abbreviation = self._get_team_abbreviation(team_id)
 
             # Notify progress
             self._notify_progress(
                 current=current_item,
                 total=len(self._team_ids),
                 status=DownloadStatus.DOWNLOADING,
-                message=f"Downloading {abbreviation}",
+                message=f"Downloading {self._get_team_abbreviation(team_id)}",
             )
+            return self._download_team_or_failure(team_id)
 
-            try:
-                result = await self.download_team(team_id)
-                yield result
-
-            except DownloadError as e:
-                logger.warning(
-                    "%s: Failed to download team %s (%d): %s",
-                    self.source_name,
-                    abbreviation,
-                    team_id,
-                    e,
-                )
-                yield DownloadResult(
-                    source=self.source_name,
-                    season_id=0,
-                    game_id=0,
-                    data={"team_id": team_id, "team_abbreviation": abbreviation},
-                    status=DownloadStatus.FAILED,
-                    error_message=str(e),
-                )
+        async for result in self._iter_concurrent(self._team_ids, start):
+            yield result
 
         logger.info(
             "%s: Completed download for %d teams",
             self.source_name,
             len(self._team_ids),
         )
+
+    async def _download_team_or_failure(self, team_id: int) -> DownloadResult:
+        """Download one team, converting download errors to a FAILED result.
+
+        Args:
+            team_id: NHL team ID
+
+        Returns:
+            DownloadResult for the team
+        """
+        abbreviation = self._get_team_abbreviation(team_id)
+        try:
+            return await self.download_team(team_id)
+        except DownloadError as e:
+            logger.warning(
+                "%s: Failed to download team %s (%d): %s",
+                self.source_name,
+                abbreviation,
+                team_id,
+                e,
+            )
+            return DownloadResult(
+                source=self.source_name,
+                season_id=0,
+                game_id=0,
+                data={"team_id": team_id, "team_abbreviation": abbreviation},
+                status=DownloadStatus.FAILED,
+                error_message=str(e),
+            )
@@ -173,7 +173,7 @@ class InjuryDownloader(BaseDailyFaceoffDownloader):
         """
         return "line-combinations"
 
-    async def _parse_page(self, soup: BeautifulSoup, team_id: int) -> dict[str, Any]:
+    def _parse_page_sync(self, soup: BeautifulSoup, team_id: int) -> dict[str, Any]:
         """Parse injuries from the team's line combinations page.
 
         Args:
@@ -128,7 +128,7 @@ class PenaltyKillDownloader(BaseDailyFaceoffDownloader):
         """
         return "line-combinations"
 
-    async def _parse_page(self, soup: BeautifulSoup, team_id: int) -> dict[str, Any]:
+    def _parse_page_sync(self, soup: BeautifulSoup, team_id: int) -> dict[str, Any]:
         """Parse penalty kill units from the line combinations page.
 
         Args:
@@ -126,7 +126,7 @@ class PowerPlayDownloader(BaseDailyFaceoffDownloader):
         """Return URL path for line combinations page."""
         return "line-combinations"
 
-    async def _parse_page(self, soup: BeautifulSoup, team_id: int) -> dict[str, Any]:
+    def _parse_page_sync(self, soup: BeautifulSoup, team_id: int) -> dict[str, Any]:
         """Parse power play data from DailyFaceoff page.
 
         DailyFaceoff embeds lineup data as JSON in a __NEXT_DATA__ script tag.
@@ -189,7 +189,7 @@ class StartingGoaliesDownloader(BaseDailyFaceoffDownloader):
         """
         return "starting-goalies"
 
-    async def _parse_page(self, soup: BeautifulSoup, team_id: int) -> dict[str, Any]:
+    def _parse_page_sync(self, soup: BeautifulSoup, team_id: int) -> dict[str, Any]:
         """Not used for starting goalies.
 
         Starting goalies uses download_tonight() instead of team-based download.
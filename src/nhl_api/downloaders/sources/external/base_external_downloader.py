@@ -256,7 +256,6 @@ class BaseExternalDownloader(BaseDownloader):
         self._store_raw = (
             getattr(config, "store_raw_response", True) if config else True
         )
-        self._last_raw_content: bytes | None = None
 
     @property
     def source_category(self) -> str:
@@ -330,6 +329,12 @@ class BaseExternalDownloader(BaseDownloader):
         # We need to temporarily store headers for the request
         client = await self._ensure_client()
 
+        # Fresh cache hits (e.g. completed-season pages) skip the rate limiter
+        if self.config.cache_dir is not None:
+            cached = await client.cached_response(url, params=params)
+            if cached is not None:
+                return cached
+
         from nhl_api.downloaders.base.retry_handler import RetryableError
 
         async def do_request() -> HTTPResponse:
@@ -490,11 +495,8 @@ class BaseExternalDownloader(BaseDownloader):
             # Validate response
             await self._validate_response(response)
 
-            # Store raw content if configured
-            raw_content: bytes | None = None
-            if self._store_raw:
-                raw_content = response.content
-                self._last_raw_content = raw_content
+            # Carry raw content on the result if configured
+            raw_content = response.content if self._store_raw else None
 
             # Parse response
             try:
@@ -561,11 +563,7 @@ class BaseExternalDownloader(BaseDownloader):
         if validate:
             await self._validate_response(response)
 
-        content = response.content
-        if self._store_raw:
-            self._last_raw_content = content
-
-        return response, content
+        return response, response.content
 
     # =========================================================================
     # Default Implementations of Base Methods
@@ -629,12 +627,3 @@ class BaseExternalDownloader(BaseDownloader):
             Full URL string
         """
         return f"{self.config.base_url.rstrip('/')}/{path.lstrip('/')}"
-
-    @property
-    def last_raw_content(self) -> bytes | None:
-        """Get the raw content from the last request.
-
-        Useful for debugging or reprocessing.
-        Only available if store_raw_response=True in config.
-        """
-        return self._last_raw_content
@@ -11,13 +11,17 @@ from nhl_api.downloaders.sources.external.quanthockey.career_stats import (
     QuantHockeyCareerStatsDownloader,
 )
 from nhl_api.downloaders.sources.external.quanthockey.player_stats import (
+    BaseQuantHockeyDownloader,
     QuantHockeyConfig,
     QuantHockeyPlayerStatsDownloader,
+    is_completed_season_page,
 )
 
 __all__ = [
+    "BaseQuantHockeyDownloader",
     "CareerStatCategory",
     "QuantHockeyCareerStatsDownloader",
     "QuantHockeyConfig",
     "QuantHockeyPlayerStatsDownloader",
+    "is_completed_season_page",
 ]
@@ -28,25 +28,19 @@ from __future__ import annotations
 import logging
 import re
 from enum import Enum
-from typing import TYPE_CHECKING, Any
+from typing import Any, ClassVar
 
 from bs4 import BeautifulSoup, Tag
 
-from nhl_api.downloaders.sources.external.base_external_downloader import (
-    BaseExternalDownloader,
-    ContentParsingError,
-)
 from nhl_api.downloaders.sources.external.quanthockey.player_stats import (
-    QuantHockeyConfig,
+    BaseQuantHockeyDownloader,
 )
 from nhl_api.models.quanthockey import (
     QuantHockeyPlayerCareerStats,
     _safe_float,
     _safe_int,
 )
-
-if TYPE_CHECKING:
-    from nhl_api.utils.http_client import HTTPResponse
+from nhl_api.utils.http_client import CachePolicy
 
 logger = logging.getLogger(__name__)
 
@@ -56,6 +50,9 @@ PLAYERS_PER_PAGE = 20
 # Maximum pages to fetch (20 pages = 400 players)
 MAX_PAGES = 20
 
+# All-time leaderboards move slowly; cached pages are reused for a day
+CAREER_CACHE_MAX_AGE = 24 * 60 * 60.0
+
 
 class CareerStatCategory(Enum):
     """Categories for career statistics leaderboards.
@@ -88,7 +85,7 @@ CATEGORY_URL_MAP: dict[CareerStatCategory, str] = {
 }
 
 
-class QuantHockeyCareerStatsDownloader(BaseExternalDownloader):
+class QuantHockeyCareerStatsDownloader(BaseQuantHockeyDownloader):
     """Downloader for QuantHockey all-time career statistics.
 
     Fetches and parses career statistics from QuantHockey's all-time records pages.
@@ -96,7 +93,8 @@ class QuantHockeyCareerStatsDownloader(BaseExternalDownloader):
 
     Features:
     - Multiple category support (points, goals, assists, etc.)
-    - Pagination support (20 players per page)
+    - Pagination support (20 players per page), with pages after the first
+      fetched concurrently
     - Configurable top_n limit
     - Conservative rate limiting (1 req per 2 sec)
     - Robust HTML parsing with BeautifulSoup
@@ -111,20 +109,8 @@ class QuantHockeyCareerStatsDownloader(BaseExternalDownloader):
             )
     """
 
-    config: QuantHockeyConfig  # Type hint for IDE support
-
-    def __init__(
-        self,
-        config: QuantHockeyConfig | None = None,
-        **kwargs: Any,
-    ) -> None:
-        """Initialize the QuantHockey career stats downloader.
-
-        Args:
-            config: Downloader configuration (uses defaults if None)
-            **kwargs: Additional arguments for BaseExternalDownloader
-        """
-        super().__init__(config or QuantHockeyConfig(), **kwargs)
+    # Served from the response cache for a day when config.cache_dir is set
+    cache_policy: ClassVar[CachePolicy] = CachePolicy(max_age=CAREER_CACHE_MAX_AGE)
 
     @property
     def source_name(self) -> str:
@@ -251,7 +237,22 @@ class QuantHockeyCareerStatsDownloader(BaseExternalDownloader):
         Returns:
             List of player career statistics
         """
-        soup = BeautifulSoup(html_content, "lxml")
+        return self._parse_career_soup(BeautifulSoup(html_content, "lxml"), category)
+
+    def _parse_career_soup(
+        self,
+        soup: BeautifulSoup,
+        category: CareerStatCategory,
+    ) -> list[QuantHockeyPlayerCareerStats]:
+        """Parse career statistics from a parsed page.
+
+        Args:
+            soup: Parsed page
+            category: Statistics category being parsed
+
+        Returns:
+            List of player career statistics
+        """
         players: list[QuantHockeyPlayerCareerStats] = []
 
         # Find the main statistics table
@@ -293,76 +294,20 @@ class QuantHockeyCareerStatsDownloader(BaseExternalDownloader):
 
         return players
 
-    def _has_next_page(self, html_content: str, current_page: int) -> bool:
-        """Check if there's a next page of results.
-
-        Args:
-            html_content: Current page HTML content
-            current_page: Current page number
-
-        Returns:
-            True if next page exists
-        """
-        soup = BeautifulSoup(html_content, "lxml")
-
-        # Look for pagination links
-        next_page = current_page + 1
-
-        # Check for page=N links
-        page_link = soup.find("a", href=re.compile(rf"page={next_page}"))
-        if page_link:
-            return True
-
-        # Check for "Next" link
-        for link in soup.find_all("a"):
-            if isinstance(link, Tag):
-                link_text = link.get_text(strip=True)
-                if re.search(r"Next|►|>>", link_text):
-                    return True
-
-        # Check for numbered pagination
-        pagination = soup.find(class_=re.compile(r"pagination|pager"))
-        if pagination and isinstance(pagination, Tag):
-            links = pagination.find_all("a")
-            for link in links:
-                try:
-                    page_num = int(link.get_text(strip=True))
-                    if page_num > current_page:
-                        return True
-                except ValueError:
-                    continue
-
-        return False
-
-    # =========================================================================
-    # Abstract Method Implementation
-    # =========================================================================
-
-    async def _parse_response(
-        self,
-        response: HTTPResponse,
-        context: dict[str, Any],
-    ) -> dict[str, Any]:
-        """Parse QuantHockey response into structured data.
+    def _parse_players(
+        self, soup: BeautifulSoup, context: dict[str, Any]
+    ) -> list[QuantHockeyPlayerCareerStats]:
+        """Extract career stats from a parsed page.
 
         Args:
-            response: HTTP response
+            soup: Parsed page
             context: Request context (category, page)
 
         Returns:
-            Dictionary with parsed player data
+            List of player career statistics
         """
-        html_content = response.text()
         category = context.get("category", CareerStatCategory.POINTS)
-
-        players = self._parse_career_table(html_content, category)
-        has_next = self._has_next_page(html_content, context.get("page", 1))
-
-        return {
-            "players": [p.to_dict() for p in players],
-            "player_count": len(players),
-            "has_next_page": has_next,
-        }
+        return self._parse_career_soup(soup, category)
 
     # =========================================================================
     # Download Methods
@@ -378,7 +323,8 @@ class QuantHockeyCareerStatsDownloader(BaseExternalDownloader):
         """Download career statistics leaders for a category.
 
         Fetches all pages of career statistics up to the specified limits.
-        Uses rate limiting and retries for robust operation.
+        Pages after the first are fetched concurrently; every request still
+        uses rate limiting and retries.
 
         Args:
             category: Statistics category to fetch (points, goals, etc.)
@@ -393,7 +339,6 @@ class QuantHockeyCareerStatsDownloader(BaseExternalDownloader):
             ContentParsingError: If parsing fails
         """
         all_players: list[QuantHockeyPlayerCareerStats] = []
-        page = 1
 
         logger.info(
             "Starting QuantHockey career stats download for %s (top_n=%d, max_pages=%d)",
@@ -402,55 +347,34 @@ class QuantHockeyCareerStatsDownloader(BaseExternalDownloader):
             max_pages,
         )
 
-        while page <= max_pages:
-            url = self._build_category_url(category, page)
-            context = {"category": category, "page": page}
-
-            logger.debug("Fetching page %d: %s", page, url)
-
-            # Fetch and parse page
-            result = await self.fetch_resource(
-                url.replace(self.config.base_url, ""),
-                context=context,
-            )
-
-            data = result.data
-            if not isinstance(data, dict):
-                raise ContentParsingError(
-                    "Unexpected response format",
-                    source=self.source_name,
-                    url=url,
+        pages = self._iter_pages(
+            lambda page: self._build_category_url(category, page),
+            {"category": category},
+            max_pages,
+        )
+        try:
+            async for data in pages:
+                # Convert player dicts back to dataclass objects
+                players_data = data.get("players", [])
+                for p_dict in players_data:
+                    player = QuantHockeyPlayerCareerStats.from_dict(
+                        p_dict, validate=True
+                    )
+                    all_players.append(player)
+
+                logger.debug(
+                    "Fetched %d players (total: %d)",
+                    len(players_data),
+                    len(all_players),
                 )
 
-            # Convert player dicts back to dataclass objects
-            players_data = data.get("players", [])
-            for p_dict in players_data:
-                player = QuantHockeyPlayerCareerStats.from_dict(p_dict, validate=True)
-                all_players.append(player)
-
-            logger.debug(
-                "Page %d: fetched %d players (total: %d)",
-                page,
-                len(players_data),
-                len(all_players),
-            )
-
-            # Check if we've reached limits
-            if len(all_players) >= top_n:
-                all_players = all_players[:top_n]
-                logger.info("Reached top_n limit (%d)", top_n)
-                break
-
-            # Check for more pages
-            if not data.get("has_next_page", False):
-                logger.debug("No more pages available")
-                break
-
-            if len(players_data) == 0:
-                logger.debug("Empty page, stopping")
-                break
-
-            page += 1
+                # Check if we've reached limits
+                if len(all_players) >= top_n:
+                    all_players = all_players[:top_n]
+                    logger.info("Reached top_n limit (%d)", top_n)
+                    break
+        finally:
+            await pages.aclose()
 
         logger.info(
             "QuantHockey career stats download complete: %d players fetched for %s",
@@ -468,7 +392,8 @@ class QuantHockeyCareerStatsDownloader(BaseExternalDownloader):
         """Download leaders for all career stat categories.
 
         Convenience method to fetch top players across all categories.
-        Note: This makes multiple requests with rate limiting.
+        Categories are downloaded concurrently; all requests share the
+        rate limiter.
 
         Args:
             top_n: Maximum number of players per category
@@ -476,11 +401,18 @@ class QuantHockeyCareerStatsDownloader(BaseExternalDownloader):
         Returns:
             Dictionary mapping category to list of players
         """
-        results: dict[CareerStatCategory, list[QuantHockeyPlayerCareerStats]] = {}
+        categories = list(CareerStatCategory)
 
-        for category in CareerStatCategory:
+        async def download(
+            category: CareerStatCategory,
+        ) -> list[QuantHockeyPlayerCareerStats]:
             logger.info("Downloading %s leaders...", category.value)
-            leaders = await self.download_leaders(category, top_n=top_n)
-            results[category] = leaders
+            return await self.download_leaders(category, top_n=top_n)
 
-        return results
+        leaders = [
+            players
+            async for players in self._iter_concurrent(
+                categories, download, in_order=True
+            )
+        ]
+        return dict(zip(categories, leaders, strict=True))
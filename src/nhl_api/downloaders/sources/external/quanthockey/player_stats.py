@@ -20,11 +20,13 @@ Example usage:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
+from abc import abstractmethod
 from dataclasses import dataclass
-from datetime import UTC, datetime
-from typing import TYPE_CHECKING, Any
+from datetime import UTC, date, datetime
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from bs4 import BeautifulSoup, Tag
 
@@ -37,8 +39,11 @@ from nhl_api.models.quanthockey import (
     QuantHockeyPlayerSeasonStats,
     QuantHockeySeasonData,
 )
+from nhl_api.utils.http_client import CachePolicy
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Callable, Sequence
+
     from nhl_api.utils.http_client import HTTPResponse
 
 logger = logging.getLogger(__name__)
@@ -52,6 +57,12 @@ PLAYERS_PER_PAGE = 20
 # Maximum pages to fetch (20 pages = 400 players)
 MAX_PAGES = 20
 
+# Pages fetched at once once pagination is known (requests stay rate limited)
+DEFAULT_PAGE_CONCURRENCY = 4
+
+_SEASON_URL_PATTERN = re.compile(r"/seasons/(\d{4})-\d{2}-nhl-players-stats")
+_PAGE_LINK_PATTERN = re.compile(r"page=(\d+)")
+
 
 @dataclass
 class QuantHockeyConfig(ExternalDownloaderConfig):
@@ -63,32 +74,44 @@ class QuantHockeyConfig(ExternalDownloaderConfig):
         base_url: QuantHockey base URL
         requests_per_second: Rate limit (conservative for external site)
         retry_base_delay: Longer delay for external site retries
+        max_concurrency: Pages fetched at once after page discovery
     """
 
     base_url: str = "https://www.quanthockey.com"
     requests_per_second: float = QUANTHOCKEY_RATE_LIMIT
     retry_base_delay: float = 3.0  # Longer delay for external site
+    max_concurrency: int = DEFAULT_PAGE_CONCURRENCY
 
 
-class QuantHockeyPlayerStatsDownloader(BaseExternalDownloader):
-    """Downloader for QuantHockey player season statistics.
+def is_completed_season_page(response: HTTPResponse) -> bool:
+    """Check whether a season stats page is for a season that has ended.
 
-    Fetches and parses player statistics from QuantHockey's season pages.
-    The site provides comprehensive 51-field player statistics including
-    scoring, TOI, situational performance, and advanced metrics.
+    Stats for completed seasons never change, so their pages can be served
+    from the response cache without revalidation.
 
-    Features:
-    - Parse 51 fields per player from HTML tables
-    - Pagination support (20 players per page, up to 20 pages)
-    - Configurable max players limit
-    - Conservative rate limiting (1 req per 2 sec)
-    - Robust HTML parsing with BeautifulSoup
+    Args:
+        response: Response to inspect
 
-    Example:
-        config = QuantHockeyConfig()
-        async with QuantHockeyPlayerStatsDownloader(config) as downloader:
-            # Get top 100 players from 2024-25 season
-            stats = await downloader.download_player_stats(20242025, max_players=100)
+    Returns:
+        True if the URL names a season whose playoffs are over
+    """
+    match = _SEASON_URL_PATTERN.search(response.url)
+    if match is None:
+        return False
+    end_year = int(match.group(1)) + 1
+    return date.today() >= date(end_year, 7, 1)
+
+
+class BaseQuantHockeyDownloader(BaseExternalDownloader):
+    """Shared pagination and parsing for QuantHockey downloaders.
+
+    Result tables are split into pages linked with ``?page=N``. Page 1 is
+    fetched first to discover how many pages are linked, then the remaining
+    pages are fetched concurrently (up to ``config.max_concurrency``) and
+    returned in page order. HTML is parsed in a worker thread.
+
+    Subclasses must implement:
+    - _parse_players: Extract player records from a parsed page
     """
 
     config: QuantHockeyConfig  # Type hint for IDE support
@@ -106,6 +129,239 @@ class QuantHockeyPlayerStatsDownloader(BaseExternalDownloader):
         """
         super().__init__(config or QuantHockeyConfig(), **kwargs)
 
+    @abstractmethod
+    def _parse_players(
+        self, soup: BeautifulSoup, context: dict[str, Any]
+    ) -> Sequence[Any]:
+        """Extract player records from a parsed page.
+
+        Args:
+            soup: Parsed page
+            context: Request context
+
+        Returns:
+            Player records providing ``to_dict()``
+        """
+        ...
+
+    # =========================================================================
+    # Pagination
+    # =========================================================================
+
+    def _has_next_page(self, html_content: str, current_page: int) -> bool:
+        """Check if there's a next page of results.
+
+        Args:
+            html_content: Current page HTML content
+            current_page: Current page number
+
+        Returns:
+            True if next page exists
+        """
+        return self._soup_has_next_page(
+            BeautifulSoup(html_content, "lxml"), current_page
+        )
+
+    def _soup_has_next_page(self, soup: BeautifulSoup, current_page: int) -> bool:
+        """Check a parsed page for a link to the next page.
+
+        Args:
+            soup: Parsed page
+            current_page: Current page number
+
+        Returns:
+            True if next page exists
+        """
+        # Look for pagination links
+        next_page = current_page + 1
+
+        # Check for page=N links
+        page_link = soup.find("a", href=re.compile(rf"page={next_page}"))
+        if page_link:
+            return True
+
+        # Check for "Next" link
+        for link in soup.find_all("a"):
+            if isinstance(link, Tag):
+                link_text = link.get_text(strip=True)
+                if re.search(r"Next|►|>>", link_text):
+                    return True
+
+        # Check for numbered pagination (look for higher page number)
+        pagination = soup.find(class_=re.compile(r"pagination|pager"))
+        if pagination and isinstance(pagination, Tag):
+            links = pagination.find_all("a")
+            for link in links:
+                try:
+                    page_num = int(link.get_text(strip=True))
+                    if page_num > current_page:
+                        return True
+                except ValueError:
+                    continue
+
+        return False
+
+    @staticmethod
+    def _last_linked_page(soup: BeautifulSoup) -> int:
+        """Find the highest page number linked from a page.
+
+        Args:
+            soup: Parsed page
+
+        Returns:
+            Highest ``page=N`` link target, or 0 if there are none
+        """
+        last_page = 0
+        for link in soup.find_all("a", href=_PAGE_LINK_PATTERN):
+            if isinstance(link, Tag):
+                match = _PAGE_LINK_PATTERN.search(str(link.get("href", "")))
+                if match:
+                    last_page = max(last_page, int(match.group(1)))
+        return last_page
+
+    async def _iter_pages(
+        self,
+        page_url: Callable[[int], str],
+        context: dict[str, Any],
+        max_pages: int,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Fetch and parse result pages in page order.
+
+        Stops after the last page, an empty page, or ``max_pages``. Pages
+        still in flight are cancelled if the consumer stops early.
+
+        Args:
+            page_url: Builds the full URL for a page number
+            context: Request context shared by all pages
+            max_pages: Maximum number of pages to fetch
+
+        Yields:
+            Parsed page data from _parse_response
+        """
+
+        async def fetch(page: int) -> dict[str, Any]:
+            url = page_url(page)
+            logger.debug("Fetching page %d: %s", page, url)
+
+            result = await self.fetch_resource(
+                url.replace(self.config.base_url, ""),
+                context={**context, "page": page},
+            )
+
+            data = result.data
+            if not isinstance(data, dict):
+                raise ContentParsingError(
+                    "Unexpected response format",
+                    source=self.source_name,
+                    url=url,
+                )
+            return data
+
+        next_page = 1
+        last_known = 1
+        while next_page <= max_pages:
+            # Fetch every page known so far; unlinked pages one at a time
+            end = min(max(last_known, next_page), max_pages)
+            pages = self._iter_concurrent(
+                range(next_page, end + 1), fetch, in_order=True
+            )
+            try:
+                async for data in pages:
+                    yield data
+                    last_known = max(last_known, data.get("last_page", 0))
+
+                    # Check for more pages
+                    if not data.get("has_next_page", False):
+                        logger.debug("No more pages available")
+                        return
+
+                    if not data.get("players"):
+                        logger.debug("Empty page, stopping")
+                        return
+            finally:
+                await pages.aclose()
+            next_page = end + 1
+
+    # =========================================================================
+    # Abstract Method Implementation
+    # =========================================================================
+
+    def _parse_page_html(
+        self, html_content: str, context: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Parse one page of results, for use in a worker thread.
+
+        Args:
+            html_content: Page HTML
+            context: Request context (page and source-specific keys)
+
+        Returns:
+            Dictionary with parsed player data and pagination
+        """
+        soup = BeautifulSoup(html_content, "lxml")
+        players = self._parse_players(soup, context)
+
+        return {
+            "players": [p.to_dict() for p in players],
+            "player_count": len(players),
+            "has_next_page": self._soup_has_next_page(soup, context.get("page", 1)),
+            "last_page": self._last_linked_page(soup),
+        }
+
+    async def _parse_response(
+        self,
+        response: HTTPResponse,
+        context: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Parse QuantHockey response into structured data.
+
+        Args:
+            response: HTTP response
+            context: Request context (page and source-specific keys)
+
+        Returns:
+            Dictionary with parsed player data
+        """
+        # QuantHockey pages may contain non-UTF-8 characters (player names with accents)
+        # Try UTF-8 first, fall back to latin-1
+        try:
+            html_content = response.text()
+        except UnicodeDecodeError:
+            html_content = response.text("latin-1")
+
+        # Parse off the event loop so concurrent page fetches keep flowing
+        return await asyncio.to_thread(self._parse_page_html, html_content, context)
+
+
+class QuantHockeyPlayerStatsDownloader(BaseQuantHockeyDownloader):
+    """Downloader for QuantHockey player season statistics.
+
+    Fetches and parses player statistics from QuantHockey's season pages.
+    The site provides comprehensive 51-field player statistics including
+    scoring, TOI, situational performance, and advanced metrics.
+
+    Features:
+    - Parse 51 fields per player from HTML tables
+    - Pagination support (20 players per page, up to 20 pages), with pages
+      after the first fetched concurrently
+    - Completed seasons served from the response cache when
+      ``config.cache_dir`` is set
+    - Configurable max players limit
+    - Conservative rate limiting (1 req per 2 sec)
+    - Robust HTML parsing with BeautifulSoup
+
+    Example:
+        config = QuantHockeyConfig()
+        async with QuantHockeyPlayerStatsDownloader(config) as downloader:
+            # Get top 100 players from 2024-25 season
+            stats = await downloader.download_player_stats(20242025, max_players=100)
+    """
+
+    # Completed seasons never change; the current season is revalidated
+    cache_policy: ClassVar[CachePolicy] = CachePolicy(
+        is_immutable=is_completed_season_page
+    )
+
     @property
     def source_name(self) -> str:
         """Unique identifier for this data source."""
@@ -236,7 +492,22 @@ class QuantHockeyPlayerStatsDownloader(BaseExternalDownloader):
         Returns:
             List of player statistics
         """
-        soup = BeautifulSoup(html_content, "lxml")
+        return self._parse_stats_soup(BeautifulSoup(html_content, "lxml"), season_id)
+
+    def _parse_stats_soup(
+        self,
+        soup: BeautifulSoup,
+        season_id: int,
+    ) -> list[QuantHockeyPlayerSeasonStats]:
+        """Parse player statistics from a parsed page.
+
+        Args:
+            soup: Parsed page
+            season_id: NHL season ID
+
+        Returns:
+            List of player statistics
+        """
         players: list[QuantHockeyPlayerSeasonStats] = []
 
         # Find the main statistics table
@@ -281,81 +552,19 @@ class QuantHockeyPlayerStatsDownloader(BaseExternalDownloader):
 
         return players
 
-    def _has_next_page(self, html_content: str, current_page: int) -> bool:
-        """Check if there's a next page of results.
-
-        Args:
-            html_content: Current page HTML content
-            current_page: Current page number
-
-        Returns:
-            True if next page exists
-        """
-        soup = BeautifulSoup(html_content, "lxml")
-
-        # Look for pagination links
-        next_page = current_page + 1
-
-        # Check for page=N links
-        page_link = soup.find("a", href=re.compile(rf"page={next_page}"))
-        if page_link:
-            return True
-
-        # Check for "Next" link
-        for link in soup.find_all("a"):
-            if isinstance(link, Tag):
-                link_text = link.get_text(strip=True)
-                if re.search(r"Next|►|>>", link_text):
-                    return True
-
-        # Check for numbered pagination (look for higher page number)
-        pagination = soup.find(class_=re.compile(r"pagination|pager"))
-        if pagination and isinstance(pagination, Tag):
-            links = pagination.find_all("a")
-            for link in links:
-                try:
-                    page_num = int(link.get_text(strip=True))
-                    if page_num > current_page:
-                        return True
-                except ValueError:
-                    continue
-
-        return False
-
-    # =========================================================================
-    # Abstract Method Implementation
-    # =========================================================================
-
-    async def _parse_response(
-        self,
-        response: HTTPResponse,
-        context: dict[str, Any],
-    ) -> dict[str, Any]:
-        """Parse QuantHockey response into structured data.
+    def _parse_players(
+        self, soup: BeautifulSoup, context: dict[str, Any]
+    ) -> list[QuantHockeyPlayerSeasonStats]:
+        """Extract season stats from a parsed page.
 
         Args:
-            response: HTTP response
+            soup: Parsed page
             context: Request context (season_id, page)
 
         Returns:
-            Dictionary with parsed player data
+            List of player statistics
         """
-        # QuantHockey pages may contain non-UTF-8 characters (player names with accents)
-        # Try UTF-8 first, fall back to latin-1
-        try:
-            html_content = response.text()
-        except UnicodeDecodeError:
-            html_content = response.text("latin-1")
-        season_id = context.get("season_id", 0)
-
-        players = self._parse_stats_table(html_content, season_id)
-        has_next = self._has_next_page(html_content, context.get("page", 1))
-
-        return {
-            "players": [p.to_dict() for p in players],
-            "player_count": len(players),
-            "has_next_page": has_next,
-        }
+        return self._parse_stats_soup(soup, context.get("season_id", 0))
 
     # =========================================================================
     # Download Methods
@@ -371,7 +580,8 @@ class QuantHockeyPlayerStatsDownloader(BaseExternalDownloader):
         """Download player statistics for a season.
 
         Fetches all pages of player statistics up to the specified limits.
-        Uses rate limiting and retries for robust operation.
+        Pages after the first are fetched concurrently; every request still
+        uses rate limiting and retries.
 
         Args:
             season_id: NHL season ID (e.g., 20242025)
@@ -386,7 +596,6 @@ class QuantHockeyPlayerStatsDownloader(BaseExternalDownloader):
             ContentParsingError: If parsing fails
         """
         all_players: list[QuantHockeyPlayerSeasonStats] = []
-        page = 1
 
         logger.info(
             "Starting QuantHockey download for season %d (max_players=%s, max_pages=%d)",
@@ -395,55 +604,34 @@ class QuantHockeyPlayerStatsDownloader(BaseExternalDownloader):
             max_pages,
         )
 
-        while page <= max_pages:
-            url = self._build_season_url(season_id, page)
-            context = {"season_id": season_id, "page": page}
-
-            logger.debug("Fetching page %d: %s", page, url)
-
-            # Fetch and parse page
-            result = await self.fetch_resource(
-                url.replace(self.config.base_url, ""),
-                context=context,
-            )
+        pages = self._iter_pages(
+            lambda page: self._build_season_url(season_id, page),
+            {"season_id": season_id},
+            max_pages,
+        )
+        try:
+            async for data in pages:
+                # Convert player dicts back to dataclass objects
+                players_data = data.get("players", [])
+                for p_dict in players_data:
+                    player = QuantHockeyPlayerSeasonStats.from_dict(
+                        p_dict, validate=True
+                    )
+                    all_players.append(player)
 
-            data = result.data
-            if not isinstance(data, dict):
-                raise ContentParsingError(
-                    "Unexpected response format",
-                    source=self.source_name,
-                    url=url,
+                logger.debug(
+                    "Fetched %d players (total: %d)",
+                    len(players_data),
+                    len(all_players),
                 )
 
-            # Convert player dicts back to dataclass objects
-            players_data = data.get("players", [])
-            for p_dict in players_data:
-                player = QuantHockeyPlayerSeasonStats.from_dict(p_dict, validate=True)
-                all_players.append(player)
-
-            logger.debug(
-                "Page %d: fetched %d players (total: %d)",
-                page,
-                len(players_data),
-                len(all_players),
-            )
-
-            # Check if we've reached limits
-            if max_players and len(all_players) >= max_players:
-                all_players = all_players[:max_players]
-                logger.info("Reached max_players limit (%d)", max_players)
-                break
-
-            # Check for more pages
-            if not data.get("has_next_page", False):
-                logger.debug("No more pages available")
-                break
-
-            if len(players_data) == 0:
-                logger.debug("Empty page, stopping")
-                break
-
-            page += 1
+                # Check if we've reached limits
+                if max_players and len(all_players) >= max_players:
+                    all_players = all_players[:max_players]
+                    logger.info("Reached max_players limit (%d)", max_players)
+                    break
+        finally:
+            await pages.aclose()
 
         logger.info(
             "QuantHockey download complete: %d players fetched for season %d",
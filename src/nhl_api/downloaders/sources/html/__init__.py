@@ -18,6 +18,7 @@ Report Types:
 from nhl_api.downloaders.sources.html.base_html_downloader import (
     HTML_DOWNLOADER_CONFIG,
     BaseHTMLDownloader,
+    FetchedReport,
     HTMLDownloaderConfig,
 )
 from nhl_api.downloaders.sources.html.event_summary import (
@@ -98,6 +99,7 @@ __all__ = [
     "FaceoffStat",
     "FaceoffSummaryDownloader",
     "FCTeamFaceoffSummary",
+    "FetchedReport",
     "GameSummaryDownloader",
     "GoalieStats",
     "GoalInfo",
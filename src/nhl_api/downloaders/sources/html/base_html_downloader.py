@@ -12,19 +12,29 @@ Example usage:
         def report_type(self) -> str:
             return "GS"
 
-        async def _parse_report(self, soup: BeautifulSoup, game_id: int) -> dict[str, Any]:
+        def _parse_report_sync(self, soup: BeautifulSoup, game_id: int) -> dict[str, Any]:
             # Parse game summary HTML
             ...
+
+Parsing a large report (play-by-play, time on ice) takes long enough to stall
+the event loop. Setting ``parse_executor`` to "thread" or "process" moves the
+BeautifulSoup parse and ``_parse_report_sync`` into a worker pool so fetches keep
+flowing while earlier reports are parsed:
+
+    config = HTMLDownloaderConfig(parse_executor="process", parse_workers=4)
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
+import time
 from abc import abstractmethod
 from collections.abc import AsyncGenerator, Callable
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any, cast
 
 from bs4 import BeautifulSoup, Tag
 
@@ -38,6 +48,7 @@ from nhl_api.downloaders.base.protocol import (
     DownloadStatus,
 )
 from nhl_api.utils.html_storage import HTMLStorageManager
+from nhl_api.utils.http_client import COMPLETED_GAME_POLICY
 
 if TYPE_CHECKING:
     from nhl_api.downloaders.base.rate_limiter import RateLimiter
@@ -72,6 +83,12 @@ class HTMLDownloaderConfig(DownloaderConfig):
         health_check_url: Not used for HTML reports
         store_raw_html: Whether to preserve raw HTML bytes in results
         persist_html: Whether to save HTML reports to disk for comparison
+        storage_dir: Directory for persisted HTML (defaults to ./data/html)
+        storage_backend: How persisted HTML is stored: "files" (one .HTM per
+            report) or "archive" (one compressed archive per season and type)
+        parse_executor: Where reports are parsed: "inline" (on the event
+            loop), "thread" (thread pool) or "process" (process pool)
+        parse_workers: Worker count for the thread or process pool
     """
 
     base_url: str = NHL_HTML_BASE_URL
@@ -82,11 +99,92 @@ class HTMLDownloaderConfig(DownloaderConfig):
     health_check_url: str = ""
     store_raw_html: bool = True
     persist_html: bool = True
+    storage_dir: str | None = None
+    storage_backend: str = "files"
+    parse_executor: str = "inline"
+    parse_workers: int = 2
 
 
 # Default configuration instance
 HTML_DOWNLOADER_CONFIG = HTMLDownloaderConfig()
 
+PARSE_EXECUTORS = ("inline", "thread", "process")
+
+
+@dataclass
+class HTMLTimings:
+    """Cumulative network and parse time for a downloader.
+
+    Attributes:
+        reports: Number of reports fetched and parsed
+        network_seconds: Time spent waiting on HTTP requests
+        parse_seconds: Time spent parsing HTML into data
+    """
+
+    reports: int = 0
+    network_seconds: float = 0.0
+    parse_seconds: float = 0.0
+
+    def record(self, network_seconds: float, parse_seconds: float) -> None:
+        """Add one report's timings."""
+        self.reports += 1
+        self.network_seconds += network_seconds
+        self.parse_seconds += parse_seconds
+
+
+@dataclass(frozen=True, slots=True)
+class FetchedReport:
+    """A parsed HTML report together with the bytes it was parsed from.
+
+    Carrying the raw payload with the result (rather than on the downloader)
+    keeps concurrent downloads through one instance from mixing up reports.
+
+    Attributes:
+        data: Parsed report data
+        raw_content: Original HTML bytes
+    """
+
+    data: dict[str, Any]
+    raw_content: bytes
+
+
+# Parsers built by _parse_in_worker, kept for the life of the worker process
+_WORKER_PARSERS: dict[
+    tuple[type[BaseHTMLDownloader], tuple[Any, ...]], BaseHTMLDownloader
+] = {}
+
+
+def _parse_in_worker(
+    downloader_cls: type[BaseHTMLDownloader],
+    config: HTMLDownloaderConfig,
+    init_kwargs: dict[str, Any],
+    content: bytes,
+    game_id: int,
+) -> dict[str, Any]:
+    """Parse a report in a worker process.
+
+    The downloader is rebuilt from its class and configuration because the
+    live instance (HTTP session, rate limiter) cannot be pickled. Each worker
+    process builds one parser per class and constructor arguments and reuses
+    it for every later report.
+
+    Args:
+        downloader_cls: Concrete downloader class
+        config: Downloader configuration
+        init_kwargs: Extra constructor arguments (e.g. TOI side)
+        content: Raw HTML bytes
+        game_id: NHL game ID
+
+    Returns:
+        Parsed report data as a plain dictionary
+    """
+    key = (downloader_cls, tuple(sorted(init_kwargs.items())))
+    parser = _WORKER_PARSERS.get(key)
+    if parser is None:
+        parser = downloader_cls(config, **init_kwargs)
+        _WORKER_PARSERS[key] = parser
+    return parser._parse_content(content, game_id)
+
 
 class BaseHTMLDownloader(BaseDownloader):
     """Abstract base class for NHL HTML report downloaders.
@@ -100,7 +198,7 @@ class BaseHTMLDownloader(BaseDownloader):
 
     Subclasses must implement:
     - report_type: Property returning report code (GS, ES, PL, etc.)
-    - _parse_report: Method to parse the HTML into structured data
+    - _parse_report_sync: Method to parse the HTML into structured data
 
     Example:
         class GameSummaryDownloader(BaseHTMLDownloader):
@@ -108,7 +206,7 @@ class BaseHTMLDownloader(BaseDownloader):
             def report_type(self) -> str:
                 return "GS"
 
-            async def _parse_report(
+            def _parse_report_sync(
                 self, soup: BeautifulSoup, game_id: int
             ) -> dict[str, Any]:
                 # Extract game summary data from HTML
@@ -121,6 +219,9 @@ class BaseHTMLDownloader(BaseDownloader):
             # result.data contains parsed data
     """
 
+    # Reports whose header reads "Final" never change, so cached copies are reused
+    cache_policy = COMPLETED_GAME_POLICY
+
     def __init__(
         self,
         config: HTMLDownloaderConfig | None = None,
@@ -151,9 +252,25 @@ class BaseHTMLDownloader(BaseDownloader):
         self._game_ids: list[int] = game_ids or []
         self._store_raw = getattr(config, "store_raw_html", True)
         self._persist_html = getattr(config, "persist_html", True)
-        self._last_raw_content: bytes | None = None
         self._config: HTMLDownloaderConfig  # Type hint for IDE
-        self._storage_manager = HTMLStorageManager() if self._persist_html else None
+        self._storage_manager = (
+            HTMLStorageManager(
+                getattr(config, "storage_dir", None),
+                backend=getattr(config, "storage_backend", "files"),
+            )
+            if self._persist_html
+            else None
+        )
+
+        self._parse_mode = getattr(config, "parse_executor", "inline")
+        if self._parse_mode not in PARSE_EXECUTORS:
+            raise ValueError(
+                f"Invalid parse_executor: {self._parse_mode}. "
+                f"Must be one of {PARSE_EXECUTORS}."
+            )
+        self._parse_workers = getattr(config, "parse_workers", 2)
+        self._parse_pool: Executor | None = None
+        self.timings = HTMLTimings()
 
     @property
     @abstractmethod
@@ -175,11 +292,12 @@ class BaseHTMLDownloader(BaseDownloader):
         return f"html_{self.report_type.lower()}"
 
     @abstractmethod
-    async def _parse_report(self, soup: BeautifulSoup, game_id: int) -> dict[str, Any]:
+    def _parse_report_sync(self, soup: BeautifulSoup, game_id: int) -> dict[str, Any]:
         """Parse the HTML report into structured data.
 
         This method should be implemented by subclasses to handle
-        report-specific parsing logic.
+        report-specific parsing logic. It does no I/O, so parse workers
+        call it directly.
 
         Args:
             soup: Parsed BeautifulSoup document
@@ -193,6 +311,18 @@ class BaseHTMLDownloader(BaseDownloader):
         """
         ...
 
+    async def _parse_report(self, soup: BeautifulSoup, game_id: int) -> dict[str, Any]:
+        """Parse the HTML report into structured data.
+
+        Args:
+            soup: Parsed BeautifulSoup document
+            game_id: NHL game ID
+
+        Returns:
+            Parsed report data as a dictionary
+        """
+        return self._parse_report_sync(soup, game_id)
+
     def set_game_ids(self, game_ids: list[int]) -> None:
         """Set game IDs for season download.
 
@@ -236,6 +366,98 @@ class BaseHTMLDownloader(BaseDownloader):
         html_text = content.decode("utf-8", errors="replace")
         return BeautifulSoup(html_text, "lxml")
 
+    def _parse_content(self, content: bytes, game_id: int) -> dict[str, Any]:
+        """Parse raw HTML into report data synchronously.
+
+        Used by parse workers.
+
+        Args:
+            content: Raw HTML bytes
+            game_id: NHL game ID
+
+        Returns:
+            Parsed report data as a dictionary
+        """
+        return self._parse_report_sync(self._parse_html(content), game_id)
+
+    def _parser_init_kwargs(self) -> dict[str, Any]:
+        """Constructor arguments, besides config, needed to rebuild the parser.
+
+        Override in subclasses whose parsing depends on constructor state.
+
+        Returns:
+            Keyword arguments passed to the class in a worker process
+        """
+        return {}
+
+    def _get_parse_pool(self) -> Executor | None:
+        """Get the parse worker pool, creating it on first use.
+
+        Returns:
+            The executor, or None when parsing inline
+        """
+        if self._parse_mode == "inline":
+            return None
+        if self._parse_pool is None:
+            if self._parse_mode == "process":
+                self._parse_pool = ProcessPoolExecutor(max_workers=self._parse_workers)
+            else:
+                self._parse_pool = ThreadPoolExecutor(
+                    max_workers=self._parse_workers,
+                    thread_name_prefix=f"{self.source_name}-parse",
+                )
+        return self._parse_pool
+
+    async def _parse_content_async(
+        self, content: bytes, game_id: int
+    ) -> dict[str, Any]:
+        """Parse raw HTML on the configured executor.
+
+        Args:
+            content: Raw HTML bytes
+            game_id: NHL game ID
+
+        Returns:
+            Parsed report data as a dictionary
+        """
+        pool = self._get_parse_pool()
+        if pool is None:
+            soup = self._parse_html(content)
+            return await self._parse_report(soup, game_id)
+
+        loop = asyncio.get_running_loop()
+        if isinstance(pool, ProcessPoolExecutor):
+            worker_config = replace(
+                cast(HTMLDownloaderConfig, self.config),
+                persist_html=False,
+                parse_executor="inline",
+            )
+            return await loop.run_in_executor(
+                pool,
+                _parse_in_worker,
+                type(self),
+                worker_config,
+                self._parser_init_kwargs(),
+                content,
+                game_id,
+            )
+        return await loop.run_in_executor(pool, self._parse_content, content, game_id)
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: Any,
+    ) -> None:
+        """Exit async context, shutting down the parse pool and archives."""
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown(wait=False, cancel_futures=True)
+            self._parse_pool = None
+        if self._storage_manager is not None:
+            # Archive handles and memory maps reopen lazily on next use
+            self._storage_manager.close()
+        await super().__aexit__(exc_type, exc_val, exc_tb)
+
     def _validate_html(self, content: bytes) -> bool:
         """Validate that content is HTML.
 
@@ -275,6 +497,21 @@ class BaseHTMLDownloader(BaseDownloader):
         Returns:
             Parsed report data as a dictionary
 
+        Raises:
+            DownloadError: If fetch or parse fails
+        """
+        report = await self._fetch_report(game_id)
+        return report.data
+
+    async def _fetch_report(self, game_id: int) -> FetchedReport:
+        """Fetch and parse HTML report for a single game, keeping the raw HTML.
+
+        Args:
+            game_id: NHL game ID
+
+        Returns:
+            FetchedReport with parsed data and raw HTML bytes
+
         Raises:
             DownloadError: If fetch or parse fails
         """
@@ -291,7 +528,9 @@ class BaseHTMLDownloader(BaseDownloader):
         try:
             # Use relative path for _get() method
             path = url.replace(self.config.base_url, "")
+            started = time.perf_counter()
             response = await self._get(path)
+            network_seconds = time.perf_counter() - started
 
             if not response.is_success:
                 raise DownloadError(
@@ -311,16 +550,20 @@ class BaseHTMLDownloader(BaseDownloader):
                     game_id=game_id,
                 )
 
-            # Parse HTML
-            soup = self._parse_html(raw_content)
-
-            # Call subclass parser
-            parsed_data = await self._parse_report(soup, game_id)
-
-            # Store raw content reference for the download_game override
-            self._last_raw_content = raw_content
+            # Parse HTML and call subclass parser (inline or on a worker)
+            started = time.perf_counter()
+            parsed_data = await self._parse_content_async(raw_content, game_id)
+            parse_seconds = time.perf_counter() - started
+            self.timings.record(network_seconds, parse_seconds)
+            logger.debug(
+                "%s: Game %d fetched in %.3fs, parsed in %.3fs",
+                self.source_name,
+                game_id,
+                network_seconds,
+                parse_seconds,
+            )
 
-            return parsed_data
+            return FetchedReport(data=parsed_data, raw_content=raw_content)
 
         except DownloadError:
             raise
@@ -352,30 +595,28 @@ class BaseHTMLDownloader(BaseDownloader):
         Raises:
             DownloadError: If download fails
         """
-        self._last_raw_content = None
-
         try:
-            data = await self._fetch_game(game_id)
+            report = await self._fetch_report(game_id)
             season_id = self._extract_season_from_game_id(game_id)
 
             result = DownloadResult(
                 source=self.source_name,
                 season_id=season_id,
                 game_id=game_id,
-                data=data,
+                data=report.data,
                 status=DownloadStatus.COMPLETED,
-                raw_content=self._last_raw_content if self._store_raw else None,
+                raw_content=report.raw_content if self._store_raw else None,
             )
 
             # Persist HTML to disk if enabled
-            if self._storage_manager and self._last_raw_content:
+            if self._storage_manager and report.raw_content:
                 try:
                     season_str = str(season_id)
                     self._storage_manager.save_html(
                         season=season_str,
                         report_type=self.report_type,
                         game_id=game_id,
-                        html=self._last_raw_content,
+                        html=report.raw_content,
                     )
                     logger.debug(
                         "%s: Persisted HTML for game %d to disk",
@@ -131,7 +131,7 @@ class EventSummaryDownloader(BaseHTMLDownloader):
         """Return report type code for Event Summary."""
         return "ES"
 
-    async def _parse_report(self, soup: BeautifulSoup, game_id: int) -> dict[str, Any]:
+    def _parse_report_sync(self, soup: BeautifulSoup, game_id: int) -> dict[str, Any]:
         """Parse Event Summary HTML into structured data.
 
         Args:
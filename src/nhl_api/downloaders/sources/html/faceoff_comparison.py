@@ -133,7 +133,7 @@ class FaceoffComparisonDownloader(BaseHTMLDownloader):
         """Return report type code for Faceoff Comparison."""
         return "FC"
 
-    async def _parse_report(self, soup: BeautifulSoup, game_id: int) -> dict[str, Any]:
+    def _parse_report_sync(self, soup: BeautifulSoup, game_id: int) -> dict[str, Any]:
         """Parse Faceoff Comparison HTML into structured data.
 
         Args:
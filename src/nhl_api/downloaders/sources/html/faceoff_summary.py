@@ -140,7 +140,7 @@ class FaceoffSummaryDownloader(BaseHTMLDownloader):
         """Return report type code for Faceoff Summary."""
         return "FS"
 
-    async def _parse_report(self, soup: BeautifulSoup, game_id: int) -> dict[str, Any]:
+    def _parse_report_sync(self, soup: BeautifulSoup, game_id: int) -> dict[str, Any]:
         """Parse Faceoff Summary HTML into structured data.
 
         Args:
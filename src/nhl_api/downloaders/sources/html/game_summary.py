@@ -160,7 +160,7 @@ class GameSummaryDownloader(BaseHTMLDownloader):
         """Return report type code for Game Summary."""
         return "GS"
 
-    async def _parse_report(self, soup: BeautifulSoup, game_id: int) -> dict[str, Any]:
+    def _parse_report_sync(self, soup: BeautifulSoup, game_id: int) -> dict[str, Any]:
         """Parse Game Summary HTML into structured data.
 
         Args:
@@ -180,7 +180,7 @@ class PlayByPlayDownloader(BaseHTMLDownloader):
         """Return report type code for Play-by-Play."""
         return "PL"
 
-    async def _parse_report(self, soup: BeautifulSoup, game_id: int) -> dict[str, Any]:
+    def _parse_report_sync(self, soup: BeautifulSoup, game_id: int) -> dict[str, Any]:
         """Parse Play-by-Play HTML into structured data.
 
         Args:
@@ -17,12 +17,21 @@ Example usage:
 
     # Get source name for database
     source_name = HTMLDownloaderRegistry.get_source_name("GS")  # "html_gs"
+
+    # Download every report type for a season concurrently
+    config = HTMLDownloaderConfig(max_concurrency=4)
+    async for result in HTMLDownloaderRegistry.download_season_all(
+        20242025, game_ids, config
+    ):
+        print(result.source, result.game_id)
 """
 
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING
 
+from nhl_api.downloaders.base.rate_limiter import RateLimiter
 from nhl_api.downloaders.sources.html.base_html_downloader import (
     HTML_DOWNLOADER_CONFIG,
     BaseHTMLDownloader,
@@ -40,9 +49,9 @@ from nhl_api.downloaders.sources.html.shot_summary import ShotSummaryDownloader
 from nhl_api.downloaders.sources.html.time_on_ice import TimeOnIceDownloader
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import AsyncIterator, Callable, Sequence
 
-    from nhl_api.downloaders.base.rate_limiter import RateLimiter
+    from nhl_api.downloaders.base.protocol import DownloadResult
     from nhl_api.downloaders.base.retry_handler import RetryHandler
     from nhl_api.utils.http_client import HTTPClient
 
@@ -182,9 +191,14 @@ class HTMLDownloaderRegistry:
         retry_handler: RetryHandler | None = None,
         progress_callback: Callable[..., None] | None = None,
         game_ids: list[int] | None = None,
+        report_types: Sequence[str] | None = None,
     ) -> dict[str, BaseHTMLDownloader]:
         """Create all HTML downloaders.
 
+        Every report is served from www.nhl.com, so unless a rate limiter is
+        given the downloaders share one per-domain limiter and together never
+        exceed ``config.requests_per_second`` against that host.
+
         Args:
             config: Optional downloader configuration. Uses default if not provided.
             http_client: Optional shared HTTP client
@@ -192,6 +206,7 @@ class HTMLDownloaderRegistry:
             retry_handler: Optional shared retry handler
             progress_callback: Optional callback for progress updates
             game_ids: Optional list of game IDs for season download
+            report_types: Report types to create (default: all)
 
         Returns:
             Dictionary mapping report type to downloader instance.
@@ -201,6 +216,12 @@ class HTMLDownloaderRegistry:
             for report_type, downloader in downloaders.items():
                 print(f"{report_type}: {downloader.source_name}")
         """
+        config = config or cls.default_config()
+        if rate_limiter is None:
+            rate_limiter = RateLimiter(
+                requests_per_second=config.requests_per_second, per_domain=True
+            )
+
         return {
             report_type: cls.create(
                 report_type,
@@ -211,9 +232,67 @@ class HTMLDownloaderRegistry:
                 progress_callback=progress_callback,
                 game_ids=game_ids,
             )
-            for report_type in cls.REPORT_TYPES
+            for report_type in (report_types or cls.REPORT_TYPES)
         }
 
+    @classmethod
+    async def download_season_all(
+        cls,
+        season_id: int,
+        game_ids: list[int],
+        config: HTMLDownloaderConfig | None = None,
+        *,
+        report_types: Sequence[str] | None = None,
+    ) -> AsyncIterator[DownloadResult]:
+        """Download a season for every report type concurrently.
+
+        Each report type runs its own ``download_season`` (with up to
+        ``config.max_concurrency`` games in flight) while all of them share
+        one per-domain rate limiter. Results are yielded as they arrive.
+
+        Args:
+            season_id: NHL season ID (e.g., 20242025)
+            game_ids: Game IDs to download
+            config: Optional downloader configuration
+            report_types: Report types to download (default: all)
+
+        Yields:
+            DownloadResult for each report and game, across report types
+        """
+        downloaders = cls.create_all(
+            config, game_ids=game_ids, report_types=report_types
+        )
+        queue: asyncio.Queue[DownloadResult | BaseException | None] = asyncio.Queue(
+            maxsize=len(downloaders)
+        )
+
+        async def pump(downloader: BaseHTMLDownloader) -> None:
+            try:
+                async with downloader:
+                    async for result in downloader.download_season(season_id):
+                        await queue.put(result)
+            except Exception as e:
+                await queue.put(e)
+                return
+            await queue.put(None)
+
+        tasks = [asyncio.create_task(pump(d)) for d in downloaders.values()]
+        try:
+            remaining = len(tasks)
+            while remaining:
+                item = await queue.get()
+                if item is None:
+                    remaining -= 1
+                elif isinstance(item, BaseException):
+                    raise item
+                else:
+                    yield item
+        finally:
+            # Cancels outstanding report types if the consumer stops early
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
     @classmethod
     def default_config(cls) -> HTMLDownloaderConfig:
         """Return default configuration for HTML downloaders.
@@ -116,7 +116,7 @@ class RosterDownloader(BaseHTMLDownloader):
         """Return report type code for Roster Report."""
         return "RO"
 
-    async def _parse_report(self, soup: BeautifulSoup, game_id: int) -> dict[str, Any]:
+    def _parse_report_sync(self, soup: BeautifulSoup, game_id: int) -> dict[str, Any]:
         """Parse Roster Report HTML into structured data.
 
         Args:
@@ -148,7 +148,7 @@ class ShotSummaryDownloader(BaseHTMLDownloader):
         """Return report type code for Shot Summary."""
         return "SS"
 
-    async def _parse_report(self, soup: BeautifulSoup, game_id: int) -> dict[str, Any]:
+    def _parse_report_sync(self, soup: BeautifulSoup, game_id: int) -> dict[str, Any]:
         """Parse Shot Summary HTML into structured data.
 
         Args:
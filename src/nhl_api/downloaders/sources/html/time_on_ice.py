@@ -296,7 +296,11 @@ class TimeOnIceDownloader(BaseHTMLDownloader):
         """Return the side (home or away) this downloader handles."""
         return self._side
 
-    async def _parse_report(self, soup: BeautifulSoup, game_id: int) -> dict[str, Any]:
+    def _parser_init_kwargs(self) -> dict[str, Any]:
+        """Rebuild parse workers for the same side."""
+        return {"side": self._side}
+
+    def _parse_report_sync(self, soup: BeautifulSoup, game_id: int) -> dict[str, Any]:
         """Parse Time on Ice HTML into structured data.
 
         Args:
@@ -59,6 +59,7 @@ from nhl_api.downloaders.sources.nhl_json.roster import (
     NHL_TEAM_ABBREVS,
     TEAM_RELOCATIONS,
     ParsedRoster,
+    PlayerIndex,
     PlayerInfo,
     RosterDownloader,
     create_roster_downloader,
@@ -141,6 +142,7 @@ __all__ = [
     "create_right_rail_downloader",
     # Roster
     "ParsedRoster",
+    "PlayerIndex",
     "PlayerInfo",
     "RosterDownloader",
     "create_roster_downloader",
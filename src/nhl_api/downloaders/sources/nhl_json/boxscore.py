@@ -24,6 +24,7 @@ from nhl_api.downloaders.base.base_downloader import (
     DownloaderConfig,
 )
 from nhl_api.downloaders.base.protocol import DownloadError
+from nhl_api.utils.http_client import COMPLETED_GAME_POLICY
 
 if TYPE_CHECKING:
     from nhl_api.downloaders.base.rate_limiter import RateLimiter
@@ -39,6 +40,63 @@ NHL_API_BASE_URL = "https://api-web.nhle.com"
 # Default rate limit for NHL API (requests per second)
 DEFAULT_RATE_LIMIT = 5.0
 
+# Column order of the rows built for each stats table
+TEAM_STATS_COLUMNS = (
+    "game_id",
+    "season_id",
+    "team_id",
+    "is_home",
+    "goals",
+    "shots",
+    "pim",
+    "power_play_goals",
+    "blocked_shots",
+    "hits",
+    "takeaways",
+    "giveaways",
+)
+SKATER_STATS_COLUMNS = (
+    "game_id",
+    "season_id",
+    "player_id",
+    "team_id",
+    "position",
+    "goals",
+    "assists",
+    "points",
+    "plus_minus",
+    "pim",
+    "shots",
+    "hits",
+    "blocked_shots",
+    "giveaways",
+    "takeaways",
+    "faceoff_pct",
+    "toi_seconds",
+    "shifts",
+    "power_play_goals",
+    "shorthanded_goals",
+)
+GOALIE_STATS_COLUMNS = (
+    "game_id",
+    "season_id",
+    "player_id",
+    "team_id",
+    "saves",
+    "shots_against",
+    "goals_against",
+    "save_pct",
+    "toi_seconds",
+    "even_strength_saves",
+    "even_strength_shots",
+    "power_play_saves",
+    "power_play_shots",
+    "shorthanded_saves",
+    "shorthanded_shots",
+    "is_starter",
+    "decision",
+)
+
 
 @dataclass
 class BoxscoreDownloaderConfig(DownloaderConfig):
@@ -235,6 +293,9 @@ class BoxscoreDownloader(BaseDownloader):
                 print(f"Downloaded game {result.game_id}")
     """
 
+    # Finished games never change, so their cached responses are reused
+    cache_policy = COMPLETED_GAME_POLICY
+
     def __init__(
         self,
         config: BoxscoreDownloaderConfig | None = None,
@@ -835,6 +896,128 @@ class BoxscoreDownloader(BaseDownloader):
             is_shootout=data.get("is_shootout", False),
         )
 
+    def _team_stats_rows(self, boxscore: ParsedBoxscore) -> list[tuple[Any, ...]]:
+        """Build game_team_stats rows for both teams.
+
+        Team totals not present on TeamBoxscore are aggregated from the
+        team's skaters.
+
+        Args:
+            boxscore: Parsed boxscore
+
+        Returns:
+            Row tuples in TEAM_STATS_COLUMNS order
+        """
+        rows = []
+        for team, skaters in [
+            (boxscore.home_team, boxscore.home_skaters),
+            (boxscore.away_team, boxscore.away_skaters),
+        ]:
+            rows.append(
+                (
+                    boxscore.game_id,
+                    boxscore.season_id,
+                    team.team_id,
+                    team.is_home,
+                    team.score,
+                    team.shots_on_goal,
+                    sum(s.pim for s in skaters),
+                    sum(s.power_play_goals for s in skaters),
+                    sum(s.blocked_shots for s in skaters),
+                    sum(s.hits for s in skaters),
+                    sum(s.takeaways for s in skaters),
+                    sum(s.giveaways for s in skaters),
+                )
+            )
+        return rows
+
+    def _skater_stats_rows(self, boxscore: ParsedBoxscore) -> list[tuple[Any, ...]]:
+        """Build game_skater_stats rows for both teams.
+
+        Args:
+            boxscore: Parsed boxscore
+
+        Returns:
+            Row tuples in SKATER_STATS_COLUMNS order
+        """
+        return [
+            (
+                boxscore.game_id,
+                boxscore.season_id,
+                skater.player_id,
+                skater.team_id,
+                skater.position,
+                skater.goals,
+                skater.assists,
+                skater.points,
+                skater.plus_minus,
+                skater.pim,
+                skater.shots,
+                skater.hits,
+                skater.blocked_shots,
+                skater.giveaways,
+                skater.takeaways,
+                skater.faceoff_pct if skater.faceoff_pct > 0 else None,
+                self._toi_to_seconds(skater.toi),
+                skater.shifts,
+                skater.power_play_goals,
+                skater.shorthanded_goals,
+            )
+            for skater in boxscore.home_skaters + boxscore.away_skaters
+        ]
+
+    def _goalie_stats_rows(self, boxscore: ParsedBoxscore) -> list[tuple[Any, ...]]:
+        """Build game_goalie_stats rows for both teams.
+
+        Args:
+            boxscore: Parsed boxscore
+
+        Returns:
+            Row tuples in GOALIE_STATS_COLUMNS order
+        """
+        rows = []
+        for goalie in boxscore.home_goalies + boxscore.away_goalies:
+            es_saves, es_shots = self._parse_saves_shots(
+                goalie.even_strength_shots_against
+            )
+            pp_saves, pp_shots = self._parse_saves_shots(
+                goalie.power_play_shots_against
+            )
+            sh_saves, sh_shots = self._parse_saves_shots(
+                goalie.shorthanded_shots_against
+            )
+            rows.append(
+                (
+                    boxscore.game_id,
+                    boxscore.season_id,
+                    goalie.player_id,
+                    goalie.team_id,
+                    goalie.saves,
+                    goalie.shots_against,
+                    goalie.goals_against,
+                    goalie.save_pct if goalie.save_pct > 0 else None,
+                    self._toi_to_seconds(goalie.toi),
+                    es_saves,
+                    es_shots,
+                    pp_saves,
+                    pp_shots,
+                    sh_saves,
+                    sh_shots,
+                    goalie.is_starter,
+                    goalie.decision,
+                )
+            )
+        return rows
+
+    def _to_parsed_boxscores(
+        self, boxscores: list[ParsedBoxscore] | list[dict[str, Any]]
+    ) -> list[ParsedBoxscore]:
+        """Convert dicts to ParsedBoxscore if needed."""
+        return [
+            self._dict_to_boxscore(item) if isinstance(item, dict) else item
+            for item in boxscores
+        ]
+
     async def persist(
         self,
         db: DatabaseService,
@@ -847,6 +1030,8 @@ class BoxscoreDownloader(BaseDownloader):
         - Skater stats to game_skater_stats
         - Goalie stats to game_goalie_stats
 
+        Issues one upsert per row; use persist_bulk for large batches.
+
         Args:
             db: Database service instance
             boxscores: List of ParsedBoxscore objects or dicts to persist
@@ -857,29 +1042,12 @@ class BoxscoreDownloader(BaseDownloader):
         if not boxscores:
             return 0
 
-        # Convert dicts to ParsedBoxscore if needed
-        parsed_boxscores: list[ParsedBoxscore] = []
-        for item in boxscores:
-            if isinstance(item, dict):
-                parsed_boxscores.append(self._dict_to_boxscore(item))
-            else:
-                parsed_boxscores.append(item)
+        parsed_boxscores = self._to_parsed_boxscores(boxscores)
 
         count = 0
         for boxscore in parsed_boxscores:
             # Persist team stats for both teams
-            for team, skaters in [
-                (boxscore.home_team, boxscore.home_skaters),
-                (boxscore.away_team, boxscore.away_skaters),
-            ]:
-                # Aggregate stats from players
-                total_hits = sum(s.hits for s in skaters)
-                total_blocked = sum(s.blocked_shots for s in skaters)
-                total_takeaways = sum(s.takeaways for s in skaters)
-                total_giveaways = sum(s.giveaways for s in skaters)
-                total_pim = sum(s.pim for s in skaters)
-                pp_goals = sum(s.power_play_goals for s in skaters)
-
+            for row in self._team_stats_rows(boxscore):
                 await db.execute(
                     """
                     INSERT INTO game_team_stats (
@@ -898,24 +1066,11 @@ class BoxscoreDownloader(BaseDownloader):
                         giveaways = EXCLUDED.giveaways,
                         updated_at = CURRENT_TIMESTAMP
                     """,
-                    boxscore.game_id,
-                    boxscore.season_id,
-                    team.team_id,
-                    team.is_home,
-                    team.score,
-                    team.shots_on_goal,
-                    total_pim,
-                    pp_goals,
-                    total_blocked,
-                    total_hits,
-                    total_takeaways,
-                    total_giveaways,
+                    *row,
                 )
 
             # Persist skater stats
-            all_skaters = boxscore.home_skaters + boxscore.away_skaters
-            for skater in all_skaters:
-                toi_seconds = self._toi_to_seconds(skater.toi)
+            for row in self._skater_stats_rows(boxscore):
                 await db.execute(
                     """
                     INSERT INTO game_skater_stats (
@@ -946,42 +1101,11 @@ class BoxscoreDownloader(BaseDownloader):
                         shorthanded_goals = EXCLUDED.shorthanded_goals,
                         updated_at = CURRENT_TIMESTAMP
                     """,
-                    boxscore.game_id,
-                    boxscore.season_id,
-                    skater.player_id,
-                    skater.team_id,
-                    skater.position,
-                    skater.goals,
-                    skater.assists,
-                    skater.points,
-                    skater.plus_minus,
-                    skater.pim,
-                    skater.shots,
-                    skater.hits,
-                    skater.blocked_shots,
-                    skater.giveaways,
-                    skater.takeaways,
-                    skater.faceoff_pct if skater.faceoff_pct > 0 else None,
-                    toi_seconds,
-                    skater.shifts,
-                    skater.power_play_goals,
-                    skater.shorthanded_goals,
+                    *row,
                 )
 
             # Persist goalie stats
-            all_goalies = boxscore.home_goalies + boxscore.away_goalies
-            for goalie in all_goalies:
-                toi_seconds = self._toi_to_seconds(goalie.toi)
-                es_saves, es_shots = self._parse_saves_shots(
-                    goalie.even_strength_shots_against
-                )
-                pp_saves, pp_shots = self._parse_saves_shots(
-                    goalie.power_play_shots_against
-                )
-                sh_saves, sh_shots = self._parse_saves_shots(
-                    goalie.shorthanded_shots_against
-                )
-
+            for row in self._goalie_stats_rows(boxscore):
                 await db.execute(
                     """
                     INSERT INTO game_goalie_stats (
@@ -1011,23 +1135,7 @@ class BoxscoreDownloader(BaseDownloader):
                         decision = EXCLUDED.decision,
                         updated_at = CURRENT_TIMESTAMP
                     """,
-                    boxscore.game_id,
-                    boxscore.season_id,
-                    goalie.player_id,
-                    goalie.team_id,
-                    goalie.saves,
-                    goalie.shots_against,
-                    goalie.goals_against,
-                    goalie.save_pct if goalie.save_pct > 0 else None,
-                    toi_seconds,
-                    es_saves,
-                    es_shots,
-                    pp_saves,
-                    pp_shots,
-                    sh_saves,
-                    sh_shots,
-                    goalie.is_starter,
-                    goalie.decision,
+                    *row,
                 )
 
             count += 1
@@ -1039,3 +1147,73 @@ class BoxscoreDownloader(BaseDownloader):
             sum(len(b.home_goalies) + len(b.away_goalies) for b in parsed_boxscores),
         )
         return count
+
+    async def persist_bulk(
+        self,
+        db: DatabaseService,
+        boxscores: list[ParsedBoxscore] | list[dict[str, Any]],
+    ) -> int:
+        """Persist a batch of boxscores with COPY-based bulk upserts.
+
+        Writes the same rows as persist, but stages each table's rows for
+        the whole batch with COPY and merges them with one upsert statement
+        per table, all in a single transaction.
+
+        Args:
+            db: Database service instance
+            boxscores: List of ParsedBoxscore objects or dicts to persist
+
+        Returns:
+            Number of boxscores persisted
+        """
+        from nhl_api.services.db.bulk import copy_upsert
+
+        if not boxscores:
+            return 0
+
+        parsed_boxscores = self._to_parsed_boxscores(boxscores)
+
+        team_rows: list[tuple[Any, ...]] = []
+        skater_rows: list[tuple[Any, ...]] = []
+        goalie_rows: list[tuple[Any, ...]] = []
+        for boxscore in parsed_boxscores:
+            team_rows.extend(self._team_stats_rows(boxscore))
+            skater_rows.extend(self._skater_stats_rows(boxscore))
+            goalie_rows.extend(self._goalie_stats_rows(boxscore))
+
+        async with db.transaction() as conn:
+            await copy_upsert(
+                conn,
+                "game_team_stats",
+                TEAM_STATS_COLUMNS,
+                team_rows,
+                key_columns=("game_id", "season_id", "team_id"),
+                update_columns=TEAM_STATS_COLUMNS[4:],
+                touch_updated_at=True,
+            )
+            skaters = await copy_upsert(
+                conn,
+                "game_skater_stats",
+                SKATER_STATS_COLUMNS,
+                skater_rows,
+                key_columns=("game_id", "season_id", "player_id"),
+                update_columns=SKATER_STATS_COLUMNS[5:],
+                touch_updated_at=True,
+            )
+            goalies = await copy_upsert(
+                conn,
+                "game_goalie_stats",
+                GOALIE_STATS_COLUMNS,
+                goalie_rows,
+                key_columns=("game_id", "season_id", "player_id"),
+                update_columns=GOALIE_STATS_COLUMNS[4:],
+                touch_updated_at=True,
+            )
+
+        logger.info(
+            "Bulk persisted %d boxscores (%d skater stats, %d goalie stats)",
+            len(parsed_boxscores),
+            skaters,
+            goalies,
+        )
+        return len(parsed_boxscores)
@@ -24,6 +24,7 @@ from nhl_api.downloaders.base.base_downloader import (
     DownloaderConfig,
 )
 from nhl_api.downloaders.base.protocol import DownloadError
+from nhl_api.utils.http_client import COMPLETED_GAME_POLICY
 
 if TYPE_CHECKING:
     from nhl_api.services.db import DatabaseService
@@ -297,6 +298,9 @@ class GamecenterLandingDownloader(BaseDownloader):
             landing = result.data
     """
 
+    # Finished games never change, so their cached responses are reused
+    cache_policy = COMPLETED_GAME_POLICY
+
     def __init__(
         self,
         config: GamecenterLandingDownloaderConfig | None = None,
@@ -456,6 +456,9 @@ class PlayerGameLogDownloader(BaseDownloader):
     ) -> AsyncGenerator[DownloadResult, None]:
         """Download game logs for all configured players.
 
+        Up to ``config.max_concurrency`` game logs are fetched at once, all
+        through the shared rate limiter.
+
         Yields:
             DownloadResult for each player
         """
@@ -463,8 +466,9 @@ class PlayerGameLogDownloader(BaseDownloader):
             logger.warning("No players configured for download")
             return
 
-        for player_id, season_id, game_type in self._players:
-            result = await self.download_player_season(player_id, season_id, game_type)
+        async for result in self._iter_concurrent(
+            self._players, lambda player: self.download_player_season(*player)
+        ):
             yield result
 
     async def persist(
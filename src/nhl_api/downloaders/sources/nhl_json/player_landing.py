@@ -530,6 +530,8 @@ class PlayerLandingDownloader(BaseDownloader):
 
         Note:
             Set player IDs first with set_player_ids() or pass them to constructor.
+            Up to ``config.max_concurrency`` players are fetched at once, all
+            through the shared rate limiter.
         """
         if not self._player_ids:
             logger.warning(
@@ -546,24 +548,36 @@ class PlayerLandingDownloader(BaseDownloader):
             len(self._player_ids),
         )
 
-        for player_id in self._player_ids:
-            try:
-                result = await self.download_player(player_id)
-                yield result
-            except DownloadError as e:
-                logger.warning(
-                    "%s: Failed to download player %d: %s",
-                    self.source_name,
-                    player_id,
-                    e,
-                )
-                yield DownloadResult(
-                    source=self.source_name,
-                    season_id=0,
-                    data={"player_id": player_id},
-                    status=DownloadStatus.FAILED,
-                    error_message=str(e),
-                )
+        async for result in self._iter_concurrent(
+            self._player_ids, self._download_player_or_failure
+        ):
+            yield result
+
+    async def _download_player_or_failure(self, player_id: int) -> DownloadResult:
+        """Download one player, converting download errors to a FAILED result.
+
+        Args:
+            player_id: NHL player ID
+
+        Returns:
+            DownloadResult for the player
+        """
+        try:
+            return await self.download_player(player_id)
+        except DownloadError as e:
+            logger.warning(
+                "%s: Failed to download player %d: %s",
+                self.source_name,
+                player_id,
+                e,
+            )
+            return DownloadResult(
+                source=self.source_name,
+                season_id=0,
+                data={"player_id": player_id},
+                status=DownloadStatus.FAILED,
+                error_message=str(e),
+            )
 
     async def _fetch_player(self, player_id: int) -> dict[str, Any]:
         """Fetch landing page data for a single player.
@@ -8,6 +8,7 @@ and available seasons for each team.
 from __future__ import annotations
 
 import logging
+import time
 from dataclasses import dataclass
 from datetime import date
 from typing import TYPE_CHECKING, Any
@@ -19,15 +20,27 @@ from nhl_api.downloaders.base.base_downloader import (
 from nhl_api.downloaders.base.protocol import DownloadError
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncGenerator, Sequence
+    from collections.abc import (
+        AsyncGenerator,
+        Awaitable,
+        Callable,
+        Iterable,
+        Sequence,
+    )
 
+    from nhl_api.downloaders.base.rate_limiter import RateLimiter
+    from nhl_api.downloaders.base.retry_handler import RetryHandler
     from nhl_api.services.db import DatabaseService
+    from nhl_api.utils.http_client import HTTPClient
 
 logger = logging.getLogger(__name__)
 
 # NHL JSON API base URL
 NHL_API_BASE_URL = "https://api-web.nhle.com/v1"
 
+# Seconds a player index is reused before rosters are fetched again
+DEFAULT_PLAYER_INDEX_TTL = 3600.0
+
 
 @dataclass(frozen=True, slots=True)
 class PlayerInfo:
@@ -143,6 +156,37 @@ def _parse_player(player_data: dict[str, Any], team_abbrev: str) -> PlayerInfo:
     )
 
 
+def _player_from_record(record: Any) -> PlayerInfo:
+    """Build a PlayerInfo from a team_rosters row joined with players.
+
+    Args:
+        record: Database row with roster and player columns
+
+    Returns:
+        PlayerInfo for the roster entry (metric sizes derived from imperial)
+    """
+    height_inches = record["height_inches"] or 0
+    weight_pounds = record["weight_lbs"] or 0
+    return PlayerInfo(
+        player_id=record["player_id"],
+        first_name=record["first_name"] or "",
+        last_name=record["last_name"] or "",
+        sweater_number=record["sweater_number"],
+        position_code=record["position_code"],
+        shoots_catches=record["shoots_catches"] or "",
+        height_inches=height_inches,
+        weight_pounds=weight_pounds,
+        height_cm=round(height_inches * 2.54),
+        weight_kg=round(weight_pounds * 0.45359237),
+        birth_date=record["birth_date"],
+        birth_city=record["birth_city"],
+        birth_country=record["birth_country"],
+        birth_state_province=record["birth_state_province"],
+        headshot_url=record["headshot_url"],
+        team_abbrev=record["team_abbrev"],
+    )
+
+
 def _parse_roster(
     data: dict[str, Any], team_abbrev: str, season_id: int | None = None
 ) -> ParsedRoster:
@@ -315,6 +359,99 @@ ALL_TEAM_ABBREVS: tuple[str, ...] = (
 NHL_TEAM_ABBREVS = CURRENT_TEAM_ABBREVS
 
 
+class PlayerIndex:
+    """Player ID lookup built from team rosters.
+
+    Filled as a side effect of roster downloads (or from the team_rosters
+    table) and reused until ``ttl`` seconds after the refresh that built it.
+    Tracks which teams it covers so lookups only fetch missing teams.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_PLAYER_INDEX_TTL) -> None:
+        """Initialize the index.
+
+        Args:
+            ttl: Seconds the index is reused after a refresh starts
+        """
+        self.ttl = ttl
+        self._players: dict[int, PlayerInfo] = {}
+        self._teams: set[str] = set()
+        self._built_at: float | None = None
+
+    @property
+    def is_fresh(self) -> bool:
+        """Check if the index was built within the TTL."""
+        return (
+            self._built_at is not None and time.monotonic() - self._built_at <= self.ttl
+        )
+
+    def begin_refresh(self) -> None:
+        """Start a new generation if the current one has expired."""
+        if not self.is_fresh:
+            self.invalidate()
+            self._built_at = time.monotonic()
+
+    def add_roster(self, roster: ParsedRoster) -> None:
+        """Index every player on a roster.
+
+        Args:
+            roster: Parsed team roster
+        """
+        self.add_players(roster.all_players)
+        self._teams.add(roster.team_abbrev)
+
+    def add_players(self, players: Iterable[PlayerInfo]) -> None:
+        """Index players by ID.
+
+        Args:
+            players: Players to index; later entries replace earlier ones
+        """
+        for player in players:
+            self._players[player.player_id] = player
+
+    def mark_teams(self, teams: Iterable[str]) -> None:
+        """Record teams as covered without adding a roster for them.
+
+        Args:
+            teams: Team abbreviations whose players are already indexed
+        """
+        self._teams.update(teams)
+
+    def missing_teams(self, teams: Sequence[str]) -> list[str]:
+        """List teams the index does not cover yet.
+
+        Args:
+            teams: Team abbreviations to check
+
+        Returns:
+            Teams to fetch, in the given order (all teams if expired)
+        """
+        if not self.is_fresh:
+            return list(teams)
+        return [team for team in teams if team not in self._teams]
+
+    def get(self, player_id: int) -> PlayerInfo | None:
+        """Look up a player.
+
+        Args:
+            player_id: NHL player ID
+
+        Returns:
+            PlayerInfo if indexed, None otherwise
+        """
+        return self._players.get(player_id)
+
+    def invalidate(self) -> None:
+        """Drop every indexed player so the next lookup refreshes."""
+        self._players.clear()
+        self._teams.clear()
+        self._built_at = None
+
+    def __len__(self) -> int:
+        """Number of indexed players."""
+        return len(self._players)
+
+
 class RosterDownloader(BaseDownloader):
     """Downloads NHL team rosters.
 
@@ -338,6 +475,37 @@ class RosterDownloader(BaseDownloader):
                 print(f"{roster.team_abbrev}: {roster.player_count} players")
     """
 
+    def __init__(
+        self,
+        config: DownloaderConfig,
+        *,
+        http_client: HTTPClient | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_handler: RetryHandler | None = None,
+        progress_callback: Callable[..., None] | None = None,
+        player_index_ttl: float = DEFAULT_PLAYER_INDEX_TTL,
+    ) -> None:
+        """Initialize the Roster Downloader.
+
+        Args:
+            config: Downloader configuration
+            http_client: Optional custom HTTP client
+            rate_limiter: Optional custom rate limiter
+            retry_handler: Optional custom retry handler
+            progress_callback: Optional callback for progress updates
+            player_index_ttl: Seconds a player index is reused
+        """
+        super().__init__(
+            config,
+            http_client=http_client,
+            rate_limiter=rate_limiter,
+            retry_handler=retry_handler,
+            progress_callback=progress_callback,
+        )
+        self._player_index_ttl = player_index_ttl
+        # One index per season; None holds current rosters
+        self._player_indexes: dict[int | None, PlayerIndex] = {}
+
     @property
     def source_name(self) -> str:
         """Return unique identifier for this source."""
@@ -479,6 +647,9 @@ class RosterDownloader(BaseDownloader):
     ) -> list[ParsedRoster]:
         """Download current rosters for multiple teams.
 
+        Up to ``config.max_concurrency`` teams are fetched at once, and the
+        player index is updated with every roster fetched.
+
         Args:
             team_abbrevs: List of team abbreviations to download.
                          If None, downloads all 32 NHL teams.
@@ -494,14 +665,15 @@ class RosterDownloader(BaseDownloader):
 
         logger.info("Downloading rosters for %d teams", len(teams))
 
-        rosters: list[ParsedRoster] = []
-        for team in teams:
+        async def fetch(team: str) -> ParsedRoster | None:
             try:
-                roster = await self.get_current_roster(team)
-                rosters.append(roster)
+                return await self.get_current_roster(team)
             except DownloadError as e:
                 logger.warning("Failed to download roster for %s: %s", team, e)
                 # Continue with other teams
+                return None
+
+        rosters = await self._download_and_index(None, teams, fetch)
 
         logger.info(
             "Downloaded %d rosters with %d total players",
@@ -518,30 +690,38 @@ class RosterDownloader(BaseDownloader):
     ) -> list[ParsedRoster]:
         """Download rosters for multiple teams for a specific season.
 
+        Up to ``config.max_concurrency`` teams are fetched at once, and the
+        player index is updated with every roster fetched.
+
         Args:
             season_id: Season ID (e.g., 20232024)
             team_abbrevs: List of team abbreviations to download.
                          If None, downloads all 32 NHL teams.
 
         Returns:
-            List of ParsedRoster objects
-
-        Raises:
-            DownloadError: If any roster cannot be fetched
+            List of ParsedRoster objects. Teams whose roster cannot be
+            fetched or parsed are skipped, so one bad roster does not fail
+            the others.
         """
         teams = team_abbrevs if team_abbrevs is not None else NHL_TEAM_ABBREVS
         self.set_total_items(len(teams))
 
         logger.info("Downloading rosters for %d teams season %d", len(teams), season_id)
 
-        rosters: list[ParsedRoster] = []
-        for team in teams:
+        async def fetch(team: str) -> ParsedRoster | None:
             try:
-                roster = await self.get_roster_for_season(team, season_id)
-                rosters.append(roster)
+                return await self.get_roster_for_season(team, season_id)
             except DownloadError as e:
                 # Some teams may not have existed in older seasons
                 logger.debug("No roster for %s season %d: %s", team, season_id, e)
+                return None
+            except (KeyError, TypeError, ValueError) as e:
+                logger.warning(
+                    "Malformed roster for %s season %d: %s", team, season_id, e
+                )
+                return None
+
+        rosters = await self._download_and_index(season_id, teams, fetch)
 
         logger.info(
             "Downloaded %d rosters for season %d with %d total players",
@@ -553,32 +733,138 @@ class RosterDownloader(BaseDownloader):
         return rosters
 
     async def get_player_by_id(
-        self, player_id: int, team_abbrevs: Sequence[str] | None = None
+        self,
+        player_id: int,
+        team_abbrevs: Sequence[str] | None = None,
+        *,
+        season_id: int | None = None,
     ) -> PlayerInfo | None:
         """Find a player by ID across team rosters.
 
-        This searches current rosters to find a player. For more complete
-        player info, use the Player Landing downloader.
+        Looks the player up in the player index, fetching only the rosters
+        it does not cover yet (all of them once the index has expired). For
+        more complete player info, use the Player Landing downloader.
 
         Args:
             player_id: NHL player ID
             team_abbrevs: Teams to search. If None, searches all teams.
+            season_id: Search this season's rosters instead of current ones
 
         Returns:
             PlayerInfo if found, None otherwise
         """
-        teams = team_abbrevs if team_abbrevs is not None else NHL_TEAM_ABBREVS
+        if team_abbrevs is not None:
+            teams = team_abbrevs
+        elif season_id is not None:
+            teams = get_teams_for_season(season_id)
+        else:
+            teams = NHL_TEAM_ABBREVS
+
+        missing = self.player_index(season_id).missing_teams(teams)
+        if missing:
+            if season_id is None:
+                await self.download_all_current_rosters(missing)
+            else:
+                await self.download_rosters_for_season(season_id, missing)
+
+        player = self.player_index(season_id).get(player_id)
+        if player is None or player.team_abbrev not in teams:
+            return None
+        return player
+
+    def player_index(self, season_id: int | None = None) -> PlayerIndex:
+        """Get the player index for current or season rosters.
 
-        for team in teams:
-            try:
-                roster = await self.get_current_roster(team)
-                for player in roster.all_players:
-                    if player.player_id == player_id:
-                        return player
-            except DownloadError:
-                continue
+        Args:
+            season_id: Season of the indexed rosters, None for current rosters
 
-        return None
+        Returns:
+            The season's PlayerIndex
+        """
+        index = self._player_indexes.get(season_id)
+        if index is None:
+            index = PlayerIndex(self._player_index_ttl)
+            self._player_indexes[season_id] = index
+        return index
+
+    async def load_player_index(self, db: DatabaseService, season_id: int) -> int:
+        """Fill a season's player index from the team_rosters table.
+
+        Uses each player's latest roster snapshot for the season, so lookups
+        only hit the API for teams with no stored roster.
+
+        Args:
+            db: Database service instance
+            season_id: Season ID (e.g., 20242025)
+
+        Returns:
+            Number of players indexed
+        """
+        records = await db.fetch(
+            """
+            SELECT DISTINCT ON (tr.player_id)
+                tr.player_id, tr.team_abbrev, tr.position_code,
+                tr.sweater_number, p.first_name, p.last_name,
+                p.shoots_catches, p.height_inches, p.weight_lbs, p.birth_date,
+                p.birth_city, p.birth_country, p.birth_state_province,
+                p.headshot_url
+            FROM team_rosters tr
+            JOIN players p ON p.player_id = tr.player_id
+            WHERE tr.season_id = $1
+            ORDER BY tr.player_id, tr.snapshot_date DESC
+            """,
+            season_id,
+        )
+
+        players = [_player_from_record(record) for record in records]
+        teams = {player.team_abbrev for player in players}
+
+        index = self.player_index(season_id)
+        index.begin_refresh()
+        index.add_players(players)
+        index.mark_teams(teams)
+
+        logger.info(
+            "Loaded %d players across %d teams into the season %d player index",
+            len(players),
+            len(teams),
+            season_id,
+        )
+        return len(players)
+
+    async def _download_and_index(
+        self,
+        season_id: int | None,
+        teams: Sequence[str],
+        fetch: Callable[[str], Awaitable[ParsedRoster | None]],
+    ) -> list[ParsedRoster]:
+        """Fetch rosters concurrently, adding each to the player index.
+
+        Only teams that returned a roster are marked as covered.
+
+        Args:
+            season_id: Season of the rosters, None for current rosters
+            teams: Team abbreviations to fetch
+            fetch: Coroutine function fetching one team's roster
+
+        Returns:
+            Rosters that were fetched
+        """
+        index = self.player_index(season_id)
+        index.begin_refresh()
+
+        rosters: list[ParsedRoster] = []
+        results = self._iter_concurrent(teams, fetch)
+        try:
+            async for roster in results:
+                if roster is not None:
+                    index.add_roster(roster)
+                    rosters.append(roster)
+        finally:
+            await results.aclose()
+
+        # Teams whose fetch failed stay uncovered so the next lookup retries
+        return rosters
 
     async def persist(
         self,
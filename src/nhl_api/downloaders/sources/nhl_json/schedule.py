@@ -27,6 +27,9 @@ logger = logging.getLogger(__name__)
 # NHL JSON API base URL
 NHL_API_BASE_URL = "https://api-web.nhle.com/v1"
 
+# Default number of schedule weeks fetched at once
+DEFAULT_SCHEDULE_CONCURRENCY = 4
+
 # Map numeric game type to string code for database
 GAME_TYPE_MAP = {
     1: "PR",  # Preseason
@@ -114,6 +117,20 @@ def _parse_game(game_data: dict[str, Any]) -> GameInfo:
     )
 
 
+def season_date_range(season_id: int) -> tuple[date, date]:
+    """Get the dates a season's schedule can span.
+
+    Args:
+        season_id: Season ID (e.g., 20242025)
+
+    Returns:
+        Tuple of (first date, last date), preseason through the playoffs
+    """
+    start_year = season_id // 10000
+    # Regular season typically Oct 1 - Apr 15, playoffs through June
+    return date(start_year, 9, 15), date(start_year + 1, 6, 30)
+
+
 class ScheduleDownloader(BaseDownloader):
     """Downloads NHL game schedules.
 
@@ -133,6 +150,17 @@ class ScheduleDownloader(BaseDownloader):
                 print(f"Downloaded game {result.game_id}")
     """
 
+    def __init__(self, config: DownloaderConfig, **kwargs: Any) -> None:
+        """Initialize the downloader.
+
+        Args:
+            config: Downloader configuration
+            **kwargs: Additional arguments passed to BaseDownloader
+        """
+        super().__init__(config, **kwargs)
+        # Anchor dates of weeks the last multi-week fetch could not download
+        self.missing_weeks: list[date] = []
+
     @property
     def source_name(self) -> str:
         """Return unique identifier for this source."""
@@ -268,23 +296,25 @@ class ScheduleDownloader(BaseDownloader):
         season_id: int,
         *,
         game_type: int | None = None,
+        since: date | None = None,
     ) -> list[GameInfo]:
         """Get complete schedule for a season.
 
-        Iterates through all dates in the season to collect games.
+        Fetches the season a week at a time, up to ``config.max_concurrency``
+        weeks at once.
 
         Args:
             season_id: Season ID (e.g., 20242025)
             game_type: Optional filter (1=pre, 2=regular, 3=playoffs)
+            since: Only fetch weeks from this date on (for incremental refresh)
 
         Returns:
             List of all games in the season
         """
         # Determine season date range
-        start_year = season_id // 10000
-        # Regular season typically Oct 1 - Apr 15, playoffs through June
-        season_start = date(start_year, 9, 15)  # Early for preseason
-        season_end = date(start_year + 1, 6, 30)
+        season_start, season_end = season_date_range(season_id)
+        if since is not None:
+            season_start = max(season_start, since)
 
         logger.info(
             "Fetching season %d schedule (%s to %s)",
@@ -293,37 +323,13 @@ class ScheduleDownloader(BaseDownloader):
             season_end,
         )
 
-        all_games: list[GameInfo] = []
-        seen_game_ids: set[int] = set()
-        current_date = season_start
-
-        while current_date <= season_end:
-            try:
-                # Use get_schedule_for_week to fetch all games in the week
-                week_games = await self.get_schedule_for_week(current_date)
-
-                for game in week_games:
-                    # Filter by game type if specified
-                    if game_type is not None and game.game_type != game_type:
-                        continue
-
-                    # Skip if we've already seen this game
-                    if game.game_id in seen_game_ids:
-                        continue
-
-                    # Verify it's from the correct season
-                    if game.season_id != season_id:
-                        continue
-
-                    seen_game_ids.add(game.game_id)
-                    all_games.append(game)
-
-            except DownloadError as e:
-                # Log but continue - some dates may have no games
-                logger.debug("No schedule data for %s: %s", current_date, e)
-
-            # Move to next week (schedule API returns a week at a time)
-            current_date += timedelta(days=7)
+        all_games = [
+            game
+            for game in await self._get_weeks(season_start, season_end)
+            # Weeks at the season edges include games from other seasons
+            if game.season_id == season_id
+            and (game_type is None or game.game_type == game_type)
+        ]
 
         logger.info(
             "Found %d total games for season %d",
@@ -331,7 +337,7 @@ class ScheduleDownloader(BaseDownloader):
             season_id,
         )
 
-        return sorted(all_games, key=lambda g: (g.game_date, g.game_id))
+        return all_games
 
     async def get_games_in_range(
         self,
@@ -347,25 +353,61 @@ class ScheduleDownloader(BaseDownloader):
         Returns:
             List of games in the date range
         """
-        all_games: list[GameInfo] = []
-        seen_game_ids: set[int] = set()
-        current_date = start_date
+        return [
+            game
+            for game in await self._get_weeks(start_date, end_date)
+            if start_date <= game.game_date <= end_date
+        ]
 
-        while current_date <= end_date:
-            try:
-                date_games = await self.get_schedule_for_date(current_date)
+    async def _get_weeks(self, start_date: date, end_date: date) -> list[GameInfo]:
+        """Fetch every schedule week between two dates.
 
-                for game in date_games:
-                    if game.game_id not in seen_game_ids:
-                        seen_game_ids.add(game.game_id)
-                        all_games.append(game)
+        The schedule API returns a week at a time, so one anchor date per
+        week covers the range. Up to ``config.max_concurrency`` weeks are
+        fetched at once; weeks that fail to download are skipped and listed
+        in ``missing_weeks``.
 
-            except DownloadError:
-                pass  # Some dates may have no games
+        Args:
+            start_date: First anchor date
+            end_date: Last date that must be covered
 
+        Returns:
+            Games de-duplicated by game ID, sorted by date and game ID
+        """
+        anchors: list[date] = []
+        current_date = start_date
+        while current_date <= end_date:
+            anchors.append(current_date)
             current_date += timedelta(days=7)
 
-        return sorted(all_games, key=lambda g: (g.game_date, g.game_id))
+        self.missing_weeks = []
+        games: dict[int, GameInfo] = {}
+        results = self._iter_concurrent(anchors, self._get_week_or_empty, in_order=True)
+        try:
+            async for week_games in results:
+                for game in week_games:
+                    games.setdefault(game.game_id, game)
+        finally:
+            await results.aclose()
+
+        return sorted(games.values(), key=lambda g: (g.game_date, g.game_id))
+
+    async def _get_week_or_empty(self, anchor_date: date) -> list[GameInfo]:
+        """Get a week's games, logging failures instead of raising.
+
+        Args:
+            anchor_date: Any date in the week to fetch
+
+        Returns:
+            Games for the week, or an empty list if it could not be fetched
+        """
+        try:
+            return await self.get_schedule_for_week(anchor_date)
+        except DownloadError as e:
+            # Log but continue - some dates may have no games
+            logger.debug("No schedule data for %s: %s", anchor_date, e)
+            self.missing_weeks.append(anchor_date)
+            return []
 
     async def persist(
         self,
@@ -374,8 +416,9 @@ class ScheduleDownloader(BaseDownloader):
     ) -> int:
         """Persist downloaded games to the database.
 
-        Uses upsert (INSERT ... ON CONFLICT) to handle re-downloads gracefully.
-        Updates scores and game state for games that already exist.
+        Stages every game with COPY and merges them into games in a single
+        upsert, so re-downloads update scores and game state for games that
+        already exist.
 
         Args:
             db: Database service instance
@@ -384,77 +427,102 @@ class ScheduleDownloader(BaseDownloader):
         Returns:
             Number of games upserted
         """
+        from nhl_api.services.db.bulk import copy_upsert
+
         if not games:
             return 0
 
-        count = 0
-        for game in games:
-            # Convert game_type int to string code
-            game_type_str = GAME_TYPE_MAP.get(game.game_type, "R")
-
-            # Extract time from start_time_utc if available
-            game_time: time | None = None
-            if game.start_time_utc:
-                game_time = game.start_time_utc.timetz()
-
-            # Determine game outcome from state
-            game_outcome: str | None = None
-            if game.game_state in ("OFF", "FINAL"):
-                if game.is_shootout:
-                    game_outcome = "SO"
-                elif game.is_overtime:
-                    game_outcome = "OT"
-                else:
-                    game_outcome = "REG"
-
-            await db.execute(
-                """
-                INSERT INTO games (
-                    game_id, season_id, game_type, game_date, game_time,
-                    home_team_id, away_team_id, home_score, away_score,
-                    period, game_state, is_overtime, is_shootout, game_outcome
-                ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14)
-                ON CONFLICT (game_id, season_id) DO UPDATE SET
-                    home_score = EXCLUDED.home_score,
-                    away_score = EXCLUDED.away_score,
-                    period = EXCLUDED.period,
-                    game_state = EXCLUDED.game_state,
-                    is_overtime = EXCLUDED.is_overtime,
-                    is_shootout = EXCLUDED.is_shootout,
-                    game_outcome = EXCLUDED.game_outcome,
-                    updated_at = CURRENT_TIMESTAMP
-                """,
-                game.game_id,
-                game.season_id,
-                game_type_str,
-                game.game_date,
-                game_time,
-                game.home_team_id,
-                game.away_team_id,
-                game.home_score,
-                game.away_score,
-                game.period,
-                game.game_state,
-                game.is_overtime,
-                game.is_shootout,
-                game_outcome,
+        async with db.transaction() as conn:
+            count = await copy_upsert(
+                conn,
+                "games",
+                GAME_COLUMNS,
+                [_game_row(game) for game in games],
+                key_columns=("game_id", "season_id"),
+                update_columns=GAME_COLUMNS[7:],
+                touch_updated_at=True,
             )
-            count += 1
 
         logger.info("Persisted %d games to database", count)
         return count
 
 
+# Column order of the rows built by _game_row
+GAME_COLUMNS = (
+    "game_id",
+    "season_id",
+    "game_type",
+    "game_date",
+    "game_time",
+    "home_team_id",
+    "away_team_id",
+    "home_score",
+    "away_score",
+    "period",
+    "game_state",
+    "is_overtime",
+    "is_shootout",
+    "game_outcome",
+)
+
+
+def _game_row(game: GameInfo) -> tuple[Any, ...]:
+    """Build a games row for a scheduled game.
+
+    Args:
+        game: Parsed game
+
+    Returns:
+        Row tuple in GAME_COLUMNS order
+    """
+    # Convert game_type int to string code
+    game_type_str = GAME_TYPE_MAP.get(game.game_type, "R")
+
+    # Extract time from start_time_utc if available
+    game_time: time | None = None
+    if game.start_time_utc:
+        game_time = game.start_time_utc.timetz()
+
+    # Determine game outcome from state
+    game_outcome: str | None = None
+    if game.game_state in ("OFF", "FINAL"):
+        if game.is_shootout:
+            game_outcome = "SO"
+        elif game.is_overtime:
+            game_outcome = "OT"
+        else:
+            game_outcome = "REG"
+
+    return (
+        game.game_id,
+        game.season_id,
+        game_type_str,
+        game.game_date,
+        game_time,
+        game.home_team_id,
+        game.away_team_id,
+        game.home_score,
+        game.away_score,
+        game.period,
+        game.game_state,
+        game.is_overtime,
+        game.is_shootout,
+        game_outcome,
+    )
+
+
 def create_schedule_downloader(
     *,
     requests_per_second: float = 5.0,
     max_retries: int = 3,
+    max_concurrency: int = DEFAULT_SCHEDULE_CONCURRENCY,
 ) -> ScheduleDownloader:
     """Factory function to create a configured ScheduleDownloader.
 
     Args:
         requests_per_second: Rate limit for API calls
         max_retries: Maximum retry attempts
+        max_concurrency: Schedule weeks fetched at once
 
     Returns:
         Configured ScheduleDownloader instance
@@ -464,5 +532,6 @@ def create_schedule_downloader(
         requests_per_second=requests_per_second,
         max_retries=max_retries,
         health_check_url="schedule/now",
+        max_concurrency=max_concurrency,
     )
     return ScheduleDownloader(config)
@@ -9,7 +9,7 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from datetime import date
+from datetime import date, timedelta
 from typing import TYPE_CHECKING, Any
 
 from nhl_api.downloaders.base.base_downloader import (
@@ -19,7 +19,7 @@ from nhl_api.downloaders.base.base_downloader import (
 from nhl_api.downloaders.base.protocol import DownloadError
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncGenerator
+    from collections.abc import AsyncGenerator, Iterator, Sequence
 
     from nhl_api.services.db import DatabaseService
 
@@ -28,6 +28,9 @@ logger = logging.getLogger(__name__)
 # NHL JSON API base URL
 NHL_API_BASE_URL = "https://api-web.nhle.com/v1"
 
+# Dates in flight during get_standings_range for factory-built downloaders
+DEFAULT_RANGE_CONCURRENCY = 4
+
 
 @dataclass(frozen=True, slots=True)
 class StreakInfo:
@@ -410,24 +413,24 @@ class StandingsDownloader(BaseDownloader):
         start_date: date,
         end_date: date,
         interval_days: int = 7,
+        *,
+        db: DatabaseService | None = None,
     ) -> list[ParsedStandings]:
         """Get standings snapshots over a date range.
 
-        Useful for tracking standings progression over time.
+        Useful for tracking standings progression over time. Up to
+        ``config.max_concurrency`` dates are fetched at once; snapshots are
+        returned in date order. Dates that fail to download are skipped.
 
         Args:
             start_date: Start date (inclusive)
             end_date: End date (inclusive)
             interval_days: Days between snapshots (default 7 for weekly)
+            db: If given, skip dates that already have a snapshot stored
 
         Returns:
-            List of standings snapshots
-
-        Raises:
-            DownloadError: If any standings fetch fails
+            List of standings snapshots, in date order
         """
-        from datetime import timedelta
-
         logger.info(
             "Fetching standings from %s to %s (every %d days)",
             start_date,
@@ -435,22 +438,77 @@ class StandingsDownloader(BaseDownloader):
             interval_days,
         )
 
-        snapshots: list[ParsedStandings] = []
+        dates: list[date] = []
         current_date = start_date
-
         while current_date <= end_date:
-            try:
-                standings = await self.get_standings_for_date(current_date)
-                snapshots.append(standings)
-            except DownloadError as e:
-                logger.warning("No standings for %s: %s", current_date, e)
-
+            dates.append(current_date)
             current_date += timedelta(days=interval_days)
 
+        if db is not None and dates:
+            existing = await self.get_existing_snapshot_dates(db, start_date, end_date)
+            if existing:
+                logger.info("Skipping %d dates already stored", len(existing))
+                dates = [d for d in dates if d not in existing]
+
+        snapshots: list[ParsedStandings] = []
+        results = self._iter_concurrent(
+            dates, self._get_standings_or_none, in_order=True
+        )
+        try:
+            async for standings in results:
+                if standings is not None:
+                    snapshots.append(standings)
+        finally:
+            await results.aclose()
+
         logger.info("Retrieved %d standings snapshots", len(snapshots))
 
         return snapshots
 
+    async def _get_standings_or_none(
+        self, standings_date: date
+    ) -> ParsedStandings | None:
+        """Get standings for a date, logging failures instead of raising.
+
+        Args:
+            standings_date: Date to fetch standings for
+
+        Returns:
+            ParsedStandings, or None if the date could not be fetched
+        """
+        try:
+            return await self.get_standings_for_date(standings_date)
+        except DownloadError as e:
+            logger.warning("No standings for %s: %s", standings_date, e)
+            return None
+
+    async def get_existing_snapshot_dates(
+        self,
+        db: DatabaseService,
+        start_date: date,
+        end_date: date,
+    ) -> set[date]:
+        """Get dates that already have standings stored.
+
+        Args:
+            db: Database service instance
+            start_date: Start date (inclusive)
+            end_date: End date (inclusive)
+
+        Returns:
+            Snapshot dates present in standings_snapshots
+        """
+        rows = await db.fetch(
+            """
+            SELECT DISTINCT snapshot_date
+            FROM standings_snapshots
+            WHERE snapshot_date BETWEEN $1 AND $2
+            """,
+            start_date,
+            end_date,
+        )
+        return {row["snapshot_date"] for row in rows}
+
     async def persist(
         self,
         db: DatabaseService,
@@ -460,6 +518,7 @@ class StandingsDownloader(BaseDownloader):
 
         Uses upsert (INSERT ... ON CONFLICT) to handle re-downloads gracefully.
         Updates all fields for standings that already exist for the same date.
+        Issues one upsert per team; use persist_bulk for a range of snapshots.
 
         Args:
             db: Database service instance
@@ -472,16 +531,7 @@ class StandingsDownloader(BaseDownloader):
             return 0
 
         count = 0
-        for team in standings.standings:
-            # Format record splits as strings (e.g., "15-5-2")
-            home_record = _format_record_split(team.home_record)
-            road_record = _format_record_split(team.road_record)
-            last_10_record = _format_record_split(team.last_10_record)
-
-            # Extract streak info
-            streak_code = team.streak.code if team.streak else None
-            streak_count = team.streak.count if team.streak else None
-
+        for row in _standings_snapshot_rows(standings):
             await db.execute(
                 """
                 INSERT INTO standings_snapshots (
@@ -528,36 +578,7 @@ class StandingsDownloader(BaseDownloader):
                     last_10_record = EXCLUDED.last_10_record,
                     clinch_indicator = EXCLUDED.clinch_indicator
                 """,
-                team.team_abbrev,
-                standings.season_id,
-                standings.standings_date,
-                team.conference_abbrev,
-                team.conference_name,
-                team.division_abbrev,
-                team.division_name,
-                team.games_played,
-                team.wins,
-                team.losses,
-                team.ot_losses,
-                team.points,
-                team.point_pctg,
-                team.goals_for,
-                team.goals_against,
-                team.goal_differential,
-                team.regulation_wins,
-                team.regulation_plus_ot_wins,
-                team.shootout_wins,
-                team.shootout_losses,
-                team.league_sequence,
-                team.conference_sequence,
-                team.division_sequence,
-                team.wildcard_sequence,
-                streak_code,
-                streak_count,
-                home_record,
-                road_record,
-                last_10_record,
-                team.clinch_indicator,
+                *row,
             )
             count += 1
 
@@ -568,6 +589,130 @@ class StandingsDownloader(BaseDownloader):
         )
         return count
 
+    async def persist_bulk(
+        self,
+        db: DatabaseService,
+        snapshots: Sequence[ParsedStandings],
+    ) -> int:
+        """Persist a range of standings snapshots in one transaction.
+
+        Writes the same rows as persist, but stages every team of every
+        snapshot with COPY and merges them into standings_snapshots in a
+        single statement.
+
+        Args:
+            db: Database service instance
+            snapshots: Standings snapshots to persist
+
+        Returns:
+            Number of team standings upserted
+        """
+        from nhl_api.services.db.bulk import copy_upsert
+
+        rows = [
+            row
+            for standings in snapshots
+            for row in _standings_snapshot_rows(standings)
+        ]
+        if not rows:
+            return 0
+
+        async with db.transaction() as conn:
+            count = await copy_upsert(
+                conn,
+                "standings_snapshots",
+                STANDINGS_SNAPSHOT_COLUMNS,
+                rows,
+                key_columns=("team_abbrev", "season_id", "snapshot_date"),
+                update_columns=STANDINGS_SNAPSHOT_COLUMNS[3:],
+            )
+
+        logger.info(
+            "Bulk persisted %d standings snapshots (%d team rows) to database",
+            len(snapshots),
+            count,
+        )
+        return count
+
+
+# Column order of the rows built by _standings_snapshot_rows
+STANDINGS_SNAPSHOT_COLUMNS = (
+    "team_abbrev",
+    "season_id",
+    "snapshot_date",
+    "conference_abbrev",
+    "conference_name",
+    "division_abbrev",
+    "division_name",
+    "games_played",
+    "wins",
+    "losses",
+    "ot_losses",
+    "points",
+    "point_pctg",
+    "goals_for",
+    "goals_against",
+    "goal_differential",
+    "regulation_wins",
+    "regulation_plus_ot_wins",
+    "shootout_wins",
+    "shootout_losses",
+    "league_sequence",
+    "conference_sequence",
+    "division_sequence",
+    "wildcard_sequence",
+    "streak_code",
+    "streak_count",
+    "home_record",
+    "road_record",
+    "last_10_record",
+    "clinch_indicator",
+)
+
+
+def _standings_snapshot_rows(standings: ParsedStandings) -> Iterator[tuple[Any, ...]]:
+    """Yield standings_snapshots rows for one snapshot.
+
+    Args:
+        standings: Standings snapshot
+
+    Yields:
+        Row tuples in STANDINGS_SNAPSHOT_COLUMNS order
+    """
+    for team in standings.standings:
+        yield (
+            team.team_abbrev,
+            standings.season_id,
+            standings.standings_date,
+            team.conference_abbrev,
+            team.conference_name,
+            team.division_abbrev,
+            team.division_name,
+            team.games_played,
+            team.wins,
+            team.losses,
+            team.ot_losses,
+            team.points,
+            team.point_pctg,
+            team.goals_for,
+            team.goals_against,
+            team.goal_differential,
+            team.regulation_wins,
+            team.regulation_plus_ot_wins,
+            team.shootout_wins,
+            team.shootout_losses,
+            team.league_sequence,
+            team.conference_sequence,
+            team.division_sequence,
+            team.wildcard_sequence,
+            team.streak.code if team.streak else None,
+            team.streak.count if team.streak else None,
+            _format_record_split(team.home_record),
+            _format_record_split(team.road_record),
+            _format_record_split(team.last_10_record),
+            team.clinch_indicator,
+        )
+
 
 def _format_record_split(record: RecordSplit | None) -> str | None:
     """Format a record split as a W-L-OTL string.
@@ -587,12 +732,14 @@ def create_standings_downloader(
     *,
     requests_per_second: float = 5.0,
     max_retries: int = 3,
+    max_concurrency: int = DEFAULT_RANGE_CONCURRENCY,
 ) -> StandingsDownloader:
     """Factory function to create a configured StandingsDownloader.
 
     Args:
         requests_per_second: Rate limit for API calls
         max_retries: Maximum retry attempts
+        max_concurrency: Dates fetched at once by get_standings_range
 
     Returns:
         Configured StandingsDownloader instance
@@ -602,5 +749,6 @@ def create_standings_downloader(
         requests_per_second=requests_per_second,
         max_retries=max_retries,
         health_check_url="standings/now",
+        max_concurrency=max_concurrency,
     )
     return StandingsDownloader(config)
@@ -38,7 +38,7 @@ from nhl_api.models.shifts import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator
 
     from nhl_api.downloaders.base.rate_limiter import RateLimiter
     from nhl_api.downloaders.base.retry_handler import RetryHandler
@@ -78,6 +78,10 @@ class ShiftChartsDownloader(BaseStatsDownloader):
             async for result in downloader.download_season(20242025):
                 chart = result.data
                 print(f"Game {chart['game_id']}: {chart['total_shifts']} shifts")
+
+    Shift chart payloads carry no game state, so a finished game cannot be
+    told apart from one in progress; cached responses are always
+    revalidated rather than marked immutable.
     """
 
     def __init__(
@@ -276,6 +280,8 @@ class ShiftChartsDownloader(BaseStatsDownloader):
     ) -> int:
         """Persist shift charts to database.
 
+        Issues one upsert per shift; use persist_bulk for large batches.
+
         Args:
             db: Database service
             shift_charts: List of parsed shift charts or dicts
@@ -284,42 +290,22 @@ class ShiftChartsDownloader(BaseStatsDownloader):
             Number of shifts upserted
         """
         count = 0
-        for chart_data in shift_charts:
-            if isinstance(chart_data, ParsedShiftChart):
-                shifts = chart_data.shifts
-            else:
-                # Convert dict back to ShiftRecord objects
-                shifts = [
-                    ShiftRecord(**s) if isinstance(s, dict) else s
-                    for s in chart_data.get("shifts", [])
-                ]
-
-            for shift in shifts:
-                await db.execute(
-                    """
-                    INSERT INTO game_shifts (
-                        shift_id, game_id, player_id, team_id, period,
-                        shift_number, start_time, end_time, duration_seconds,
-                        is_goal_event, event_description, updated_at
-                    )
-                    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, NOW())
-                    ON CONFLICT (shift_id) DO UPDATE SET
-                        duration_seconds = EXCLUDED.duration_seconds,
-                        updated_at = NOW()
-                    """,
-                    shift.shift_id,
-                    shift.game_id,
-                    shift.player_id,
-                    shift.team_id,
-                    shift.period,
-                    shift.shift_number,
-                    shift.start_time,
-                    shift.end_time,
-                    shift.duration_seconds,
-                    shift.is_goal_event,
-                    shift.event_description,
+        for row in _game_shift_rows(shift_charts):
+            await db.execute(
+                """
+                INSERT INTO game_shifts (
+                    shift_id, game_id, player_id, team_id, period,
+                    shift_number, start_time, end_time, duration_seconds,
+                    is_goal_event, event_description, updated_at
                 )
-                count += 1
+                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, NOW())
+                ON CONFLICT (shift_id) DO UPDATE SET
+                    duration_seconds = EXCLUDED.duration_seconds,
+                    updated_at = NOW()
+                """,
+                *row,
+            )
+            count += 1
 
         logger.info(
             "%s: Persisted %d shifts to database",
@@ -328,6 +314,100 @@ class ShiftChartsDownloader(BaseStatsDownloader):
         )
         return count
 
+    async def persist_bulk(
+        self,
+        db: DatabaseService,
+        shift_charts: list[ParsedShiftChart | dict[str, Any]],
+    ) -> int:
+        """Persist shift charts for many games with one bulk upsert.
+
+        Writes the same rows as persist, but stages every shift in the batch
+        with COPY and merges them into game_shifts in a single statement.
+
+        Args:
+            db: Database service
+            shift_charts: List of parsed shift charts or dicts
+
+        Returns:
+            Number of shifts upserted
+        """
+        from nhl_api.services.db.bulk import copy_upsert
+
+        rows = list(_game_shift_rows(shift_charts))
+        if not rows:
+            return 0
+
+        async with db.transaction() as conn:
+            count = await copy_upsert(
+                conn,
+                "game_shifts",
+                GAME_SHIFT_COLUMNS,
+                rows,
+                key_columns=("shift_id",),
+                update_columns=("duration_seconds",),
+                touch_updated_at=True,
+            )
+
+        logger.info(
+            "%s: Bulk persisted %d shifts to database",
+            self.source_name,
+            count,
+        )
+        return count
+
+
+# Column order of the rows built by _game_shift_rows
+GAME_SHIFT_COLUMNS = (
+    "shift_id",
+    "game_id",
+    "player_id",
+    "team_id",
+    "period",
+    "shift_number",
+    "start_time",
+    "end_time",
+    "duration_seconds",
+    "is_goal_event",
+    "event_description",
+)
+
+
+def _game_shift_rows(
+    shift_charts: list[ParsedShiftChart | dict[str, Any]],
+) -> Iterator[tuple[Any, ...]]:
+    """Yield game_shifts rows for a batch of shift charts.
+
+    Args:
+        shift_charts: List of parsed shift charts or dicts
+
+    Yields:
+        Row tuples in GAME_SHIFT_COLUMNS order
+    """
+    for chart_data in shift_charts:
+        if isinstance(chart_data, ParsedShiftChart):
+            shifts = chart_data.shifts
+        else:
+            # Convert dict back to ShiftRecord objects
+            shifts = [
+                ShiftRecord(**s) if isinstance(s, dict) else s
+                for s in chart_data.get("shifts", [])
+            ]
+
+        for shift in shifts:
+            yield (
+                shift.shift_id,
+                shift.game_id,
+                shift.player_id,
+                shift.team_id,
+                shift.period,
+                shift.shift_number,
+                shift.start_time,
+                shift.end_time,
+                shift.duration_seconds,
+                shift.is_goal_event,
+                shift.event_description,
+            )
+
 
 def create_shift_charts_downloader(
     *,
@@ -17,6 +17,10 @@ Example usage:
         matchup_service = MatchupService(db)
         matchups = await matchup_service.get_player_matchups(8478402)
 
+        # Season-scale expand -> attribute -> save
+        pipeline = AnalyticsPipeline(db, PipelineConfig(season_id=20242025))
+        stats = await pipeline.run()
+
         # Aggregation (Wave 5)
         agg_service = AggregationService(db)
         game_stats = await agg_service.aggregate_game(game_id=2024020500)
@@ -32,6 +36,7 @@ from nhl_api.services.analytics.aggregation import (
     AggregationService,
     GameAggregation,
     LineCombinationStats,
+    LineUnit,
     PeriodAggregation,
     SeasonAggregation,
     ShiftAggregation,
@@ -47,9 +52,15 @@ from nhl_api.services.analytics.matchup_service import (
     MatchupQueryFilters,
     MatchupService,
 )
+from nhl_api.services.analytics.pipeline import (
+    AnalyticsPipeline,
+    PipelineConfig,
+    PipelineStats,
+)
 from nhl_api.services.analytics.shift_expander import (
     ExpandedSecond,
     GameExpansionResult,
+    OnIceInterval,
     ShiftExpander,
 )
 from nhl_api.services.analytics.situation import (
@@ -67,11 +78,16 @@ __all__ = [
     "ShiftExpander",
     "ExpandedSecond",
     "GameExpansionResult",
+    "OnIceInterval",
     # Event attribution
     "EventAttributor",
     "EventAttribution",
     "AttributionResult",
     "GameEvent",
+    # Season pipeline
+    "AnalyticsPipeline",
+    "PipelineConfig",
+    "PipelineStats",
     # Situation calculation
     "SituationCalculator",
     "Situation",
@@ -92,4 +108,5 @@ __all__ = [
     "GameAggregation",
     "SeasonAggregation",
     "LineCombinationStats",
+    "LineUnit",
 ]
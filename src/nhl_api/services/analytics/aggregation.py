@@ -1,7 +1,12 @@
 """Aggregation service for flexible TOI rollups at any level.
 
 This module provides aggregation functions for second-by-second analytics
-data at multiple levels: shift, period, game, and season.
+data at multiple levels: shift, period, game, and season. Queries read
+second_snapshots by default, or lineup_segments (summing segment durations)
+with ``use_segments=True``; both give the same results. Season line
+combinations are read from the line_combinations index, which
+refresh_line_combinations() rebuilds for a game whenever its snapshots are
+saved (migration 033 backfills games expanded before the index existed).
 
 Example usage:
     async with DatabaseService() as db:
@@ -22,6 +27,12 @@ Example usage:
             min_toi=600,
         )
 
+        # Forward lines and defence pairs
+        forwards = await service.get_line_combinations(
+            season_id=20242025,
+            unit=LineUnit.FORWARDS,
+        )
+
 Issue: #263 - Wave 5: Aggregation Functions (T030-T033)
 """
 
@@ -29,14 +40,123 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass, field
+from enum import StrEnum
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    import asyncpg
+
     from nhl_api.services.db.connection import DatabaseService
 
 logger = logging.getLogger(__name__)
 
 
+class LineUnit(StrEnum):
+    """On-ice unit indexed in line_combinations."""
+
+    SKATERS = "skaters"  # All of a team's skaters on ice
+    FORWARDS = "forwards"  # Forwards only (forward line)
+    DEFENSE = "defense"  # Defencemen only (defence pair)
+
+
+# Default (min, max) players per unit for get_line_combinations
+_UNIT_SIZES = {
+    LineUnit.SKATERS: (3, 5),
+    LineUnit.FORWARDS: (3, 3),
+    LineUnit.DEFENSE: (2, 2),
+}
+
+
+async def refresh_line_combinations(conn: asyncpg.Connection, game_id: int) -> None:
+    """Rebuild a game's line_combinations rows from its lineup_segments.
+
+    Each side of every segment contributes its sorted skater array plus
+    its forward and defence subsets, summed per situation and flags. Call
+    in the transaction that writes the game's segments, after they are
+    written.
+
+    Args:
+        conn: Connection with an open transaction.
+        game_id: NHL game ID.
+    """
+    await conn.execute("DELETE FROM line_combinations WHERE game_id = $1", game_id)
+    await conn.execute(
+        """
+        INSERT INTO line_combinations (
+            season_id, unit, num_players, player_ids, game_id,
+            situation_code, is_empty_net, is_stoppage, toi_seconds
+        )
+        WITH members AS (
+            SELECT
+                s.season_id,
+                s.game_id,
+                s.start_game_second,
+                side.is_home,
+                s.situation_code,
+                COALESCE(s.is_empty_net, false) as is_empty_net,
+                COALESCE(s.is_stoppage, false) as is_stoppage,
+                s.duration_seconds,
+                m.player_id,
+                CASE LEFT(COALESCE(gss.position, p.primary_position), 1)
+                    WHEN 'D' THEN 'defense'
+                    WHEN 'C' THEN 'forwards'
+                    WHEN 'L' THEN 'forwards'
+                    WHEN 'R' THEN 'forwards'
+                END as unit
+            FROM lineup_segments s
+            CROSS JOIN LATERAL (
+                VALUES (true, s.home_skater_ids), (false, s.away_skater_ids)
+            ) AS side(is_home, skater_ids)
+            CROSS JOIN LATERAL unnest(side.skater_ids) AS m(player_id)
+            LEFT JOIN game_skater_stats gss
+                ON gss.game_id = s.game_id
+                AND gss.season_id = s.season_id
+                AND gss.player_id = m.player_id
+            LEFT JOIN players p ON p.player_id = m.player_id
+            WHERE s.game_id = $1
+        ),
+        lineups AS (
+            SELECT
+                season_id,
+                game_id,
+                situation_code,
+                is_empty_net,
+                is_stoppage,
+                duration_seconds,
+                array_agg(player_id ORDER BY player_id) as skaters,
+                array_agg(player_id ORDER BY player_id)
+                    FILTER (WHERE unit = 'forwards') as forwards,
+                array_agg(player_id ORDER BY player_id)
+                    FILTER (WHERE unit = 'defense') as defense
+            FROM members
+            GROUP BY season_id, game_id, start_game_second, is_home,
+                     situation_code, is_empty_net, is_stoppage, duration_seconds
+        )
+        SELECT
+            l.season_id,
+            u.unit,
+            cardinality(u.player_ids),
+            u.player_ids,
+            l.game_id,
+            l.situation_code,
+            l.is_empty_net,
+            l.is_stoppage,
+            SUM(l.duration_seconds)
+        FROM lineups l
+        CROSS JOIN LATERAL (
+            VALUES
+                ('skaters', l.skaters),
+                ('forwards', l.forwards),
+                ('defense', l.defense)
+        ) AS u(unit, player_ids)
+        WHERE u.player_ids IS NOT NULL
+        GROUP BY l.season_id, u.unit, u.player_ids, l.game_id,
+                 l.situation_code, l.is_empty_net, l.is_stoppage
+        """,
+        game_id,
+    )
+
+
 @dataclass
 class AggregationFilters:
     """Filters for aggregation queries.
@@ -157,6 +277,7 @@ class LineCombinationStats:
         toi_together: Total seconds on ice together.
         game_count: Number of games with shared ice time.
         by_situation: Breakdown by situation code.
+        unit: Which on-ice unit the combination is.
     """
 
     player_ids: frozenset[int]
@@ -164,6 +285,7 @@ class LineCombinationStats:
     toi_together: int
     game_count: int
     by_situation: dict[str, int] = field(default_factory=dict)
+    unit: LineUnit = LineUnit.SKATERS
 
 
 class AggregationService:
@@ -181,13 +303,35 @@ class AggregationService:
         >>> print(f"Total shifts: {len(shifts)}")
     """
 
-    def __init__(self, db: DatabaseService) -> None:
+    def __init__(self, db: DatabaseService, *, use_segments: bool = False) -> None:
         """Initialize the AggregationService.
 
         Args:
             db: Database service for data access.
+            use_segments: Read lineup_segments instead of second_snapshots.
         """
         self.db = db
+        self.use_segments = use_segments
+
+    @property
+    def _spans(self) -> tuple[str, str]:
+        """Table and span columns for the configured storage.
+
+        Each row covers start_second..end_second (game seconds, inclusive)
+        and contributes toi_seconds, so per-second rows and lineup segments
+        aggregate with the same queries.
+        """
+        if self.use_segments:
+            return (
+                "lineup_segments",
+                "start_game_second as start_second, "
+                "end_game_second as end_second, "
+                "duration_seconds as toi_seconds",
+            )
+        return (
+            "second_snapshots",
+            "game_second as start_second, game_second as end_second, 1 as toi_seconds",
+        )
 
     def _build_where_clause(
         self,
@@ -275,6 +419,7 @@ class AggregationService:
             params.extend(filters.player_ids)
 
         where_clause = " AND ".join(conditions) if conditions else "1=1"
+        table, spans = self._spans
 
         # Use window functions to detect shift boundaries
         query = f"""
@@ -283,10 +428,10 @@ class AggregationService:
                 SELECT
                     game_id,
                     period,
-                    game_second,
+                    {spans},
                     situation_code,
                     unnest(home_skater_ids) as player_id
-                FROM second_snapshots
+                FROM {table}
                 WHERE {where_clause}
 
                 UNION ALL
@@ -294,18 +439,18 @@ class AggregationService:
                 SELECT
                     game_id,
                     period,
-                    game_second,
+                    {spans},
                     situation_code,
                     unnest(away_skater_ids) as player_id
-                FROM second_snapshots
+                FROM {table}
                 WHERE {where_clause}
             ),
             with_gaps AS (
                 -- Detect gaps in continuous ice time
                 SELECT
                     *,
-                    game_second - LAG(game_second, 1, game_second)
-                        OVER (PARTITION BY player_id ORDER BY game_second) as gap
+                    start_second - LAG(end_second, 1, start_second)
+                        OVER (PARTITION BY player_id ORDER BY start_second) as gap
                 FROM player_seconds
                 {player_filter}
             ),
@@ -314,7 +459,7 @@ class AggregationService:
                 SELECT
                     *,
                     SUM(CASE WHEN gap > 1 THEN 1 ELSE 0 END)
-                        OVER (PARTITION BY player_id ORDER BY game_second) as shift_id
+                        OVER (PARTITION BY player_id ORDER BY start_second) as shift_id
                 FROM with_gaps
             )
             SELECT
@@ -322,11 +467,11 @@ class AggregationService:
                 game_id,
                 shift_id + 1 as shift_number,
                 MIN(period) as period,
-                MIN(game_second) as start_second,
-                MAX(game_second) as end_second,
-                COUNT(*) as toi_seconds,
+                MIN(start_second) as start_second,
+                MAX(end_second) as end_second,
+                SUM(toi_seconds) as toi_seconds,
                 situation_code,
-                COUNT(*) as situation_toi
+                SUM(toi_seconds) as situation_toi
             FROM with_shift_id
             GROUP BY player_id, game_id, shift_id, situation_code
             ORDER BY player_id, shift_id, situation_code
@@ -402,16 +547,17 @@ class AggregationService:
             params.extend(filters.player_ids)
 
         where_clause = " AND ".join(conditions) if conditions else "1=1"
+        table, spans = self._spans
 
         query = f"""
             WITH player_seconds AS (
                 SELECT
                     game_id,
                     period,
-                    game_second,
+                    {spans},
                     situation_code,
                     unnest(home_skater_ids) as player_id
-                FROM second_snapshots
+                FROM {table}
                 WHERE {where_clause}
 
                 UNION ALL
@@ -419,17 +565,17 @@ class AggregationService:
                 SELECT
                     game_id,
                     period,
-                    game_second,
+                    {spans},
                     situation_code,
                     unnest(away_skater_ids) as player_id
-                FROM second_snapshots
+                FROM {table}
                 WHERE {where_clause}
             ),
             with_gaps AS (
                 SELECT
                     *,
-                    game_second - LAG(game_second, 1, game_second)
-                        OVER (PARTITION BY player_id, period ORDER BY game_second) as gap
+                    start_second - LAG(end_second, 1, start_second)
+                        OVER (PARTITION BY player_id, period ORDER BY start_second) as gap
                 FROM player_seconds
                 WHERE 1=1 {player_condition}
             ),
@@ -437,7 +583,7 @@ class AggregationService:
                 SELECT
                     *,
                     SUM(CASE WHEN gap > 1 THEN 1 ELSE 0 END)
-                        OVER (PARTITION BY player_id, period ORDER BY game_second) as shift_id
+                        OVER (PARTITION BY player_id, period ORDER BY start_second) as shift_id
                 FROM with_gaps
             )
             SELECT
@@ -445,7 +591,7 @@ class AggregationService:
                 game_id,
                 period,
                 situation_code,
-                COUNT(*) as toi_seconds,
+                SUM(toi_seconds) as toi_seconds,
                 COUNT(DISTINCT shift_id) as shift_count
             FROM with_shifts
             GROUP BY player_id, game_id, period, situation_code
@@ -522,16 +668,17 @@ class AggregationService:
             params.extend(filters.player_ids)
 
         where_clause = " AND ".join(conditions) if conditions else "1=1"
+        table, spans = self._spans
 
         query = f"""
             WITH player_seconds AS (
                 SELECT
                     game_id,
                     period,
-                    game_second,
+                    {spans},
                     situation_code,
                     unnest(home_skater_ids) as player_id
-                FROM second_snapshots
+                FROM {table}
                 WHERE {where_clause}
 
                 UNION ALL
@@ -539,17 +686,17 @@ class AggregationService:
                 SELECT
                     game_id,
                     period,
-                    game_second,
+                    {spans},
                     situation_code,
                     unnest(away_skater_ids) as player_id
-                FROM second_snapshots
+                FROM {table}
                 WHERE {where_clause}
             ),
             with_gaps AS (
                 SELECT
                     *,
-                    game_second - LAG(game_second, 1, game_second)
-                        OVER (PARTITION BY player_id ORDER BY game_second) as gap
+                    start_second - LAG(end_second, 1, start_second)
+                        OVER (PARTITION BY player_id ORDER BY start_second) as gap
                 FROM player_seconds
                 WHERE 1=1 {player_condition}
             ),
@@ -557,14 +704,14 @@ class AggregationService:
                 SELECT
                     *,
                     SUM(CASE WHEN gap > 1 THEN 1 ELSE 0 END)
-                        OVER (PARTITION BY player_id ORDER BY game_second) as shift_id
+                        OVER (PARTITION BY player_id ORDER BY start_second) as shift_id
                 FROM with_gaps
             )
             SELECT
                 player_id,
                 game_id,
                 situation_code,
-                COUNT(*) as toi_seconds,
+                SUM(toi_seconds) as toi_seconds,
                 COUNT(DISTINCT period) as period_count,
                 COUNT(DISTINCT shift_id) as shift_count
             FROM with_shifts
@@ -643,6 +790,7 @@ class AggregationService:
             params.extend(filters.player_ids)
 
         where_clause = " AND ".join(conditions) if conditions else "1=1"
+        table, spans = self._spans
 
         query = f"""
             WITH player_seconds AS (
@@ -650,8 +798,9 @@ class AggregationService:
                     game_id,
                     season_id,
                     situation_code,
+                    {spans},
                     unnest(home_skater_ids) as player_id
-                FROM second_snapshots
+                FROM {table}
                 WHERE {where_clause}
 
                 UNION ALL
@@ -660,15 +809,16 @@ class AggregationService:
                     game_id,
                     season_id,
                     situation_code,
+                    {spans},
                     unnest(away_skater_ids) as player_id
-                FROM second_snapshots
+                FROM {table}
                 WHERE {where_clause}
             )
             SELECT
                 player_id,
                 season_id,
                 situation_code,
-                COUNT(*) as toi_seconds,
+                SUM(toi_seconds) as toi_seconds,
                 COUNT(DISTINCT game_id) as game_count
             FROM player_seconds
             WHERE 1=1 {player_condition}
@@ -724,77 +874,65 @@ class AggregationService:
         season_id: int,
         *,
         min_toi: int = 300,
-        min_players: int = 3,
-        max_players: int = 5,
+        min_players: int | None = None,
+        max_players: int | None = None,
         filters: AggregationFilters | None = None,
+        unit: LineUnit = LineUnit.SKATERS,
     ) -> list[LineCombinationStats]:
         """Get season-level line combination stats (T033).
 
         Analyzes which player combinations have spent time on ice together.
+        Reads the line_combinations index, where each lineup is stored under
+        its sorted player_ids, so this is a grouped read over the season's
+        rows for one unit.
 
         Args:
             season_id: Season ID (e.g., 20242025).
-            min_toi: Minimum TOI in seconds to include (default 300 = 5 min).
-            min_players: Minimum players in combination (default 3).
-            max_players: Maximum players in combination (default 5).
+            min_toi: Minimum total TOI in seconds to include (default 300 = 5 min).
+            min_players: Minimum players in combination (default 3 for
+                skaters and forwards, 2 for defense).
+            max_players: Maximum players in combination (default 5 for
+                skaters, 3 for forwards, 2 for defense).
             filters: Optional aggregation filters.
+            unit: Full skater groups, forward lines or defence pairs.
 
         Returns:
             List of LineCombinationStats sorted by TOI together.
         """
+        default_min, default_max = _UNIT_SIZES[unit]
         conditions, params, param_idx = self._build_where_clause(
             filters, season_id=season_id
         )
 
-        # Add array length filters
-        conditions.append(f"array_length(home_skater_ids, 1) >= ${param_idx}")
-        params.append(min_players)
+        conditions.append(f"unit = ${param_idx}")
+        params.append(unit.value)
         param_idx += 1
 
-        conditions.append(f"array_length(home_skater_ids, 1) <= ${param_idx}")
-        params.append(max_players)
-        param_idx += 1
+        conditions.append(f"num_players BETWEEN ${param_idx} AND ${param_idx + 1}")
+        params.append(default_min if min_players is None else min_players)
+        params.append(default_max if max_players is None else max_players)
+        param_idx += 2
 
-        # Store min_toi param index
-        min_toi_idx = param_idx
         params.append(min_toi)
+        where_clause = " AND ".join(conditions)
 
-        where_clause = " AND ".join(conditions) if conditions else "1=1"
-
-        # Query for line combinations (using sorted array for consistent grouping)
+        # The (player_ids) grouping set gives each line's total; the window
+        # carries it onto the per-situation rows for the TOI threshold.
         query = f"""
-            WITH line_seconds AS (
-                -- Home team line combinations
+            SELECT player_ids, situation_code, is_total, toi_seconds, game_count
+            FROM (
                 SELECT
-                    game_id,
-                    season_id,
+                    player_ids,
                     situation_code,
-                    (SELECT array_agg(x ORDER BY x) FROM unnest(home_skater_ids) x) as sorted_players
-                FROM second_snapshots
+                    GROUPING(situation_code) as is_total,
+                    SUM(toi_seconds) as toi_seconds,
+                    COUNT(DISTINCT game_id) as game_count,
+                    MAX(SUM(toi_seconds)) OVER (PARTITION BY player_ids) as line_toi
+                FROM line_combinations
                 WHERE {where_clause}
-
-                UNION ALL
-
-                -- Away team line combinations
-                SELECT
-                    game_id,
-                    season_id,
-                    situation_code,
-                    (SELECT array_agg(x ORDER BY x) FROM unnest(away_skater_ids) x) as sorted_players
-                FROM second_snapshots
-                WHERE {where_clause.replace("home_skater_ids", "away_skater_ids")}
-            )
-            SELECT
-                sorted_players,
-                season_id,
-                situation_code,
-                COUNT(*) as toi_seconds,
-                COUNT(DISTINCT game_id) as game_count
-            FROM line_seconds
-            WHERE sorted_players IS NOT NULL
-            GROUP BY sorted_players, season_id, situation_code
-            HAVING COUNT(*) >= ${min_toi_idx}
-            ORDER BY COUNT(*) DESC
+                GROUP BY GROUPING SETS ((player_ids, situation_code), (player_ids))
+            ) lines
+            WHERE line_toi >= ${param_idx}
         """
 
         results = await self.db.fetch(query, *params)
@@ -803,37 +941,28 @@ class AggregationService:
         line_data: dict[tuple[int, ...], dict[str, Any]] = {}
 
         for row in results:
-            # Convert list to tuple for dict key
-            players = tuple(sorted(row["sorted_players"]))
-
-            if players not in line_data:
-                line_data[players] = {
-                    "player_ids": frozenset(players),
-                    "season_id": row["season_id"],
-                    "toi_together": 0,
-                    "game_count": 0,
-                    "by_situation": {},
-                }
-
-            line_data[players]["toi_together"] += row["toi_seconds"]
-            line_data[players]["game_count"] = max(
-                line_data[players]["game_count"], row["game_count"]
+            players = tuple(row["player_ids"])
+            data = line_data.setdefault(
+                players, {"toi_together": 0, "game_count": 0, "by_situation": {}}
             )
-
-            situation = row["situation_code"]
-            if situation not in line_data[players]["by_situation"]:
-                line_data[players]["by_situation"][situation] = 0
-            line_data[players]["by_situation"][situation] += row["toi_seconds"]
+            if row["is_total"]:
+                data["toi_together"] = row["toi_seconds"]
+                data["game_count"] = row["game_count"]
+            else:
+                data["by_situation"][row["situation_code"]] = row["toi_seconds"]
 
         return [
             LineCombinationStats(
-                player_ids=data["player_ids"],
-                season_id=data["season_id"],
+                player_ids=frozenset(players),
+                season_id=season_id,
                 toi_together=data["toi_together"],
                 game_count=data["game_count"],
                 by_situation=data["by_situation"],
+                unit=unit,
+            )
+            for players, data in sorted(
+                line_data.items(), key=lambda item: -item[1]["toi_together"]
             )
-            for data in sorted(line_data.values(), key=lambda x: -x["toi_together"])
         ]
 
     async def get_player_toi_summary(
@@ -21,7 +21,7 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from nhl_api.services.analytics.shift_expander import (
     parse_game_clock_to_elapsed,
@@ -29,6 +29,8 @@ from nhl_api.services.analytics.shift_expander import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
     from nhl_api.services.analytics.shift_expander import ExpandedSecond
     from nhl_api.services.db.connection import DatabaseService
 
@@ -133,6 +135,43 @@ class GameEvent:
         return self.event_type in FACEOFF_EVENTS
 
 
+def game_event_from_row(row: Mapping[str, Any]) -> GameEvent:
+    """Build a GameEvent from a game_events row.
+
+    Args:
+        row: Row with the columns selected by EventAttributor.get_game_events.
+
+    Returns:
+        GameEvent with game clock converted to elapsed seconds.
+    """
+    period = row["period"]
+    time_str = row["time_in_period"] or "20:00"
+
+    # Convert game clock to elapsed seconds
+    period_second = parse_game_clock_to_elapsed(time_str, period)
+    game_second = period_to_game_second(period, period_second)
+
+    return GameEvent(
+        event_id=row["id"],
+        game_id=row["game_id"],
+        event_idx=row["event_idx"],
+        event_type=row["event_type"],
+        period=period,
+        time_in_period=time_str,
+        period_second=period_second,
+        game_second=game_second,
+        team_id=row["event_owner_team_id"],
+        player1_id=row["player1_id"],
+        player2_id=row["player2_id"],
+        player3_id=row["player3_id"],
+        goalie_id=row["goalie_id"],
+        x_coord=row["x_coord"],
+        y_coord=row["y_coord"],
+        zone=row["zone"],
+        description=row["description"],
+    )
+
+
 @dataclass
 class EventAttribution:
     """Result of attributing an event to a second snapshot.
@@ -189,13 +228,14 @@ class EventAttributor:
 
     def __init__(
         self,
-        db: DatabaseService,
+        db: DatabaseService | None,
         fuzzy_window: int = DEFAULT_FUZZY_WINDOW,
     ) -> None:
         """Initialize the EventAttributor.
 
         Args:
-            db: Database service for data access.
+            db: Database service for data access. May be None when only
+                attributing events that were fetched elsewhere.
             fuzzy_window: Seconds of tolerance for fuzzy time matching.
         """
         self.db = db
@@ -209,7 +249,13 @@ class EventAttributor:
 
         Returns:
             List of GameEvent objects ordered by event_idx.
+
+        Raises:
+            ValueError: If the attributor has no database service.
         """
+        if self.db is None:
+            raise ValueError("EventAttributor needs a database to fetch events")
+
         rows = await self.db.fetch(
             """
             SELECT id, game_id, event_idx, event_type, period,
@@ -223,35 +269,7 @@ class EventAttributor:
             game_id,
         )
 
-        events = []
-        for row in rows:
-            period = row["period"]
-            time_str = row["time_in_period"] or "20:00"
-
-            # Convert game clock to elapsed seconds
-            period_second = parse_game_clock_to_elapsed(time_str, period)
-            game_second = period_to_game_second(period, period_second)
-
-            event = GameEvent(
-                event_id=row["id"],
-                game_id=row["game_id"],
-                event_idx=row["event_idx"],
-                event_type=row["event_type"],
-                period=period,
-                time_in_period=time_str,
-                period_second=period_second,
-                game_second=game_second,
-                team_id=row["event_owner_team_id"],
-                player1_id=row["player1_id"],
-                player2_id=row["player2_id"],
-                player3_id=row["player3_id"],
-                goalie_id=row["goalie_id"],
-                x_coord=row["x_coord"],
-                y_coord=row["y_coord"],
-                zone=row["zone"],
-                description=row["description"],
-            )
-            events.append(event)
+        events = [game_event_from_row(row) for row in rows]
 
         logger.info(f"Fetched {len(events)} events for game {game_id}")
         return events
@@ -259,7 +277,7 @@ class EventAttributor:
     def attribute_to_snapshots(
         self,
         events: list[GameEvent],
-        snapshots: list[ExpandedSecond],
+        snapshots: Iterable[ExpandedSecond],
     ) -> AttributionResult:
         """Attribute events to second snapshots.
 
@@ -268,7 +286,8 @@ class EventAttributor:
 
         Args:
             events: List of GameEvent objects.
-            snapshots: List of ExpandedSecond objects.
+            snapshots: ExpandedSecond objects (a list, or a lazy view such
+                as GameExpansionResult.iter_seconds()).
 
         Returns:
             AttributionResult with all attributions.
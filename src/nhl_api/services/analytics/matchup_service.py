@@ -6,8 +6,14 @@ Provides functionality for analyzing player matchups including:
 - Zone-based matchup filtering
 - Situation-based breakdowns
 
-The service queries the second_snapshots table to calculate
-shared ice time between player pairs.
+Teammate and opponent matchups are read from player_pair_toi, which
+refresh_pair_toi() rebuilds for a game whenever its snapshots are saved
+(migration 032 backfills games expanded before the table existed).
+Other queries use the second_snapshots table to calculate shared ice
+time between player pairs. With ``use_segments=True`` they run against
+lineup_segments instead, summing segment durations rather than counting
+seconds. The flag does not apply to teammate/opponent matchups, since
+player_pair_toi is already derived from lineup_segments.
 
 Example usage:
     async with DatabaseService() as db:
@@ -45,11 +51,59 @@ from nhl_api.models.matchups import (
 from nhl_api.services.analytics.zone_detection import ZoneDetector
 
 if TYPE_CHECKING:
+    import asyncpg
+
     from nhl_api.services.db.connection import DatabaseService
 
 logger = logging.getLogger(__name__)
 
 
+async def refresh_pair_toi(conn: asyncpg.Connection, game_id: int) -> None:
+    """Rebuild a game's player_pair_toi rows from its lineup_segments.
+
+    Call in the transaction that writes the game's segments, after they
+    are written.
+
+    Args:
+        conn: Connection with an open transaction.
+        game_id: NHL game ID.
+    """
+    await conn.execute("DELETE FROM player_pair_toi WHERE game_id = $1", game_id)
+    await conn.execute(
+        """
+        INSERT INTO player_pair_toi (
+            player_id, season_id, matchup_type, game_id,
+            other_player_id, situation_code, is_empty_net, toi_seconds
+        )
+        SELECT
+            p.player_id,
+            s.season_id,
+            side.matchup_type,
+            s.game_id,
+            o.player_id,
+            s.situation_code,
+            COALESCE(s.is_empty_net, false),
+            SUM(s.duration_seconds)
+        FROM lineup_segments s
+        CROSS JOIN LATERAL (
+            VALUES
+                (s.home_skater_ids, s.home_skater_ids, 'teammate'),
+                (s.away_skater_ids, s.away_skater_ids, 'teammate'),
+                (s.home_skater_ids, s.away_skater_ids, 'opponent'),
+                (s.away_skater_ids, s.home_skater_ids, 'opponent')
+        ) AS side(own_ids, other_ids, matchup_type)
+        CROSS JOIN LATERAL unnest(side.own_ids) AS p(player_id)
+        CROSS JOIN LATERAL unnest(side.other_ids) AS o(player_id)
+        WHERE s.game_id = $1
+            AND s.is_stoppage = false
+            AND p.player_id <> o.player_id
+        GROUP BY p.player_id, s.season_id, side.matchup_type, s.game_id,
+                 o.player_id, s.situation_code, COALESCE(s.is_empty_net, false)
+        """,
+        game_id,
+    )
+
+
 @dataclass
 class MatchupQueryFilters:
     """Filters for matchup queries.
@@ -98,7 +152,7 @@ class MatchupService:
     """Service for analyzing player matchups.
 
     Provides methods for querying and aggregating player pair
-    ice time from second_snapshots data.
+    ice time from player_pair_toi and second_snapshots data.
 
     Attributes:
         db: Database service for data access.
@@ -110,14 +164,26 @@ class MatchupService:
         >>> print(f"Top opponent: {matchups.top_opponents[0]}")
     """
 
-    def __init__(self, db: DatabaseService) -> None:
+    def __init__(self, db: DatabaseService, *, use_segments: bool = False) -> None:
         """Initialize the MatchupService.
 
         Args:
             db: Database service for data access.
+            use_segments: Answer TOI queries from lineup_segments instead of
+                second_snapshots. Teammate and opponent matchups always
+                read player_pair_toi, and zone matchups, which join events
+                to individual seconds, always use second_snapshots.
         """
         self.db = db
         self.zone_detector = ZoneDetector()
+        self.use_segments = use_segments
+
+    @property
+    def _toi_source(self) -> tuple[str, str]:
+        """Table and TOI aggregate for the configured storage."""
+        if self.use_segments:
+            return "lineup_segments", "SUM(duration_seconds)"
+        return "second_snapshots", "COUNT(*)"
 
     async def get_player_matchups(
         self,
@@ -226,9 +292,10 @@ class MatchupService:
         )
         params.append(player2_id)
 
+        table, toi = self._toi_source
         query = f"""
-            SELECT COUNT(*) as toi_seconds
-            FROM second_snapshots
+            SELECT {toi} as toi_seconds
+            FROM {table}
             WHERE {" AND ".join(conditions)}
         """
 
@@ -367,125 +434,47 @@ class MatchupService:
         Returns:
             List of PlayerMatchup for teammates.
         """
-        # Build WHERE clause
-        conditions = ["is_stoppage = false"]
-        params: list[Any] = []
-        param_idx = 1
-
-        if filters.game_id:
-            conditions.append(f"game_id = ${param_idx}")
-            params.append(filters.game_id)
-            param_idx += 1
-
-        if filters.season_id:
-            conditions.append(f"season_id = ${param_idx}")
-            params.append(filters.season_id)
-            param_idx += 1
+        return await self._get_pair_matchups(player_id, filters, MatchupType.TEAMMATE)
 
-        if filters.situation_codes:
-            placeholders = ", ".join(
-                f"${param_idx + i}" for i in range(len(filters.situation_codes))
-            )
-            conditions.append(f"situation_code IN ({placeholders})")
-            params.extend(filters.situation_codes)
-            param_idx += len(filters.situation_codes)
-
-        if filters.exclude_empty_net:
-            conditions.append("is_empty_net = false")
+    async def _get_opponent_matchups(
+        self,
+        player_id: int,
+        filters: MatchupQueryFilters,
+    ) -> list[PlayerMatchup]:
+        """Get opponent matchups for a player.
 
-        # Query for home team teammates
-        home_query = f"""
-            SELECT
-                unnest(home_skater_ids) as teammate_id,
-                situation_code,
-                COUNT(*) as toi_seconds,
-                COUNT(DISTINCT game_id) as game_count
-            FROM second_snapshots
-            WHERE {" AND ".join(conditions)}
-                AND ${param_idx} = ANY(home_skater_ids)
-            GROUP BY teammate_id, situation_code
-            HAVING unnest(home_skater_ids) != ${param_idx}
-        """
+        Args:
+            player_id: Player to analyze.
+            filters: Query filters.
 
-        # Query for away team teammates
-        away_query = f"""
-            SELECT
-                unnest(away_skater_ids) as teammate_id,
-                situation_code,
-                COUNT(*) as toi_seconds,
-                COUNT(DISTINCT game_id) as game_count
-            FROM second_snapshots
-            WHERE {" AND ".join(conditions)}
-                AND ${param_idx} = ANY(away_skater_ids)
-            GROUP BY teammate_id, situation_code
-            HAVING unnest(away_skater_ids) != ${param_idx}
+        Returns:
+            List of PlayerMatchup for opponents.
         """
+        return await self._get_pair_matchups(player_id, filters, MatchupType.OPPONENT)
 
-        params.append(player_id)
-
-        # Execute both queries
-        home_results = await self.db.fetch(home_query, *params)
-        away_results = await self.db.fetch(away_query, *params)
-
-        # Combine results
-        teammate_data: dict[int, dict[str, Any]] = {}
-
-        for row in list(home_results) + list(away_results):
-            teammate_id = row["teammate_id"]
-            situation = row["situation_code"]
-            toi = row["toi_seconds"]
-            games = row["game_count"]
-
-            if teammate_id not in teammate_data:
-                teammate_data[teammate_id] = {
-                    "toi_seconds": 0,
-                    "game_count": 0,
-                    "situations": {},
-                }
-
-            teammate_data[teammate_id]["toi_seconds"] += toi
-            teammate_data[teammate_id]["game_count"] = max(
-                teammate_data[teammate_id]["game_count"], games
-            )
-            if situation not in teammate_data[teammate_id]["situations"]:
-                teammate_data[teammate_id]["situations"][situation] = 0
-            teammate_data[teammate_id]["situations"][situation] += toi
-
-        # Convert to PlayerMatchup objects
-        matchups = []
-        for teammate_id, data in teammate_data.items():
-            if data["toi_seconds"] >= filters.min_toi_seconds:
-                matchups.append(
-                    PlayerMatchup(
-                        player1_id=player_id,
-                        player2_id=teammate_id,
-                        matchup_type=MatchupType.TEAMMATE,
-                        toi_seconds=data["toi_seconds"],
-                        game_count=data["game_count"],
-                        situation_breakdown=data["situations"],
-                    )
-                )
-
-        return matchups
-
-    async def _get_opponent_matchups(
+    async def _get_pair_matchups(
         self,
         player_id: int,
         filters: MatchupQueryFilters,
+        matchup_type: MatchupType,
     ) -> list[PlayerMatchup]:
-        """Get opponent matchups for a player.
+        """Read a player's matchups of one type from player_pair_toi.
+
+        Rows are keyed by (player_id, season_id, matchup_type, game_id), so
+        this is a primary-key range read. Per-situation totals and each
+        partner's overall totals come back from one grouped query.
 
         Args:
             player_id: Player to analyze.
             filters: Query filters.
+            matchup_type: Teammate or opponent.
 
         Returns:
-            List of PlayerMatchup for opponents.
+            List of PlayerMatchup meeting the TOI threshold.
         """
-        # Build WHERE clause
-        conditions = ["is_stoppage = false"]
-        params: list[Any] = []
-        param_idx = 1
+        conditions = ["player_id = $1", "matchup_type = $2"]
+        params: list[Any] = [player_id, matchup_type.value]
+        param_idx = 3
 
         if filters.game_id:
             conditions.append(f"game_id = ${param_idx}")
@@ -498,88 +487,54 @@ class MatchupService:
             param_idx += 1
 
         if filters.situation_codes:
-            placeholders = ", ".join(
-                f"${param_idx + i}" for i in range(len(filters.situation_codes))
-            )
-            conditions.append(f"situation_code IN ({placeholders})")
-            params.extend(filters.situation_codes)
-            param_idx += len(filters.situation_codes)
+            conditions.append(f"situation_code = ANY(${param_idx}::text[])")
+            params.append(filters.situation_codes)
+            param_idx += 1
 
         if filters.exclude_empty_net:
             conditions.append("is_empty_net = false")
 
-        # Query: player on home team, get away opponents
-        home_query = f"""
-            SELECT
-                unnest(away_skater_ids) as opponent_id,
-                situation_code,
-                COUNT(*) as toi_seconds,
-                COUNT(DISTINCT game_id) as game_count
-            FROM second_snapshots
-            WHERE {" AND ".join(conditions)}
-                AND ${param_idx} = ANY(home_skater_ids)
-            GROUP BY opponent_id, situation_code
-        """
-
-        # Query: player on away team, get home opponents
-        away_query = f"""
+        query = f"""
             SELECT
-                unnest(home_skater_ids) as opponent_id,
+                other_player_id,
                 situation_code,
-                COUNT(*) as toi_seconds,
+                GROUPING(situation_code) as is_total,
+                SUM(toi_seconds) as toi_seconds,
                 COUNT(DISTINCT game_id) as game_count
-            FROM second_snapshots
+            FROM player_pair_toi
             WHERE {" AND ".join(conditions)}
-                AND ${param_idx} = ANY(away_skater_ids)
-            GROUP BY opponent_id, situation_code
+            GROUP BY GROUPING SETS (
+                (other_player_id, situation_code),
+                (other_player_id)
+            )
         """
 
-        params.append(player_id)
+        results = await self.db.fetch(query, *params)
 
-        # Execute both queries
-        home_results = await self.db.fetch(home_query, *params)
-        away_results = await self.db.fetch(away_query, *params)
-
-        # Combine results
-        opponent_data: dict[int, dict[str, Any]] = {}
-
-        for row in list(home_results) + list(away_results):
-            opponent_id = row["opponent_id"]
-            situation = row["situation_code"]
-            toi = row["toi_seconds"]
-            games = row["game_count"]
-
-            if opponent_id not in opponent_data:
-                opponent_data[opponent_id] = {
-                    "toi_seconds": 0,
-                    "game_count": 0,
-                    "situations": {},
-                }
-
-            opponent_data[opponent_id]["toi_seconds"] += toi
-            opponent_data[opponent_id]["game_count"] = max(
-                opponent_data[opponent_id]["game_count"], games
+        pair_data: dict[int, dict[str, Any]] = {}
+        for row in results:
+            data = pair_data.setdefault(
+                row["other_player_id"],
+                {"toi_seconds": 0, "game_count": 0, "situations": {}},
             )
-            if situation not in opponent_data[opponent_id]["situations"]:
-                opponent_data[opponent_id]["situations"][situation] = 0
-            opponent_data[opponent_id]["situations"][situation] += toi
-
-        # Convert to PlayerMatchup objects
-        matchups = []
-        for opponent_id, data in opponent_data.items():
-            if data["toi_seconds"] >= filters.min_toi_seconds:
-                matchups.append(
-                    PlayerMatchup(
-                        player1_id=player_id,
-                        player2_id=opponent_id,
-                        matchup_type=MatchupType.OPPONENT,
-                        toi_seconds=data["toi_seconds"],
-                        game_count=data["game_count"],
-                        situation_breakdown=data["situations"],
-                    )
-                )
+            if row["is_total"]:
+                data["toi_seconds"] = row["toi_seconds"]
+                data["game_count"] = row["game_count"]
+            else:
+                data["situations"][row["situation_code"]] = row["toi_seconds"]
 
-        return matchups
+        return [
+            PlayerMatchup(
+                player1_id=player_id,
+                player2_id=other_id,
+                matchup_type=matchup_type,
+                toi_seconds=data["toi_seconds"],
+                game_count=data["game_count"],
+                situation_breakdown=data["situations"],
+            )
+            for other_id, data in pair_data.items()
+            if data["toi_seconds"] >= filters.min_toi_seconds
+        ]
 
     async def _get_zone_matchups(
         self,
@@ -734,14 +689,15 @@ class MatchupService:
         Returns:
             List of all opponent PlayerMatchups.
         """
-        query = """
+        table, toi = self._toi_source
+        query = f"""
             WITH home_vs_away AS (
                 SELECT
                     h.player_id as home_player,
                     a.player_id as away_player,
                     s.situation_code,
-                    COUNT(*) as toi_seconds
-                FROM second_snapshots s
+                    {toi} as toi_seconds
+                FROM {table} s
                 CROSS JOIN LATERAL unnest(s.home_skater_ids) AS h(player_id)
                 CROSS JOIN LATERAL unnest(s.away_skater_ids) AS a(player_id)
                 WHERE s.game_id = $1
@@ -800,9 +756,10 @@ class MatchupService:
 
         params.append(player_id)
 
+        table, _ = self._toi_source
         query = f"""
             SELECT COUNT(DISTINCT game_id)
-            FROM second_snapshots
+            FROM {table}
             WHERE {" AND ".join(conditions)}
                 AND (${param_idx} = ANY(home_skater_ids)
                      OR ${param_idx} = ANY(away_skater_ids))
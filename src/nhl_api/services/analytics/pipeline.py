@@ -0,0 +1,517 @@
+"""Season-scale analytics pipeline: expand -> attribute -> save.
+
+Drives ShiftExpander and EventAttributor across every completed game in a
+season and writes the resulting second_snapshots rows. Work is split into
+three overlapping stages:
+
+1. Fetch: shifts and events for the next ``batch_size`` games are loaded
+   with one batched query each, while the previous batch is computing.
+2. Compute: shift expansion and event attribution are pure CPU work and
+   run in a process pool (``process_game``).
+3. Save: each game's second_snapshots and lineup_segments rows are
+   bulk-loaded with COPY and its player_pair_toi and line_combinations
+   rows rebuilt, with a bounded number of writes in flight so saving
+   overlaps with computing.
+
+Per-game completion is recorded in download_progress under the
+``analytics_snapshots`` source, so an interrupted run resumes where it
+stopped.
+
+Example usage:
+    async with DatabaseService() as db:
+        pipeline = AnalyticsPipeline(db, PipelineConfig(season_id=20242025))
+        stats = await pipeline.run()
+        print(stats.summary())
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from nhl_api.services.analytics.aggregation import refresh_line_combinations
+from nhl_api.services.analytics.event_attributor import (
+    DEFAULT_FUZZY_WINDOW,
+    EventAttributor,
+    game_event_from_row,
+)
+from nhl_api.services.analytics.matchup_service import refresh_pair_toi
+from nhl_api.services.analytics.shift_expander import (
+    SNAPSHOT_COLUMNS,
+    ShiftExpander,
+    replace_lineup_segments,
+    segment_rows,
+    snapshot_rows,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from nhl_api.services.db.connection import DatabaseService
+
+logger = logging.getLogger(__name__)
+
+# data_sources name used for download_progress resume tracking
+PIPELINE_SOURCE_NAME = "analytics_snapshots"
+
+_GAME_SECOND_IDX = SNAPSHOT_COLUMNS.index("game_second")
+_IS_STOPPAGE_IDX = SNAPSHOT_COLUMNS.index("is_stoppage")
+
+
+@dataclass
+class PipelineConfig:
+    """Configuration for an analytics pipeline run.
+
+    Attributes:
+        season_id: Season to process (e.g., 20242025).
+        batch_size: Games whose shifts and events are prefetched per query.
+        workers: Process pool size. None uses os.cpu_count(); 0 computes
+            in the event loop's process (useful for debugging and tests).
+        max_pending_writes: Maximum game saves in flight at once.
+        fuzzy_window: Seconds of tolerance for event attribution.
+        resume: If True, skip games already recorded as successful.
+    """
+
+    season_id: int
+    batch_size: int = 50
+    workers: int | None = None
+    max_pending_writes: int = 4
+    fuzzy_window: int = DEFAULT_FUZZY_WINDOW
+    resume: bool = True
+
+
+@dataclass
+class GameOutcome:
+    """Result of computing one game in a worker.
+
+    Attributes:
+        game_id: NHL game ID.
+        rows: second_snapshots rows, in SNAPSHOT_COLUMNS order.
+        segments: lineup_segments rows, in SEGMENT_COLUMNS order.
+        events_attributed: Events matched to a snapshot second.
+        events_unattributed: Events with no matching second.
+        compute_seconds: Worker time spent expanding and attributing.
+        errors: Expansion errors; the game is not saved if any are present.
+    """
+
+    game_id: int
+    rows: list[tuple[Any, ...]] = field(default_factory=list)
+    segments: list[tuple[Any, ...]] = field(default_factory=list)
+    events_attributed: int = 0
+    events_unattributed: int = 0
+    compute_seconds: float = 0.0
+    errors: list[str] = field(default_factory=list)
+
+
+@dataclass
+class PipelineStats:
+    """Throughput and per-stage timings for a pipeline run.
+
+    Stage timings are summed per game, so with overlapping stages and
+    multiple workers they can exceed the wall-clock ``elapsed_seconds``.
+
+    Attributes:
+        games_total: Completed games in the season.
+        games_skipped: Games already processed by an earlier run.
+        games_processed: Games saved successfully in this run.
+        games_failed: Games that failed to expand or save.
+        seconds_written: second_snapshots rows written.
+        segments_written: lineup_segments rows written.
+        events_attributed: Events matched to a snapshot second.
+        fetch_seconds: Time spent in batched shift/event queries.
+        compute_seconds: Worker time spent expanding and attributing.
+        save_seconds: Time spent writing snapshots and progress.
+        elapsed_seconds: Wall-clock time for the run.
+    """
+
+    games_total: int = 0
+    games_skipped: int = 0
+    games_processed: int = 0
+    games_failed: int = 0
+    seconds_written: int = 0
+    segments_written: int = 0
+    events_attributed: int = 0
+    fetch_seconds: float = 0.0
+    compute_seconds: float = 0.0
+    save_seconds: float = 0.0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def games_per_second(self) -> float:
+        """Games processed per wall-clock second."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.games_processed / self.elapsed_seconds
+
+    def summary(self) -> str:
+        """Format a human-readable summary of the run."""
+        return "\n".join(
+            [
+                f"Games: {self.games_processed} processed, "
+                f"{self.games_failed} failed, {self.games_skipped} skipped "
+                f"(of {self.games_total})",
+                f"Snapshots written: {self.seconds_written} "
+                f"({self.segments_written} lineup segments)",
+                f"Events attributed: {self.events_attributed}",
+                f"Throughput: {self.games_per_second:.2f} games/sec "
+                f"over {self.elapsed_seconds:.1f}s",
+                f"Stage time: fetch {self.fetch_seconds:.1f}s, "
+                f"compute {self.compute_seconds:.1f}s, "
+                f"save {self.save_seconds:.1f}s",
+            ]
+        )
+
+
+def process_game(
+    game_info: dict[str, Any],
+    shifts: list[dict[str, Any]],
+    event_rows: list[dict[str, Any]],
+    fuzzy_window: int = DEFAULT_FUZZY_WINDOW,
+) -> GameOutcome:
+    """Expand and attribute one game without touching the database.
+
+    Module-level so it can be pickled into a process pool.
+
+    Args:
+        game_info: Game row with game_id, season_id, home_team_id,
+            away_team_id and period keys.
+        shifts: Shift records for the game.
+        event_rows: game_events rows for the game, ordered by event_idx.
+        fuzzy_window: Seconds of tolerance for event attribution.
+
+    Returns:
+        GameOutcome with snapshot and segment rows, stoppage flags set
+        from events.
+    """
+    started = time.perf_counter()
+    expansion = ShiftExpander.expand_shifts(
+        game_info, shifts, materialize_seconds=False
+    )
+    outcome = GameOutcome(game_id=expansion.game_id, errors=list(expansion.errors))
+    if not expansion.success:
+        if not outcome.errors:
+            outcome.errors.append(f"No on-ice data for game {expansion.game_id}")
+        outcome.compute_seconds = time.perf_counter() - started
+        return outcome
+
+    events = [game_event_from_row(row) for row in event_rows]
+    attributor = EventAttributor(None, fuzzy_window=fuzzy_window)
+    attribution = attributor.attribute_to_snapshots(events, expansion.iter_seconds())
+    stoppages = attributor.get_stoppage_seconds(attribution.attributions)
+
+    rows = []
+    for row in snapshot_rows(expansion):
+        if row[_GAME_SECOND_IDX] in stoppages:
+            row = (*row[:_IS_STOPPAGE_IDX], True, *row[_IS_STOPPAGE_IDX + 1 :])
+        rows.append(row)
+
+    outcome.rows = rows
+    outcome.segments = list(segment_rows(rows))
+    outcome.events_attributed = attribution.attributed
+    outcome.events_unattributed = attribution.unattributed
+    outcome.compute_seconds = time.perf_counter() - started
+    return outcome
+
+
+class AnalyticsPipeline:
+    """Runs expand -> attribute -> save for every completed game in a season.
+
+    Attributes:
+        db: Database service for reads, writes and progress tracking.
+        config: Pipeline configuration.
+
+    Example:
+        >>> pipeline = AnalyticsPipeline(db, PipelineConfig(season_id=20242025))
+        >>> stats = await pipeline.run()
+        >>> print(f"{stats.games_per_second:.1f} games/sec")
+    """
+
+    def __init__(self, db: DatabaseService, config: PipelineConfig) -> None:
+        """Initialize the pipeline.
+
+        Args:
+            db: Database service for data access.
+            config: Pipeline configuration.
+        """
+        self.db = db
+        self.config = config
+
+    async def run(self) -> PipelineStats:
+        """Process the season, resuming from previous runs if configured.
+
+        Returns:
+            PipelineStats for this run.
+
+        Raises:
+            ValueError: If the pipeline data source is not registered.
+        """
+        started = time.perf_counter()
+        stats = PipelineStats()
+        config = self.config
+
+        source_id = await self._get_source_id()
+        games = await self._get_games()
+        stats.games_total = len(games)
+        if config.resume:
+            done = await self._get_completed_game_ids(source_id)
+            games = [game for game in games if game["game_id"] not in done]
+            stats.games_skipped = stats.games_total - len(games)
+
+        logger.info(
+            "Analytics pipeline for season %d: %d games to process (%d skipped)",
+            config.season_id,
+            len(games),
+            stats.games_skipped,
+        )
+
+        batches = [
+            games[i : i + config.batch_size]
+            for i in range(0, len(games), config.batch_size)
+        ]
+        if batches:
+            executor = self._create_executor()
+            try:
+                await self._run_batches(batches, executor, source_id, stats)
+            finally:
+                if executor is not None:
+                    # Don't block the event loop on jobs still running
+                    executor.shutdown(wait=False, cancel_futures=True)
+
+        stats.elapsed_seconds = time.perf_counter() - started
+        logger.info(
+            "Analytics pipeline for season %d finished: %.2f games/sec",
+            config.season_id,
+            stats.games_per_second,
+        )
+        return stats
+
+    async def _run_batches(
+        self,
+        batches: list[list[dict[str, Any]]],
+        executor: Executor | None,
+        source_id: int,
+        stats: PipelineStats,
+    ) -> None:
+        """Fetch, compute and save batches with the stages overlapped.
+
+        Args:
+            batches: Game rows, grouped into prefetch batches.
+            executor: Process pool, or None to compute in-process.
+            source_id: data_sources ID for progress tracking.
+            stats: Stats to update.
+        """
+        loop = asyncio.get_running_loop()
+        writes: set[asyncio.Task[None]] = set()
+        prefetch = asyncio.create_task(self._fetch_batch(batches[0], stats))
+        try:
+            for index, batch in enumerate(batches):
+                shifts_by_game, events_by_game = await prefetch
+                if index + 1 < len(batches):
+                    prefetch = asyncio.create_task(
+                        self._fetch_batch(batches[index + 1], stats)
+                    )
+
+                jobs = [
+                    (
+                        game,
+                        shifts_by_game.get(game["game_id"], []),
+                        events_by_game.get(game["game_id"], []),
+                        self.config.fuzzy_window,
+                    )
+                    for game in batch
+                ]
+                if executor is None:
+                    outcomes = [process_game(*job) for job in jobs]
+                else:
+                    outcomes = await asyncio.gather(
+                        *(
+                            loop.run_in_executor(executor, process_game, *job)
+                            for job in jobs
+                        )
+                    )
+
+                for outcome in outcomes:
+                    stats.compute_seconds += outcome.compute_seconds
+                    while len(writes) >= self.config.max_pending_writes:
+                        done, writes = await asyncio.wait(
+                            writes, return_when=asyncio.FIRST_COMPLETED
+                        )
+                        for task in done:
+                            task.result()
+                    writes.add(
+                        asyncio.create_task(self._save_game(outcome, source_id, stats))
+                    )
+
+            if writes:
+                await asyncio.gather(*writes)
+        finally:
+            prefetch.cancel()
+            for task in writes:
+                task.cancel()
+            await asyncio.gather(prefetch, *writes, return_exceptions=True)
+
+    async def _get_source_id(self) -> int:
+        """Look up the data source used for progress tracking."""
+        source_id = await self.db.fetchval(
+            "SELECT source_id FROM data_sources WHERE name = $1",
+            PIPELINE_SOURCE_NAME,
+        )
+        if source_id is None:
+            raise ValueError(
+                f"Data source {PIPELINE_SOURCE_NAME!r} not found; "
+                "apply migration 028_analytics_pipeline_source.sql"
+            )
+        return int(source_id)
+
+    async def _get_games(self) -> list[dict[str, Any]]:
+        """Get completed games for the season in game_id order."""
+        rows = await self.db.fetch(
+            """
+            SELECT game_id, season_id, home_team_id, away_team_id, period
+            FROM games
+            WHERE season_id = $1 AND game_state IN ('OFF', 'FINAL')
+            ORDER BY game_id
+            """,
+            self.config.season_id,
+        )
+        return [dict(row) for row in rows]
+
+    async def _get_completed_game_ids(self, source_id: int) -> set[int]:
+        """Get games already processed successfully for the season."""
+        rows = await self.db.fetch(
+            """
+            SELECT item_key FROM download_progress
+            WHERE source_id = $1 AND season_id = $2 AND status = 'success'
+            """,
+            source_id,
+            self.config.season_id,
+        )
+        return {int(row["item_key"]) for row in rows}
+
+    async def _fetch_batch(
+        self,
+        games: Sequence[dict[str, Any]],
+        stats: PipelineStats,
+    ) -> tuple[dict[int, list[dict[str, Any]]], dict[int, list[dict[str, Any]]]]:
+        """Fetch shifts and events for a batch of games.
+
+        Args:
+            games: Game rows in the batch.
+            stats: Stats to update with fetch time.
+
+        Returns:
+            Tuple of (shifts by game_id, event rows by game_id).
+        """
+        started = time.perf_counter()
+        game_ids = [game["game_id"] for game in games]
+
+        shift_rows = await self.db.fetch(
+            """
+            SELECT shift_id, game_id, player_id, team_id, period,
+                   shift_number, start_time, end_time, duration_seconds,
+                   is_goal_event, event_description
+            FROM game_shifts
+            WHERE game_id = ANY($1::bigint[])
+            ORDER BY game_id, period, shift_number
+            """,
+            game_ids,
+        )
+        event_rows = await self.db.fetch(
+            """
+            SELECT id, game_id, event_idx, event_type, period,
+                   time_in_period, event_owner_team_id,
+                   player1_id, player2_id, player3_id, goalie_id,
+                   x_coord, y_coord, zone, description
+            FROM game_events
+            WHERE game_id = ANY($1::bigint[])
+            ORDER BY game_id, event_idx
+            """,
+            game_ids,
+        )
+
+        shifts_by_game: dict[int, list[dict[str, Any]]] = {}
+        for row in shift_rows:
+            shifts_by_game.setdefault(row["game_id"], []).append(dict(row))
+        events_by_game: dict[int, list[dict[str, Any]]] = {}
+        for row in event_rows:
+            events_by_game.setdefault(row["game_id"], []).append(dict(row))
+
+        stats.fetch_seconds += time.perf_counter() - started
+        return shifts_by_game, events_by_game
+
+    async def _save_game(
+        self, outcome: GameOutcome, source_id: int, stats: PipelineStats
+    ) -> None:
+        """Write one game's snapshots and record its progress.
+
+        Failures, including database errors while tracking progress, are
+        logged and recorded in download_progress rather than raised, so one
+        bad game does not stop the season.
+
+        Args:
+            outcome: Computed game.
+            source_id: data_sources ID for progress tracking.
+            stats: Stats to update.
+        """
+        # Imported here so worker processes don't load the db package (boto3)
+        from nhl_api.services.db.bulk import copy_upsert
+        from nhl_api.services.db.progress_repo import ProgressRepository
+
+        started = time.perf_counter()
+        repo = ProgressRepository(self.db)
+        error = "; ".join(outcome.errors)
+        progress_id: int | None = None
+        written = segments = 0
+        try:
+            progress_id = await repo.upsert_progress(
+                source_id,
+                str(outcome.game_id),
+                season_id=self.config.season_id,
+            )
+            if not error:
+                async with self.db.transaction() as conn:
+                    written = await copy_upsert(
+                        conn,
+                        "second_snapshots",
+                        SNAPSHOT_COLUMNS,
+                        outcome.rows,
+                        key_columns=["game_id", "game_second"],
+                        update_columns=SNAPSHOT_COLUMNS[5:],
+                    )
+                    segments = await replace_lineup_segments(
+                        conn, outcome.game_id, outcome.segments
+                    )
+                    await refresh_pair_toi(conn, outcome.game_id)
+                    await refresh_line_combinations(conn, outcome.game_id)
+                await repo.mark_success(progress_id)
+        except Exception as e:
+            logger.exception("Failed to save snapshots for game %d", outcome.game_id)
+            error = str(e) or type(e).__name__
+
+        if error:
+            stats.games_failed += 1
+            if progress_id is not None:
+                try:
+                    await repo.mark_failed(progress_id, error)
+                except Exception:
+                    logger.exception(
+                        "Failed to record failure for game %d", outcome.game_id
+                    )
+        else:
+            stats.games_processed += 1
+            stats.seconds_written += written
+            stats.segments_written += segments
+            stats.events_attributed += outcome.events_attributed
+        stats.save_seconds += time.perf_counter() - started
+
+    def _create_executor(self) -> Executor | None:
+        """Create the compute pool, or None for in-process computation."""
+        workers = self.config.workers
+        if workers == 0:
+            return None
+        return ProcessPoolExecutor(max_workers=workers or os.cpu_count())
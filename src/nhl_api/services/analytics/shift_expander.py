@@ -5,14 +5,19 @@ tracking which players are on the ice at each moment of the game.
 
 The NHL API provides shift data in MM:SS format representing game clock
 time (counting down from 20:00). This service converts those shifts to
-elapsed seconds and generates one snapshot per second of game time.
+elapsed seconds, sweeps the shift start/end boundaries once to produce
+on-ice intervals (runs of identical lineups), and can expand those
+intervals to one snapshot per second of game time on demand.
 
 Example usage:
     async with DatabaseService() as db:
         expander = ShiftExpander(db)
         result = await expander.expand_game(game_id=2024020500)
 
-        for second in result.seconds:
+        for interval in result.intervals:
+            print(f"{interval.period}: {interval.duration}s of the same lineup")
+
+        for second in result.iter_seconds():
             print(f"Second {second.game_second}: {len(second.home_skaters)} home skaters")
 
 Issue: #259 - Wave 1: Core Pipeline (T004-T007)
@@ -21,12 +26,19 @@ Issue: #259 - Wave 1: Core Pipeline (T004-T007)
 from __future__ import annotations
 
 import logging
+from collections import defaultdict
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 from nhl_api.models.second_snapshots import calculate_situation_code
+from nhl_api.services.analytics.aggregation import refresh_line_combinations
+from nhl_api.services.analytics.matchup_service import refresh_pair_toi
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+    import asyncpg
+
     from nhl_api.services.db.connection import DatabaseService
 
 logger = logging.getLogger(__name__)
@@ -37,6 +49,41 @@ PERIOD_SECONDS = 1200
 # Overtime period duration (5 minutes for regular season)
 OT_SECONDS = 300
 
+# second_snapshots columns, in the order produced by snapshot_rows()
+SNAPSHOT_COLUMNS = [
+    "game_id",
+    "season_id",
+    "period",
+    "period_second",
+    "game_second",
+    "situation_code",
+    "home_skater_count",
+    "away_skater_count",
+    "home_skater_ids",
+    "away_skater_ids",
+    "home_goalie_id",
+    "away_goalie_id",
+    "is_stoppage",
+    "is_power_play",
+    "is_empty_net",
+]
+
+# lineup_segments columns, in the order produced by segment_rows()
+SEGMENT_COLUMNS = [
+    "game_id",
+    "season_id",
+    "period",
+    "start_second",
+    "end_second",
+    "start_game_second",
+    "end_game_second",
+    "duration_seconds",
+    *SNAPSHOT_COLUMNS[5:],
+]
+
+# Snapshot columns that must match for consecutive seconds to share a segment
+_SEGMENT_STATE = slice(5, len(SNAPSHOT_COLUMNS))
+
 
 def parse_game_clock_to_elapsed(time_str: str, period: int) -> int:
     """Convert game clock time (MM:SS counting down) to elapsed seconds in period.
@@ -152,6 +199,161 @@ class ExpandedSecond:
         return self.home_goalie_id is None or self.away_goalie_id is None
 
 
+@dataclass(frozen=True, slots=True)
+class OnIceInterval:
+    """A run of consecutive seconds with an unchanged on-ice lineup.
+
+    Attributes:
+        period: Period number.
+        start_second: First elapsed period second of the run (inclusive).
+        end_second: Last elapsed period second of the run (inclusive).
+        home_skaters: Home team skater player IDs on ice.
+        away_skaters: Away team skater player IDs on ice.
+    """
+
+    period: int
+    start_second: int
+    end_second: int
+    home_skaters: frozenset[int]
+    away_skaters: frozenset[int]
+
+    @property
+    def duration(self) -> int:
+        """Number of seconds covered by the interval."""
+        return self.end_second - self.start_second + 1
+
+    @property
+    def situation_code(self) -> str:
+        """Situation code shared by every second of the interval."""
+        return calculate_situation_code(
+            home_skaters=len(self.home_skaters),
+            away_skaters=len(self.away_skaters),
+            home_empty_net=True,
+            away_empty_net=True,
+        )
+
+    def iter_seconds(self, game_id: int, season_id: int) -> Iterator[ExpandedSecond]:
+        """Yield one ExpandedSecond per second of the interval.
+
+        Args:
+            game_id: NHL game ID.
+            season_id: Season ID.
+
+        Yields:
+            ExpandedSecond objects in period-second order.
+        """
+        for period_second in range(self.start_second, self.end_second + 1):
+            yield ExpandedSecond(
+                game_id=game_id,
+                season_id=season_id,
+                period=self.period,
+                period_second=period_second,
+                game_second=period_to_game_second(self.period, period_second),
+                home_skaters=self.home_skaters,
+                away_skaters=self.away_skaters,
+                # Goalies will be set by a separate step (from roster/events)
+                home_goalie_id=None,
+                away_goalie_id=None,
+            )
+
+
+def sweep_shifts(
+    shifts: Iterable[dict[str, Any]], home_team_id: int
+) -> list[OnIceInterval]:
+    """Sweep shift boundaries to produce on-ice intervals.
+
+    Each shift contributes an entry boundary at its first second and an
+    exit boundary one second after its last (shifts are inclusive of both
+    clock endpoints). Boundaries are sorted per period and swept once,
+    keeping per-player presence counts so overlapping shift records for
+    the same player are handled. Adjacent runs with identical lineups are
+    merged, and seconds with nobody on ice are omitted.
+
+    The seconds covered and lineups produced are exactly those of a naive
+    per-second expansion, without allocating anything per second.
+
+    Args:
+        shifts: Shift records with team_id, player_id, period, start_time,
+            end_time and is_goal_event keys.
+        home_team_id: Home team ID; any other team is treated as away.
+
+    Returns:
+        Intervals sorted by (period, start_second).
+    """
+    # period -> second -> list of (is_home, player_id, delta)
+    boundaries: dict[int, dict[int, list[tuple[bool, int, int]]]] = defaultdict(
+        lambda: defaultdict(list)
+    )
+
+    for shift in shifts:
+        # Skip goal events (they're not actual shifts)
+        if shift["is_goal_event"]:
+            continue
+
+        period = shift["period"]
+        start_elapsed = parse_game_clock_to_elapsed(shift["start_time"], period)
+        end_elapsed = parse_game_clock_to_elapsed(shift["end_time"], period)
+
+        # Ensure start < end (sometimes data has quirks)
+        if start_elapsed > end_elapsed:
+            start_elapsed, end_elapsed = end_elapsed, start_elapsed
+
+        is_home = shift["team_id"] == home_team_id
+        player_id = shift["player_id"]
+        period_boundaries = boundaries[period]
+        period_boundaries[start_elapsed].append((is_home, player_id, 1))
+        period_boundaries[end_elapsed + 1].append((is_home, player_id, -1))
+
+    intervals: list[OnIceInterval] = []
+
+    for period in sorted(boundaries):
+        period_boundaries = boundaries[period]
+        points = sorted(period_boundaries)
+        counts: dict[bool, dict[int, int]] = {True: {}, False: {}}
+
+        for point, next_point in zip(points, points[1:], strict=False):
+            for is_home, player_id, delta in period_boundaries[point]:
+                side = counts[is_home]
+                remaining = side.get(player_id, 0) + delta
+                if remaining:
+                    side[player_id] = remaining
+                else:
+                    del side[player_id]
+
+            if not counts[True] and not counts[False]:
+                continue
+
+            home = frozenset(counts[True])
+            away = frozenset(counts[False])
+            last = intervals[-1] if intervals else None
+            if (
+                last is not None
+                and last.period == period
+                and last.end_second + 1 == point
+                and last.home_skaters == home
+                and last.away_skaters == away
+            ):
+                intervals[-1] = OnIceInterval(
+                    period=period,
+                    start_second=last.start_second,
+                    end_second=next_point - 1,
+                    home_skaters=home,
+                    away_skaters=away,
+                )
+            else:
+                intervals.append(
+                    OnIceInterval(
+                        period=period,
+                        start_second=point,
+                        end_second=next_point - 1,
+                        home_skaters=home,
+                        away_skaters=away,
+                    )
+                )
+
+    return intervals
+
+
 @dataclass
 class GameExpansionResult:
     """Result of expanding a game's shifts to second-by-second data.
@@ -164,7 +366,10 @@ class GameExpansionResult:
         total_shifts: Number of shifts processed.
         total_seconds: Total game seconds generated.
         periods: Number of periods in the game.
-        seconds: List of ExpandedSecond objects, one per game second.
+        intervals: On-ice intervals (runs of identical lineups).
+        seconds: Materialized ExpandedSecond objects, one per game second.
+            Empty when expansion skipped materialization; use iter_seconds()
+            to read per-second data either way.
         errors: Any errors encountered during expansion.
     """
 
@@ -175,21 +380,184 @@ class GameExpansionResult:
     total_shifts: int = 0
     total_seconds: int = 0
     periods: int = 3
+    intervals: list[OnIceInterval] = field(default_factory=list)
     seconds: list[ExpandedSecond] = field(default_factory=list)
     errors: list[str] = field(default_factory=list)
 
     @property
     def success(self) -> bool:
         """True if expansion completed without critical errors."""
-        return len(self.seconds) > 0 and len(self.errors) == 0
+        has_data = len(self.seconds) > 0 or len(self.intervals) > 0
+        return has_data and len(self.errors) == 0
+
+    def iter_seconds(self) -> Iterator[ExpandedSecond]:
+        """Iterate per-second snapshots, expanding intervals lazily.
+
+        Yields:
+            ExpandedSecond objects in game-second order.
+        """
+        if self.seconds or not self.intervals:
+            yield from self.seconds
+            return
+        for interval in self.intervals:
+            yield from interval.iter_seconds(self.game_id, self.season_id)
+
+
+def snapshot_rows(result: GameExpansionResult) -> Iterator[tuple[Any, ...]]:
+    """Yield second_snapshots rows for an expansion result.
+
+    Skater ID arrays are written in sorted order so rows are deterministic.
+    When only intervals are present, each interval's arrays and situation
+    are computed once and shared by all of its seconds.
+
+    Args:
+        result: GameExpansionResult from expand_game().
+
+    Yields:
+        Row tuples in second_snapshots insert column order.
+    """
+    if result.seconds or not result.intervals:
+        for sec in result.seconds:
+            yield (
+                sec.game_id,
+                sec.season_id,
+                sec.period,
+                sec.period_second,
+                sec.game_second,
+                sec.situation_code,
+                len(sec.home_skaters),
+                len(sec.away_skaters),
+                sorted(sec.home_skaters),
+                sorted(sec.away_skaters),
+                sec.home_goalie_id,
+                sec.away_goalie_id,
+                False,  # is_stoppage - will be set by event attribution
+                sec.is_power_play,
+                sec.is_empty_net,
+            )
+        return
+
+    for interval in result.intervals:
+        home_ids = sorted(interval.home_skaters)
+        away_ids = sorted(interval.away_skaters)
+        situation_code = interval.situation_code
+        is_power_play = len(home_ids) != len(away_ids)
+        for period_second in range(interval.start_second, interval.end_second + 1):
+            yield (
+                result.game_id,
+                result.season_id,
+                interval.period,
+                period_second,
+                period_to_game_second(interval.period, period_second),
+                situation_code,
+                len(home_ids),
+                len(away_ids),
+                home_ids,
+                away_ids,
+                None,  # Goalies are not tracked by shift expansion
+                None,
+                False,  # is_stoppage - will be set by event attribution
+                is_power_play,
+                True,  # is_empty_net, as no goalie is assigned
+            )
+
+
+def _last_row_per_second(
+    rows: Iterable[tuple[Any, ...]],
+) -> Iterator[tuple[Any, ...]]:
+    """Drop rows whose game_second repeats in the next row."""
+    previous: tuple[Any, ...] | None = None
+    for row in rows:
+        if previous is not None and previous[4] != row[4]:
+            yield previous
+        previous = row
+    if previous is not None:
+        yield previous
+
+
+def segment_rows(rows: Iterable[tuple[Any, ...]]) -> Iterator[tuple[Any, ...]]:
+    """Run-length encode second_snapshots rows into lineup_segments rows.
+
+    Consecutive seconds in the same period with identical state (lineups,
+    goalies, situation and flags) collapse into one segment, so per-second
+    TOI counts become sums of ``duration_seconds``. Period boundaries share
+    a game_second (period N second 1200 and period N+1 second 0); as with
+    the second_snapshots upsert, the later row wins.
+
+    Args:
+        rows: Snapshot rows in SNAPSHOT_COLUMNS order and game-second order,
+            e.g. from snapshot_rows().
+
+    Yields:
+        Segment rows in SEGMENT_COLUMNS order.
+    """
+    start: tuple[Any, ...] | None = None
+    end: tuple[Any, ...] = ()
+    for row in _last_row_per_second(rows):
+        if (
+            start is not None
+            and row[2] == start[2]
+            and row[4] == end[4] + 1
+            and row[_SEGMENT_STATE] == start[_SEGMENT_STATE]
+        ):
+            end = row
+            continue
+        if start is not None:
+            yield _segment(start, end)
+        start = end = row
+
+    if start is not None:
+        yield _segment(start, end)
+
+
+def _segment(start: tuple[Any, ...], end: tuple[Any, ...]) -> tuple[Any, ...]:
+    """Build a lineup_segments row spanning two snapshot rows."""
+    return (
+        start[0],
+        start[1],
+        start[2],
+        start[3],
+        end[3],
+        start[4],
+        end[4],
+        end[4] - start[4] + 1,
+        *start[_SEGMENT_STATE],
+    )
+
+
+async def replace_lineup_segments(
+    conn: asyncpg.Connection,
+    game_id: int,
+    rows: Sequence[tuple[Any, ...]],
+) -> int:
+    """Replace a game's lineup_segments rows.
+
+    Segment boundaries move when a game is re-expanded, so existing rows
+    are deleted rather than upserted. Call inside the transaction that
+    writes the game's second_snapshots so both tables stay in step.
+
+    Args:
+        conn: Connection with an open transaction.
+        game_id: NHL game ID.
+        rows: Segment rows from segment_rows().
+
+    Returns:
+        Number of segments written.
+    """
+    await conn.execute("DELETE FROM lineup_segments WHERE game_id = $1", game_id)
+    if rows:
+        await conn.copy_records_to_table(
+            "lineup_segments", records=rows, columns=SEGMENT_COLUMNS
+        )
+    return len(rows)
 
 
 class ShiftExpander:
     """Service for expanding shifts into second-by-second snapshots.
 
-    Takes player shift records from the database and expands each shift
-    into individual seconds, tracking which players are on ice at each
-    moment of game time.
+    Takes player shift records from the database and sweeps their
+    boundaries into on-ice intervals, from which the players on ice at
+    each moment of game time can be expanded second by second.
 
     Attributes:
         db: Database service for querying shift and game data.
@@ -208,18 +576,23 @@ class ShiftExpander:
         """
         self.db = db
 
-    async def expand_game(self, game_id: int) -> GameExpansionResult:
-        """Expand all shifts for a game into second-by-second snapshots.
+    async def expand_game(
+        self, game_id: int, *, materialize_seconds: bool = True
+    ) -> GameExpansionResult:
+        """Expand all shifts for a game into on-ice intervals and snapshots.
 
-        Fetches shifts from the database, expands each shift into
-        individual seconds, and aggregates all players on ice at
-        each game second.
+        Fetches shifts from the database and sweeps their boundaries once
+        to build on-ice intervals. Per-second snapshots are derived from
+        those intervals.
 
         Args:
             game_id: NHL game ID to expand.
+            materialize_seconds: If True, also fill ``result.seconds`` with
+                one ExpandedSecond per second. If False, only intervals are
+                kept and seconds are available lazily via iter_seconds().
 
         Returns:
-            GameExpansionResult with all expanded seconds.
+            GameExpansionResult with intervals and (optionally) seconds.
 
         Raises:
             ValueError: If game not found or no shifts available.
@@ -229,21 +602,43 @@ class ShiftExpander:
         if not game_info:
             raise ValueError(f"Game {game_id} not found in database")
 
-        season_id = game_info["season_id"]
+        shifts = await self._get_game_shifts(game_id)
+        return self.expand_shifts(
+            game_info, shifts, materialize_seconds=materialize_seconds
+        )
+
+    @staticmethod
+    def expand_shifts(
+        game_info: dict[str, Any],
+        shifts: list[dict[str, Any]],
+        *,
+        materialize_seconds: bool = True,
+    ) -> GameExpansionResult:
+        """Expand already-fetched shifts for one game.
+
+        This is the database-free core of expand_game, usable when shifts
+        and game metadata have been loaded in bulk.
+
+        Args:
+            game_info: Game row with game_id, season_id, home_team_id,
+                away_team_id and period keys.
+            shifts: Shift records for the game.
+            materialize_seconds: See expand_game.
+
+        Returns:
+            GameExpansionResult with intervals and (optionally) seconds.
+        """
+        game_id = game_info["game_id"]
         home_team_id = game_info["home_team_id"]
-        away_team_id = game_info["away_team_id"]
-        num_periods = game_info["period"] or 3
 
         result = GameExpansionResult(
             game_id=game_id,
-            season_id=season_id,
+            season_id=game_info["season_id"],
             home_team_id=home_team_id,
-            away_team_id=away_team_id,
-            periods=num_periods,
+            away_team_id=game_info["away_team_id"],
+            periods=game_info["period"] or 3,
         )
 
-        # Get all shifts for the game
-        shifts = await self._get_game_shifts(game_id)
         if not shifts:
             result.errors.append(f"No shifts found for game {game_id}")
             return result
@@ -251,62 +646,15 @@ class ShiftExpander:
         result.total_shifts = len(shifts)
         logger.info(f"Expanding {len(shifts)} shifts for game {game_id}")
 
-        # Build second-by-second player presence map
-        # Key: (period, period_second), Value: {home_skaters: set, away_skaters: set}
-        presence_map: dict[tuple[int, int], dict[str, set[int]]] = {}
-
-        for shift in shifts:
-            team_id = shift["team_id"]
-            player_id = shift["player_id"]
-            period = shift["period"]
-            is_goal = shift["is_goal_event"]
-
-            # Skip goal events (they're not actual shifts)
-            if is_goal:
-                continue
-
-            # Parse start/end times to elapsed seconds
-            start_elapsed = parse_game_clock_to_elapsed(shift["start_time"], period)
-            end_elapsed = parse_game_clock_to_elapsed(shift["end_time"], period)
-
-            # Ensure start < end (sometimes data has quirks)
-            if start_elapsed > end_elapsed:
-                start_elapsed, end_elapsed = end_elapsed, start_elapsed
-
-            # Determine if home or away
-            team_key = "home_skaters" if team_id == home_team_id else "away_skaters"
-
-            # Mark player present for each second of the shift
-            for sec in range(start_elapsed, end_elapsed + 1):
-                key = (period, sec)
-                if key not in presence_map:
-                    presence_map[key] = {"home_skaters": set(), "away_skaters": set()}
-                presence_map[key][team_key].add(player_id)
-
-        # Convert presence map to ExpandedSecond objects
-        expanded_seconds: list[ExpandedSecond] = []
-        for (period, period_second), players in sorted(presence_map.items()):
-            game_second = period_to_game_second(period, period_second)
-            expanded = ExpandedSecond(
-                game_id=game_id,
-                season_id=season_id,
-                period=period,
-                period_second=period_second,
-                game_second=game_second,
-                home_skaters=frozenset(players["home_skaters"]),
-                away_skaters=frozenset(players["away_skaters"]),
-                # Goalies will be set by a separate step (from roster/events)
-                home_goalie_id=None,
-                away_goalie_id=None,
-            )
-            expanded_seconds.append(expanded)
-
-        result.seconds = expanded_seconds
-        result.total_seconds = len(expanded_seconds)
+        result.intervals = sweep_shifts(shifts, home_team_id)
+        result.total_seconds = sum(i.duration for i in result.intervals)
+        if materialize_seconds:
+            result.seconds = list(result.iter_seconds())
 
         logger.info(
             f"Game {game_id}: Expanded {result.total_shifts} shifts to "
-            f"{result.total_seconds} seconds across {result.periods} periods"
+            f"{len(result.intervals)} intervals / {result.total_seconds} seconds "
+            f"across {result.periods} periods"
         )
 
         return result
@@ -355,13 +703,16 @@ class ShiftExpander:
         return [dict(row) for row in rows]
 
     async def save_expanded_game(self, result: GameExpansionResult) -> int:
-        """Save expanded seconds to the second_snapshots table.
+        """Save expanded seconds to second_snapshots and derived tables.
+
+        Snapshots, lineup_segments, player_pair_toi and line_combinations
+        are written in one transaction.
 
         Args:
             result: GameExpansionResult from expand_game().
 
         Returns:
-            Number of rows inserted.
+            Number of second_snapshots rows inserted.
 
         Raises:
             ValueError: If result has errors or no seconds.
@@ -369,56 +720,42 @@ class ShiftExpander:
         if not result.success:
             raise ValueError(f"Cannot save failed expansion: {result.errors}")
 
-        if not result.seconds:
+        insert_data = list(snapshot_rows(result))
+        if not insert_data:
             return 0
 
-        # Prepare insert data
-        insert_data = []
-        for sec in result.seconds:
-            insert_data.append(
-                (
-                    sec.game_id,
-                    sec.season_id,
-                    sec.period,
-                    sec.period_second,
-                    sec.game_second,
-                    sec.situation_code,
-                    len(sec.home_skaters),
-                    len(sec.away_skaters),
-                    list(sec.home_skaters),
-                    list(sec.away_skaters),
-                    sec.home_goalie_id,
-                    sec.away_goalie_id,
-                    False,  # is_stoppage - will be set by event attribution
-                    sec.is_power_play,
-                    sec.is_empty_net,
-                )
+        async with self.db.transaction() as conn:
+            # Batch insert with ON CONFLICT for idempotency
+            await conn.executemany(
+                """
+                INSERT INTO second_snapshots (
+                    game_id, season_id, period, period_second, game_second,
+                    situation_code, home_skater_count, away_skater_count,
+                    home_skater_ids, away_skater_ids,
+                    home_goalie_id, away_goalie_id,
+                    is_stoppage, is_power_play, is_empty_net
+                ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15)
+                ON CONFLICT (game_id, game_second) DO UPDATE SET
+                    situation_code = EXCLUDED.situation_code,
+                    home_skater_count = EXCLUDED.home_skater_count,
+                    away_skater_count = EXCLUDED.away_skater_count,
+                    home_skater_ids = EXCLUDED.home_skater_ids,
+                    away_skater_ids = EXCLUDED.away_skater_ids,
+                    home_goalie_id = EXCLUDED.home_goalie_id,
+                    away_goalie_id = EXCLUDED.away_goalie_id,
+                    is_stoppage = EXCLUDED.is_stoppage,
+                    is_power_play = EXCLUDED.is_power_play,
+                    is_empty_net = EXCLUDED.is_empty_net
+                """,
+                insert_data,
             )
+            segments = list(segment_rows(insert_data))
+            await replace_lineup_segments(conn, result.game_id, segments)
+            await refresh_pair_toi(conn, result.game_id)
+            await refresh_line_combinations(conn, result.game_id)
 
-        # Batch insert with ON CONFLICT for idempotency
-        await self.db.executemany(
-            """
-            INSERT INTO second_snapshots (
-                game_id, season_id, period, period_second, game_second,
-                situation_code, home_skater_count, away_skater_count,
-                home_skater_ids, away_skater_ids,
-                home_goalie_id, away_goalie_id,
-                is_stoppage, is_power_play, is_empty_net
-            ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15)
-            ON CONFLICT (game_id, game_second) DO UPDATE SET
-                situation_code = EXCLUDED.situation_code,
-                home_skater_count = EXCLUDED.home_skater_count,
-                away_skater_count = EXCLUDED.away_skater_count,
-                home_skater_ids = EXCLUDED.home_skater_ids,
-                away_skater_ids = EXCLUDED.away_skater_ids,
-                home_goalie_id = EXCLUDED.home_goalie_id,
-                away_goalie_id = EXCLUDED.away_goalie_id,
-                is_stoppage = EXCLUDED.is_stoppage,
-                is_power_play = EXCLUDED.is_power_play,
-                is_empty_net = EXCLUDED.is_empty_net
-            """,
-            insert_data,
+        logger.info(
+            f"Saved {len(insert_data)} seconds ({len(segments)} segments) "
+            f"for game {result.game_id}"
         )
-
-        logger.info(f"Saved {len(insert_data)} seconds for game {result.game_id}")
         return len(insert_data)
@@ -1,11 +1,18 @@
 """Database services."""
 
+from nhl_api.services.db.bulk import copy_upsert
 from nhl_api.services.db.connection import DatabaseError, DatabaseService
-from nhl_api.services.db.progress_repo import ProgressEntry, ProgressRepository
+from nhl_api.services.db.progress_repo import (
+    ProgressEntry,
+    ProgressRepository,
+    ProgressUpdate,
+)
 
 __all__ = [
     "DatabaseError",
     "DatabaseService",
     "ProgressEntry",
     "ProgressRepository",
+    "ProgressUpdate",
+    "copy_upsert",
 ]
@@ -0,0 +1,125 @@
+"""Bulk upsert helpers built on PostgreSQL COPY.
+
+Row-at-a-time ``INSERT ... ON CONFLICT`` costs one round trip per row, which
+dominates persistence time for play-by-play events and shift charts. These
+helpers stage rows into a temporary table with asyncpg's binary COPY
+(``copy_records_to_table``) and merge them into the target table with a
+single ``INSERT ... SELECT ... ON CONFLICT`` statement, preserving the same
+idempotent upsert semantics.
+
+Usage:
+    from nhl_api.services.db import copy_upsert
+
+    async with db.transaction() as conn:
+        await copy_upsert(
+            conn,
+            "game_shifts",
+            ["shift_id", "game_id", "duration_seconds"],
+            rows,
+            key_columns=["shift_id"],
+            update_columns=["duration_seconds"],
+            touch_updated_at=True,
+        )
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    import asyncpg
+
+logger = logging.getLogger(__name__)
+
+
+def dedupe_rows(
+    columns: Sequence[str],
+    rows: Iterable[Sequence[Any]],
+    key_columns: Sequence[str],
+) -> list[tuple[Any, ...]]:
+    """Drop rows with duplicate conflict keys, keeping the last occurrence.
+
+    A single ``INSERT ... ON CONFLICT DO UPDATE`` cannot touch the same row
+    twice, so duplicates must be removed before merging. Keeping the last
+    occurrence matches the result of applying row-by-row upserts in order.
+
+    Args:
+        columns: Column names, in row order.
+        rows: Row tuples to deduplicate.
+        key_columns: Columns forming the conflict key.
+
+    Returns:
+        Deduplicated rows in first-seen key order.
+    """
+    key_idx = [columns.index(col) for col in key_columns]
+    by_key: dict[tuple[Any, ...], tuple[Any, ...]] = {}
+    for row in rows:
+        by_key[tuple(row[i] for i in key_idx)] = tuple(row)
+    return list(by_key.values())
+
+
+async def copy_upsert(
+    conn: asyncpg.Connection,
+    table: str,
+    columns: Sequence[str],
+    rows: Iterable[Sequence[Any]],
+    *,
+    key_columns: Sequence[str],
+    update_columns: Sequence[str],
+    touch_updated_at: bool = False,
+) -> int:
+    """Upsert rows into a table via a COPY-loaded staging table.
+
+    Must be called inside a transaction: the staging table is created with
+    ``ON COMMIT DROP`` so it disappears when the caller's transaction ends.
+
+    Args:
+        conn: Connection with an open transaction.
+        table: Target table name.
+        columns: Columns supplied for each row, in row order.
+        rows: Row tuples matching ``columns``.
+        key_columns: Conflict target (primary key or unique constraint).
+        update_columns: Columns overwritten from the new row on conflict.
+        touch_updated_at: If True, also set ``updated_at`` on conflict.
+
+    Returns:
+        Number of distinct rows merged.
+    """
+    records = dedupe_rows(columns, rows, key_columns)
+    if not records:
+        return 0
+
+    column_list = ", ".join(columns)
+    staging = f"_stage_{table}"
+
+    # Same column types as the target, but no defaults, constraints or indexes
+    await conn.execute(
+        f"""
+        CREATE TEMP TABLE IF NOT EXISTS {staging} ON COMMIT DROP AS
+        SELECT {column_list} FROM {table} WITH NO DATA
+        """
+    )
+    await conn.copy_records_to_table(staging, records=records, columns=list(columns))
+
+    assignments = [f"{col} = EXCLUDED.{col}" for col in update_columns]
+    if touch_updated_at:
+        assignments.append("updated_at = CURRENT_TIMESTAMP")
+    conflict_action = (
+        f"DO UPDATE SET {', '.join(assignments)}" if assignments else "DO NOTHING"
+    )
+
+    await conn.execute(
+        f"""
+        INSERT INTO {table} ({column_list})
+        SELECT {column_list} FROM {staging}
+        ON CONFLICT ({", ".join(key_columns)}) {conflict_action}
+        """
+    )
+    # Allow a second batch for the same table within one transaction
+    await conn.execute(f"TRUNCATE {staging}")
+
+    logger.debug("Bulk upserted %d rows into %s", len(records), table)
+    return len(records)
@@ -24,6 +24,8 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from nhl_api.services.db.connection import DatabaseService
 
 logger = logging.getLogger(__name__)
@@ -90,6 +92,50 @@ class ProgressEntry:
         )
 
 
+@dataclass(frozen=True)
+class ProgressUpdate:
+    """A pending change to one download_progress row.
+
+    Used by write-behind progress tracking to apply many state transitions
+    in a single statement. ``status`` is the final status to store (None
+    leaves it unchanged); ``attempts_added`` is added to the stored count.
+
+    Attributes:
+        progress_id: The progress entry ID.
+        status: New status (success, failed, skipped) or None.
+        attempts_added: Attempts made since the last write.
+        error_message: Failure or skip reason for failed/skipped rows.
+        response_size_bytes: Size of downloaded response for success rows.
+        response_time_ms: Response time in milliseconds for success rows.
+    """
+
+    progress_id: int
+    status: str | None = None
+    attempts_added: int = 0
+    error_message: str | None = None
+    response_size_bytes: int | None = None
+    response_time_ms: int | None = None
+
+    def combine(self, later: ProgressUpdate) -> ProgressUpdate:
+        """Fold a later update for the same row into this one.
+
+        Args:
+            later: Update made after this one.
+
+        Returns:
+            An update with the same effect as applying both in order.
+        """
+        latest = later if later.status is not None else self
+        return ProgressUpdate(
+            progress_id=self.progress_id,
+            status=latest.status,
+            attempts_added=self.attempts_added + later.attempts_added,
+            error_message=latest.error_message,
+            response_size_bytes=latest.response_size_bytes,
+            response_time_ms=latest.response_time_ms,
+        )
+
+
 class ProgressRepository:
     """Repository for download_progress table operations.
 
@@ -166,6 +212,53 @@ class ProgressRepository:
         )
         return int(result)
 
+    async def upsert_progress_many(
+        self,
+        source_id: int,
+        item_keys: Sequence[str],
+        *,
+        season_id: int | None = None,
+        batch_id: int | None = None,
+        status: str = "pending",
+    ) -> dict[str, int]:
+        """Create or update progress entries for many items at once.
+
+        Same conflict handling as upsert_progress, in a single statement.
+
+        Args:
+            source_id: Data source ID.
+            item_keys: Unique item identifiers.
+            season_id: Season ID (optional).
+            batch_id: Import batch ID (optional).
+            status: Initial status (default: pending).
+
+        Returns:
+            Mapping of item_key to progress_id.
+        """
+        # ON CONFLICT cannot touch the same row twice in one statement
+        keys = list(dict.fromkeys(item_keys))
+        if not keys:
+            return {}
+
+        query = """
+            INSERT INTO download_progress (source_id, season_id, item_key, batch_id, status)
+            SELECT $1::int, $2::int, item_key, $4::int, $5::text
+            FROM unnest($3::text[]) AS t(item_key)
+            ON CONFLICT (source_id, season_id, item_key)
+            DO UPDATE SET
+                batch_id = COALESCE(EXCLUDED.batch_id, download_progress.batch_id),
+                status = EXCLUDED.status,
+                last_attempt_at = CURRENT_TIMESTAMP
+            RETURNING item_key, progress_id
+        """
+        records = await self.db.fetch(
+            query, source_id, season_id, keys, batch_id, status
+        )
+        logger.debug(
+            "Upserted %d progress entries: source_id=%d", len(records), source_id
+        )
+        return {r["item_key"]: int(r["progress_id"]) for r in records}
+
     # Read operations
 
     async def get_by_id(self, progress_id: int) -> ProgressEntry | None:
@@ -376,6 +469,64 @@ class ProgressRepository:
 
     # Batch operations
 
+    async def apply_updates(self, updates: Sequence[ProgressUpdate]) -> int:
+        """Apply many progress updates in a single statement.
+
+        Each update has the same effect as the matching mark_success,
+        mark_failed, mark_skipped and increment_attempts calls. The statement
+        is atomic, so a failed call can be retried with the same updates.
+
+        Args:
+            updates: Updates to apply, at most one per progress_id.
+
+        Returns:
+            Number of entries updated.
+        """
+        if not updates:
+            return 0
+
+        query = """
+            UPDATE download_progress AS p
+            SET status = COALESCE(u.status, p.status),
+                attempts = p.attempts + u.attempts_added,
+                last_attempt_at = CASE
+                    WHEN u.attempts_added > 0 OR u.status = 'failed'
+                    THEN CURRENT_TIMESTAMP ELSE p.last_attempt_at END,
+                completed_at = CASE
+                    WHEN u.status IN ('success', 'skipped')
+                    THEN CURRENT_TIMESTAMP ELSE p.completed_at END,
+                error_message = CASE
+                    WHEN u.status IN ('failed', 'skipped')
+                    THEN u.error_message ELSE p.error_message END,
+                response_size_bytes = CASE
+                    WHEN u.status = 'success'
+                    THEN u.response_size_bytes ELSE p.response_size_bytes END,
+                response_time_ms = CASE
+                    WHEN u.status = 'success'
+                    THEN u.response_time_ms ELSE p.response_time_ms END
+            FROM unnest(
+                $1::int[], $2::text[], $3::int[], $4::text[], $5::int[], $6::int[]
+            ) AS u(
+                progress_id, status, attempts_added,
+                error_message, response_size_bytes, response_time_ms
+            )
+            WHERE p.progress_id = u.progress_id
+        """
+        result = await self.db.execute(
+            query,
+            [u.progress_id for u in updates],
+            [u.status for u in updates],
+            [u.attempts_added for u in updates],
+            [u.error_message for u in updates],
+            [u.response_size_bytes for u in updates],
+            [u.response_time_ms for u in updates],
+        )
+
+        # Parse "UPDATE N" to get count
+        count = int(result.split()[-1]) if result else 0
+        logger.debug("Applied %d batched progress updates", count)
+        return count
+
     async def get_batch_stats(self, batch_id: int) -> dict[str, int]:
         """Get statistics for a batch.
 
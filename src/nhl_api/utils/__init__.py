@@ -1,16 +1,23 @@
 """Utility functions and helpers."""
 
-from nhl_api.utils.html_storage import HTMLStorageManager
+from nhl_api.utils.html_storage import HTMLStorageManager, migrate_html_directory
 from nhl_api.utils.http_client import (
+    COMPLETED_GAME_POLICY,
+    CachePolicy,
+    CacheStats,
     ConnectionError,
     ContentType,
     HTTPClient,
     HTTPClientConfig,
     HTTPClientError,
     HTTPResponse,
+    ResponseCache,
     TimeoutError,
+    clear_shared_response_caches,
     create_nhl_api_client,
     create_nhl_html_client,
+    is_completed_game,
+    shared_response_cache,
 )
 from nhl_api.utils.name_matching import (
     MatchResult,
@@ -19,24 +26,35 @@ from nhl_api.utils.name_matching import (
     name_similarity,
     normalize_name,
 )
+from nhl_api.utils.pack_archive import PackArchive
 
 __all__ = [
     # HTML Storage
     "HTMLStorageManager",
+    "migrate_html_directory",
     # HTTP Client
+    "COMPLETED_GAME_POLICY",
+    "CachePolicy",
+    "CacheStats",
     "ConnectionError",
     "ContentType",
     "HTTPClient",
     "HTTPClientConfig",
     "HTTPClientError",
     "HTTPResponse",
+    "ResponseCache",
     "TimeoutError",
+    "clear_shared_response_caches",
     "create_nhl_api_client",
     "create_nhl_html_client",
+    "is_completed_game",
+    "shared_response_cache",
     # Name Matching
     "MatchResult",
     "PlayerNameMatcher",
     "find_best_match",
     "name_similarity",
     "normalize_name",
+    # Pack Archive
+    "PackArchive",
 ]
@@ -4,11 +4,16 @@ This module provides utilities for persisting NHL HTML reports to disk
 for cross-source validation and comparison.
 
 Storage Structure:
-    data/html/{season}/{report_type}/{game_id}.HTM
+    data/html/{season}/{report_type}/{game_id}.HTM     (backend="files")
+    data/html/{season}/{report_type}.pack              (backend="archive")
 
 Example:
     data/html/20242025/ES/2024020001.HTM
     data/html/20242025/GS/2024020500.HTM
+
+The "archive" backend packs each season/report type into one compressed,
+append-only file (see nhl_api.utils.pack_archive). Existing directories can
+be converted with ``python -m nhl_api.cli pack-html``.
 """
 
 from __future__ import annotations
@@ -17,8 +22,15 @@ import logging
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from nhl_api.utils.pack_archive import ARCHIVE_SUFFIX, PackArchive
+
 if TYPE_CHECKING:
-    pass
+    from collections.abc import Iterator
+
+STORAGE_BACKENDS = ("files", "archive")
+
+# Where reports are stored when no base_dir is given
+DEFAULT_HTML_DIR = Path("data/html")
 
 logger = logging.getLogger(__name__)
 
@@ -49,16 +61,58 @@ class HTMLStorageManager:
         )
     """
 
-    def __init__(self, base_dir: Path | str | None = None) -> None:
+    def __init__(
+        self, base_dir: Path | str | None = None, *, backend: str = "files"
+    ) -> None:
         """Initialize the HTML storage manager.
 
         Args:
-            base_dir: Base directory for HTML storage. Defaults to ./data/html
+            base_dir: Base directory for HTML storage. Defaults to DEFAULT_HTML_DIR
+            backend: "files" for one .HTM file per report, or "archive" for
+                one compressed archive per season and report type
+
+        Raises:
+            ValueError: If backend is not recognized
         """
+        if backend not in STORAGE_BACKENDS:
+            raise ValueError(
+                f"Invalid backend: {backend}. Must be one of {STORAGE_BACKENDS}."
+            )
         if base_dir is None:
-            base_dir = Path("data/html")
+            base_dir = DEFAULT_HTML_DIR
         self.base_dir = Path(base_dir)
-        logger.debug("HTMLStorageManager initialized with base_dir=%s", self.base_dir)
+        self.backend = backend
+        self._archives: dict[tuple[str, str], PackArchive] = {}
+        logger.debug(
+            "HTMLStorageManager initialized with base_dir=%s, backend=%s",
+            self.base_dir,
+            self.backend,
+        )
+
+    def _get_archive(self, season: str, report_type: str) -> PackArchive:
+        """Get the archive for a season and report type, opening it once.
+
+        Args:
+            season: NHL season ID (e.g., "20242025")
+            report_type: Report type code (ES, GS, PL, etc.)
+
+        Returns:
+            PackArchive for the season and report type
+        """
+        key = (season, report_type)
+        archive = self._archives.get(key)
+        if archive is None:
+            archive = PackArchive(
+                self.base_dir / season / f"{report_type}{ARCHIVE_SUFFIX}"
+            )
+            self._archives[key] = archive
+        return archive
+
+    def close(self) -> None:
+        """Close any open archives."""
+        for archive in self._archives.values():
+            archive.close()
+        self._archives.clear()
 
     def _get_file_path(self, season: str, report_type: str, game_id: int) -> Path:
         """Build file path for HTML report.
@@ -89,11 +143,25 @@ class HTMLStorageManager:
             html: Raw HTML content (string or bytes)
 
         Returns:
-            Path object where the file was saved
+            Path object where the file (or archive) was saved
 
         Raises:
             OSError: If file cannot be written
         """
+        if self.backend == "archive":
+            archive = self._get_archive(season, report_type)
+            archive.save(
+                game_id, html.encode("utf-8") if isinstance(html, str) else html
+            )
+            logger.debug(
+                "Archived HTML report: season=%s, report_type=%s, game_id=%d, path=%s",
+                season,
+                report_type,
+                game_id,
+                archive.path,
+            )
+            return archive.path
+
         file_path = self._get_file_path(season, report_type, game_id)
 
         # Create parent directories if needed
@@ -129,19 +197,32 @@ class HTMLStorageManager:
         Raises:
             OSError: If file exists but cannot be read
         """
-        file_path = self._get_file_path(season, report_type, game_id)
+        if self.backend == "archive":
+            content = self._get_archive(season, report_type).load(game_id)
+            if content is None:
+                logger.debug(
+                    "HTML report not found: season=%s, report_type=%s, game_id=%d",
+                    season,
+                    report_type,
+                    game_id,
+                )
+                return None
+            html = content.decode("utf-8")
+        else:
+            file_path = self._get_file_path(season, report_type, game_id)
 
-        if not file_path.exists():
-            logger.debug(
-                "HTML report not found: season=%s, report_type=%s, game_id=%d, path=%s",
-                season,
-                report_type,
-                game_id,
-                file_path,
-            )
-            return None
+            if not file_path.exists():
+                logger.debug(
+                    "HTML report not found: season=%s, report_type=%s, "
+                    "game_id=%d, path=%s",
+                    season,
+                    report_type,
+                    game_id,
+                    file_path,
+                )
+                return None
 
-        html = file_path.read_text(encoding="utf-8")
+            html = file_path.read_text(encoding="utf-8")
 
         logger.debug(
             "Loaded HTML report: season=%s, report_type=%s, game_id=%d, size=%d bytes",
@@ -164,6 +245,8 @@ class HTMLStorageManager:
         Returns:
             True if file exists, False otherwise
         """
+        if self.backend == "archive":
+            return game_id in self._get_archive(season, report_type)
         file_path = self._get_file_path(season, report_type, game_id)
         return file_path.exists()
 
@@ -181,12 +264,16 @@ class HTMLStorageManager:
         Raises:
             OSError: If file exists but cannot be deleted
         """
-        file_path = self._get_file_path(season, report_type, game_id)
+        if self.backend == "archive":
+            if not self._get_archive(season, report_type).delete(game_id):
+                return False
+        else:
+            file_path = self._get_file_path(season, report_type, game_id)
 
-        if not file_path.exists():
-            return False
+            if not file_path.exists():
+                return False
 
-        file_path.unlink()
+            file_path.unlink()
 
         logger.debug(
             "Deleted HTML report: season=%s, report_type=%s, game_id=%d",
@@ -209,6 +296,9 @@ class HTMLStorageManager:
         Returns:
             List of (season, report_type, game_id) tuples for all matching reports
         """
+        if self.backend == "archive":
+            return self._list_archived_reports(season, report_type)
+
         reports: list[tuple[str, str, int]] = []
 
         if season and report_type:
@@ -239,3 +329,109 @@ class HTMLStorageManager:
                 continue
 
         return sorted(reports)
+
+    def _list_archived_reports(
+        self, season: str | None, report_type: str | None
+    ) -> list[tuple[str, str, int]]:
+        """List reports stored in archives.
+
+        Args:
+            season: Optional season filter
+            report_type: Optional report type filter
+
+        Returns:
+            Sorted (season, report_type, game_id) tuples
+        """
+        if season:
+            season_dirs = [self.base_dir / season]
+        elif self.base_dir.exists():
+            season_dirs = [p for p in self.base_dir.iterdir() if p.is_dir()]
+        else:
+            season_dirs = []
+
+        reports: list[tuple[str, str, int]] = []
+        for season_dir in season_dirs:
+            for pack in season_dir.glob(f"{report_type or '*'}{ARCHIVE_SUFFIX}"):
+                file_report_type = pack.name.removesuffix(ARCHIVE_SUFFIX)
+                archive = self._get_archive(season_dir.name, file_report_type)
+                reports.extend(
+                    (season_dir.name, file_report_type, game_id)
+                    for game_id in archive.keys()
+                )
+        return sorted(reports)
+
+    def iter_reports(self, season: str, report_type: str) -> Iterator[tuple[int, str]]:
+        """Yield every stored report for a season and report type.
+
+        With the archive backend this reads the whole season from one file.
+
+        Args:
+            season: NHL season ID (e.g., "20242025")
+            report_type: Report type code (ES, GS, PL, etc.)
+
+        Yields:
+            Tuples of (game_id, HTML content) in game ID order
+        """
+        if self.backend == "archive":
+            for game_id, content in self._get_archive(
+                season, report_type
+            ).iter_entries():
+                yield game_id, content.decode("utf-8")
+            return
+
+        for _, _, game_id in self.list_reports(season, report_type):
+            html = self.load_html(season, report_type, game_id)
+            if html is not None:
+                yield game_id, html
+
+
+def migrate_html_directory(
+    base_dir: Path | str,
+    season: str | None = None,
+    *,
+    remove_files: bool = False,
+) -> int:
+    """Pack per-game ``.HTM`` files into season/report-type archives.
+
+    Converts ``{base_dir}/{season}/{report_type}/*.HTM`` into
+    ``{base_dir}/{season}/{report_type}.pack``. Games already in an archive
+    are skipped, so the migration can be re-run safely.
+
+    Args:
+        base_dir: HTML storage root (e.g., data/html)
+        season: Only migrate this season (default: all seasons)
+        remove_files: Delete each ``.HTM`` file once it has been archived
+
+    Returns:
+        Number of reports added to archives
+    """
+    base_dir = Path(base_dir)
+    season_dirs = [base_dir / season] if season else sorted(base_dir.iterdir())
+    migrated = 0
+
+    for season_dir in season_dirs:
+        if not season_dir.is_dir():
+            continue
+        for report_dir in sorted(p for p in season_dir.iterdir() if p.is_dir()):
+            archive = PackArchive(season_dir / f"{report_dir.name}{ARCHIVE_SUFFIX}")
+            try:
+                for htm_file in sorted(report_dir.glob("*.HTM")):
+                    try:
+                        game_id = int(htm_file.stem)
+                    except ValueError:
+                        logger.warning("Skipping invalid HTML file path: %s", htm_file)
+                        continue
+                    if game_id not in archive:
+                        archive.save(game_id, htm_file.read_bytes())
+                        migrated += 1
+                    if remove_files:
+                        htm_file.unlink()
+            finally:
+                archive.close()
+
+            if remove_files and not any(report_dir.iterdir()):
+                report_dir.rmdir()
+
+            logger.info("Packed %s into %s", report_dir, archive.path)
+
+    return migrated
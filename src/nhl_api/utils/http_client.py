@@ -13,19 +13,33 @@ Example usage:
     config = HTTPClientConfig(timeout=60, user_agent="MyApp/1.0")
     async with HTTPClient(config) as client:
         response = await client.get(url)
+
+    # With an on-disk response cache; completed games are never refetched
+    cache = ResponseCache("data/cache/http", max_bytes=2 * 1024**3)
+    async with HTTPClient(cache=cache, cache_policy=COMPLETED_GAME_POLICY) as client:
+        response = await client.get(url)
+    print(cache.stats)
 """
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json as jsonlib
 import logging
-from dataclasses import dataclass
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass, field
 from enum import Enum
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import aiohttp
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Callable, Mapping
 
 logger = logging.getLogger(__name__)
 
@@ -84,6 +98,7 @@ class HTTPResponse:
         content: Raw response content as bytes
         url: Final URL after redirects
         content_type: Detected content type
+        from_cache: True if served from the response cache without a request
     """
 
     status: int
@@ -91,6 +106,7 @@ class HTTPResponse:
     content: bytes
     url: str
     content_type: ContentType = ContentType.BINARY
+    from_cache: bool = False
 
     @classmethod
     async def from_aiohttp_response(
@@ -176,6 +192,11 @@ class HTTPResponse:
         """Check if response indicates client error (4xx status)."""
         return 400 <= self.status < 500
 
+    @property
+    def is_throttled(self) -> bool:
+        """Check if the server asked for fewer requests (429, 503 or Retry-After)."""
+        return self.status in (429, 503) or self.retry_after is not None
+
     @property
     def retry_after(self) -> float | None:
         """Get Retry-After header value if present.
@@ -218,6 +239,372 @@ class TimeoutError(HTTPClientError):
     pass
 
 
+@dataclass
+class CacheStats:
+    """Counters for a response cache.
+
+    Attributes:
+        hits: Responses served from disk without a network request
+        misses: Requests with no usable cache entry
+        revalidations: Conditional requests answered with 304 Not Modified
+        stores: Responses written to the cache
+        evictions: Entries removed to stay within the size bound
+    """
+
+    hits: int = 0
+    misses: int = 0
+    revalidations: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+    @property
+    def network_free(self) -> int:
+        """Requests answered without downloading a body."""
+        return self.hits + self.revalidations
+
+
+@dataclass(frozen=True, slots=True)
+class CachePolicy:
+    """Per-source rules for serving cached responses.
+
+    Attributes:
+        is_immutable: Returns True for responses that will never change;
+            these are served from disk without revalidation
+        max_age: Seconds a cached response is served without revalidation
+            (0 always revalidates when validators are available)
+    """
+
+    is_immutable: Callable[[HTTPResponse], bool] | None = None
+    max_age: float = 0.0
+
+
+# Game status cell in the page header of every NHL HTML report
+_FINAL_REPORT_HEADER = re.compile(rb">\s*Final\s*<")
+
+
+def is_completed_game(response: HTTPResponse) -> bool:
+    """Check whether a gamecenter or HTML report response is for a finished game.
+
+    Args:
+        response: Response to inspect
+
+    Returns:
+        True if a JSON payload's gameState is OFF or FINAL, or an HTML
+        report's page header reads "Final"
+    """
+    if response.content_type == ContentType.HTML:
+        return _FINAL_REPORT_HEADER.search(response.content) is not None
+    if response.content_type != ContentType.JSON:
+        return False
+    try:
+        data = response.json()
+    except ValueError:
+        return False
+    return isinstance(data, dict) and data.get("gameState") in ("OFF", "FINAL")
+
+
+# Completed games never change; everything else is revalidated
+COMPLETED_GAME_POLICY = CachePolicy(is_immutable=is_completed_game)
+
+
+def _header(headers: Mapping[str, str], name: str) -> str | None:
+    """Look up a header case-insensitively (servers differ in casing)."""
+    name = name.lower()
+    for key, value in headers.items():
+        if key.lower() == name:
+            return value
+    return None
+
+
+@dataclass
+class _CacheEntry:
+    """Metadata for one cached response."""
+
+    key: str
+    size: int
+    stored_at: float
+    immutable: bool = False
+    etag: str | None = None
+    last_modified: str | None = None
+    meta: dict[str, Any] = field(default_factory=dict)
+
+
+class ResponseCache:
+    """On-disk cache of successful GET responses.
+
+    Entries are keyed by URL and query parameters and stored as a body
+    file plus a JSON metadata file. The total body size is bounded by
+    ``max_bytes``; least recently used entries are evicted first.
+
+    Methods do blocking disk I/O and are safe to call from several threads;
+    HTTPClient runs them via ``asyncio.to_thread`` to keep the event loop
+    free.
+
+    Example:
+        cache = ResponseCache("data/cache/http", max_bytes=512 * 1024**2)
+        async with HTTPClient(cache=cache) as client:
+            await client.get(url)
+        print(cache.stats.hits, cache.stats.misses)
+    """
+
+    def __init__(self, directory: Path | str, *, max_bytes: int = 1024**3) -> None:
+        """Initialize the response cache.
+
+        Args:
+            directory: Directory holding cached responses
+            max_bytes: Maximum total size of cached bodies
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._entries: dict[str, _CacheEntry] | None = None
+        self._total_bytes = 0
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def make_key(url: str, params: Mapping[str, str] | None = None) -> str:
+        """Build the cache key for a request.
+
+        Args:
+            url: Request URL
+            params: Query parameters
+
+        Returns:
+            Hex digest identifying the request
+        """
+        query = "&".join(f"{k}={v}" for k, v in sorted((params or {}).items()))
+        return hashlib.sha256(f"{url}?{query}".encode()).hexdigest()
+
+    def _body_path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.body"
+
+    def _meta_path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _index(self) -> dict[str, _CacheEntry]:
+        """Load entry metadata from disk on first use."""
+        if self._entries is not None:
+            return self._entries
+
+        self._entries = {}
+        self._total_bytes = 0
+        if self.directory.exists():
+            for meta_path in self.directory.glob("*/*.json"):
+                try:
+                    meta = jsonlib.loads(meta_path.read_text())
+                    last_used = self._body_path(meta_path.stem).stat().st_mtime
+                except (OSError, ValueError):
+                    continue
+                entry = self._entry_from_meta(meta_path.stem, meta)
+                entry.stored_at = last_used
+                self._entries[entry.key] = entry
+                self._total_bytes += entry.size
+        return self._entries
+
+    @staticmethod
+    def _entry_from_meta(key: str, meta: dict[str, Any]) -> _CacheEntry:
+        headers = meta.get("headers", {})
+        return _CacheEntry(
+            key=key,
+            size=meta.get("size", 0),
+            stored_at=meta.get("stored_at", 0.0),
+            immutable=meta.get("immutable", False),
+            etag=_header(headers, "ETag"),
+            last_modified=_header(headers, "Last-Modified"),
+            meta=meta,
+        )
+
+    def lookup(self, key: str) -> _CacheEntry | None:
+        """Get the entry for a key, if cached."""
+        with self._lock:
+            return self._index().get(key)
+
+    def is_fresh(self, entry: _CacheEntry, policy: CachePolicy) -> bool:
+        """Check whether an entry may be served without revalidation.
+
+        Args:
+            entry: Cached entry
+            policy: Policy for the requesting source
+
+        Returns:
+            True if the entry is immutable or within the policy's max age
+        """
+        if entry.immutable:
+            return True
+        return policy.max_age > 0 and time.time() - entry.stored_at < policy.max_age
+
+    def conditional_headers(self, entry: _CacheEntry) -> dict[str, str]:
+        """Build validator headers for revalidating an entry.
+
+        Args:
+            entry: Cached entry
+
+        Returns:
+            If-None-Match / If-Modified-Since headers (empty if none stored)
+        """
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def load(self, entry: _CacheEntry) -> HTTPResponse | None:
+        """Read a cached response and mark it as recently used.
+
+        Args:
+            entry: Cached entry
+
+        Returns:
+            The cached response, or None if its files are missing
+        """
+        body_path = self._body_path(entry.key)
+        try:
+            content = body_path.read_bytes()
+            os.utime(body_path)
+        except OSError:
+            with self._lock:
+                self._remove(entry.key)
+            return None
+        entry.stored_at = time.time()
+
+        meta = entry.meta
+        return HTTPResponse(
+            status=meta["status"],
+            headers=dict(meta["headers"]),
+            content=content,
+            url=meta["url"],
+            content_type=ContentType(meta["content_type"]),
+        )
+
+    def store(self, key: str, response: HTTPResponse, policy: CachePolicy) -> None:
+        """Write a successful response to the cache.
+
+        Args:
+            key: Cache key from make_key
+            response: Response to store
+            policy: Policy for the requesting source
+        """
+        size = len(response.content)
+        if size > self.max_bytes:
+            return
+
+        immutable = bool(policy.is_immutable and policy.is_immutable(response))
+        meta = {
+            "status": response.status,
+            "headers": response.headers,
+            "url": response.url,
+            "content_type": response.content_type.value,
+            "size": size,
+            "stored_at": time.time(),
+            "immutable": immutable,
+        }
+
+        with self._lock:
+            entries = self._index()
+            self._remove(key)
+            body_path = self._body_path(key)
+            try:
+                body_path.parent.mkdir(parents=True, exist_ok=True)
+                body_path.write_bytes(response.content)
+                self._meta_path(key).write_text(jsonlib.dumps(meta))
+            except OSError as e:
+                logger.warning("Failed to cache %s: %s", response.url, e)
+                return
+
+            entries[key] = self._entry_from_meta(key, meta)
+            self._total_bytes += size
+            self.stats.stores += 1
+            self._evict()
+
+    def refresh(self, entry: _CacheEntry, response: HTTPResponse) -> None:
+        """Update validators after a 304 Not Modified response.
+
+        Args:
+            entry: Revalidated entry
+            response: The 304 response
+        """
+        stored = entry.meta["headers"]
+        changed = False
+        for header in ("ETag", "Last-Modified"):
+            value = _header(response.headers, header)
+            if value and _header(stored, header) != value:
+                # Replace the old value whatever its casing
+                for name in [k for k in stored if k.lower() == header.lower()]:
+                    del stored[name]
+                stored[header] = value
+                changed = True
+        if changed:
+            entry.etag = _header(stored, "ETag")
+            entry.last_modified = _header(stored, "Last-Modified")
+            with self._lock:
+                try:
+                    self._meta_path(entry.key).write_text(jsonlib.dumps(entry.meta))
+                except OSError as e:
+                    logger.warning("Failed to update cache entry %s: %s", entry.key, e)
+
+    def _remove(self, key: str) -> None:
+        entry = self._index().pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry.size
+        self._body_path(key).unlink(missing_ok=True)
+        self._meta_path(key).unlink(missing_ok=True)
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until under max_bytes."""
+        if self._total_bytes <= self.max_bytes:
+            return
+        for entry in sorted(self._index().values(), key=lambda e: e.stored_at):
+            if self._total_bytes <= self.max_bytes:
+                break
+            self._remove(entry.key)
+            self.stats.evictions += 1
+
+    @property
+    def total_bytes(self) -> int:
+        """Total size of cached bodies."""
+        with self._lock:
+            self._index()
+            return self._total_bytes
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        with self._lock:
+            for key in list(self._index()):
+                self._remove(key)
+
+
+# Process-wide response caches, one per directory
+_shared_caches: dict[Path, ResponseCache] = {}
+
+
+def shared_response_cache(
+    directory: Path | str, *, max_bytes: int = 1024**3
+) -> ResponseCache:
+    """Get the process-wide response cache for a directory.
+
+    Every downloader caching into the same directory shares one index,
+    size bound and set of counters. The first caller for a directory sets
+    its size bound.
+
+    Args:
+        directory: Directory holding cached responses
+        max_bytes: Maximum total size of cached bodies if the cache is new
+
+    Returns:
+        Shared ResponseCache for the directory
+    """
+    path = Path(directory).resolve()
+    if path not in _shared_caches:
+        _shared_caches[path] = ResponseCache(path, max_bytes=max_bytes)
+    return _shared_caches[path]
+
+
+def clear_shared_response_caches() -> None:
+    """Forget all shared response caches (files on disk are kept)."""
+    _shared_caches.clear()
+
+
 class HTTPClient:
     """Async HTTP client with connection pooling.
 
@@ -232,13 +619,24 @@ class HTTPClient:
                 data = response.json()
     """
 
-    def __init__(self, config: HTTPClientConfig | None = None) -> None:
+    def __init__(
+        self,
+        config: HTTPClientConfig | None = None,
+        *,
+        cache: ResponseCache | None = None,
+        cache_policy: CachePolicy | None = None,
+    ) -> None:
         """Initialize the HTTP client.
 
         Args:
             config: Optional configuration. Uses defaults if not provided.
+            cache: Optional on-disk cache for GET responses
+            cache_policy: Rules for serving cached responses without
+                revalidation. Defaults to always revalidating.
         """
         self.config = config or HTTPClientConfig()
+        self.cache = cache
+        self.cache_policy = cache_policy or CachePolicy()
         self._session: aiohttp.ClientSession | None = None
         self._connector: aiohttp.TCPConnector | None = None
         self._cookie_jar: aiohttp.CookieJar | aiohttp.DummyCookieJar | None = None
@@ -304,6 +702,11 @@ class HTTPClient:
             self._cookie_jar = None
             logger.debug("Closed HTTP session")
 
+    @property
+    def cache_stats(self) -> CacheStats | None:
+        """Hit/miss/revalidation counters, or None without a cache."""
+        return self.cache.stats if self.cache is not None else None
+
     @property
     def is_open(self) -> bool:
         """Check if the session is open."""
@@ -348,10 +751,112 @@ class HTTPClient:
             TimeoutError: If request times out
             HTTPClientError: For other HTTP errors
         """
-        return await self._request(
-            "GET", url, headers=headers, params=params, timeout=timeout
+        if self.cache is None:
+            return await self._request(
+                "GET", url, headers=headers, params=params, timeout=timeout
+            )
+        return await self._cached_get(
+            self.cache, url, headers=headers, params=params, timeout=timeout
+        )
+
+    async def cached_response(
+        self,
+        url: str,
+        *,
+        params: Mapping[str, str] | None = None,
+    ) -> HTTPResponse | None:
+        """Serve a GET request from the cache without a network request.
+
+        Callers that pace requests can check this first, so cache hits do
+        not spend rate-limit tokens. Disk reads run in a worker thread.
+
+        Args:
+            url: The URL to request
+            params: Query parameters to append to URL
+
+        Returns:
+            The cached response if it is fresh under the cache policy, else None
+        """
+        if self.cache is None:
+            return None
+        cached = await asyncio.to_thread(self._load_fresh, self.cache, url, params)
+        if cached is not None:
+            cached.from_cache = True
+            self.cache.stats.hits += 1
+            logger.debug("Cache hit for %s", url)
+        return cached
+
+    def _load_fresh(
+        self,
+        cache: ResponseCache,
+        url: str,
+        params: Mapping[str, str] | None,
+    ) -> HTTPResponse | None:
+        """Read a cached response if it is fresh (blocking)."""
+        entry = cache.lookup(cache.make_key(url, params))
+        if entry is None or not cache.is_fresh(entry, self.cache_policy):
+            return None
+        return cache.load(entry)
+
+    async def _cached_get(
+        self,
+        cache: ResponseCache,
+        url: str,
+        *,
+        headers: Mapping[str, str] | None = None,
+        params: Mapping[str, str] | None = None,
+        timeout: float | None = None,
+    ) -> HTTPResponse:
+        """Perform a GET request through the response cache.
+
+        Fresh entries are served from disk. Stale entries with an ETag or
+        Last-Modified are revalidated with a conditional request, and a 304
+        serves the cached body. Successful responses are stored.
+
+        Args:
+            cache: Response cache
+            url: The URL to request
+            headers: Additional headers to send
+            params: Query parameters to append to URL
+            timeout: Override default timeout for this request
+
+        Returns:
+            HTTPResponse with response data
+        """
+        cached = await self.cached_response(url, params=params)
+        if cached is not None:
+            return cached
+
+        key = cache.make_key(url, params)
+        entry = await asyncio.to_thread(cache.lookup, key)
+
+        request_headers = dict(headers or {})
+        if entry is not None and not cache.is_fresh(entry, self.cache_policy):
+            request_headers.update(cache.conditional_headers(entry))
+        else:
+            entry = None
+
+        response = await self._request(
+            "GET", url, headers=request_headers, params=params, timeout=timeout
         )
 
+        if response.status == 304 and entry is not None:
+            cached = await asyncio.to_thread(cache.load, entry)
+            if cached is not None:
+                cache.stats.revalidations += 1
+                await asyncio.to_thread(cache.refresh, entry, response)
+                logger.debug("Cache revalidated for %s", url)
+                return cached
+            # Entry vanished from disk; fetch the full body
+            response = await self._request(
+                "GET", url, headers=headers, params=params, timeout=timeout
+            )
+
+        cache.stats.misses += 1
+        if response.status == 200:
+            await asyncio.to_thread(cache.store, key, response, self.cache_policy)
+        return response
+
     async def post(
         self,
         url: str,
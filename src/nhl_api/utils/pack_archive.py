@@ -0,0 +1,261 @@
+"""Packed, compressed append-only archives of keyed byte payloads.
+
+Many small payloads (one HTML report or raw API response per game) are
+appended to a single archive file instead of one file each. Each entry is
+gzip-compressed on its own, and an offset index built from the entry
+headers lets any key be read straight from a memory map of the archive.
+
+Used by HTMLStorageManager (``backend="archive"``, keyed by game ID) and by
+the downloaders' raw response archive (keyed by a request hash).
+
+Archive Layout:
+    MAGIC, then repeated entries of
+    [key: u64][flags: u8][length: u32][payload: length bytes]
+
+    Entries are never rewritten: saving a key again appends a new entry that
+    supersedes the old one (unless the payload is unchanged), and deleting
+    appends a tombstone. Call ``compact()`` to drop superseded entries.
+
+Example:
+    archive = PackArchive(Path("data/html/20242025/GS.pack"))
+    archive.save(2024020001, b"<html>...</html>")
+    html = archive.load(2024020001)
+    for key, content in archive.iter_entries():
+        ...
+"""
+
+from __future__ import annotations
+
+import gzip
+import logging
+import mmap
+import struct
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_SUFFIX = ".pack"
+# Kept from the first (HTML-only) format so existing archives stay readable
+ARCHIVE_MAGIC = b"NHLHTML1"
+
+_ENTRY_HEADER = struct.Struct("<QBI")
+_FLAG_GZIP = 0
+_FLAG_DELETED = 1
+
+
+class PackArchiveError(Exception):
+    """Raised when a file is not a valid pack archive."""
+
+    pass
+
+
+class PackArchive:
+    """Append-only archive of compressed payloads keyed by 64-bit integers.
+
+    Writes must come from a single process; reads are served from a memory
+    map that is refreshed when the file grows.
+    """
+
+    def __init__(self, path: Path | str, *, compresslevel: int = 6) -> None:
+        """Initialize the archive.
+
+        Args:
+            path: Archive file path (created on first save)
+            compresslevel: gzip compression level for new entries
+        """
+        self.path = Path(path)
+        self.compresslevel = compresslevel
+        self._index: dict[int, tuple[int, int]] | None = None
+        self._indexed_size = 0
+        self._file: BinaryIO | None = None
+        self._map: mmap.mmap | None = None
+
+    # =========================================================================
+    # Index
+    # =========================================================================
+
+    def _ensure_index(self) -> dict[int, tuple[int, int]]:
+        """Build or extend the offset index from entry headers.
+
+        Returns:
+            Mapping of key to (payload offset, payload length)
+        """
+        if self._index is None:
+            self._index = {}
+            self._indexed_size = 0
+
+        if not self.path.exists():
+            return self._index
+
+        size = self.path.stat().st_size
+        if size <= self._indexed_size:
+            return self._index
+
+        view = self._view(size)
+        offset = self._indexed_size
+        if offset == 0:
+            if view[: len(ARCHIVE_MAGIC)] != ARCHIVE_MAGIC:
+                raise PackArchiveError(f"Not a pack archive: {self.path}")
+            offset = len(ARCHIVE_MAGIC)
+
+        while offset + _ENTRY_HEADER.size <= size:
+            key, flags, length = _ENTRY_HEADER.unpack_from(view, offset)
+            payload = offset + _ENTRY_HEADER.size
+            if payload + length > size:
+                # Partially written trailing entry; ignore it
+                logger.warning("Truncated entry for key %d in %s", key, self.path)
+                break
+            if flags == _FLAG_DELETED:
+                self._index.pop(key, None)
+            else:
+                self._index[key] = (payload, length)
+            offset = payload + length
+
+        self._indexed_size = offset
+        return self._index
+
+    def _view(self, size: int) -> mmap.mmap:
+        """Get a memory map covering at least ``size`` bytes of the archive."""
+        if self._map is None or len(self._map) < size:
+            if self._map is not None:
+                self._map.close()
+            with self.path.open("rb") as f:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map
+
+    # =========================================================================
+    # Reading
+    # =========================================================================
+
+    def keys(self) -> list[int]:
+        """List keys stored in the archive.
+
+        Returns:
+            Sorted keys
+        """
+        return sorted(self._ensure_index())
+
+    def __contains__(self, key: object) -> bool:
+        """Check if a key is stored in the archive."""
+        return key in self._ensure_index()
+
+    def __len__(self) -> int:
+        """Number of keys stored in the archive."""
+        return len(self._ensure_index())
+
+    def load(self, key: int) -> bytes | None:
+        """Read one payload.
+
+        Args:
+            key: Entry key (e.g., NHL game ID)
+
+        Returns:
+            Decompressed payload, or None if the key is not stored
+        """
+        entry = self._ensure_index().get(key)
+        if entry is None:
+            return None
+        offset, length = entry
+        view = self._view(offset + length)
+        return gzip.decompress(view[offset : offset + length])
+
+    def iter_entries(self) -> Iterator[tuple[int, bytes]]:
+        """Yield every stored payload in key order.
+
+        Yields:
+            Tuples of (key, decompressed payload)
+        """
+        index = self._ensure_index()
+        for key in sorted(index):
+            offset, length = index[key]
+            view = self._view(offset + length)
+            yield key, gzip.decompress(view[offset : offset + length])
+
+    # =========================================================================
+    # Writing
+    # =========================================================================
+
+    def _append(self, key: int, flags: int, payload: bytes) -> None:
+        """Append one entry and flush it so readers can see it."""
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_index()
+            if self._indexed_size and self.path.stat().st_size > self._indexed_size:
+                # Drop a partially written entry so new entries stay aligned
+                if self._map is not None:
+                    self._map.close()
+                    self._map = None
+                with self.path.open("r+b") as f:
+                    f.truncate(self._indexed_size)
+            self._file = self.path.open("ab")
+            if self._file.tell() == 0:
+                self._file.write(ARCHIVE_MAGIC)
+        self._file.write(_ENTRY_HEADER.pack(key, flags, len(payload)))
+        self._file.write(payload)
+        self._file.flush()
+
+    def save(self, key: int, content: bytes) -> bool:
+        """Append a payload, superseding any earlier copy.
+
+        Compression is deterministic, so an unchanged payload is detected by
+        comparing compressed bytes and is not appended again.
+
+        Args:
+            key: Entry key (e.g., NHL game ID)
+            content: Raw payload bytes
+
+        Returns:
+            True if a new entry was appended, False if the payload was unchanged
+        """
+        compressed = gzip.compress(content, compresslevel=self.compresslevel, mtime=0)
+        entry = self._ensure_index().get(key)
+        if entry is not None:
+            offset, length = entry
+            if length == len(compressed):
+                view = self._view(offset + length)
+                if view[offset : offset + length] == compressed:
+                    return False
+        self._append(key, _FLAG_GZIP, compressed)
+        return True
+
+    def delete(self, key: int) -> bool:
+        """Mark a key as deleted.
+
+        Args:
+            key: Entry key (e.g., NHL game ID)
+
+        Returns:
+            True if the key was stored, False otherwise
+        """
+        if key not in self._ensure_index():
+            return False
+        self._append(key, _FLAG_DELETED, b"")
+        return True
+
+    def compact(self) -> None:
+        """Rewrite the archive keeping only the live entry for each key."""
+        entries = list(self.iter_entries())
+        self.close()
+
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp_path.unlink(missing_ok=True)
+        tmp = PackArchive(tmp_path, compresslevel=self.compresslevel)
+        for key, content in entries:
+            tmp.save(key, content)
+        tmp.close()
+        tmp_path.replace(self.path)
+
+    def close(self) -> None:
+        """Close the write handle and memory map; the index is rebuilt on use."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._index = None
+        self._indexed_size = 0
@@ -41,6 +41,9 @@ from nhl_api.viewer.routers import (
     reconciliation,
     validation,
 )
+from nhl_api.viewer.services.auto_validation_service import (
+    get_auto_validation_service,
+)
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
@@ -54,6 +57,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
 
     Handles:
     - Database connection pool initialization on startup
+    - Stopping auto-validation workers, which share the pool, on shutdown
     - Clean shutdown of database connections
 
     Args:
@@ -90,6 +94,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         # Shutdown
         logger.info("Shutting down NHL Data Viewer backend...")
         set_db_service(None)
+        await get_auto_validation_service().stop()
         await db.disconnect()
         logger.info("Database connection closed")
 
@@ -13,9 +13,13 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel
 
+from nhl_api.downloaders.base.rate_limiter import shared_rate_stats
 from nhl_api.services.db import DatabaseService
 from nhl_api.viewer.config import get_settings
 from nhl_api.viewer.dependencies import get_db
+from nhl_api.viewer.services.auto_validation_service import (
+    get_auto_validation_service,
+)
 
 # Type alias for dependency injection
 DbDep = Annotated[DatabaseService, Depends(get_db)]
@@ -40,6 +44,29 @@ class DatabaseStatus(BaseModel):
     error: str | None = None
 
 
+class DomainRateStatus(BaseModel):
+    """Adaptive rate limit state for one upstream host."""
+
+    domain: str
+    requests_per_second: float
+    latency_ms: float | None = None
+    requests: int
+    throttled: int
+
+
+class ValidationQueueStatus(BaseModel):
+    """Auto-validation worker pool state."""
+
+    workers: int
+    queue_depth: int
+    in_flight: int
+    completed: int
+    failed: int
+    coalesced: int
+    games_per_second: float
+    avg_latency_ms: float | None = None
+
+
 class HealthResponse(BaseModel):
     """Health check response model."""
 
@@ -141,3 +168,61 @@ async def readiness(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Database not available",
         ) from None
+
+
+@router.get(
+    "/health/rate-limits",
+    response_model=list[DomainRateStatus],
+    status_code=status.HTTP_200_OK,
+    summary="Upstream Rate Limits",
+    description="Current adaptive request rate and latency per upstream host",
+)
+async def rate_limits() -> list[DomainRateStatus]:
+    """Report the adaptive rate limiter state for each upstream host.
+
+    Returns:
+        One entry per domain seen by downloads in this process.
+    """
+    return [
+        DomainRateStatus(
+            domain=domain,
+            requests_per_second=round(stats.requests_per_second, 3),
+            latency_ms=(
+                round(stats.latency_ms, 2) if stats.latency_ms is not None else None
+            ),
+            requests=stats.requests,
+            throttled=stats.throttled,
+        )
+        for domain, stats in sorted(shared_rate_stats().items())
+    ]
+
+
+@router.get(
+    "/health/validation-queue",
+    response_model=ValidationQueueStatus,
+    status_code=status.HTTP_200_OK,
+    summary="Validation Queue",
+    description="Auto-validation queue depth, throughput and latency",
+)
+async def validation_queue() -> ValidationQueueStatus:
+    """Report the auto-validation worker pool state.
+
+    Returns:
+        Queue depth, games validated per second over the last minute and
+        average time from queueing to validation.
+    """
+    stats = get_auto_validation_service().get_stats()
+    return ValidationQueueStatus(
+        workers=stats.workers,
+        queue_depth=stats.queue_depth,
+        in_flight=stats.in_flight,
+        completed=stats.completed,
+        failed=stats.failed,
+        coalesced=stats.coalesced,
+        games_per_second=round(stats.games_per_second, 3),
+        avg_latency_ms=(
+            round(stats.avg_latency_seconds * 1000, 2)
+            if stats.avg_latency_seconds is not None
+            else None
+        ),
+    )
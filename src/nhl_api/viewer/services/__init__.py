@@ -6,12 +6,14 @@ from nhl_api.viewer.services.auto_validation_service import (
 )
 from nhl_api.viewer.services.download_service import DownloadService
 from nhl_api.viewer.services.reconciliation_service import ReconciliationService
+from nhl_api.viewer.services.schedule_cache import ScheduleCache
 from nhl_api.viewer.services.validation_service import ValidationService
 
 __all__ = [
     "AutoValidationService",
     "DownloadService",
     "ReconciliationService",
+    "ScheduleCache",
     "ValidationService",
     "get_auto_validation_service",
 ]
@@ -3,12 +3,21 @@
 This service monitors download completions and automatically triggers
 cross-source validation when all required data sources for a game are available.
 
+Queued games are validated by a pool of workers sharing one database pool.
+Each worker takes up to VALIDATION_BATCH_SIZE games off the queue and checks
+them with set-based queries; a game queued again before a worker picks it up
+is coalesced into the pending entry.
+
 Configuration:
     VALIDATION_AUTO_RUN: Enable/disable auto-validation (default: True)
-    VALIDATION_DELAY_SECONDS: Delay before running validation (default: 2)
+    VALIDATION_DELAY_SECONDS: Minimum age of a queued game before it is
+        validated, letting related downloads settle (default: 2)
+    VALIDATION_WORKERS: Number of concurrent validation workers (default: 4)
+    VALIDATION_BATCH_SIZE: Maximum games validated together (default: 25)
 
 Example usage:
     service = AutoValidationService.get_instance()
+    await service.start(db)  # Reuse the application's database pool
 
     # Queue validation for a game after downloads complete
     await service.queue_validation(db, game_id, season_id)
@@ -20,8 +29,11 @@ Example usage:
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
 import os
+import time
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
@@ -34,6 +46,14 @@ logger = logging.getLogger(__name__)
 # Configuration from environment
 VALIDATION_AUTO_RUN = os.getenv("VALIDATION_AUTO_RUN", "true").lower() == "true"
 VALIDATION_DELAY_SECONDS = float(os.getenv("VALIDATION_DELAY_SECONDS", "2"))
+VALIDATION_WORKERS = int(os.getenv("VALIDATION_WORKERS", "4"))
+VALIDATION_BATCH_SIZE = int(os.getenv("VALIDATION_BATCH_SIZE", "25"))
+
+# Attempts per game before a failing validation is dropped
+MAX_VALIDATION_ATTEMPTS = 3
+
+# Seconds of completions used for the throughput figure
+THROUGHPUT_WINDOW_SECONDS = 60.0
 
 # Required sources for JSON vs JSON validation
 REQUIRED_JSON_SOURCES = {"nhl_boxscore", "nhl_pbp", "shift_chart"}
@@ -64,6 +84,20 @@ class ValidationQueueItem:
     attempts: int = 0
 
 
+@dataclass(frozen=True)
+class ValidationQueueStats:
+    """Snapshot of the validation worker pool."""
+
+    workers: int
+    queue_depth: int
+    in_flight: int
+    completed: int
+    failed: int
+    coalesced: int
+    games_per_second: float
+    avg_latency_seconds: float | None
+
+
 @dataclass
 class AutoValidationService:
     """Service for auto-triggering validation after downloads.
@@ -71,20 +105,40 @@ class AutoValidationService:
     This is a singleton service that:
     - Monitors batch completions
     - Checks data completeness for games
-    - Queues and runs validation asynchronously
+    - Queues and runs validation asynchronously in a worker pool
     - Stores results in the database
 
     Attributes:
+        workers: Number of concurrent validation workers
+        batch_size: Maximum games validated together
         _queue: Async queue for pending validations
-        _worker_task: Background worker processing the queue
-        _running: Whether the worker is running
+        _pending: Queued items by game ID, used to coalesce duplicates
+        _worker_tasks: Background workers processing the queue
+        _running: Whether the workers are running
+        _db: Database service shared by all workers
     """
 
+    workers: int = VALIDATION_WORKERS
+    batch_size: int = VALIDATION_BATCH_SIZE
     _queue: asyncio.Queue[ValidationQueueItem] = field(
         default_factory=lambda: asyncio.Queue()
     )
-    _worker_task: asyncio.Task[None] | None = None
+    _pending: dict[int, ValidationQueueItem] = field(default_factory=dict)
+    _worker_tasks: list[asyncio.Task[None]] = field(default_factory=list)
     _running: bool = False
+    _db: DatabaseService | None = None
+    _owns_db: bool = False
+    _db_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    _rule_ids: dict[str, int] = field(default_factory=dict)
+
+    # Throughput and latency counters
+    _in_flight: int = 0
+    _completed: int = 0
+    _failed: int = 0
+    _coalesced: int = 0
+    _latency_total: float = 0.0
+    _recent_completions: deque[float] = field(default_factory=deque)
+
     _instance: AutoValidationService | None = None
 
     @classmethod
@@ -94,24 +148,42 @@ class AutoValidationService:
             cls._instance = cls()
         return cls._instance
 
-    async def start(self) -> None:
-        """Start the validation worker."""
+    async def start(self, db: DatabaseService | None = None) -> None:
+        """Start the validation workers.
+
+        Args:
+            db: Connected database service for the workers to share. If not
+                given, the workers open a single pool of their own when the
+                first game is validated.
+        """
+        if db is not None and self._db is None:
+            self._db = db
+
         if self._running:
             return
 
         self._running = True
-        self._worker_task = asyncio.create_task(self._worker_loop())
-        logger.info("Auto-validation service started")
+        self._worker_tasks = [
+            asyncio.create_task(self._worker_loop(worker_id))
+            for worker_id in range(max(1, self.workers))
+        ]
+        logger.info(
+            "Auto-validation service started with %d workers",
+            len(self._worker_tasks),
+        )
 
     async def stop(self) -> None:
-        """Stop the validation worker."""
+        """Stop the validation workers."""
         self._running = False
-        if self._worker_task:
-            self._worker_task.cancel()
-            try:
-                await self._worker_task
-            except asyncio.CancelledError:
-                pass
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+
+        if self._owns_db and self._db is not None:
+            await self._db.disconnect()
+            self._db = None
+            self._owns_db = False
         logger.info("Auto-validation service stopped")
 
     async def queue_validation(
@@ -123,6 +195,9 @@ class AutoValidationService:
     ) -> bool:
         """Queue a game for validation.
 
+        A game that is already waiting in the queue is not queued twice;
+        any new validator types are added to the waiting entry instead.
+
         Args:
             db: Database service
             game_id: Game ID to validate
@@ -144,17 +219,43 @@ class AutoValidationService:
         item = ValidationQueueItem(
             game_id=game_id,
             season_id=season_id,
-            validator_types=validator_types,
+            validator_types=list(validator_types),
         )
 
-        await self._queue.put(item)
-        logger.info(
-            "Queued validation for game %d (types: %s)",
-            game_id,
-            validator_types,
-        )
+        if self._enqueue(item):
+            logger.info(
+                "Queued validation for game %d (types: %s)",
+                game_id,
+                validator_types,
+            )
         return True
 
+    def get_stats(self) -> ValidationQueueStats:
+        """Get queue depth, throughput and latency of the worker pool.
+
+        Returns:
+            Current ValidationQueueStats
+        """
+        now = time.monotonic()
+        while (
+            self._recent_completions
+            and now - self._recent_completions[0] > THROUGHPUT_WINDOW_SECONDS
+        ):
+            self._recent_completions.popleft()
+
+        return ValidationQueueStats(
+            workers=len(self._worker_tasks),
+            queue_depth=self._queue.qsize(),
+            in_flight=self._in_flight,
+            completed=self._completed,
+            failed=self._failed,
+            coalesced=self._coalesced,
+            games_per_second=len(self._recent_completions) / THROUGHPUT_WINDOW_SECONDS,
+            avg_latency_seconds=(
+                self._latency_total / self._completed if self._completed else None
+            ),
+        )
+
     async def has_complete_json_data(self, db: DatabaseService, game_id: int) -> bool:
         """Check if a game has complete JSON data for validation.
 
@@ -240,54 +341,168 @@ class AutoValidationService:
         rows = await db.fetch(query, season_id, limit)
         return [row["game_id"] for row in rows]
 
-    async def _worker_loop(self) -> None:
-        """Background worker that processes the validation queue."""
-        # Import here to avoid circular imports
-        from nhl_api.services.db import DatabaseService
+    def _enqueue(self, item: ValidationQueueItem) -> bool:
+        """Put an item on the queue unless its game is already waiting.
+
+        Args:
+            item: Validation queue item
 
-        logger.info("Auto-validation worker started")
+        Returns:
+            True if queued, False if merged into the waiting entry
+        """
+        waiting = self._pending.get(item.game_id)
+        if waiting is not None:
+            for validator_type in item.validator_types:
+                if validator_type not in waiting.validator_types:
+                    waiting.validator_types.append(validator_type)
+            self._coalesced += 1
+            logger.debug("Coalesced validation for game %d", item.game_id)
+            return False
 
-        while self._running:
-            try:
-                # Wait for items with timeout to allow checking _running
-                try:
-                    item = await asyncio.wait_for(
-                        self._queue.get(),
-                        timeout=5.0,
-                    )
-                except TimeoutError:
-                    continue
+        self._pending[item.game_id] = item
+        self._queue.put_nowait(item)
+        return True
 
-                # Delay before running validation
-                if VALIDATION_DELAY_SECONDS > 0:
-                    await asyncio.sleep(VALIDATION_DELAY_SECONDS)
+    async def _get_db(self) -> DatabaseService:
+        """Get the database service shared by the workers.
 
-                # Run validation
-                try:
-                    async with DatabaseService() as db:
-                        await self._run_validation(db, item)
-                except Exception as e:
-                    logger.error(
-                        "Validation failed for game %d: %s",
-                        item.game_id,
-                        e,
-                        exc_info=True,
-                    )
-                    item.attempts += 1
-                    if item.attempts < 3:
-                        # Re-queue with backoff
-                        await asyncio.sleep(item.attempts * 5)
-                        await self._queue.put(item)
-                finally:
-                    self._queue.task_done()
+        Returns:
+            The service passed to start(), or one pool opened on first use
+        """
+        if self._db is None:
+            async with self._db_lock:
+                if self._db is None:
+                    # Import here to avoid circular imports
+                    from nhl_api.services.db import DatabaseService
+
+                    db = DatabaseService()
+                    await db.connect()
+                    self._db = db
+                    self._owns_db = True
+        return self._db
+
+    async def _worker_loop(self, worker_id: int = 0) -> None:
+        """Background worker that validates batches of queued games.
+
+        Args:
+            worker_id: Worker number, for logging
+        """
+        logger.info("Auto-validation worker %d started", worker_id)
 
+        while self._running:
+            try:
+                batch = await self._next_batch()
+                if batch:
+                    await self._process_batch(batch)
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error("Worker error: %s", e, exc_info=True)
                 await asyncio.sleep(1)
 
-        logger.info("Auto-validation worker stopped")
+        logger.info("Auto-validation worker %d stopped", worker_id)
+
+    async def _next_batch(self) -> list[ValidationQueueItem]:
+        """Take up to batch_size queued games once they are old enough.
+
+        Returns:
+            Items to validate (empty if the queue stayed empty)
+        """
+        # Wait for items with timeout to allow checking _running
+        try:
+            first = await asyncio.wait_for(self._queue.get(), timeout=5.0)
+        except TimeoutError:
+            return []
+
+        batch = [first]
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+
+        # Let downloads for the newest game settle; duplicates queued
+        # meanwhile are still coalesced into these items
+        if VALIDATION_DELAY_SECONDS > 0:
+            newest = max(item.queued_at for item in batch)
+            age = (datetime.now(UTC) - newest).total_seconds()
+            if age < VALIDATION_DELAY_SECONDS:
+                try:
+                    await asyncio.sleep(VALIDATION_DELAY_SECONDS - age)
+                except asyncio.CancelledError:
+                    # Hand the items back so a restarted worker validates them
+                    for item in batch:
+                        self._queue.put_nowait(item)
+                        self._queue.task_done()
+                    raise
+
+        for item in batch:
+            if self._pending.get(item.game_id) is item:
+                del self._pending[item.game_id]
+        return batch
+
+    async def _process_batch(self, batch: list[ValidationQueueItem]) -> None:
+        """Validate a batch, isolating failures to individual games.
+
+        Args:
+            batch: Items taken off the queue
+        """
+        self._in_flight += len(batch)
+        try:
+            try:
+                db = await self._get_db()
+                await self._run_batch(db, batch)
+                self._record_completed(batch)
+            except Exception as e:
+                if len(batch) == 1:
+                    self._handle_failure(batch[0], e)
+                    return
+                logger.warning(
+                    "Batch validation of %d games failed, retrying one by one: %s",
+                    len(batch),
+                    e,
+                )
+                for item in batch:
+                    try:
+                        await self._run_batch(await self._get_db(), [item])
+                        self._record_completed([item])
+                    except Exception as item_error:
+                        self._handle_failure(item, item_error)
+        finally:
+            self._in_flight -= len(batch)
+            for _ in batch:
+                self._queue.task_done()
+
+    def _handle_failure(self, item: ValidationQueueItem, error: Exception) -> None:
+        """Re-queue a failed game with backoff, or give up on it.
+
+        Args:
+            item: Item whose validation failed
+            error: The failure
+        """
+        logger.error(
+            "Validation failed for game %d: %s",
+            item.game_id,
+            error,
+            exc_info=True,
+        )
+        item.attempts += 1
+        if item.attempts < MAX_VALIDATION_ATTEMPTS:
+            # Re-queue with backoff without holding up this worker
+            asyncio.get_running_loop().call_later(
+                item.attempts * 5, self._enqueue, item
+            )
+        else:
+            self._failed += 1
+
+    def _record_completed(self, batch: list[ValidationQueueItem]) -> None:
+        """Update throughput and latency counters for validated games."""
+        now = datetime.now(UTC)
+        finished = time.monotonic()
+        for item in batch:
+            self._completed += 1
+            self._latency_total += (now - item.queued_at).total_seconds()
+            self._recent_completions.append(finished)
 
     async def _run_validation(
         self,
@@ -300,125 +515,179 @@ class AutoValidationService:
             db: Database service
             item: Validation queue item
         """
-        game_id = item.game_id
-        season_id = item.season_id
+        await self._run_batch(db, [item])
 
-        logger.info("Running validation for game %d", game_id)
+    async def _run_batch(
+        self,
+        db: DatabaseService,
+        items: list[ValidationQueueItem],
+    ) -> None:
+        """Run validation for several games with set-based queries.
 
-        # Create validation run record
-        run_id = await db.fetchval(
-            """
-            INSERT INTO validation_runs (season_id, status, metadata)
-            VALUES ($1, 'running', $2)
-            RETURNING run_id
-            """,
-            season_id,
-            {"game_id": game_id, "auto_triggered": True, "types": item.validator_types},
-        )
+        Each game still gets its own validation run record. Runs and their
+        results are written in one transaction, so a failed batch never
+        leaves half-recorded runs behind.
 
-        try:
-            total_passed = 0
-            total_failed = 0
-            total_warnings = 0
-            rules_checked = 0
+        Args:
+            db: Database service
+            items: Validation queue items, one per game
+        """
+        game_ids = [item.game_id for item in items]
+        logger.info("Running validation for %d games", len(game_ids))
 
-            for validator_type in item.validator_types:
+        started_at = datetime.now(UTC)
+        season_ids = [item.season_id for item in items]
+        metadata = [
+            json.dumps(
+                {
+                    "game_id": item.game_id,
+                    "auto_triggered": True,
+                    "types": item.validator_types,
+                }
+            )
+            for item in items
+        ]
+
+        try:
+            # Run each validator once for every game that asked for it
+            results: dict[int, list[dict[str, object]]] = {g: [] for g in game_ids}
+            validator_types = list(
+                dict.fromkeys(t for item in items for t in item.validator_types)
+            )
+            for validator_type in validator_types:
+                type_game_ids = [
+                    item.game_id
+                    for item in items
+                    if validator_type in item.validator_types
+                ]
                 if validator_type == "json_cross_source":
-                    results = await self._run_json_cross_source(db, game_id)
+                    by_game = await self._run_json_cross_source(db, type_game_ids)
                 elif validator_type == "json_vs_html":
-                    results = await self._run_json_vs_html(db, game_id)
+                    by_game = await self._run_json_vs_html(db, type_game_ids)
                 else:
                     logger.warning("Unknown validator type: %s", validator_type)
                     continue
-
-                if not results:
-                    continue
-
-                # Store results
-                for result in results:
-                    rules_checked += 1
-
-                    # Get rule_id for this check
+                for game_id, game_results in by_game.items():
+                    results[game_id].extend(game_results)
+
+            # Build result rows and per-game counts
+            rows: list[tuple[object, ...]] = []
+            counts: list[tuple[int, int, int, int]] = []
+            for item in items:
+                passed_count = failed_count = warning_count = 0
+                for result in results[item.game_id]:
                     rule_name = str(result.get("rule_name", "unknown"))
-                    rule_id = await self._get_or_create_rule(
-                        db, rule_name, "cross_file"
-                    )
+                    rule_id = await self._rule_id(db, rule_name, "cross_file")
 
                     passed = bool(result.get("passed", False))
                     severity = str(result.get("severity", "warning"))
 
                     if passed:
-                        total_passed += 1
+                        passed_count += 1
                     elif severity == "error":
-                        total_failed += 1
+                        failed_count += 1
                     else:
-                        total_warnings += 1
-
-                    # Insert result
-                    await db.execute(
+                        warning_count += 1
+
+                    details = result.get("details")
+                    rows.append(
+                        (
+                            rule_id,
+                            item.game_id,
+                            item.season_id,
+                            passed,
+                            severity,
+                            result.get("message"),
+                            json.dumps(details) if details is not None else None,
+                        )
+                    )
+                counts.append(
+                    (
+                        len(results[item.game_id]),
+                        passed_count,
+                        failed_count,
+                        warning_count,
+                    )
+                )
+
+            # Store completed runs and their results together
+            async with db.transaction() as conn:
+                run_rows = await conn.fetch(
+                    """
+                    INSERT INTO validation_runs
+                    (season_id, started_at, completed_at, status, rules_checked,
+                     total_passed, total_failed, total_warnings, metadata)
+                    SELECT season_id, $7::timestamptz, CURRENT_TIMESTAMP,
+                           'completed', rules_checked, total_passed, total_failed,
+                           total_warnings, metadata::jsonb
+                    FROM unnest(
+                        $1::int[], $2::int[], $3::int[], $4::int[], $5::int[],
+                        $6::text[]
+                    ) AS t(
+                        season_id, rules_checked, total_passed, total_failed,
+                        total_warnings, metadata
+                    )
+                    RETURNING run_id, (metadata->>'game_id')::bigint AS game_id
+                    """,
+                    season_ids,
+                    *(list(column) for column in zip(*counts, strict=True)),
+                    metadata,
+                    started_at,
+                )
+                run_ids = {row["game_id"]: row["run_id"] for row in run_rows}
+
+                if rows:
+                    columns = list(zip(*rows, strict=True))
+                    await conn.execute(
                         """
                         INSERT INTO validation_results
-                        (run_id, rule_id, game_id, season_id, passed, severity, message, details)
-                        VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+                        (run_id, rule_id, game_id, season_id, passed, severity,
+                         message, details)
+                        SELECT run_id, rule_id, game_id, season_id, passed,
+                               severity, message, details::jsonb
+                        FROM unnest(
+                            $1::int[], $2::int[], $3::bigint[], $4::int[],
+                            $5::bool[], $6::text[], $7::text[], $8::text[]
+                        ) AS r(
+                            run_id, rule_id, game_id, season_id,
+                            passed, severity, message, details
+                        )
                         """,
-                        run_id,
-                        rule_id,
-                        game_id,
-                        season_id,
-                        passed,
-                        severity,
-                        result.get("message"),
-                        result.get("details"),
+                        [run_ids[game_id] for game_id in columns[1]],
+                        *(list(column) for column in columns),
                     )
 
-            # Update run as completed
-            await db.execute(
-                """
-                UPDATE validation_runs
-                SET status = 'completed',
-                    completed_at = CURRENT_TIMESTAMP,
-                    rules_checked = $2,
-                    total_passed = $3,
-                    total_failed = $4,
-                    total_warnings = $5
-                WHERE run_id = $1
-                """,
-                run_id,
-                rules_checked,
-                total_passed,
-                total_failed,
-                total_warnings,
-            )
-
             logger.info(
-                "Validation complete for game %d: %d passed, %d failed, %d warnings",
-                game_id,
-                total_passed,
-                total_failed,
-                total_warnings,
+                "Validation complete for %d games: %d passed, %d failed, %d warnings",
+                len(items),
+                sum(c[1] for c in counts),
+                sum(c[2] for c in counts),
+                sum(c[3] for c in counts),
             )
 
         except Exception as e:
-            # Mark run as failed
+            # Record the runs as failed
             await db.execute(
                 """
-                UPDATE validation_runs
-                SET status = 'failed',
-                    completed_at = CURRENT_TIMESTAMP,
-                    metadata = metadata || $2
-                WHERE run_id = $1
+                INSERT INTO validation_runs
+                (season_id, started_at, completed_at, status, metadata)
+                SELECT season_id, $3::timestamptz, CURRENT_TIMESTAMP, 'failed',
+                       metadata::jsonb || $4::jsonb
+                FROM unnest($1::int[], $2::text[]) AS t(season_id, metadata)
                 """,
-                run_id,
-                {"error": str(e)},
+                season_ids,
+                metadata,
+                started_at,
+                json.dumps({"error": str(e)}),
             )
             raise
 
     async def _run_json_cross_source(
         self,
         db: DatabaseService,
-        game_id: int,
-    ) -> list[dict[str, object]]:
-        """Run JSON cross-source validation for a game.
+        game_ids: list[int],
+    ) -> dict[int, list[dict[str, object]]]:
+        """Run JSON cross-source validation for several games.
 
         Validates:
         - Goals: PBP vs Boxscore
@@ -428,50 +697,57 @@ class AutoValidationService:
 
         Args:
             db: Database service
-            game_id: Game ID to validate
+            game_ids: Game IDs to validate
 
         Returns:
-            List of validation result dictionaries
+            Validation result dictionaries by game ID
         """
-        results: list[dict[str, object]] = []
+        results: dict[int, list[dict[str, object]]] = {g: [] for g in game_ids}
 
         # Get boxscore goals from database
-        boxscore_row = await db.fetchrow(
+        boxscore_rows = await db.fetch(
             """
             SELECT
+                g.game_id,
                 SUM(CASE WHEN team_abbrev = home_team THEN goals ELSE 0 END) as home_goals,
                 SUM(CASE WHEN team_abbrev = away_team THEN goals ELSE 0 END) as away_goals
             FROM game_skater_stats gss
             JOIN games g ON gss.game_id = g.game_id
-            WHERE gss.game_id = $1
+            WHERE gss.game_id = ANY($1::bigint[])
             GROUP BY g.game_id
             """,
-            game_id,
+            game_ids,
         )
 
         # Get PBP goal events
-        pbp_goals = await db.fetchrow(
+        pbp_rows = await db.fetch(
             """
             SELECT
-                COUNT(CASE WHEN team_abbrev = (
-                    SELECT home_team FROM games WHERE game_id = $1
-                ) THEN 1 END) as home_goals,
-                COUNT(CASE WHEN team_abbrev = (
-                    SELECT away_team FROM games WHERE game_id = $1
-                ) THEN 1 END) as away_goals
-            FROM game_events
-            WHERE game_id = $1 AND event_type = 'GOAL'
+                g.game_id,
+                COUNT(CASE WHEN ge.team_abbrev = g.home_team THEN 1 END) as home_goals,
+                COUNT(CASE WHEN ge.team_abbrev = g.away_team THEN 1 END) as away_goals
+            FROM games g
+            LEFT JOIN game_events ge
+                ON ge.game_id = g.game_id AND ge.event_type = 'GOAL'
+            WHERE g.game_id = ANY($1::bigint[])
+            GROUP BY g.game_id
             """,
-            game_id,
+            game_ids,
         )
+        pbp_goals = {row["game_id"]: row for row in pbp_rows}
+
+        for boxscore_row in boxscore_rows:
+            game_id = boxscore_row["game_id"]
+            pbp_row = pbp_goals.get(game_id)
+            if pbp_row is None:
+                continue
 
-        if boxscore_row and pbp_goals:
             # Check home goals match
             box_home = boxscore_row["home_goals"] or 0
-            pbp_home = pbp_goals["home_goals"] or 0
+            pbp_home = pbp_row["home_goals"] or 0
             home_match = box_home == pbp_home
 
-            results.append(
+            results[game_id].append(
                 {
                     "rule_name": "goals_pbp_vs_boxscore_home",
                     "passed": home_match,
@@ -487,10 +763,10 @@ class AutoValidationService:
 
             # Check away goals match
             box_away = boxscore_row["away_goals"] or 0
-            pbp_away = pbp_goals["away_goals"] or 0
+            pbp_away = pbp_row["away_goals"] or 0
             away_match = box_away == pbp_away
 
-            results.append(
+            results[game_id].append(
                 {
                     "rule_name": "goals_pbp_vs_boxscore_away",
                     "passed": away_match,
@@ -504,23 +780,23 @@ class AutoValidationService:
                 }
             )
 
-        # Get shift TOI totals
-        shift_toi = await db.fetchrow(
+        # Get the highest shift TOI total per game
+        shift_rows = await db.fetch(
             """
-            SELECT
+            SELECT DISTINCT ON (game_id)
+                game_id,
                 player_id,
                 SUM(duration_seconds) as total_toi_seconds
             FROM game_shifts
-            WHERE game_id = $1
-            GROUP BY player_id
-            ORDER BY total_toi_seconds DESC
-            LIMIT 1
+            WHERE game_id = ANY($1::bigint[])
+            GROUP BY game_id, player_id
+            ORDER BY game_id, total_toi_seconds DESC
             """,
-            game_id,
+            game_ids,
         )
 
-        if shift_toi:
-            results.append(
+        for shift_toi in shift_rows:
+            results[shift_toi["game_id"]].append(
                 {
                     "rule_name": "shift_data_present",
                     "passed": True,
@@ -535,9 +811,9 @@ class AutoValidationService:
     async def _run_json_vs_html(
         self,
         db: DatabaseService,
-        game_id: int,
-    ) -> list[dict[str, object]]:
-        """Run JSON vs HTML cross-source validation for a game.
+        game_ids: list[int],
+    ) -> dict[int, list[dict[str, object]]]:
+        """Run JSON vs HTML cross-source validation for several games.
 
         Compares:
         - Goals: PBP/Boxscore JSON vs Game Summary HTML
@@ -545,108 +821,109 @@ class AutoValidationService:
 
         Args:
             db: Database service
-            game_id: Game ID to validate
+            game_ids: Game IDs to validate
 
         Returns:
-            List of validation result dictionaries
+            Validation result dictionaries by game ID
         """
-        results: list[dict[str, object]] = []
-
-        # Get season_id for this game
-        season_id = await db.fetchval(
-            "SELECT season_id FROM games WHERE game_id = $1",
-            game_id,
-        )
-
-        if not season_id:
-            return results
+        results: dict[int, list[dict[str, object]]] = {g: [] for g in game_ids}
 
-        # Get goals from PBP JSON
-        pbp_goals = await db.fetchrow(
+        # Get goals from PBP JSON for games with a known season
+        pbp_rows = await db.fetch(
             """
             SELECT
-                COUNT(CASE WHEN team_abbrev = g.home_team THEN 1 END) as home_goals,
-                COUNT(CASE WHEN team_abbrev = g.away_team THEN 1 END) as away_goals
-            FROM game_events ge
-            JOIN games g ON ge.game_id = g.game_id
-            WHERE ge.game_id = $1 AND ge.event_type = 'GOAL'
+                g.game_id,
+                COUNT(CASE WHEN ge.team_abbrev = g.home_team THEN 1 END) as home_goals,
+                COUNT(CASE WHEN ge.team_abbrev = g.away_team THEN 1 END) as away_goals
+            FROM games g
+            LEFT JOIN game_events ge
+                ON ge.game_id = g.game_id AND ge.event_type = 'GOAL'
+            WHERE g.game_id = ANY($1::bigint[]) AND g.season_id IS NOT NULL
+            GROUP BY g.game_id
             """,
-            game_id,
+            game_ids,
         )
+        pbp_goals = {row["game_id"]: row for row in pbp_rows}
 
         # Get goals from HTML Game Summary
-        html_gs = await db.fetchrow(
+        html_gs_rows = await db.fetch(
             """
-            SELECT home_goals, away_goals
-            FROM html_game_summary
-            WHERE game_id = $1 AND season_id = $2
+            SELECT h.game_id, h.home_goals, h.away_goals
+            FROM html_game_summary h
+            JOIN games g ON g.game_id = h.game_id AND g.season_id = h.season_id
+            WHERE h.game_id = ANY($1::bigint[])
             """,
-            game_id,
-            season_id,
+            game_ids,
         )
-
-        if pbp_goals and html_gs:
-            # Compare home goals: JSON vs HTML
-            json_home = pbp_goals["home_goals"] or 0
-            html_home = html_gs["home_goals"] or 0
-            home_match = json_home == html_home
-
-            results.append(
-                {
-                    "rule_name": "goals_json_vs_html_home",
-                    "passed": home_match,
-                    "severity": "error" if not home_match else "info",
-                    "message": f"Home goals: JSON={json_home}, HTML={html_home}",
-                    "details": {
-                        "json_value": json_home,
-                        "html_value": html_home,
-                        "team": "home",
-                    },
-                }
-            )
-
-            # Compare away goals: JSON vs HTML
-            json_away = pbp_goals["away_goals"] or 0
-            html_away = html_gs["away_goals"] or 0
-            away_match = json_away == html_away
-
-            results.append(
-                {
-                    "rule_name": "goals_json_vs_html_away",
-                    "passed": away_match,
-                    "severity": "error" if not away_match else "info",
-                    "message": f"Away goals: JSON={json_away}, HTML={html_away}",
-                    "details": {
-                        "json_value": json_away,
-                        "html_value": html_away,
-                        "team": "away",
-                    },
-                }
-            )
-        elif html_gs:
-            # HTML data available but no PBP data - log warning
-            results.append(
-                {
-                    "rule_name": "json_vs_html_data_presence",
-                    "passed": False,
-                    "severity": "warning",
-                    "message": "HTML Game Summary available but PBP events missing",
-                    "details": {"has_html": True, "has_json": False},
-                }
-            )
+        html_goals = {row["game_id"]: row for row in html_gs_rows}
+
+        for game_id in game_ids:
+            pbp_row = pbp_goals.get(game_id)
+            html_gs = html_goals.get(game_id)
+
+            if pbp_row and html_gs:
+                # Compare home goals: JSON vs HTML
+                json_home = pbp_row["home_goals"] or 0
+                html_home = html_gs["home_goals"] or 0
+                home_match = json_home == html_home
+
+                results[game_id].append(
+                    {
+                        "rule_name": "goals_json_vs_html_home",
+                        "passed": home_match,
+                        "severity": "error" if not home_match else "info",
+                        "message": f"Home goals: JSON={json_home}, HTML={html_home}",
+                        "details": {
+                            "json_value": json_home,
+                            "html_value": html_home,
+                            "team": "home",
+                        },
+                    }
+                )
+
+                # Compare away goals: JSON vs HTML
+                json_away = pbp_row["away_goals"] or 0
+                html_away = html_gs["away_goals"] or 0
+                away_match = json_away == html_away
+
+                results[game_id].append(
+                    {
+                        "rule_name": "goals_json_vs_html_away",
+                        "passed": away_match,
+                        "severity": "error" if not away_match else "info",
+                        "message": f"Away goals: JSON={json_away}, HTML={html_away}",
+                        "details": {
+                            "json_value": json_away,
+                            "html_value": html_away,
+                            "team": "away",
+                        },
+                    }
+                )
+            elif html_gs:
+                # HTML data available but no PBP data - log warning
+                results[game_id].append(
+                    {
+                        "rule_name": "json_vs_html_data_presence",
+                        "passed": False,
+                        "severity": "warning",
+                        "message": "HTML Game Summary available but PBP events missing",
+                        "details": {"has_html": True, "has_json": False},
+                    }
+                )
 
         # Check HTML data availability
-        html_es = await db.fetchval(
+        html_es_rows = await db.fetch(
             """
-            SELECT 1 FROM html_event_summary
-            WHERE game_id = $1 AND season_id = $2
+            SELECT DISTINCT h.game_id
+            FROM html_event_summary h
+            JOIN games g ON g.game_id = h.game_id AND g.season_id = h.season_id
+            WHERE h.game_id = ANY($1::bigint[])
             """,
-            game_id,
-            season_id,
+            game_ids,
         )
 
-        if html_es:
-            results.append(
+        for row in html_es_rows:
+            results[row["game_id"]].append(
                 {
                     "rule_name": "html_event_summary_present",
                     "passed": True,
@@ -658,6 +935,23 @@ class AutoValidationService:
 
         return results
 
+    async def _rule_id(self, db: DatabaseService, rule_name: str, category: str) -> int:
+        """Get a rule ID, caching it for later batches.
+
+        Args:
+            db: Database service
+            rule_name: Name of the rule
+            category: Rule category used if the rule has to be created
+
+        Returns:
+            rule_id
+        """
+        rule_id = self._rule_ids.get(rule_name)
+        if rule_id is None:
+            rule_id = await self._get_or_create_rule(db, rule_name, category)
+            self._rule_ids[rule_name] = rule_id
+        return rule_id
+
     async def _get_or_create_rule(
         self,
         db: DatabaseService,
@@ -674,20 +968,12 @@ class AutoValidationService:
         Returns:
             rule_id
         """
-        # Try to get existing rule
-        rule_id: int | None = await db.fetchval(
-            "SELECT rule_id FROM validation_rules WHERE name = $1",
-            rule_name,
-        )
-
-        if rule_id is not None:
-            return rule_id
-
-        # Create new rule
-        new_rule_id: int = await db.fetchval(
+        # Upsert so concurrent workers creating the same rule cannot race
+        rule_id: int = await db.fetchval(
             """
             INSERT INTO validation_rules (name, category, severity, description)
             VALUES ($1, $2, 'warning', $3)
+            ON CONFLICT (name) DO UPDATE SET name = EXCLUDED.name
             RETURNING rule_id
             """,
             rule_name,
@@ -695,7 +981,7 @@ class AutoValidationService:
             f"Auto-created rule: {rule_name}",
         )
 
-        return new_rule_id
+        return rule_id
 
 
 # Module-level function for easy access
@@ -9,13 +9,24 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from dataclasses import dataclass, field
 from datetime import UTC, date, datetime
+from types import TracebackType
 from typing import TYPE_CHECKING, Any
 
 from nhl_api.downloaders.base.base_downloader import DownloaderConfig
+from nhl_api.downloaders.base.rate_limiter import RateLimiter
+from nhl_api.viewer.services.schedule_cache import (
+    FULL_SCHEDULE_GAME_TYPE,
+    ScheduleCache,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from nhl_api.downloaders.sources.dailyfaceoff import TeamPageCache
+    from nhl_api.downloaders.sources.nhl_json.schedule import GameInfo
     from nhl_api.services.db import DatabaseService
 
 logger = logging.getLogger(__name__)
@@ -23,6 +34,22 @@ logger = logging.getLogger(__name__)
 # NHL JSON API base URL
 NHL_API_BASE_URL = "https://api-web.nhle.com/v1"
 
+# Concurrent requests for per-player and per-team roster fetches
+PLAYER_FETCH_CONCURRENCY = 8
+
+# Player sources whose downloads fan out over every rostered player
+PLAYER_SOURCES = ("nhl_player", "nhl_player_game_log")
+
+# Concurrent DailyFaceoff team page fetches (still bound by its rate limit)
+DAILYFACEOFF_TEAM_CONCURRENCY = 4
+
+# On-disk cache for QuantHockey pages; completed seasons are never refetched
+QUANTHOCKEY_CACHE_DIR = "data/cache/quanthockey"
+
+# Micro-batch bounds for persisting game-based downloads while they run
+PERSIST_BATCH_GAMES = 50
+PERSIST_BATCH_SECONDS = 30.0
+
 # Map source names to their source_id in the data_sources table
 # These IDs must match what's in the database (queried from data_sources table)
 SOURCE_NAME_TO_ID = {
@@ -85,6 +112,161 @@ class SyncTimestamp:
     last_batch_id: int | None
 
 
+class StreamingPersister:
+    """Persist download results in micro-batches while the download runs.
+
+    Results are buffered until ``max_items`` are waiting or ``max_seconds``
+    have passed since the last flush. Each full buffer is persisted by a
+    background task, together with the batch's success/failure counters,
+    while the next buffer fills. At most one write is in flight, so memory
+    stays bounded by two micro-batches regardless of season size, and a
+    crash loses only the batch being written and the one being filled.
+
+    Example:
+        async with StreamingPersister(db, batch_id, persist) as persister:
+            async for result in downloader.download_season(season_id):
+                if result.is_successful:
+                    await persister.add_success(result.data)
+                else:
+                    await persister.add_failure()
+    """
+
+    def __init__(
+        self,
+        db: DatabaseService,
+        batch_id: int,
+        persist: Callable[[list[Any]], Awaitable[int]],
+        *,
+        max_items: int = PERSIST_BATCH_GAMES,
+        max_seconds: float = PERSIST_BATCH_SECONDS,
+    ) -> None:
+        """Initialize the persister.
+
+        Args:
+            db: Database service for batch counter updates
+            batch_id: Import batch whose counters are updated
+            persist: Coroutine function writing one micro-batch of results
+            max_items: Results that trigger a flush
+            max_seconds: Seconds since the last flush that trigger a flush
+        """
+        self._db = db
+        self._batch_id = batch_id
+        self._persist = persist
+        self._max_items = max_items
+        self._max_seconds = max_seconds
+
+        self._buffer: list[Any] = []
+        self._failed = 0
+        self._last_flush = time.monotonic()
+        self._writer: asyncio.Task[None] | None = None
+
+        self.success_count = 0
+        self.persisted_count = 0
+
+    async def add_success(self, data: Any) -> None:
+        """Buffer a successful result, flushing if a threshold is reached."""
+        self._buffer.append(data)
+        self.success_count += 1
+        await self._maybe_flush()
+
+    async def add_failure(self) -> None:
+        """Count a failed result, flushing if a threshold is reached."""
+        self._failed += 1
+        await self._maybe_flush()
+
+    async def _maybe_flush(self) -> None:
+        """Flush when the buffer is full or the interval has passed."""
+        if (
+            len(self._buffer) >= self._max_items
+            or time.monotonic() - self._last_flush >= self._max_seconds
+        ):
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Hand the buffered results to a background write.
+
+        Waits for the previous write first, so its errors surface here.
+        """
+        await self._wait_for_writer()
+        self._last_flush = time.monotonic()
+        if not self._buffer and not self._failed:
+            return
+
+        results, failed = self._buffer, self._failed
+        self._buffer, self._failed = [], 0
+        self._writer = asyncio.create_task(self._write(results, failed))
+
+    async def _write(self, results: list[Any], failed: int) -> None:
+        """Persist one micro-batch and advance the batch counters."""
+        if results:
+            self.persisted_count += await self._persist(results)
+        await self._db.execute(
+            """
+            UPDATE import_batches
+            SET items_success = items_success + $1,
+                items_failed = items_failed + $2
+            WHERE batch_id = $3
+            """,
+            len(results),
+            failed,
+            self._batch_id,
+        )
+
+    async def _wait_for_writer(self) -> None:
+        """Wait for the in-flight write, if any."""
+        writer = self._writer
+        if writer is not None:
+            try:
+                await writer
+            finally:
+                # Keep an interrupted write so __aexit__ can stop it
+                if writer.done():
+                    self._writer = None
+
+    async def _cancel_writer(self) -> None:
+        """Cancel the in-flight write, if any, and wait for it to stop."""
+        writer, self._writer = self._writer, None
+        if writer is not None:
+            writer.cancel()
+            await asyncio.wait([writer])
+            if not writer.cancelled() and writer.exception() is not None:
+                logger.error(
+                    "Micro-batch write failed during shutdown",
+                    exc_info=writer.exception(),
+                )
+
+    async def close(self) -> None:
+        """Persist everything still buffered and wait for it."""
+        await self.flush()
+        await self._wait_for_writer()
+
+    async def __aenter__(self) -> StreamingPersister:
+        """Enter async context."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Flush on success; on error, only let the in-flight write finish.
+
+        On cancellation the in-flight write is cancelled instead, and it is
+        always awaited so no write outlives the context.
+        """
+        try:
+            if exc_type is None:
+                await self.close()
+            elif not issubclass(exc_type, asyncio.CancelledError):
+                try:
+                    await self._wait_for_writer()
+                except Exception:
+                    logger.exception("Micro-batch write failed during shutdown")
+        finally:
+            await self._cancel_writer()
+
+
 @dataclass
 class DownloadService:
     """Manages download tasks triggered from viewer.
@@ -95,6 +277,15 @@ class DownloadService:
 
     _active_downloads: dict[int, ActiveDownloadTask] = field(default_factory=dict)
 
+    # DailyFaceoff state shared across batches: lines, power play, penalty
+    # kill and injuries parse the same team page, and all requests share
+    # one per-domain rate limit
+    _dailyfaceoff_pages: TeamPageCache | None = None
+    _dailyfaceoff_limiter: RateLimiter | None = None
+
+    # Season schedules shared by every game-based download job
+    _schedule_cache: ScheduleCache | None = None
+
     # Singleton instance
     _instance: DownloadService | None = None
 
@@ -400,8 +591,24 @@ class DownloadService:
             ScheduleDownloader,
             StandingsDownloader,
         )
+        from nhl_api.downloaders.sources.nhl_json.schedule import (
+            DEFAULT_SCHEDULE_CONCURRENCY,
+        )
 
-        config = DownloaderConfig(base_url=NHL_API_BASE_URL)
+        config = DownloaderConfig(base_url=NHL_API_BASE_URL, adaptive_rate_limit=True)
+        if source_name in PLAYER_SOURCES:
+            config = DownloaderConfig(
+                base_url=NHL_API_BASE_URL,
+                max_concurrency=PLAYER_FETCH_CONCURRENCY,
+                completion_order=True,
+                adaptive_rate_limit=True,
+            )
+        elif source_name == "nhl_schedule":
+            config = DownloaderConfig(
+                base_url=NHL_API_BASE_URL,
+                max_concurrency=DEFAULT_SCHEDULE_CONCURRENCY,
+                adaptive_rate_limit=True,
+            )
 
         # Map source names to downloader classes
         downloader_map = {
@@ -462,6 +669,14 @@ class DownloadService:
 
         await self._complete_batch(db, batch_id, "completed")
 
+    async def _season_games(
+        self, db: DatabaseService, season_id: int
+    ) -> list[GameInfo]:
+        """Get a season's schedule from the shared schedule cache."""
+        if self._schedule_cache is None:
+            self._schedule_cache = ScheduleCache()
+        return await self._schedule_cache.get_season_games(db, season_id)
+
     async def _run_shift_chart_download(
         self,
         db: DatabaseService,
@@ -472,7 +687,6 @@ class DownloadService:
         force: bool,
     ) -> None:
         """Run a download for NHL Stats API shift charts."""
-        from nhl_api.downloaders.sources.nhl_json import ScheduleDownloader
         from nhl_api.downloaders.sources.nhl_stats import (
             ShiftChartsDownloader,
             ShiftChartsDownloaderConfig,
@@ -481,10 +695,7 @@ class DownloadService:
         active_download = self._active_downloads.get(batch_id)
 
         # First get completed game IDs from schedule
-        schedule_config = DownloaderConfig(base_url=NHL_API_BASE_URL)
-        schedule_dl = ScheduleDownloader(schedule_config)
-        async with schedule_dl:
-            all_games = await schedule_dl.get_season_schedule(season_id)
+        all_games = await self._season_games(db, season_id)
 
         # Filter by game types first, then by completed status
         type_filtered = [g for g in all_games if g.game_type in game_types]
@@ -567,7 +778,7 @@ class DownloadService:
 
         # Persist all collected shift charts
         if successful_results:
-            persisted = await shift_dl.persist(db, successful_results)
+            persisted = await shift_dl.persist_bulk(db, successful_results)
             logger.info(
                 "Persisted %d shifts for season %d",
                 persisted,
@@ -603,9 +814,18 @@ class DownloadService:
             PenaltyKillDownloader,
             PowerPlayDownloader,
             StartingGoaliesDownloader,
+            TeamPageCache,
         )
 
-        config = DailyFaceoffConfig()
+        config = DailyFaceoffConfig(
+            max_concurrency=DAILYFACEOFF_TEAM_CONCURRENCY, completion_order=True
+        )
+        if self._dailyfaceoff_pages is None:
+            self._dailyfaceoff_pages = TeamPageCache()
+        if self._dailyfaceoff_limiter is None:
+            self._dailyfaceoff_limiter = RateLimiter(
+                requests_per_second=config.requests_per_second, per_domain=True
+            )
         active_download = self._active_downloads.get(batch_id)
         snapshot_date = date.today()
 
@@ -628,7 +848,11 @@ class DownloadService:
             season_id,
         )
 
-        async with downloader_cls(config) as downloader:
+        async with downloader_cls(
+            config,
+            rate_limiter=self._dailyfaceoff_limiter,
+            page_cache=self._dailyfaceoff_pages,
+        ) as downloader:
             # Starting goalies is date-based, not team-based
             if source_name == "dailyfaceoff_starting_goalies":
                 await self._download_starting_goalies(
@@ -666,7 +890,7 @@ class DownloadService:
             QuantHockeyPlayerStatsDownloader,
         )
 
-        config = QuantHockeyConfig()
+        config = QuantHockeyConfig(cache_dir=QUANTHOCKEY_CACHE_DIR)
         active_download = self._active_downloads.get(batch_id)
         snapshot_date = date.today()
 
@@ -906,7 +1130,6 @@ class DownloadService:
             ShotSummaryDownloader,
             TimeOnIceDownloader,
         )
-        from nhl_api.downloaders.sources.nhl_json import ScheduleDownloader
 
         config = HTMLDownloaderConfig()
         active_download = self._active_downloads.get(batch_id)
@@ -939,10 +1162,7 @@ class DownloadService:
             toi_sides = ["home", "away"]
 
         # Get completed game IDs from schedule
-        schedule_config = DownloaderConfig(base_url=NHL_API_BASE_URL)
-        schedule_dl = ScheduleDownloader(schedule_config)
-        async with schedule_dl:
-            all_games = await schedule_dl.get_season_schedule(season_id)
+        all_games = await self._season_games(db, season_id)
 
         # Filter by game types and completed status
         type_filtered = [g for g in all_games if g.game_type in game_types]
@@ -1100,8 +1320,11 @@ class DownloadService:
         game_types: list[int],
         active_download: ActiveDownloadTask | None,
     ) -> None:
-        """Download schedule for a season, filtered by game types."""
-        # Fetch all games, then filter by game_types
+        """Download schedule for a season, reporting the requested game types.
+
+        The full schedule is stored regardless of ``game_types`` so the
+        schedule cache can trust the games table for every game type.
+        """
         all_games = await downloader.get_season_schedule(season_id)
         games = [g for g in all_games if g.game_type in game_types]
 
@@ -1121,8 +1344,20 @@ class DownloadService:
             batch_id,
         )
 
-        # Persist games to database
-        persisted = await downloader.persist(db, games)
+        # Persist every game type; only the requested ones count as items
+        await downloader.persist(db, all_games)
+        persisted = len(games)
+        if not downloader.missing_weeks:
+            await self._update_sync_timestamp(
+                db,
+                SOURCE_NAME_TO_ID["nhl_schedule"],
+                season_id,
+                FULL_SCHEDULE_GAME_TYPE,
+                len(all_games),
+                batch_id,
+            )
+        if self._schedule_cache is not None:
+            self._schedule_cache.invalidate(season_id)
 
         if active_download:
             active_download.items_completed = persisted
@@ -1134,7 +1369,10 @@ class DownloadService:
         )
 
         logger.info(
-            "Downloaded and persisted %d games for season %d", persisted, season_id
+            "Downloaded and persisted %d games for season %d (%d missing weeks)",
+            len(all_games),
+            season_id,
+            len(downloader.missing_weeks),
         )
 
     async def _download_game_based(
@@ -1152,16 +1390,12 @@ class DownloadService:
         Returns:
             Number of items successfully downloaded (for sync timestamp tracking)
         """
-        from nhl_api.downloaders.sources.nhl_json import ScheduleDownloader
 
         # Get source_id for sync timestamp lookup
         source_id = SOURCE_NAME_TO_ID.get(source_name)
 
         # First get game IDs from schedule
-        schedule_config = DownloaderConfig(base_url=NHL_API_BASE_URL)
-        schedule_dl = ScheduleDownloader(schedule_config)
-        async with schedule_dl:
-            all_games = await schedule_dl.get_season_schedule(season_id)
+        all_games = await self._season_games(db, season_id)
 
         # Filter by game types first, then by completed status
         type_filtered = [g for g in all_games if g.game_type in game_types]
@@ -1216,48 +1450,34 @@ class DownloadService:
             batch_id,
         )
 
-        # Collect results for persistence
-        successful_results: list[dict[str, Any]] = []
+        async def persist(results: list[Any]) -> int:
+            count: int = await downloader.persist_bulk(db, results)
+            return count
 
-        # Download each game
-        async for result in downloader.download_season(season_id):
-            if active_download and active_download.cancel_requested:
-                raise asyncio.CancelledError()
+        # Persist in micro-batches while the season downloads
+        async with StreamingPersister(db, batch_id, persist) as persister:
+            async for result in downloader.download_season(season_id):
+                if active_download and active_download.cancel_requested:
+                    raise asyncio.CancelledError()
 
-            if result.is_successful:
-                successful_results.append(result.data)
-                if active_download:
-                    active_download.items_completed += 1
-                await db.execute(
-                    "UPDATE import_batches SET items_success = items_success + 1 WHERE batch_id = $1",
-                    batch_id,
-                )
-            else:
-                if active_download:
-                    active_download.items_failed += 1
-                await db.execute(
-                    "UPDATE import_batches SET items_failed = items_failed + 1 WHERE batch_id = $1",
-                    batch_id,
-                )
+                if result.is_successful:
+                    if active_download:
+                        active_download.items_completed += 1
+                    await persister.add_success(result.data)
+                else:
+                    if active_download:
+                        active_download.items_failed += 1
+                    await persister.add_failure()
 
-        # Persist collected results
-        if successful_results:
-            if source_name == "nhl_boxscore":
-                await downloader.persist(db, successful_results)
-                logger.info(
-                    "Persisted %d boxscores for season %d",
-                    len(successful_results),
-                    season_id,
-                )
-            elif source_name == "nhl_pbp":
-                persisted = await downloader.persist(db, successful_results)
-                logger.info(
-                    "Persisted %d play-by-play events for season %d",
-                    persisted,
-                    season_id,
-                )
+        if persister.success_count:
+            logger.info(
+                "Persisted %d %s for season %d",
+                persister.persisted_count,
+                "boxscores" if source_name == "nhl_boxscore" else "play-by-play events",
+                season_id,
+            )
 
-        return len(successful_results)
+        return persister.success_count
 
     async def _download_rosters(
         self,
@@ -1358,6 +1578,39 @@ class DownloadService:
                 batch_id,
             )
 
+    async def _collect_season_player_ids(
+        self, season_id: int, rate_limiter: RateLimiter
+    ) -> set[int]:
+        """Collect IDs of every rostered player for a season.
+
+        Team rosters are fetched concurrently through the given rate
+        limiter, so discovery and the player fetches share one budget. A
+        team whose roster fails to download or parse is skipped.
+
+        Args:
+            season_id: Season ID (e.g., 20242025)
+            rate_limiter: Limiter of the player downloader the IDs are for
+
+        Returns:
+            Set of NHL player IDs
+        """
+        from nhl_api.downloaders.sources.nhl_json import (
+            RosterDownloader,
+            get_teams_for_season,
+        )
+
+        roster_config = DownloaderConfig(
+            base_url=NHL_API_BASE_URL, max_concurrency=PLAYER_FETCH_CONCURRENCY
+        )
+
+        # Use season-appropriate team list (handles ARI→UTA relocation)
+        teams = get_teams_for_season(season_id)
+        roster_dl = RosterDownloader(roster_config, rate_limiter=rate_limiter)
+        async with roster_dl:
+            rosters = await roster_dl.download_rosters_for_season(season_id, teams)
+
+        return {player.player_id for roster in rosters for player in roster.all_players}
+
     async def _download_player_landing(
         self,
         db: DatabaseService,
@@ -1367,29 +1620,10 @@ class DownloadService:
         active_download: ActiveDownloadTask | None,
     ) -> None:
         """Download player landing pages and persist to database."""
-        # Get player IDs from rosters
-        from nhl_api.downloaders.sources.nhl_json import (
-            RosterDownloader,
-            get_teams_for_season,
+        player_ids = await self._collect_season_player_ids(
+            season_id, downloader.rate_limiter
         )
 
-        roster_config = DownloaderConfig(base_url=NHL_API_BASE_URL)
-        player_ids: set[int] = set()
-
-        # Use season-appropriate team list (handles ARI→UTA relocation)
-        teams = get_teams_for_season(season_id)
-        roster_dl = RosterDownloader(roster_config)
-        async with roster_dl:
-            for team_abbrev in teams:
-                try:
-                    roster = await roster_dl.get_roster_for_season(
-                        team_abbrev, season_id
-                    )
-                    for player in roster.forwards + roster.defensemen + roster.goalies:
-                        player_ids.add(player.player_id)
-                except Exception as e:
-                    logger.warning("Failed to get roster for %s: %s", team_abbrev, e)
-
         downloader.set_player_ids(list(player_ids))
 
         if active_download:
@@ -1443,29 +1677,11 @@ class DownloadService:
         active_download: ActiveDownloadTask | None,
     ) -> None:
         """Download player game logs and persist to database."""
-        # Get player IDs from rosters
-        from nhl_api.downloaders.sources.nhl_json import (
-            RosterDownloader,
-            get_teams_for_season,
-        )
         from nhl_api.downloaders.sources.nhl_json.player_game_log import REGULAR_SEASON
 
-        roster_config = DownloaderConfig(base_url=NHL_API_BASE_URL)
-        player_ids: set[int] = set()
-
-        # Use season-appropriate team list (handles ARI→UTA relocation)
-        teams = get_teams_for_season(season_id)
-        roster_dl = RosterDownloader(roster_config)
-        async with roster_dl:
-            for team_abbrev in teams:
-                try:
-                    roster = await roster_dl.get_roster_for_season(
-                        team_abbrev, season_id
-                    )
-                    for player in roster.forwards + roster.defensemen + roster.goalies:
-                        player_ids.add(player.player_id)
-                except Exception as e:
-                    logger.warning("Failed to get roster for %s: %s", team_abbrev, e)
+        player_ids = await self._collect_season_player_ids(
+            season_id, downloader.rate_limiter
+        )
 
         # Set players for game log download (player_id, season_id, game_type)
         players_list = [(pid, season_id, REGULAR_SEASON) for pid in player_ids]
@@ -1611,7 +1827,7 @@ class DownloadService:
         )
 
         # Ensure worker is running
-        await auto_validation.start()
+        await auto_validation.start(db)
 
         # Determine validator types based on source
         # HTML sources (7, 8, 10, 13, 14, 15) trigger json_vs_html validation
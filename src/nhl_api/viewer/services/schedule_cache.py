@@ -0,0 +1,313 @@
+"""Process-wide season schedule cache for download jobs.
+
+Every game-based download job starts by discovering the season's game IDs.
+Walking the schedule API week by week costs ~40 requests per job, so this
+cache serves schedules from memory and from the ``games`` table instead:
+
+- Finished seasons are read from the ``games`` table once and kept forever.
+- Live seasons are reused for ``live_ttl`` seconds. After that only the
+  weeks from the earliest unfinished game onwards are fetched again, and
+  the refreshed games are upserted back into ``games``.
+
+The table is only trusted once it holds a full schedule: every game type,
+fetched without missing weeks. Each gap-free sync is recorded as a
+``source_sync_timestamps`` row for the schedule source with game type 0.
+Without that row the whole season is fetched; a finished season is served
+from the table only if the row was written after the season ended. A
+refresh that misses weeks leaves the row alone and is cached for
+``live_ttl`` only, so the missed weeks are fetched again.
+
+Example:
+    cache = ScheduleCache()
+    games = await cache.get_season_games(db, 20242025)
+    game_ids = [g.game_id for g in games if g.game_state in ("OFF", "FINAL")]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Any
+
+from nhl_api.downloaders.base.base_downloader import DownloaderConfig
+from nhl_api.downloaders.sources.nhl_json.schedule import (
+    DEFAULT_SCHEDULE_CONCURRENCY,
+    GAME_TYPE_MAP,
+    NHL_API_BASE_URL,
+    GameInfo,
+    ScheduleDownloader,
+    season_date_range,
+)
+
+if TYPE_CHECKING:
+    from nhl_api.services.db import DatabaseService
+
+logger = logging.getLogger(__name__)
+
+# How long a live season's schedule is reused before refreshing
+DEFAULT_LIVE_TTL = 900.0
+
+# Game states after which a game's schedule entry no longer changes
+FINAL_GAME_STATES = frozenset({"OFF", "FINAL"})
+
+# source_sync_timestamps key of a full (all game types) schedule sync
+SCHEDULE_SOURCE_ID = 1
+FULL_SCHEDULE_GAME_TYPE = 0
+
+_GAME_TYPE_CODES = {code: game_type for game_type, code in GAME_TYPE_MAP.items()}
+
+
+@dataclass
+class _CachedSeason:
+    """Cached schedule for one season."""
+
+    games: list[GameInfo]
+    fetched_at: float
+    complete: bool
+
+
+def is_season_finished(season_id: int, today: date | None = None) -> bool:
+    """Check if a season's schedule can no longer change.
+
+    Args:
+        season_id: Season ID (e.g., 20242025)
+        today: Date to check against (default: today)
+
+    Returns:
+        True once the season's last possible playoff date has passed
+    """
+    _, season_end = season_date_range(season_id)
+    return (today or date.today()) > season_end
+
+
+def _game_from_record(record: Any) -> GameInfo:
+    """Build a GameInfo from a ``games`` row joined with team abbreviations.
+
+    The table keeps the local game date and only the time of day in UTC, so
+    the UTC start cannot be rebuilt for games that start after midnight UTC;
+    ``start_time_utc`` is left unset rather than guessed.
+    """
+    return GameInfo(
+        game_id=record["game_id"],
+        season_id=record["season_id"],
+        game_type=_GAME_TYPE_CODES.get(record["game_type"], 2),
+        game_date=record["game_date"],
+        start_time_utc=None,
+        venue_name=None,
+        home_team_id=record["home_team_id"],
+        home_team_abbrev=record["home_abbrev"] or "",
+        home_score=record["home_score"],
+        away_team_id=record["away_team_id"],
+        away_team_abbrev=record["away_abbrev"] or "",
+        away_score=record["away_score"],
+        game_state=record["game_state"] or "FUT",
+        period=record["period"],
+        is_overtime=bool(record["is_overtime"]),
+        is_shootout=bool(record["is_shootout"]),
+    )
+
+
+class ScheduleCache:
+    """Season schedules shared by every download job in the process.
+
+    Concurrent requests for the same season wait for a single refresh.
+    """
+
+    def __init__(
+        self,
+        *,
+        live_ttl: float = DEFAULT_LIVE_TTL,
+        config: DownloaderConfig | None = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            live_ttl: Seconds a live season's schedule is reused
+            config: Schedule downloader configuration for refreshes
+        """
+        self.live_ttl = live_ttl
+        self._config = config or DownloaderConfig(
+            base_url=NHL_API_BASE_URL,
+            max_concurrency=DEFAULT_SCHEDULE_CONCURRENCY,
+            adaptive_rate_limit=True,
+        )
+        self._seasons: dict[int, _CachedSeason] = {}
+        self._locks: dict[int, asyncio.Lock] = {}
+
+    async def get_season_games(
+        self, db: DatabaseService, season_id: int
+    ) -> list[GameInfo]:
+        """Get every scheduled game of a season.
+
+        Args:
+            db: Database service backing the cache
+            season_id: Season ID (e.g., 20242025)
+
+        Returns:
+            Games sorted by date and game ID
+        """
+        cached = self._fresh(season_id)
+        if cached is not None:
+            return cached.games
+
+        lock = self._locks.setdefault(season_id, asyncio.Lock())
+        async with lock:
+            # Another job may have refreshed the season while we waited
+            cached = self._fresh(season_id)
+            if cached is None:
+                cached = await self._load(db, season_id)
+                self._seasons[season_id] = cached
+        return cached.games
+
+    def invalidate(self, season_id: int | None = None) -> None:
+        """Drop cached schedules so the next lookup refreshes them.
+
+        Args:
+            season_id: Season to drop, or None for all seasons
+        """
+        if season_id is None:
+            self._seasons.clear()
+        else:
+            self._seasons.pop(season_id, None)
+
+    def _fresh(self, season_id: int) -> _CachedSeason | None:
+        """Get a cached season if it can still be served as is."""
+        cached = self._seasons.get(season_id)
+        if cached is None:
+            return None
+        if cached.complete or time.monotonic() - cached.fetched_at < self.live_ttl:
+            return cached
+        return None
+
+    async def _load(self, db: DatabaseService, season_id: int) -> _CachedSeason:
+        """Load a season from the games table, fetching what may have changed."""
+        stored = await self._read_stored_games(db, season_id)
+        synced_at = await self._read_full_sync(db, season_id)
+        _, season_end = season_date_range(season_id)
+        finished = is_season_finished(season_id)
+
+        if stored and finished and synced_at and synced_at.date() > season_end:
+            logger.info(
+                "Schedule for finished season %d served from %d stored games",
+                season_id,
+                len(stored),
+            )
+            return _CachedSeason(stored, time.monotonic(), complete=True)
+
+        # Without a full sync the table may lack game types or whole weeks
+        since = self._refresh_start(stored) if synced_at else None
+        downloader = ScheduleDownloader(self._config)
+        async with downloader:
+            fetched = await downloader.get_season_schedule(season_id, since=since)
+            missing_weeks = list(downloader.missing_weeks)
+            games = {game.game_id: game for game in stored}
+            games.update((game.game_id, game) for game in fetched)
+            try:
+                await downloader.persist(db, fetched)
+                if not missing_weeks:
+                    await self._record_full_sync(db, season_id, len(games))
+            except Exception:
+                logger.warning(
+                    "Could not store refreshed schedule for season %d",
+                    season_id,
+                    exc_info=True,
+                )
+
+        if missing_weeks:
+            logger.warning(
+                "Schedule refresh for season %d missed %d weeks; retrying in %.0fs",
+                season_id,
+                len(missing_weeks),
+                self.live_ttl,
+            )
+
+        logger.info(
+            "Refreshed schedule for season %d: %d stored, %d fetched since %s",
+            season_id,
+            len(stored),
+            len(fetched),
+            since or "season start",
+        )
+        return _CachedSeason(
+            sorted(games.values(), key=lambda g: (g.game_date, g.game_id)),
+            time.monotonic(),
+            complete=finished and not missing_weeks,
+        )
+
+    @staticmethod
+    def _refresh_start(stored: list[GameInfo]) -> date | None:
+        """Pick the first date whose schedule may have changed.
+
+        Args:
+            stored: Games already in the games table
+
+        Returns:
+            Earliest unfinished game date, else the latest stored game date,
+            or None to fetch the whole season
+        """
+        if not stored:
+            return None
+        unfinished = [
+            g.game_date for g in stored if g.game_state not in FINAL_GAME_STATES
+        ]
+        if unfinished:
+            return min(unfinished)
+        return max(g.game_date for g in stored)
+
+    @staticmethod
+    async def _read_stored_games(db: DatabaseService, season_id: int) -> list[GameInfo]:
+        """Read a season's games from the games table."""
+        records = await db.fetch(
+            """
+            SELECT g.game_id, g.season_id, g.game_type, g.game_date,
+                   g.home_team_id, ht.abbreviation AS home_abbrev, g.home_score,
+                   g.away_team_id, at.abbreviation AS away_abbrev, g.away_score,
+                   g.period, g.game_state, g.is_overtime, g.is_shootout
+            FROM games g
+            LEFT JOIN teams ht ON ht.team_id = g.home_team_id
+            LEFT JOIN teams at ON at.team_id = g.away_team_id
+            WHERE g.season_id = $1
+            ORDER BY g.game_date, g.game_id
+            """,
+            season_id,
+        )
+        return [_game_from_record(record) for record in records]
+
+    @staticmethod
+    async def _read_full_sync(db: DatabaseService, season_id: int) -> datetime | None:
+        """Get when a season's full schedule was last stored without gaps."""
+        synced_at: datetime | None = await db.fetchval(
+            """
+            SELECT last_synced_at
+            FROM source_sync_timestamps
+            WHERE source_id = $1 AND season_id = $2 AND game_type = $3
+            """,
+            SCHEDULE_SOURCE_ID,
+            season_id,
+            FULL_SCHEDULE_GAME_TYPE,
+        )
+        return synced_at
+
+    @staticmethod
+    async def _record_full_sync(
+        db: DatabaseService, season_id: int, items_count: int
+    ) -> None:
+        """Record that a season's full schedule is stored without gaps."""
+        await db.execute(
+            """
+            INSERT INTO source_sync_timestamps
+                (source_id, season_id, game_type, last_synced_at, items_synced_count)
+            VALUES ($1, $2, $3, CURRENT_TIMESTAMP, $4)
+            ON CONFLICT (source_id, season_id, game_type) DO UPDATE SET
+                last_synced_at = CURRENT_TIMESTAMP,
+                items_synced_count = EXCLUDED.items_synced_count,
+                updated_at = CURRENT_TIMESTAMP
+            """,
+            SCHEDULE_SOURCE_ID,
+            season_id,
+            FULL_SCHEDULE_GAME_TYPE,
+            items_count,
+        )
@@ -4,6 +4,7 @@ This module provides reusable fixtures for testing the NHL API library.
 Fixtures are organized into categories:
 - Sample data fixtures (players, teams, games)
 - Mock API client fixtures
+- Mock database fixtures
 - Temporary storage fixtures
 - Async fixtures
 
@@ -17,7 +18,8 @@ Usage:
 from __future__ import annotations
 
 import json
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -388,6 +390,35 @@ def mock_async_api_client(
     return client
 
 
+# =============================================================================
+# Mock Database Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def mock_bulk_db() -> MagicMock:
+    """Create a mock DatabaseService whose transactions yield a mock connection.
+
+    The connection used inside ``db.transaction()`` is exposed as ``db.conn``
+    so tests can inspect COPY and merge calls made by bulk persist paths.
+
+    Usage:
+        async def test_example(mock_bulk_db):
+            await downloader.persist_bulk(mock_bulk_db, data)
+            mock_bulk_db.conn.copy_records_to_table.assert_awaited()
+    """
+    db = MagicMock()
+    db.conn = AsyncMock()
+    db.execute = AsyncMock()
+
+    @asynccontextmanager
+    async def transaction() -> AsyncIterator[AsyncMock]:
+        yield db.conn
+
+    db.transaction = transaction
+    return db
+
+
 # =============================================================================
 # Temporary Storage Fixtures
 # =============================================================================
@@ -415,23 +415,37 @@ class TestLineCombinationsIntegration:
             return_value=make_records(
                 [
                     {
-                        "sorted_players": [8477934, 8478402, 8478421],
-                        "season_id": 20242025,
+                        "player_ids": [8477934, 8478402, 8478421],
                         "situation_code": "5v5",
+                        "is_total": 0,
                         "toi_seconds": 5000,
                         "game_count": 30,
                     },
                     {
-                        "sorted_players": [8477934, 8478402, 8478421],
-                        "season_id": 20242025,
+                        "player_ids": [8477934, 8478402, 8478421],
                         "situation_code": "5v4",
+                        "is_total": 0,
                         "toi_seconds": 500,
                         "game_count": 25,
                     },
                     {
-                        "sorted_players": [8477846, 8477904, 8478042],
-                        "season_id": 20242025,
+                        "player_ids": [8477934, 8478402, 8478421],
+                        "situation_code": None,
+                        "is_total": 1,
+                        "toi_seconds": 5500,
+                        "game_count": 30,
+                    },
+                    {
+                        "player_ids": [8477846, 8477904, 8478042],
                         "situation_code": "5v5",
+                        "is_total": 0,
+                        "toi_seconds": 3000,
+                        "game_count": 20,
+                    },
+                    {
+                        "player_ids": [8477846, 8477904, 8478042],
+                        "situation_code": None,
+                        "is_total": 1,
                         "toi_seconds": 3000,
                         "game_count": 20,
                     },
@@ -69,25 +69,30 @@ class TestMatchupServiceQueries:
         """Should return teammate matchups."""
         db = AsyncMock()
 
-        # The service makes multiple queries - teammate and opponent queries
-        # We need to return appropriate data for each
+        # One player_pair_toi query per matchup type: teammates, then opponents
         call_count = [0]
 
         async def mock_fetch(*args, **kwargs):
             call_count[0] += 1
-            # First two calls are teammate queries (home and away)
-            if call_count[0] <= 2:
+            if call_count[0] == 1:
                 return make_records(
                     [
                         {
-                            "teammate_id": 8477934,
+                            "other_player_id": 8477934,
                             "situation_code": "5v5",
+                            "is_total": 0,
+                            "toi_seconds": 800,
+                            "game_count": 10,
+                        },
+                        {
+                            "other_player_id": 8477934,
+                            "situation_code": None,
+                            "is_total": 1,
                             "toi_seconds": 800,
                             "game_count": 10,
                         },
                     ]
                 )
-            # Next two are opponent queries
             return []
 
         db.fetch = mock_fetch
@@ -102,6 +107,10 @@ class TestMatchupServiceQueries:
 
         assert result.player_id == 8478402
         assert result.total_games == 10
+        assert len(result.teammates) == 1
+        assert result.teammates[0].player1_id == 8477934
+        assert result.teammates[0].toi_seconds == 800
+        assert result.teammates[0].situation_breakdown == {"5v5": 800}
 
     @pytest.mark.asyncio
     async def test_get_player_matchups_opponents(self, sample_game_info: dict) -> None:
@@ -112,17 +121,25 @@ class TestMatchupServiceQueries:
 
         async def mock_fetch(*args, **kwargs):
             call_count[0] += 1
-            # First two calls are teammate queries
-            if call_count[0] <= 2:
+            # First call is the teammate query
+            if call_count[0] == 1:
                 return []
-            # Next two are opponent queries
+            # Second is the opponent query
             return make_records(
                 [
                     {
-                        "opponent_id": 8477846,
+                        "other_player_id": 8477846,
                         "situation_code": "5v5",
+                        "is_total": 0,
                         "toi_seconds": 500,
-                        "game_count": 5,
+                        "game_count": 1,
+                    },
+                    {
+                        "other_player_id": 8477846,
+                        "situation_code": None,
+                        "is_total": 1,
+                        "toi_seconds": 500,
+                        "game_count": 1,
                     },
                 ]
             )
@@ -138,6 +155,7 @@ class TestMatchupServiceQueries:
         )
 
         assert result.player_id == 8478402
+        assert [m.player1_id for m in result.opponents] == [8477846]
 
 
 class TestMatchupServiceGameSummary:
@@ -235,19 +253,27 @@ class TestMatchupServiceAggregation:
 
         async def mock_fetch(*args, **kwargs):
             call_count[0] += 1
-            # Calls 1-2: opponent queries (home + away)
-            if call_count[0] <= 2:
+            # Call 1: opponent query
+            if call_count[0] == 1:
                 return make_records(
                     [
                         {
-                            "opponent_id": 8477846,
+                            "other_player_id": 8477846,
                             "situation_code": "5v5",
+                            "is_total": 0,
+                            "toi_seconds": 800,
+                            "game_count": 5,
+                        },
+                        {
+                            "other_player_id": 8477846,
+                            "situation_code": None,
+                            "is_total": 1,
                             "toi_seconds": 800,
                             "game_count": 5,
                         },
                     ]
                 )
-            # Calls 3-4: teammate queries (home + away)
+            # Call 2: teammate query
             return []
 
         db.fetch = mock_fetch
@@ -261,7 +287,10 @@ class TestMatchupServiceAggregation:
 
         assert isinstance(aggregations, list)
         # Should have opponent aggregations from our mock data
-        assert len(aggregations) >= 0
+        assert len(aggregations) == 1
+        assert aggregations[0].total_toi == 800
+        assert aggregations[0].game_count == 5
+        assert aggregations[0].by_situation == {"5v5": 800}
 
 
 class TestMatchupQueryFilters:
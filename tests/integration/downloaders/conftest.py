@@ -29,12 +29,13 @@ HTML_FIXTURES_PATH = Path(__file__).parent.parent.parent / "fixtures" / "html"
 
 
 @pytest.fixture
-def html_downloader_config() -> HTMLDownloaderConfig:
+def html_downloader_config(tmp_path: Path) -> HTMLDownloaderConfig:
     """Fast configuration for integration tests."""
     return HTMLDownloaderConfig(
         requests_per_second=100.0,  # Fast for testing with mocks
         max_retries=2,
         http_timeout=10.0,
+        storage_dir=str(tmp_path / "html"),  # Keep reports out of data/html
     )
 
 
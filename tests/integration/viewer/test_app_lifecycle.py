@@ -102,6 +102,44 @@ class TestAppLifecycle:
             connection_module.DatabaseService = original_db_service_conn  # type: ignore[misc]
             db_module.DatabaseService = original_db_service_pkg  # type: ignore[misc]
 
+    async def test_shutdown_stops_auto_validation_before_disconnect(self) -> None:
+        """Test that validation workers stop before the shared pool closes."""
+        from unittest.mock import MagicMock, patch
+
+        from asgi_lifespan import LifespanManager
+
+        _clear_module_cache()
+        if "nhl_api.viewer.main" in sys.modules:
+            del sys.modules["nhl_api.viewer.main"]
+        import nhl_api.viewer.main as main_module
+
+        events: list[str] = []
+
+        class OrderedMockDatabaseService(MockDatabaseService):
+            def __init__(self, **kwargs: object) -> None:
+                super().__init__()
+
+            async def disconnect(self) -> None:
+                events.append("disconnect")
+                await super().disconnect()
+
+        async def stop() -> None:
+            events.append("stop")
+
+        service = MagicMock()
+        service.stop = stop
+
+        with (
+            patch.object(main_module, "DatabaseService", OrderedMockDatabaseService),
+            patch.object(
+                main_module, "get_auto_validation_service", return_value=service
+            ),
+        ):
+            async with LifespanManager(main_module.create_app()):
+                pass
+
+        assert events == ["stop", "disconnect"]
+
 
 class TestHealthEndpointsIntegration:
     """Integration tests for health endpoints with lifespan."""
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -14,6 +15,7 @@ from nhl_api.downloaders.sources.dailyfaceoff.base_dailyfaceoff_downloader impor
     DEFAULT_DAILYFACEOFF_RATE_LIMIT,
     BaseDailyFaceoffDownloader,
     DailyFaceoffConfig,
+    TeamPageCache,
 )
 from nhl_api.downloaders.sources.dailyfaceoff.team_mapping import TEAM_SLUGS
 
@@ -29,7 +31,7 @@ class ConcreteDownloader(BaseDailyFaceoffDownloader):
     def page_path(self) -> str:
         return "test-page"
 
-    async def _parse_page(self, soup: BeautifulSoup, team_id: int) -> dict[str, Any]:
+    def _parse_page_sync(self, soup: BeautifulSoup, team_id: int) -> dict[str, Any]:
         return {"parsed": True, "team_id": team_id}
 
 
@@ -291,3 +293,85 @@ class TestDownloadAllTeams:
         assert len(results) == 2
         assert results[0].status == DownloadStatus.COMPLETED
         assert results[1].status == DownloadStatus.FAILED
+
+    @pytest.mark.asyncio
+    async def test_download_all_teams_concurrent(self) -> None:
+        """Teams are fetched concurrently up to max_concurrency."""
+        config = DailyFaceoffConfig(max_concurrency=3)
+        team_ids = [10, 6, 1, 2, 3, 4]
+        downloader = ConcreteDownloader(config, team_ids=team_ids)
+
+        in_flight = 0
+        peak = 0
+
+        async def fake_get(path: str) -> MagicMock:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            response = MagicMock()
+            response.is_success = True
+            response.content = b"<!DOCTYPE html><html><body>Test</body></html>"
+            return response
+
+        with patch.object(downloader, "_get", side_effect=fake_get):
+            async with downloader:
+                results = [r async for r in downloader.download_all_teams()]
+
+        assert peak == 3
+        assert [r.data["team_id"] for r in results] == team_ids
+
+
+class OtherPageDownloader(ConcreteDownloader):
+    """Second data type parsed from the same page."""
+
+    @property
+    def data_type(self) -> str:
+        return "other_data"
+
+
+class TestTeamPageCache:
+    """Tests for sharing team pages between downloaders."""
+
+    @pytest.mark.asyncio
+    async def test_downloaders_share_one_fetch(self) -> None:
+        """Concurrent downloaders of one page issue a single request."""
+        pages = TeamPageCache()
+        first = ConcreteDownloader(DailyFaceoffConfig(), page_cache=pages)
+        second = OtherPageDownloader(DailyFaceoffConfig(), page_cache=pages)
+
+        response = MagicMock()
+        response.is_success = True
+        response.content = b"<!DOCTYPE html><html><body>Test</body></html>"
+
+        async def slow_get(path: str) -> MagicMock:
+            await asyncio.sleep(0.01)
+            return response
+
+        first_get = AsyncMock(side_effect=slow_get)
+        second_get = AsyncMock(side_effect=slow_get)
+        with (
+            patch.object(first, "_get", first_get),
+            patch.object(second, "_get", second_get),
+        ):
+            a, b = await asyncio.gather(
+                first.download_team(10), second.download_team(10)
+            )
+
+        assert first_get.await_count + second_get.await_count == 1
+        assert a.source == "dailyfaceoff_test_data"
+        assert b.source == "dailyfaceoff_other_data"
+        assert a.raw_content == b.raw_content == response.content
+
+    @pytest.mark.asyncio
+    async def test_failures_and_expired_pages_are_refetched(self) -> None:
+        """Failed fetches are not cached, and entries expire after the TTL."""
+        pages = TeamPageCache(ttl=0.0)
+        fetch = AsyncMock(side_effect=[DownloadError("boom"), b"one", b"two"])
+
+        with pytest.raises(DownloadError):
+            await pages.get("url", fetch)
+        assert await pages.get("url", fetch) == b"one"
+        await asyncio.sleep(0.001)
+        assert await pages.get("url", fetch) == b"two"
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+from datetime import date
+from pathlib import Path
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -13,10 +16,16 @@ from nhl_api.downloaders.sources.external.quanthockey.player_stats import (
     QUANTHOCKEY_RATE_LIMIT,
     QuantHockeyConfig,
     QuantHockeyPlayerStatsDownloader,
+    is_completed_season_page,
 )
 from nhl_api.models.quanthockey import (
     QuantHockeySeasonData,
 )
+from nhl_api.utils.http_client import (
+    ContentType,
+    HTTPResponse,
+    clear_shared_response_caches,
+)
 
 # =============================================================================
 # Test Fixtures
@@ -528,6 +537,41 @@ class TestDownloadSeason:
         # Should have made at most 2 requests (may stop earlier if no next page)
         assert mock_get.call_count <= 2
 
+    @pytest.mark.asyncio
+    async def test_download_player_stats_fetches_linked_pages_concurrently(
+        self, downloader: QuantHockeyPlayerStatsDownloader, sample_html_page: str
+    ) -> None:
+        """Pages linked from page 1 are fetched together, in page order."""
+        in_flight = 0
+        peak = 0
+        requested: list[str] = []
+
+        async def fake_get(url: str, **kwargs: Any) -> MagicMock:
+            nonlocal in_flight, peak
+            requested.append(url)
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Later pages finish first to check ordering
+            await asyncio.sleep(0.03 if "page=2" in url else 0.01)
+            in_flight -= 1
+
+            page = int(url.rsplit("page=", 1)[1]) if "page=" in url else 1
+            html = sample_html_page.replace("Connor McDavid", f"Player {page}")
+            response = MagicMock()
+            response.text = MagicMock(return_value=html)
+            response.content = html.encode()
+            response.is_success = True
+            response.status = 200
+            return response
+
+        with patch.object(downloader, "_get_with_headers", side_effect=fake_get):
+            async with downloader:
+                players = await downloader.download_player_stats(20242025)
+
+        assert len(requested) == 3
+        assert peak == 2
+        assert [p.name for p in players] == ["Player 1", "Player 2", "Player 3"]
+
 
 # =============================================================================
 # Download Season Data Tests
@@ -603,6 +647,64 @@ class TestParseResponse:
 # =============================================================================
 
 
+class TestCompletedSeasonPolicy:
+    """Tests for caching completed season pages."""
+
+    def _response(self, url: str) -> HTTPResponse:
+        return HTTPResponse(status=200, headers={}, content=b"", url=url)
+
+    def test_past_season_is_immutable(self) -> None:
+        """Pages for finished seasons never need revalidation."""
+        url = "https://www.quanthockey.com/nhl/seasons/2019-20-nhl-players-stats.html?page=3"
+        assert is_completed_season_page(self._response(url))
+        assert QuantHockeyPlayerStatsDownloader.cache_policy.is_immutable is not None
+
+    def test_future_season_and_other_pages_are_not(self) -> None:
+        """Seasons in progress and non-season pages are revalidated."""
+        next_year = date.today().year + 1
+        url = (
+            "https://www.quanthockey.com/nhl/seasons/"
+            f"{next_year}-{str(next_year + 1)[2:]}-nhl-players-stats.html"
+        )
+        assert not is_completed_season_page(self._response(url))
+        assert not is_completed_season_page(
+            self._response("https://www.quanthockey.com/nhl/records/x.html")
+        )
+
+    @pytest.mark.asyncio
+    async def test_cached_completed_page_skips_rate_limiter(
+        self, tmp_path: Path
+    ) -> None:
+        """Completed-season pages served from the cache wait for no token."""
+        url = "https://www.quanthockey.com/nhl/seasons/2019-20-nhl-players-stats.html"
+        page = HTTPResponse(
+            status=200,
+            headers={"Content-Type": "text/html"},
+            content=b"<html>stats</html>",
+            url=url,
+            content_type=ContentType.HTML,
+        )
+        limiter = MagicMock()
+        limiter.wait = AsyncMock(return_value=0.0)
+        clear_shared_response_caches()
+        try:
+            downloader = QuantHockeyPlayerStatsDownloader(
+                QuantHockeyConfig(cache_dir=str(tmp_path)), rate_limiter=limiter
+            )
+            async with downloader:
+                assert downloader._http_client is not None
+                request = AsyncMock(return_value=page)
+                with patch.object(downloader._http_client, "_request", request):
+                    await downloader._get_with_headers(url)
+                    cached = await downloader._get_with_headers(url)
+        finally:
+            clear_shared_response_caches()
+
+        assert cached.content == page.content
+        assert request.await_count == 1
+        assert limiter.wait.await_count == 1
+
+
 class TestConstants:
     """Tests for module constants."""
 
@@ -13,6 +13,7 @@ Tests cover:
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -427,7 +428,6 @@ class TestFetchResource:
 
         assert result.raw_content is not None
         assert result.raw_content == mock_response.content
-        assert downloader.last_raw_content == mock_response.content
 
     async def test_fetch_resource_with_context(
         self,
@@ -614,27 +614,39 @@ class TestURLBuilding:
 class TestUtilities:
     """Tests for utility methods."""
 
-    def test_last_raw_content_initially_none(
-        self, downloader: ConcreteExternalDownloader
-    ) -> None:
-        """Test last_raw_content is None initially."""
-        assert downloader.last_raw_content is None
-
     @pytest.mark.asyncio
-    async def test_last_raw_content_after_fetch(
+    async def test_concurrent_fetches_keep_own_raw_content(
         self,
         downloader: ConcreteExternalDownloader,
         mock_http_client: MagicMock,
-        mock_response: MagicMock,
     ) -> None:
-        """Test last_raw_content is set after fetch."""
-        mock_http_client.get = AsyncMock(return_value=mock_response)
+        """Test raw content travels with each result, not the downloader."""
+
+        def make_response(content: bytes) -> MagicMock:
+            response = MagicMock(spec=HTTPResponse)
+            response.is_success = True
+            response.is_rate_limited = False
+            response.is_server_error = False
+            response.status = 200
+            response.content = content
+            response.retry_after = None
+            return response
+
+        async def get(url: str, **kwargs: Any) -> MagicMock:
+            await asyncio.sleep(0.01 if url.endswith("/a") else 0)
+            return make_response(f"<html>{url[-1]}</html>".encode())
+
+        mock_http_client.get = get
 
         with patch.object(downloader, "_http_client", mock_http_client):
             with patch.object(downloader._rate_limiter, "wait", AsyncMock()):
-                await downloader.fetch_resource("/test")
+                first, second = await asyncio.gather(
+                    downloader.fetch_resource("/a"),
+                    downloader.fetch_resource("/b"),
+                )
 
-        assert downloader.last_raw_content == mock_response.content
+        assert first.raw_content == b"<html>a</html>"
+        assert second.raw_content == b"<html>b</html>"
 
 
 # =============================================================================
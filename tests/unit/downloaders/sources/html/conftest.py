@@ -0,0 +1,15 @@
+"""Shared fixtures for HTML downloader unit tests."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def html_storage_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Persist downloaded reports under tmp_path instead of ./data/html."""
+    storage_dir = tmp_path / "html"
+    monkeypatch.setattr("nhl_api.utils.html_storage.DEFAULT_HTML_DIR", storage_dir)
+    return storage_dir
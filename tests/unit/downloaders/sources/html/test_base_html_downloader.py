@@ -12,6 +12,7 @@ Tests cover:
 
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -24,6 +25,7 @@ from nhl_api.downloaders.sources.html.base_html_downloader import (
     HTML_DOWNLOADER_CONFIG,
     BaseHTMLDownloader,
     HTMLDownloaderConfig,
+    _parse_in_worker,
 )
 
 # =============================================================================
@@ -38,7 +40,7 @@ class ConcreteHTMLDownloader(BaseHTMLDownloader):
     def report_type(self) -> str:
         return "GS"
 
-    async def _parse_report(self, soup: BeautifulSoup, game_id: int) -> dict[str, Any]:
+    def _parse_report_sync(self, soup: BeautifulSoup, game_id: int) -> dict[str, Any]:
         """Simple parser for testing."""
         title = soup.find("title")
         return {
@@ -396,6 +398,127 @@ class TestTableExtraction:
         assert downloader._get_cell_text(first_row, 99, "default") == "default"
 
 
+# =============================================================================
+# Parse Executor Tests
+# =============================================================================
+
+
+class TestParseExecutor:
+    """Tests for parsing reports off the event loop."""
+
+    def test_default_parses_inline(self, downloader: ConcreteHTMLDownloader) -> None:
+        """Test that parsing is inline unless configured."""
+        assert downloader._get_parse_pool() is None
+
+    def test_invalid_parse_executor(self) -> None:
+        """Test that unknown executor kinds are rejected."""
+        with pytest.raises(ValueError, match="parse_executor"):
+            ConcreteHTMLDownloader(HTMLDownloaderConfig(parse_executor="gpu"))
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("mode", ["thread", "process"])
+    async def test_pool_matches_inline(self, mode: str, sample_html: bytes) -> None:
+        """Test that worker parsing returns the same data as inline parsing."""
+        inline = ConcreteHTMLDownloader(HTMLDownloaderConfig(persist_html=False))
+        pooled = ConcreteHTMLDownloader(
+            HTMLDownloaderConfig(persist_html=False, parse_executor=mode)
+        )
+
+        async with pooled:
+            result = await pooled._parse_content_async(sample_html, 2024020500)
+            assert pooled._parse_pool is not None
+        expected = await inline._parse_content_async(sample_html, 2024020500)
+
+        assert result == expected
+        assert pooled._parse_pool is None
+
+    def test_worker_reuses_parser(self, sample_html: bytes) -> None:
+        """Test that a worker builds one parser per class and arguments."""
+        config = HTMLDownloaderConfig(persist_html=False)
+        with (
+            patch.dict(
+                "nhl_api.downloaders.sources.html.base_html_downloader._WORKER_PARSERS",
+                clear=True,
+            ),
+            patch.object(
+                ConcreteHTMLDownloader,
+                "__init__",
+                autospec=True,
+                side_effect=ConcreteHTMLDownloader.__init__,
+            ) as init,
+        ):
+            first = _parse_in_worker(
+                ConcreteHTMLDownloader, config, {}, sample_html, 2024020500
+            )
+            second = _parse_in_worker(
+                ConcreteHTMLDownloader, config, {}, sample_html, 2024020501
+            )
+
+        assert init.call_count == 1
+        assert first["game_id"] == 2024020500
+        assert second["game_id"] == 2024020501
+
+    @pytest.mark.asyncio
+    async def test_timings_recorded(self, sample_html: bytes) -> None:
+        """Test that network and parse time are tracked separately."""
+        downloader = ConcreteHTMLDownloader(
+            HTMLDownloaderConfig(persist_html=False, parse_executor="thread")
+        )
+        mock_response = MagicMock()
+        mock_response.is_success = True
+        mock_response.content = sample_html
+
+        with patch.object(
+            downloader, "_get", new_callable=AsyncMock, return_value=mock_response
+        ):
+            async with downloader:
+                result = await downloader.download_game(2024020500)
+
+        assert result.data["parsed"] is True
+        assert downloader.timings.reports == 1
+        assert downloader.timings.network_seconds >= 0
+        assert downloader.timings.parse_seconds > 0
+
+
+# =============================================================================
+# Concurrent Download Tests
+# =============================================================================
+
+
+class TestConcurrentDownloads:
+    """Tests for downloading several games through one instance at once."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_season_keeps_raw_content(self) -> None:
+        """Test each result carries the HTML fetched for its own game."""
+        downloader = ConcreteHTMLDownloader(
+            HTMLDownloaderConfig(persist_html=False, max_concurrency=3),
+            game_ids=[2024020001, 2024020002, 2024020003],
+        )
+
+        async def fake_get(path: str, **kwargs: Any) -> MagicMock:
+            game = path[-7:-4]
+            # Later games answer first so responses interleave
+            await asyncio.sleep(0.01 * (4 - int(game[-1])))
+            response = MagicMock()
+            response.is_success = True
+            response.content = (
+                f"<html><head><title>{game}</title></head></html>".encode()
+            )
+            return response
+
+        with patch.object(downloader, "_get", side_effect=fake_get):
+            async with downloader:
+                results = [r async for r in downloader.download_season(20242025)]
+
+        assert [r.game_id for r in results] == [2024020001, 2024020002, 2024020003]
+        for result in results:
+            game = f"{result.game_id}"[-3:]
+            assert result.data["title"] == game
+            assert result.raw_content is not None
+            assert f"<title>{game}</title>".encode() in result.raw_content
+
+
 # =============================================================================
 # Download Flow Tests
 # =============================================================================
@@ -711,6 +834,33 @@ class TestHTMLPersistence:
         assert (tmp_path / "20242025" / "GS" / "2024020002.HTM").exists()
         assert (tmp_path / "20242025" / "GS" / "2024020003.HTM").exists()
 
+    @pytest.mark.asyncio
+    async def test_exit_closes_archives(
+        self,
+        tmp_path: Path,
+        sample_html: bytes,
+    ) -> None:
+        """Leaving the context closes archive file handles and maps."""
+        from nhl_api.utils.html_storage import HTMLStorageManager
+
+        downloader = ConcreteHTMLDownloader(HTMLDownloaderConfig(persist_html=True))
+        storage = HTMLStorageManager(base_dir=tmp_path, backend="archive")
+        downloader._storage_manager = storage
+
+        mock_response = MagicMock()
+        mock_response.is_success = True
+        mock_response.content = sample_html
+
+        with patch.object(
+            downloader, "_get", new_callable=AsyncMock, return_value=mock_response
+        ):
+            async with downloader:
+                await downloader.download_game(2024020001)
+                assert storage._archives
+
+        assert storage._archives == {}
+        assert storage.load_html("20242025", "GS", 2024020001) is not None
+
     @pytest.mark.asyncio
     async def test_different_report_types_create_separate_directories(
         self,
@@ -5,6 +5,11 @@ Tests the registry and factory pattern for creating HTML report downloaders.
 
 from __future__ import annotations
 
+import asyncio
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
 import pytest
 
 from nhl_api.downloaders.sources.html import (
@@ -228,6 +233,53 @@ class TestHTMLDownloaderRegistry:
         for downloader in downloaders.values():
             assert downloader._game_ids == game_ids  # noqa: SLF001
 
+    def test_create_all_shares_rate_limiter(self) -> None:
+        """create_all shares one per-domain rate limiter across report types."""
+        downloaders = HTMLDownloaderRegistry.create_all()
+        limiters = {id(d._rate_limiter) for d in downloaders.values()}  # noqa: SLF001
+
+        assert len(limiters) == 1
+        assert downloaders["GS"]._rate_limiter.per_domain  # noqa: SLF001
+
+    def test_create_all_subset(self) -> None:
+        """create_all can be limited to some report types."""
+        downloaders = HTMLDownloaderRegistry.create_all(report_types=["GS", "TV"])
+        assert set(downloaders) == {"GS", "TV"}
+
+    # =========================================================================
+    # Test download_season_all()
+    # =========================================================================
+
+    @pytest.mark.asyncio
+    async def test_download_season_all_keeps_reports_apart(self) -> None:
+        """Concurrent downloads keep each report's raw HTML with its result."""
+        fixtures = Path(__file__).parents[4] / "fixtures" / "html"
+
+        async def fake_get(self: BaseHTMLDownloader, path: str, **kwargs: Any) -> Any:
+            await asyncio.sleep(0)
+            response = MagicMock()
+            response.is_success = True
+            response.content = (fixtures / f"{self.report_type}020500.HTM").read_bytes()
+            return response
+
+        config = HTMLDownloaderConfig(persist_html=False, max_concurrency=2)
+        game_ids = [2024020500, 2024020501]
+
+        with patch.object(BaseHTMLDownloader, "_get", fake_get):
+            results = [
+                result
+                async for result in HTMLDownloaderRegistry.download_season_all(
+                    20242025, game_ids, config
+                )
+            ]
+
+        assert len(results) == len(HTMLDownloaderRegistry.REPORT_TYPES) * 2
+        for result in results:
+            assert result.is_successful
+            report_type = result.source.removeprefix("html_").upper()
+            expected = (fixtures / f"{report_type}020500.HTM").read_bytes()
+            assert result.raw_content == expected
+
     # =========================================================================
     # Test default_config()
     # =========================================================================
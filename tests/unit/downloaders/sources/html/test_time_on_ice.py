@@ -899,3 +899,26 @@ class TestEdgeCases:
             by_period = player["toi_by_period"]
             assert "OT" in by_period
             assert by_period["OT"]["shifts"] == 2
+
+
+class TestParseWorkers:
+    """Tests for parsing TOI reports in a process pool."""
+
+    @pytest.mark.asyncio
+    async def test_process_pool_keeps_side(
+        self, away_downloader: TimeOnIceDownloader, away_html: bytes
+    ) -> None:
+        """Test that process workers rebuild the parser for the same side."""
+        pooled = TimeOnIceDownloader(
+            HTMLDownloaderConfig(persist_html=False, parse_executor="process"),
+            side="away",
+        )
+
+        async with pooled:
+            result = await pooled._parse_content_async(away_html, 2024020500)
+        expected = await away_downloader._parse_report(
+            BeautifulSoup(away_html, "lxml"), 2024020500
+        )
+
+        assert pooled._parser_init_kwargs() == {"side": "away"}
+        assert result == expected
@@ -1283,3 +1283,89 @@ class TestBoxscoreDownloaderPersist:
         args = skater_call[0]  # Positional args
         # args[0] = SQL string, toi_seconds is $17 = args[17]
         assert args[17] == 1335  # 22:15 = 1335 seconds
+
+
+@pytest.mark.asyncio
+class TestBoxscoreDownloaderPersistBulk:
+    """Tests for BoxscoreDownloader.persist_bulk method."""
+
+    async def test_persist_bulk_empty_list(self, mock_bulk_db: MagicMock) -> None:
+        """Test bulk persist with empty list returns 0."""
+        downloader = BoxscoreDownloader()
+
+        count = await downloader.persist_bulk(mock_bulk_db, [])
+
+        assert count == 0
+        mock_bulk_db.conn.copy_records_to_table.assert_not_called()
+
+    async def test_persist_bulk_matches_row_path(self, mock_bulk_db: MagicMock) -> None:
+        """Test bulk rows equal the per-row upsert parameters."""
+        downloader = BoxscoreDownloader()
+        boxscores = [
+            ParsedBoxscore(
+                game_id=game_id,
+                season_id=20242025,
+                game_date="2024-12-15",
+                game_type=2,
+                game_state="OFF",
+                home_team=TeamBoxscore(10, "TOR", "Maple Leafs", 4, 32, True),
+                away_team=TeamBoxscore(8, "MTL", "Canadiens", 2, 28, False),
+                home_skaters=[
+                    SkaterStats(
+                        player_id=8478483,
+                        name="Auston Matthews",
+                        sweater_number=34,
+                        position="C",
+                        goals=2,
+                        assists=1,
+                        points=3,
+                        plus_minus=2,
+                        pim=2,
+                        shots=5,
+                        hits=2,
+                        blocked_shots=0,
+                        giveaways=1,
+                        takeaways=2,
+                        faceoff_pct=55.5,
+                        toi="22:15",
+                        shifts=28,
+                        power_play_goals=1,
+                        shorthanded_goals=0,
+                        team_id=10,
+                    ),
+                ],
+                away_skaters=[],
+                home_goalies=[],
+                away_goalies=[],
+                venue_name="Scotiabank Arena",
+                is_overtime=False,
+                is_shootout=False,
+            )
+            for game_id in (2024020500, 2024020501)
+        ]
+        row_db = AsyncMock()
+        await downloader.persist(row_db, boxscores)
+
+        count = await downloader.persist_bulk(mock_bulk_db, boxscores)
+
+        assert count == 2
+        copies = {
+            c.args[0]: c.kwargs["records"]
+            for c in mock_bulk_db.conn.copy_records_to_table.call_args_list
+        }
+        assert set(copies) == {
+            "_stage_game_team_stats",
+            "_stage_game_skater_stats",
+        }
+        row_params = [tuple(c.args[1:]) for c in row_db.execute.call_args_list]
+        bulk_rows = (
+            copies["_stage_game_team_stats"] + copies["_stage_game_skater_stats"]
+        )
+        assert sorted(bulk_rows, key=repr) == sorted(row_params, key=repr)
+        # One merge statement per populated table, all in a single batch
+        merges = [
+            c.args[0]
+            for c in mock_bulk_db.conn.execute.call_args_list
+            if "INSERT INTO" in c.args[0]
+        ]
+        assert len(merges) == 2
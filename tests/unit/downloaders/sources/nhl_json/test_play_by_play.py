@@ -1127,6 +1127,41 @@ class TestPlayByPlayDownloaderPersist:
         # zone is parameter 18
         assert args[18] == "O"
 
+    @pytest.mark.asyncio
+    async def test_persist_bulk_matches_row_path(
+        self,
+        downloader: PlayByPlayDownloader,
+        mock_db: AsyncMock,
+        mock_bulk_db: MagicMock,
+        sample_pbp_data: list[dict[str, Any]],
+    ) -> None:
+        """Test bulk persist stages the same rows as the per-row path."""
+        await downloader.persist(mock_db, sample_pbp_data)
+
+        result = await downloader.persist_bulk(mock_bulk_db, sample_pbp_data)
+
+        assert result == 2
+        copy_call = mock_bulk_db.conn.copy_records_to_table.call_args
+        assert copy_call.args[0] == "_stage_game_events"
+        row_params = [tuple(c.args[1:]) for c in mock_db.execute.call_args_list]
+        assert copy_call.kwargs["records"] == row_params
+        merge = mock_bulk_db.conn.execute.call_args_list[1].args[0]
+        assert "ON CONFLICT (game_id, event_idx) DO UPDATE SET" in merge
+
+    @pytest.mark.asyncio
+    async def test_persist_bulk_empty(
+        self,
+        downloader: PlayByPlayDownloader,
+        mock_bulk_db: MagicMock,
+    ) -> None:
+        """Test bulk persist with no events skips the database."""
+        result = await downloader.persist_bulk(
+            mock_bulk_db, [{"game_id": 2024020500, "events": []}]
+        )
+
+        assert result == 0
+        mock_bulk_db.conn.execute.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_persist_multiple_games(
         self,
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import date
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -610,6 +611,32 @@ class TestPlayerGameLogDownloaderDownloadAll:
         assert results[0].status == DownloadStatus.FAILED
         assert results[1].status == DownloadStatus.COMPLETED
 
+    @pytest.mark.asyncio
+    async def test_download_all_concurrent(self) -> None:
+        """Game logs are fetched concurrently up to max_concurrency."""
+        config = PlayerGameLogDownloaderConfig(max_concurrency=3)
+        players = [(8478400 + i, 20242025, 2) for i in range(6)]
+        downloader = PlayerGameLogDownloader(config, players=players)
+
+        in_flight = 0
+        peak = 0
+
+        async def fake_get(path: str) -> MagicMock:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            response = MagicMock()
+            response.json.return_value = SAMPLE_SKATER_RESPONSE
+            return response
+
+        with patch.object(downloader, "_get", side_effect=fake_get):
+            results = [r async for r in downloader.download_all()]
+
+        assert peak == 3
+        assert [r.data["player_id"] for r in results] == [p[0] for p in players]
+
 
 @pytest.mark.unit
 class TestPlayerGameLogDownloaderParsing:
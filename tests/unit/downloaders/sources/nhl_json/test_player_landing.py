@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
@@ -1073,6 +1074,39 @@ class TestPlayerLandingDownloaderDownloadAll:
         assert not results[1].is_successful
         assert results[2].is_successful
 
+    async def test_download_all_concurrent_completion_order(
+        self,
+        mock_http_client: AsyncMock,
+        mock_rate_limiter: MagicMock,
+        mock_retry_handler: MagicMock,
+        mock_skater_response: MagicMock,
+    ) -> None:
+        """Players are fetched concurrently and yielded as they finish."""
+        delays = {8478402: 0.03, 8479318: 0.0, 8477492: 0.01}
+
+        async def fake_get(url: str, params: Any = None) -> MagicMock:
+            player_id = int(url.split("/")[-2])
+            await asyncio.sleep(delays[player_id])
+            if player_id == 8477492:
+                raise DownloadError("boom")
+            return mock_skater_response
+
+        mock_http_client.get = AsyncMock(side_effect=fake_get)
+        config = PlayerLandingDownloaderConfig(max_concurrency=3, completion_order=True)
+        downloader = PlayerLandingDownloader(
+            config,
+            http_client=mock_http_client,
+            rate_limiter=mock_rate_limiter,
+            retry_handler=mock_retry_handler,
+            player_ids=list(delays),
+        )
+
+        async with downloader:
+            results = [r async for r in downloader.download_all()]
+
+        assert [r.is_successful for r in results] == [True, False, True]
+        assert results[1].data == {"player_id": 8477492}
+
 
 class TestPlayerLandingDownloaderParsing:
     """Tests for PlayerLandingDownloader parsing methods."""
@@ -16,6 +16,7 @@ from nhl_api.downloaders.sources.nhl_json.roster import (
     NHL_TEAM_ABBREVS,
     TEAM_RELOCATIONS,
     ParsedRoster,
+    PlayerIndex,
     PlayerInfo,
     RosterDownloader,
     _parse_birth_date,
@@ -407,6 +408,58 @@ class TestNHLTeamAbbrevs:
         assert "UTA" in NHL_TEAM_ABBREVS  # Utah Hockey Club (2024)
 
 
+def _roster_response(
+    forwards: list[dict[str, Any]] | None = None,
+    defensemen: list[dict[str, Any]] | None = None,
+    goalies: list[dict[str, Any]] | None = None,
+) -> MagicMock:
+    """Create a successful roster response mock."""
+    response = MagicMock()
+    response.is_success = True
+    response.is_rate_limited = False
+    response.is_server_error = False
+    response.status = 200
+    response.retry_after = None
+    response.json.return_value = {
+        "forwards": forwards or [],
+        "defensemen": defensemen or [],
+        "goalies": goalies or [],
+    }
+    return response
+
+
+@pytest.mark.unit
+class TestPlayerIndex:
+    """Tests for PlayerIndex."""
+
+    def test_add_roster_and_get(self) -> None:
+        """Test indexing a roster's players."""
+        roster = _parse_roster(
+            {"forwards": [SAMPLE_FORWARD], "goalies": [SAMPLE_GOALIE]}, "BOS"
+        )
+        index = PlayerIndex()
+        index.begin_refresh()
+        index.add_roster(roster)
+
+        assert len(index) == 2
+        assert index.get(8480280) is not None
+        assert index.missing_teams(["BOS", "NYR"]) == ["NYR"]
+
+    def test_unbuilt_index_covers_nothing(self) -> None:
+        """Test that an index that was never refreshed misses every team."""
+        assert PlayerIndex().missing_teams(["BOS"]) == ["BOS"]
+
+    def test_expired_refresh_starts_over(self) -> None:
+        """Test that refreshing an expired index drops old players."""
+        index = PlayerIndex(ttl=0.0)
+        index.begin_refresh()
+        index.add_roster(_parse_roster({"forwards": [SAMPLE_FORWARD]}, "BOS"))
+
+        index.begin_refresh()
+
+        assert len(index) == 0
+
+
 @pytest.mark.unit
 class TestRosterDownloader:
     """Tests for RosterDownloader class."""
@@ -677,6 +730,26 @@ class TestRosterDownloader:
         assert len(rosters) == 2
         assert all(r.season_id == 20232024 for r in rosters)
 
+    @pytest.mark.asyncio
+    async def test_download_rosters_for_season_skips_malformed_roster(
+        self,
+        downloader: RosterDownloader,
+        mock_http_client: MagicMock,
+    ) -> None:
+        """Test that one unparseable roster does not fail the other teams."""
+        malformed = _roster_response()
+        malformed.json.side_effect = ValueError("Expecting value")
+        good = _roster_response(forwards=[SAMPLE_FORWARD])
+
+        async def get(url: str, **kwargs: Any) -> MagicMock:
+            return malformed if "/NYR/" in url else good
+
+        mock_http_client.get = AsyncMock(side_effect=get)
+
+        rosters = await downloader.download_rosters_for_season(20232024, ["BOS", "NYR"])
+
+        assert [r.team_abbrev for r in rosters] == ["BOS"]
+
     @pytest.mark.asyncio
     async def test_get_player_by_id_found(
         self,
@@ -729,6 +802,151 @@ class TestRosterDownloader:
 
         assert player is None
 
+    @pytest.mark.asyncio
+    async def test_get_player_by_id_uses_index(
+        self,
+        downloader: RosterDownloader,
+        mock_http_client: MagicMock,
+    ) -> None:
+        """Test that lookups after a roster download need no requests."""
+        mock_http_client.get = AsyncMock(
+            return_value=_roster_response(forwards=[SAMPLE_FORWARD])
+        )
+
+        await downloader.download_all_current_rosters(["BOS", "NYR"])
+        mock_http_client.get.reset_mock()
+
+        player = await downloader.get_player_by_id(8478402, ["BOS", "NYR"])
+        missing = await downloader.get_player_by_id(9999999, ["BOS", "NYR"])
+
+        assert player is not None
+        assert player.last_name == "Pastrnak"
+        assert missing is None
+        mock_http_client.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_player_by_id_fetches_only_missing_teams(
+        self,
+        downloader: RosterDownloader,
+        mock_http_client: MagicMock,
+    ) -> None:
+        """Test that only teams the index does not cover are fetched."""
+        mock_http_client.get = AsyncMock(
+            return_value=_roster_response(defensemen=[SAMPLE_DEFENSEMAN])
+        )
+        await downloader.download_all_current_rosters(["BOS"])
+        mock_http_client.get.reset_mock()
+
+        await downloader.get_player_by_id(8479325, ["BOS", "NYR"])
+
+        urls = [call.args[0] for call in mock_http_client.get.call_args_list]
+        assert len(urls) == 1
+        assert "roster/NYR/current" in urls[0]
+
+    @pytest.mark.asyncio
+    async def test_get_player_by_id_retries_failed_teams(
+        self,
+        downloader: RosterDownloader,
+        mock_http_client: MagicMock,
+    ) -> None:
+        """Test that a team whose fetch failed is not marked as covered."""
+        failed = MagicMock()
+        failed.is_success = False
+        failed.is_rate_limited = False
+        failed.is_server_error = False
+        failed.status = 404
+        failed.retry_after = None
+        mock_http_client.get = AsyncMock(
+            side_effect=[failed, _roster_response(forwards=[SAMPLE_FORWARD])]
+        )
+
+        first = await downloader.get_player_by_id(8478402, ["BOS"])
+        second = await downloader.get_player_by_id(8478402, ["BOS"])
+
+        assert first is None
+        assert second is not None
+        assert mock_http_client.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_player_index_expires(
+        self,
+        config: DownloaderConfig,
+        mock_http_client: MagicMock,
+        mock_rate_limiter: MagicMock,
+    ) -> None:
+        """Test that an expired index is rebuilt from fresh rosters."""
+        downloader = RosterDownloader(
+            config,
+            http_client=mock_http_client,
+            rate_limiter=mock_rate_limiter,
+            player_index_ttl=0.0,
+        )
+        downloader._owns_http_client = False
+        mock_http_client.get = AsyncMock(
+            return_value=_roster_response(forwards=[SAMPLE_FORWARD])
+        )
+
+        await downloader.get_player_by_id(8478402, ["BOS"])
+        await downloader.get_player_by_id(8478402, ["BOS"])
+
+        assert mock_http_client.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_season_rosters_have_their_own_index(
+        self,
+        downloader: RosterDownloader,
+        mock_http_client: MagicMock,
+    ) -> None:
+        """Test that season rosters do not answer current roster lookups."""
+        mock_http_client.get = AsyncMock(
+            return_value=_roster_response(goalies=[SAMPLE_GOALIE])
+        )
+
+        await downloader.download_rosters_for_season(20232024, ["BOS"])
+
+        assert downloader.player_index(20232024).get(8480280) is not None
+        assert downloader.player_index().get(8480280) is None
+        player = await downloader.get_player_by_id(8480280, ["BOS"], season_id=20232024)
+        assert player is not None
+        assert mock_http_client.get.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_load_player_index_from_db(
+        self,
+        downloader: RosterDownloader,
+        mock_http_client: MagicMock,
+    ) -> None:
+        """Test that stored rosters fill the index without API requests."""
+        db = MagicMock()
+        db.fetch = AsyncMock(
+            return_value=[
+                {
+                    "player_id": 8478402,
+                    "team_abbrev": "EDM",
+                    "position_code": "C",
+                    "sweater_number": 97,
+                    "first_name": "Connor",
+                    "last_name": "McDavid",
+                    "shoots_catches": "L",
+                    "height_inches": 73,
+                    "weight_lbs": 194,
+                    "birth_date": date(1997, 1, 13),
+                    "birth_city": "Richmond Hill",
+                    "birth_country": "CAN",
+                    "birth_state_province": "ON",
+                    "headshot_url": None,
+                }
+            ]
+        )
+
+        count = await downloader.load_player_index(db, 20242025)
+        player = await downloader.get_player_by_id(8478402, ["EDM"], season_id=20242025)
+
+        assert count == 1
+        assert player is not None
+        assert player.height_cm == 185
+        mock_http_client.get.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_fetch_game_not_applicable(
         self, downloader: RosterDownloader
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import UTC, date, datetime
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
@@ -573,6 +574,7 @@ class TestScheduleDownloaderAdvanced:
         )
 
         assert result == []
+        assert downloader.missing_weeks == [date(2024, 12, 20)]
 
     async def test_get_season_schedule(
         self,
@@ -709,6 +711,137 @@ class TestScheduleDownloaderAdvanced:
         # Games from wrong season should be filtered out
         assert all(g.season_id == 20242025 for g in result)
 
+    async def test_get_season_schedule_since(
+        self,
+        downloader: ScheduleDownloader,
+        mock_http_client: MagicMock,
+    ) -> None:
+        """Test that an incremental fetch starts at the given date."""
+        mock_response = MagicMock()
+        mock_response.is_success = True
+        mock_response.is_rate_limited = False
+        mock_response.is_server_error = False
+        mock_response.status = 200
+        mock_response.retry_after = None
+        mock_response.json.return_value = {"gameWeek": []}
+        mock_http_client.get.return_value = mock_response
+
+        await downloader.get_season_schedule(20242025, since=date(2025, 6, 20))
+
+        urls = [call.args[0] for call in mock_http_client.get.call_args_list]
+        assert urls[0].endswith("schedule/2025-06-20")
+        assert len(urls) == 2
+
+    async def test_get_season_schedule_fetches_weeks_concurrently(
+        self,
+        mock_http_client: MagicMock,
+        mock_rate_limiter: MagicMock,
+    ) -> None:
+        """Test that weeks are fetched in parallel, de-duplicated and sorted."""
+        in_flight = 0
+        peak = 0
+
+        async def mock_get_response(url: str, **kwargs: Any) -> MagicMock:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+            response = MagicMock()
+            response.is_success = True
+            response.is_rate_limited = False
+            response.is_server_error = False
+            response.status = 200
+            response.retry_after = None
+            # Every week returns the same game plus one unique to the week
+            date_str = url.split("/")[-1]
+            week_game = 2024020000 + date.fromisoformat(date_str).toordinal() % 1000
+            response.json.return_value = {
+                "gameWeek": [
+                    {
+                        "date": date_str,
+                        "games": [
+                            {
+                                "id": game_id,
+                                "season": 20242025,
+                                "gameType": 2,
+                                "startTimeUTC": f"{date_str}T00:00:00Z",
+                                "homeTeam": {"id": 1, "abbrev": "BOS"},
+                                "awayTeam": {"id": 2, "abbrev": "NYR"},
+                                "gameState": "OFF",
+                            }
+                            for game_id in (2024029999, week_game)
+                        ],
+                    }
+                ]
+            }
+            return response
+
+        mock_http_client.get.side_effect = mock_get_response
+        config = DownloaderConfig(
+            base_url="https://api-web.nhle.com/v1",
+            requests_per_second=10.0,
+            max_concurrency=4,
+        )
+        downloader = ScheduleDownloader(
+            config, http_client=mock_http_client, rate_limiter=mock_rate_limiter
+        )
+        downloader._owns_http_client = False
+
+        result = await downloader.get_season_schedule(20242025)
+
+        assert peak == 4
+        game_ids = [g.game_id for g in result]
+        assert len(game_ids) == len(set(game_ids))
+        assert game_ids.count(2024029999) == 1
+        assert result == sorted(result, key=lambda g: (g.game_date, g.game_id))
+        assert mock_http_client.get.call_count == len(game_ids) - 1
+
+    async def test_get_games_in_range_filters_to_range(
+        self,
+        downloader: ScheduleDownloader,
+        mock_http_client: MagicMock,
+    ) -> None:
+        """Test that every day of a fetched week is kept only inside the range."""
+        mock_response = MagicMock()
+        mock_response.is_success = True
+        mock_response.is_rate_limited = False
+        mock_response.is_server_error = False
+        mock_response.status = 200
+        mock_response.retry_after = None
+        mock_response.json.return_value = {
+            "gameWeek": [
+                {
+                    "date": day,
+                    "games": [
+                        {
+                            "id": game_id,
+                            "season": 20242025,
+                            "gameType": 2,
+                            "startTimeUTC": f"{day}T00:00:00Z",
+                            "homeTeam": {"id": 1, "abbrev": "BOS"},
+                            "awayTeam": {"id": 2, "abbrev": "NYR"},
+                            "gameState": "OFF",
+                        }
+                    ],
+                }
+                for day, game_id in (
+                    ("2024-12-19", 2024020510),
+                    ("2024-12-21", 2024020530),
+                    ("2024-12-23", 2024020550),
+                )
+            ]
+        }
+        mock_http_client.get.return_value = mock_response
+
+        result = await downloader.get_games_in_range(
+            date(2024, 12, 20),
+            date(2024, 12, 25),
+        )
+
+        assert [g.game_id for g in result] == [2024020530, 2024020550]
+
     async def test_fetch_season_games_generator(
         self,
         downloader: ScheduleDownloader,
@@ -757,17 +890,18 @@ class TestScheduleDownloaderAdvanced:
         assert len(game_ids) >= 1
 
 
+def _persisted_rows(db: MagicMock) -> list[tuple[Any, ...]]:
+    """Rows staged by the last bulk persist."""
+    records: list[tuple[Any, ...]] = db.conn.copy_records_to_table.call_args.kwargs[
+        "records"
+    ]
+    return records
+
+
 @pytest.mark.unit
 class TestScheduleDownloaderPersist:
     """Tests for ScheduleDownloader.persist() method."""
 
-    @pytest.fixture
-    def mock_db(self) -> MagicMock:
-        """Create a mock database service."""
-        db = MagicMock()
-        db.execute = AsyncMock()
-        return db
-
     @pytest.fixture
     def downloader(self) -> ScheduleDownloader:
         """Create a ScheduleDownloader for testing."""
@@ -822,49 +956,53 @@ class TestScheduleDownloaderPersist:
     async def test_persist_empty_list(
         self,
         downloader: ScheduleDownloader,
-        mock_db: MagicMock,
+        mock_bulk_db: MagicMock,
     ) -> None:
         """Test persisting an empty list returns 0."""
-        result = await downloader.persist(mock_db, [])
+        result = await downloader.persist(mock_bulk_db, [])
 
         assert result == 0
-        mock_db.execute.assert_not_called()
+        mock_bulk_db.conn.execute.assert_not_called()
 
     async def test_persist_single_game(
         self,
         downloader: ScheduleDownloader,
-        mock_db: MagicMock,
+        mock_bulk_db: MagicMock,
         sample_games: list[GameInfo],
     ) -> None:
         """Test persisting a single game."""
-        result = await downloader.persist(mock_db, [sample_games[0]])
+        result = await downloader.persist(mock_bulk_db, [sample_games[0]])
 
         assert result == 1
-        mock_db.execute.assert_called_once()
 
-        # Verify the SQL was called with correct parameters
-        call_args = mock_db.execute.call_args
-        assert call_args[0][1] == 2024020001  # game_id
-        assert call_args[0][2] == 20242025  # season_id
-        assert call_args[0][3] == "R"  # game_type (2 -> "R")
-        assert call_args[0][4] == date(2024, 10, 8)  # game_date
+        # Verify the staged row has the correct values
+        row = _persisted_rows(mock_bulk_db)[0]
+        assert row[0] == 2024020001  # game_id
+        assert row[1] == 20242025  # season_id
+        assert row[2] == "R"  # game_type (2 -> "R")
+        assert row[3] == date(2024, 10, 8)  # game_date
 
     async def test_persist_multiple_games(
         self,
         downloader: ScheduleDownloader,
-        mock_db: MagicMock,
+        mock_bulk_db: MagicMock,
         sample_games: list[GameInfo],
     ) -> None:
         """Test persisting multiple games."""
-        result = await downloader.persist(mock_db, sample_games)
+        result = await downloader.persist(mock_bulk_db, sample_games)
 
         assert result == 2
-        assert mock_db.execute.call_count == 2
+        # One COPY and one merge for the whole batch
+        mock_bulk_db.conn.copy_records_to_table.assert_awaited_once()
+        merge = mock_bulk_db.conn.execute.call_args_list[1].args[0]
+        assert "ON CONFLICT (game_id, season_id)" in merge
+        assert "updated_at = CURRENT_TIMESTAMP" in merge
+        mock_bulk_db.execute.assert_not_called()
 
     async def test_persist_game_type_mapping(
         self,
         downloader: ScheduleDownloader,
-        mock_db: MagicMock,
+        mock_bulk_db: MagicMock,
     ) -> None:
         """Test that game types are correctly mapped to string codes."""
         test_cases = [
@@ -875,7 +1013,7 @@ class TestScheduleDownloaderPersist:
         ]
 
         for game_type_int, expected_code in test_cases:
-            mock_db.execute.reset_mock()
+            mock_bulk_db.conn.reset_mock()
 
             game = GameInfo(
                 game_id=2024020001,
@@ -893,17 +1031,16 @@ class TestScheduleDownloaderPersist:
                 game_state="FUT",
             )
 
-            await downloader.persist(mock_db, [game])
+            await downloader.persist(mock_bulk_db, [game])
 
-            call_args = mock_db.execute.call_args
-            assert call_args[0][3] == expected_code, (
+            assert _persisted_rows(mock_bulk_db)[0][2] == expected_code, (
                 f"Expected {expected_code} for game_type {game_type_int}"
             )
 
     async def test_persist_game_outcome_regular(
         self,
         downloader: ScheduleDownloader,
-        mock_db: MagicMock,
+        mock_bulk_db: MagicMock,
     ) -> None:
         """Test game outcome is REG for regulation win."""
         game = GameInfo(
@@ -925,16 +1062,15 @@ class TestScheduleDownloaderPersist:
             is_shootout=False,
         )
 
-        await downloader.persist(mock_db, [game])
+        await downloader.persist(mock_bulk_db, [game])
 
-        call_args = mock_db.execute.call_args
-        # game_outcome is the 14th parameter (index 13 in 0-indexed after SQL)
-        assert call_args[0][14] == "REG"
+        # game_outcome is the last column
+        assert _persisted_rows(mock_bulk_db)[0][13] == "REG"
 
     async def test_persist_game_outcome_overtime(
         self,
         downloader: ScheduleDownloader,
-        mock_db: MagicMock,
+        mock_bulk_db: MagicMock,
     ) -> None:
         """Test game outcome is OT for overtime win."""
         game = GameInfo(
@@ -956,15 +1092,14 @@ class TestScheduleDownloaderPersist:
             is_shootout=False,
         )
 
-        await downloader.persist(mock_db, [game])
+        await downloader.persist(mock_bulk_db, [game])
 
-        call_args = mock_db.execute.call_args
-        assert call_args[0][14] == "OT"
+        assert _persisted_rows(mock_bulk_db)[0][13] == "OT"
 
     async def test_persist_game_outcome_shootout(
         self,
         downloader: ScheduleDownloader,
-        mock_db: MagicMock,
+        mock_bulk_db: MagicMock,
     ) -> None:
         """Test game outcome is SO for shootout win."""
         game = GameInfo(
@@ -986,15 +1121,14 @@ class TestScheduleDownloaderPersist:
             is_shootout=True,
         )
 
-        await downloader.persist(mock_db, [game])
+        await downloader.persist(mock_bulk_db, [game])
 
-        call_args = mock_db.execute.call_args
-        assert call_args[0][14] == "SO"
+        assert _persisted_rows(mock_bulk_db)[0][13] == "SO"
 
     async def test_persist_future_game_no_outcome(
         self,
         downloader: ScheduleDownloader,
-        mock_db: MagicMock,
+        mock_bulk_db: MagicMock,
     ) -> None:
         """Test future games have no game outcome."""
         game = GameInfo(
@@ -1013,7 +1147,8 @@ class TestScheduleDownloaderPersist:
             game_state="FUT",
         )
 
-        await downloader.persist(mock_db, [game])
+        await downloader.persist(mock_bulk_db, [game])
 
-        call_args = mock_db.execute.call_args
-        assert call_args[0][14] is None  # No game outcome for future games
+        assert (
+            _persisted_rows(mock_bulk_db)[0][13] is None
+        )  # No game outcome for future games
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import date
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
@@ -551,6 +552,83 @@ class TestStandingsDownloader:
         # Should only have 1 snapshot (second one succeeded)
         assert len(snapshots) == 1
 
+    @pytest.mark.asyncio
+    async def test_get_standings_range_concurrent_in_date_order(
+        self,
+        mock_http_client: MagicMock,
+        mock_rate_limiter: MagicMock,
+    ) -> None:
+        """Test that dates are fetched concurrently but returned in order."""
+        in_flight = 0
+        peak = 0
+
+        async def fake_get(url: str, **kwargs: Any) -> MagicMock:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Earlier dates finish last
+            day = int(url.rsplit("-", 1)[-1])
+            await asyncio.sleep(0.01 * (10 - day))
+            in_flight -= 1
+            response = MagicMock()
+            response.is_success = True
+            response.is_rate_limited = False
+            response.is_server_error = False
+            response.status = 200
+            response.retry_after = None
+            response.json.return_value = SAMPLE_STANDINGS_RESPONSE
+            return response
+
+        mock_http_client.get = fake_get
+        downloader = StandingsDownloader(
+            DownloaderConfig(
+                base_url="https://api-web.nhle.com/v1",
+                requests_per_second=10.0,
+                max_concurrency=3,
+                completion_order=True,
+            ),
+            http_client=mock_http_client,
+            rate_limiter=mock_rate_limiter,
+        )
+        downloader._owns_http_client = False
+
+        snapshots = await downloader.get_standings_range(
+            date(2024, 12, 1), date(2024, 12, 6), interval_days=1
+        )
+
+        assert peak == 3
+        assert [s.standings_date.day for s in snapshots] == [1, 2, 3, 4, 5, 6]
+
+    @pytest.mark.asyncio
+    async def test_get_standings_range_skips_stored_dates(
+        self,
+        downloader: StandingsDownloader,
+        mock_http_client: MagicMock,
+    ) -> None:
+        """Test that dates already in standings_snapshots are not fetched."""
+        mock_response = MagicMock()
+        mock_response.is_success = True
+        mock_response.is_rate_limited = False
+        mock_response.is_server_error = False
+        mock_response.status = 200
+        mock_response.retry_after = None
+        mock_response.json.return_value = SAMPLE_STANDINGS_RESPONSE
+        mock_http_client.get = AsyncMock(return_value=mock_response)
+
+        db = MagicMock()
+        db.fetch = AsyncMock(return_value=[{"snapshot_date": date(2024, 12, 8)}])
+
+        snapshots = await downloader.get_standings_range(
+            date(2024, 12, 1), date(2024, 12, 15), interval_days=7, db=db
+        )
+
+        assert [s.standings_date for s in snapshots] == [
+            date(2024, 12, 1),
+            date(2024, 12, 15),
+        ]
+        assert mock_http_client.get.call_count == 2
+        assert db.fetch.call_args.args[1:] == (date(2024, 12, 1), date(2024, 12, 15))
+
     @pytest.mark.asyncio
     async def test_fetch_game_not_applicable(
         self, downloader: StandingsDownloader
@@ -585,6 +663,13 @@ class TestCreateStandingsDownloader:
         assert downloader.config.requests_per_second == 10.0
         assert downloader.config.max_retries == 5
 
+    def test_create_sets_range_concurrency(self) -> None:
+        """Test that the factory enables concurrent range downloads."""
+        assert create_standings_downloader().config.max_concurrency == 4
+        assert (
+            create_standings_downloader(max_concurrency=1).config.max_concurrency == 1
+        )
+
     def test_health_check_url_set(self) -> None:
         """Test that health check URL is configured."""
         downloader = create_standings_downloader()
@@ -827,3 +912,34 @@ class TestStandingsDownloaderPersist:
         assert call_args[0][14] == 105  # goals_for
         assert call_args[0][15] == 78  # goals_against
         assert call_args[0][16] == 27  # goal_differential
+
+    @pytest.mark.asyncio
+    async def test_persist_bulk_single_transaction(
+        self,
+        downloader: StandingsDownloader,
+        mock_bulk_db: MagicMock,
+        sample_standings: ParsedStandings,
+    ) -> None:
+        """Test bulk persist stages a whole range and merges once."""
+        later = _parse_standings(SAMPLE_STANDINGS_RESPONSE, date(2024, 12, 27))
+
+        count = await downloader.persist_bulk(mock_bulk_db, [sample_standings, later])
+
+        assert count == 2 * len(SAMPLE_STANDINGS_RESPONSE["standings"])
+        copy_call = mock_bulk_db.conn.copy_records_to_table.call_args
+        assert copy_call.args[0] == "_stage_standings_snapshots"
+        records = copy_call.kwargs["records"]
+        assert {r[2] for r in records} == {date(2024, 12, 20), date(2024, 12, 27)}
+        merge = mock_bulk_db.conn.execute.call_args_list[1].args[0]
+        assert "ON CONFLICT (team_abbrev, season_id, snapshot_date)" in merge
+        mock_bulk_db.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_persist_bulk_empty(
+        self,
+        downloader: StandingsDownloader,
+        mock_bulk_db: MagicMock,
+    ) -> None:
+        """Test bulk persist with no snapshots does not open a transaction."""
+        assert await downloader.persist_bulk(mock_bulk_db, []) == 0
+        mock_bulk_db.conn.execute.assert_not_called()
@@ -495,6 +495,32 @@ class TestPersist:
         assert count == 7
         assert mock_db.execute.call_count == 7
 
+    @pytest.mark.asyncio
+    async def test_persist_bulk_single_statement(
+        self,
+        downloader: ShiftChartsDownloader,
+        sample_api_response: dict[str, Any],
+        mock_bulk_db: MagicMock,
+    ) -> None:
+        """Test bulk persist stages every shift and merges once."""
+        records = sample_api_response["data"]
+        charts = [
+            downloader._parse_shift_chart(records, 2024020500),
+            downloader._parse_shift_chart(records, 2024020500).to_dict(),
+        ]
+
+        count = await downloader.persist_bulk(mock_bulk_db, charts)
+
+        # Same shifts twice collapse to one row per shift_id
+        assert count == 7
+        copy_call = mock_bulk_db.conn.copy_records_to_table.call_args
+        assert copy_call.args[0] == "_stage_game_shifts"
+        assert len(copy_call.kwargs["records"]) == 7
+        merge = mock_bulk_db.conn.execute.call_args_list[1].args[0]
+        assert "ON CONFLICT (shift_id)" in merge
+        assert "duration_seconds = EXCLUDED.duration_seconds" in merge
+        mock_bulk_db.execute.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_persist_sql_parameters(
         self, downloader: ShiftChartsDownloader
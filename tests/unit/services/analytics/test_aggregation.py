@@ -17,9 +17,11 @@ from nhl_api.services.analytics.aggregation import (
     AggregationService,
     GameAggregation,
     LineCombinationStats,
+    LineUnit,
     PeriodAggregation,
     SeasonAggregation,
     ShiftAggregation,
+    refresh_line_combinations,
 )
 
 
@@ -55,6 +57,22 @@ def make_records(data_list: list[dict[str, Any]]) -> list[DictLikeRecord]:
     return [DictLikeRecord(d) for d in data_list]
 
 
+def line_row(
+    player_ids: list[int],
+    situation_code: str | None,
+    toi_seconds: int,
+    game_count: int,
+) -> dict[str, Any]:
+    """Build a row as returned by the grouped line_combinations query."""
+    return {
+        "player_ids": player_ids,
+        "situation_code": situation_code,
+        "is_total": 1 if situation_code is None else 0,
+        "toi_seconds": toi_seconds,
+        "game_count": game_count,
+    }
+
+
 class TestAggregationFilters:
     """Tests for AggregationFilters dataclass."""
 
@@ -576,20 +594,9 @@ class TestAggregationServiceLineCombinations:
         """get_line_combinations returns list of LineCombinationStats."""
         mock_db.fetch.return_value = make_records(
             [
-                {
-                    "sorted_players": [8477934, 8478402, 8478421],
-                    "season_id": 20242025,
-                    "situation_code": "5v5",
-                    "toi_seconds": 5000,
-                    "game_count": 30,
-                },
-                {
-                    "sorted_players": [8477934, 8478402, 8478421],
-                    "season_id": 20242025,
-                    "situation_code": "5v4",
-                    "toi_seconds": 500,
-                    "game_count": 25,
-                },
+                line_row([8477934, 8478402, 8478421], "5v5", 5000, 30),
+                line_row([8477934, 8478402, 8478421], "5v4", 500, 25),
+                line_row([8477934, 8478402, 8478421], None, 5500, 31),
             ]
         )
 
@@ -600,8 +607,9 @@ class TestAggregationServiceLineCombinations:
         assert isinstance(result[0], LineCombinationStats)
         assert result[0].player_ids == frozenset({8477934, 8478402, 8478421})
         assert result[0].toi_together == 5500
-        assert result[0].game_count == 30
+        assert result[0].game_count == 31
         assert result[0].by_situation == {"5v5": 5000, "5v4": 500}
+        assert result[0].unit == LineUnit.SKATERS
 
     @pytest.mark.asyncio
     async def test_get_line_combinations_sorted_by_toi(
@@ -610,20 +618,10 @@ class TestAggregationServiceLineCombinations:
         """Line combinations are sorted by TOI descending."""
         mock_db.fetch.return_value = make_records(
             [
-                {
-                    "sorted_players": [8477934, 8478402, 8478421],
-                    "season_id": 20242025,
-                    "situation_code": "5v5",
-                    "toi_seconds": 3000,
-                    "game_count": 30,
-                },
-                {
-                    "sorted_players": [8477846, 8477904, 8478042],
-                    "season_id": 20242025,
-                    "situation_code": "5v5",
-                    "toi_seconds": 5000,
-                    "game_count": 25,
-                },
+                line_row([8477934, 8478402, 8478421], "5v5", 3000, 30),
+                line_row([8477934, 8478402, 8478421], None, 3000, 30),
+                line_row([8477846, 8477904, 8478042], "5v5", 5000, 25),
+                line_row([8477846, 8477904, 8478042], None, 5000, 25),
             ]
         )
 
@@ -633,6 +631,78 @@ class TestAggregationServiceLineCombinations:
         assert result[0].toi_together == 5000  # Higher TOI first
         assert result[1].toi_together == 3000
 
+    @pytest.mark.asyncio
+    async def test_reads_line_combination_index(
+        self, service: AggregationService, mock_db: AsyncMock
+    ) -> None:
+        """The season call is a grouped read over line_combinations."""
+        mock_db.fetch.return_value = []
+
+        await service.get_line_combinations(20242025, min_toi=600)
+
+        query, *params = mock_db.fetch.call_args[0]
+        assert "FROM line_combinations" in query
+        assert "second_snapshots" not in query
+        assert "unnest" not in query
+        assert "GROUPING SETS" in query
+        assert params == [20242025, "skaters", 3, 5, 600]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("unit", "sizes"),
+        [(LineUnit.FORWARDS, [3, 3]), (LineUnit.DEFENSE, [2, 2])],
+    )
+    async def test_unit_selects_sub_combinations(
+        self,
+        service: AggregationService,
+        mock_db: AsyncMock,
+        unit: LineUnit,
+        sizes: list[int],
+    ) -> None:
+        """Forward lines and defence pairs default to their unit size."""
+        mock_db.fetch.return_value = make_records(
+            [line_row([8477934, 8478402], None, 900, 12)]
+        )
+
+        result = await service.get_line_combinations(20242025, unit=unit)
+
+        params = mock_db.fetch.call_args[0][1:]
+        assert params[1:4] == (unit.value, *sizes)
+        assert result[0].unit == unit
+
+    @pytest.mark.asyncio
+    async def test_explicit_player_counts_override_unit_sizes(
+        self, service: AggregationService, mock_db: AsyncMock
+    ) -> None:
+        """min_players/max_players override the unit defaults."""
+        mock_db.fetch.return_value = []
+
+        await service.get_line_combinations(
+            20242025, min_players=4, max_players=6, unit=LineUnit.FORWARDS
+        )
+
+        params = mock_db.fetch.call_args[0][1:]
+        assert params[1:4] == ("forwards", 4, 6)
+
+
+class TestRefreshLineCombinations:
+    """Tests for rebuilding a game's line_combinations rows."""
+
+    @pytest.mark.asyncio
+    async def test_replaces_game_rows_from_segments(self) -> None:
+        conn = AsyncMock()
+
+        await refresh_line_combinations(conn, 2024020500)
+
+        delete, insert = conn.execute.await_args_list
+        assert delete.args == (
+            "DELETE FROM line_combinations WHERE game_id = $1",
+            2024020500,
+        )
+        assert "FROM lineup_segments" in insert.args[0]
+        assert "game_skater_stats" in insert.args[0]
+        assert insert.args[1] == 2024020500
+
 
 class TestAggregationServicePlayerTOISummary:
     """Tests for get_player_toi_summary method."""
@@ -704,3 +774,56 @@ class TestAggregationServicePlayerTOISummary:
         assert result is not None
         # Filters should override player_ids with the specified player
         assert result.player_id == 8478402
+
+
+class TestAggregationServiceSegments:
+    """Tests for reading lineup_segments instead of second_snapshots."""
+
+    @pytest.fixture
+    def mock_db(self) -> AsyncMock:
+        """Create mock database service."""
+        return AsyncMock()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "method",
+        ["aggregate_shifts", "aggregate_periods", "aggregate_game"],
+    )
+    async def test_game_queries_sum_segment_durations(
+        self, mock_db: AsyncMock, method: str
+    ) -> None:
+        """Game-level queries read segments and sum their durations."""
+        mock_db.fetch.return_value = []
+        service = AggregationService(mock_db, use_segments=True)
+
+        await getattr(service, method)(2024020500)
+
+        query = mock_db.fetch.call_args[0][0]
+        assert "FROM lineup_segments" in query
+        assert "second_snapshots" not in query
+        assert "duration_seconds as toi_seconds" in query
+        assert "SUM(toi_seconds)" in query
+
+    @pytest.mark.asyncio
+    async def test_season_uses_segments(self, mock_db: AsyncMock) -> None:
+        """Season queries read segments."""
+        mock_db.fetch.return_value = []
+        service = AggregationService(mock_db, use_segments=True)
+
+        await service.aggregate_season(20242025)
+
+        query = mock_db.fetch.call_args[0][0]
+        assert "FROM lineup_segments" in query
+        assert "second_snapshots" not in query
+
+    @pytest.mark.asyncio
+    async def test_default_reads_snapshots(self, mock_db: AsyncMock) -> None:
+        """Without use_segments each snapshot row counts as one second."""
+        mock_db.fetch.return_value = []
+        service = AggregationService(mock_db)
+
+        await service.aggregate_game(2024020500)
+
+        query = mock_db.fetch.call_args[0][0]
+        assert "FROM second_snapshots" in query
+        assert "1 as toi_seconds" in query
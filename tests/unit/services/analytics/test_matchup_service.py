@@ -0,0 +1,118 @@
+"""Unit tests for MatchupService pair TOI reads.
+
+Tests that teammate/opponent matchups are read from player_pair_toi and
+that grouped rows are folded into PlayerMatchup objects.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+
+from nhl_api.models.matchups import MatchupType
+from nhl_api.services.analytics.matchup_service import (
+    MatchupQueryFilters,
+    MatchupService,
+    refresh_pair_toi,
+)
+
+
+def pair_row(
+    other_player_id: int,
+    situation_code: str | None,
+    toi_seconds: int,
+    game_count: int,
+) -> dict[str, Any]:
+    """Build a row as returned by the GROUPING SETS pair query."""
+    return {
+        "other_player_id": other_player_id,
+        "situation_code": situation_code,
+        "is_total": 1 if situation_code is None else 0,
+        "toi_seconds": toi_seconds,
+        "game_count": game_count,
+    }
+
+
+@pytest.fixture
+def mock_db() -> AsyncMock:
+    """Create mock database service."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def service(mock_db: AsyncMock) -> MatchupService:
+    """Create MatchupService with mock db."""
+    return MatchupService(mock_db)
+
+
+class TestPairMatchups:
+    """Tests for teammate/opponent reads from player_pair_toi."""
+
+    @pytest.mark.asyncio
+    async def test_rows_fold_into_matchups(
+        self, service: MatchupService, mock_db: AsyncMock
+    ) -> None:
+        """Situation rows fill the breakdown; total rows carry TOI and games."""
+        mock_db.fetch.return_value = [
+            pair_row(8477934, "5v5", 900, 10),
+            pair_row(8477934, "5v4", 120, 4),
+            pair_row(8477934, None, 1020, 11),
+            pair_row(8480000, "5v5", 30, 1),
+            pair_row(8480000, None, 30, 1),
+        ]
+
+        result = await service._get_teammate_matchups(
+            8478402, MatchupQueryFilters(season_id=20242025, min_toi_seconds=60)
+        )
+
+        assert len(result) == 1
+        matchup = result[0]
+        assert matchup.matchup_type == MatchupType.TEAMMATE
+        assert {matchup.player1_id, matchup.player2_id} == {8478402, 8477934}
+        assert matchup.toi_seconds == 1020
+        assert matchup.game_count == 11
+        assert matchup.situation_breakdown == {"5v5": 900, "5v4": 120}
+
+    @pytest.mark.asyncio
+    async def test_query_is_keyed_range_read(
+        self, service: MatchupService, mock_db: AsyncMock
+    ) -> None:
+        """Filters become predicates on the player_pair_toi key."""
+        mock_db.fetch.return_value = []
+
+        await service._get_opponent_matchups(
+            8478402,
+            MatchupQueryFilters(
+                season_id=20242025,
+                situation_codes=["5v5", "4v4"],
+                exclude_empty_net=True,
+            ),
+        )
+
+        query, *params = mock_db.fetch.call_args[0]
+        assert "FROM player_pair_toi" in query
+        assert "unnest" not in query
+        assert "situation_code = ANY($4::text[])" in query
+        assert "is_empty_net = false" in query
+        assert params == [8478402, "opponent", 20242025, ["5v5", "4v4"]]
+
+
+class TestRefreshPairToi:
+    """Tests for rebuilding a game's pair TOI rows."""
+
+    @pytest.mark.asyncio
+    async def test_replaces_game_rows_from_segments(self) -> None:
+        conn = AsyncMock()
+
+        await refresh_pair_toi(conn, 2024020500)
+
+        delete, insert = conn.execute.await_args_list
+        assert delete.args == (
+            "DELETE FROM player_pair_toi WHERE game_id = $1",
+            2024020500,
+        )
+        assert "FROM lineup_segments" in insert.args[0]
+        assert "is_stoppage = false" in insert.args[0]
+        assert insert.args[1] == 2024020500
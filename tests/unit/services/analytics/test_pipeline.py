@@ -0,0 +1,230 @@
+"""Unit tests for the season analytics pipeline.
+
+Exercises process_game directly and AnalyticsPipeline.run against a mock
+database, computing in-process (workers=0).
+"""
+
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from nhl_api.services.analytics.pipeline import (
+    PIPELINE_SOURCE_NAME,
+    SNAPSHOT_COLUMNS,
+    AnalyticsPipeline,
+    PipelineConfig,
+    PipelineStats,
+    process_game,
+)
+
+SEASON = 20242025
+HOME = 10
+AWAY = 20
+SOURCE_ID = 99
+
+
+def make_game(game_id: int) -> dict[str, Any]:
+    return {
+        "game_id": game_id,
+        "season_id": SEASON,
+        "home_team_id": HOME,
+        "away_team_id": AWAY,
+        "period": 3,
+    }
+
+
+def make_shifts(game_id: int) -> list[dict[str, Any]]:
+    """One home and one away player on ice for the first 10 seconds."""
+    return [
+        {
+            "game_id": game_id,
+            "player_id": player_id,
+            "team_id": team_id,
+            "period": 1,
+            "start_time": "20:00",
+            "end_time": "19:50",
+            "is_goal_event": False,
+        }
+        for player_id, team_id in ((1, HOME), (2, AWAY))
+    ]
+
+
+def make_event(game_id: int, event_idx: int, event_type: str, clock: str) -> dict:
+    return {
+        "id": event_idx,
+        "game_id": game_id,
+        "event_idx": event_idx,
+        "event_type": event_type,
+        "period": 1,
+        "time_in_period": clock,
+        "event_owner_team_id": HOME,
+        "player1_id": 1,
+        "player2_id": None,
+        "player3_id": None,
+        "goalie_id": None,
+        "x_coord": None,
+        "y_coord": None,
+        "zone": None,
+        "description": None,
+    }
+
+
+class TestProcessGame:
+    """Tests for the worker-side expand and attribute step."""
+
+    def test_rows_cover_expanded_seconds(self) -> None:
+        outcome = process_game(make_game(1), make_shifts(1), [])
+
+        assert outcome.errors == []
+        assert len(outcome.rows) == 11
+        assert all(len(row) == len(SNAPSHOT_COLUMNS) for row in outcome.rows)
+        game_second = SNAPSHOT_COLUMNS.index("game_second")
+        assert [row[game_second] for row in outcome.rows] == list(range(11))
+
+    def test_stoppage_events_flag_rows(self) -> None:
+        events = [
+            make_event(1, 1, "stoppage", "19:55"),
+            make_event(1, 2, "shot-on-goal", "19:53"),
+        ]
+        outcome = process_game(make_game(1), make_shifts(1), events)
+
+        is_stoppage = SNAPSHOT_COLUMNS.index("is_stoppage")
+        flagged = [i for i, row in enumerate(outcome.rows) if row[is_stoppage]]
+        assert flagged == [5]
+        assert outcome.events_attributed == 2
+        assert outcome.events_unattributed == 0
+        # The stoppage second splits the game's single lineup into three
+        assert [seg[7] for seg in outcome.segments] == [5, 1, 5]
+
+    def test_no_shifts_reports_error(self) -> None:
+        outcome = process_game(make_game(1), [], [])
+
+        assert outcome.rows == []
+        assert outcome.errors
+
+
+class TestPipelineStats:
+    """Tests for throughput reporting."""
+
+    def test_games_per_second(self) -> None:
+        stats = PipelineStats(games_processed=50, elapsed_seconds=10.0)
+        assert stats.games_per_second == 5.0
+
+    def test_games_per_second_zero_elapsed(self) -> None:
+        assert PipelineStats(games_processed=5).games_per_second == 0.0
+
+    def test_summary_includes_stage_timings(self) -> None:
+        summary = PipelineStats(fetch_seconds=1.5, save_seconds=2.0).summary()
+        assert "fetch 1.5s" in summary
+        assert "save 2.0s" in summary
+        assert "games/sec" in summary
+
+
+@pytest.fixture
+def pipeline_db(mock_bulk_db: MagicMock) -> MagicMock:
+    """Mock database with two completed games, one already processed."""
+    games = [make_game(1), make_game(2), make_game(3)]
+
+    async def fetch(query: str, *args: Any) -> list[dict[str, Any]]:
+        if "FROM games" in query:
+            return games
+        if "FROM download_progress" in query:
+            return [{"item_key": "1"}]
+        if "FROM game_shifts" in query:
+            return [s for game_id in args[0] for s in make_shifts(game_id)]
+        return []
+
+    mock_bulk_db.fetch = AsyncMock(side_effect=fetch)
+    # data_sources lookup, then one progress_id per upsert
+    mock_bulk_db.fetchval = AsyncMock(side_effect=[SOURCE_ID, 101, 102, 103])
+    return mock_bulk_db
+
+
+@pytest.mark.asyncio
+class TestAnalyticsPipeline:
+    """Tests for AnalyticsPipeline.run."""
+
+    async def test_run_resumes_and_saves(self, pipeline_db: MagicMock) -> None:
+        pipeline = AnalyticsPipeline(
+            pipeline_db, PipelineConfig(season_id=SEASON, batch_size=1, workers=0)
+        )
+
+        stats = await pipeline.run()
+
+        assert stats.games_total == 3
+        assert stats.games_skipped == 1
+        assert stats.games_processed == 2
+        assert stats.games_failed == 0
+        assert stats.seconds_written == 22
+        assert stats.elapsed_seconds > 0
+
+        # One batched shifts query and one events query per batch
+        shift_queries = [
+            call
+            for call in pipeline_db.fetch.await_args_list
+            if "FROM game_shifts" in call.args[0]
+        ]
+        assert [call.args[1] for call in shift_queries] == [[2], [3]]
+
+        copies = pipeline_db.conn.copy_records_to_table.await_args_list
+        assert [call.args[0] for call in copies] == [
+            "_stage_second_snapshots",
+            "lineup_segments",
+        ] * 2
+        assert copies[0].kwargs["columns"] == SNAPSHOT_COLUMNS
+        assert stats.segments_written == 2
+
+    async def test_no_resume_processes_all(self, pipeline_db: MagicMock) -> None:
+        pipeline = AnalyticsPipeline(
+            pipeline_db, PipelineConfig(season_id=SEASON, workers=0, resume=False)
+        )
+
+        stats = await pipeline.run()
+
+        assert stats.games_skipped == 0
+        assert stats.games_processed == 3
+
+    async def test_save_failure_marks_progress_failed(
+        self, pipeline_db: MagicMock
+    ) -> None:
+        pipeline_db.conn.copy_records_to_table.side_effect = RuntimeError("boom")
+        pipeline = AnalyticsPipeline(
+            pipeline_db, PipelineConfig(season_id=SEASON, workers=0)
+        )
+
+        stats = await pipeline.run()
+
+        assert stats.games_failed == 2
+        assert stats.games_processed == 0
+        failed = [
+            call
+            for call in pipeline_db.execute.await_args_list
+            if "status = 'failed'" in call.args[0]
+        ]
+        assert len(failed) == 2
+        assert failed[0].args[2] == "boom"
+
+    async def test_progress_error_fails_only_that_game(
+        self, pipeline_db: MagicMock
+    ) -> None:
+        pipeline_db.fetchval = AsyncMock(
+            side_effect=[SOURCE_ID, RuntimeError("db down"), 103]
+        )
+        pipeline = AnalyticsPipeline(
+            pipeline_db, PipelineConfig(season_id=SEASON, batch_size=1, workers=0)
+        )
+
+        stats = await pipeline.run()
+
+        assert stats.games_failed == 1
+        assert stats.games_processed == 1
+
+    async def test_missing_source_raises(self, pipeline_db: MagicMock) -> None:
+        pipeline_db.fetchval = AsyncMock(return_value=None)
+        pipeline = AnalyticsPipeline(
+            pipeline_db, PipelineConfig(season_id=SEASON, workers=0)
+        )
+
+        with pytest.raises(ValueError, match=PIPELINE_SOURCE_NAME):
+            await pipeline.run()
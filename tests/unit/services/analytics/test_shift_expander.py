@@ -5,17 +5,128 @@ Tests the time conversion and shift expansion logic without database access.
 Issue: #259 - Wave 1: Core Pipeline
 """
 
+import random
+from collections.abc import Iterable
+from typing import Any
+
 import pytest
 
 from nhl_api.services.analytics.shift_expander import (
     OT_SECONDS,
     PERIOD_SECONDS,
+    SEGMENT_COLUMNS,
+    SNAPSHOT_COLUMNS,
     ExpandedSecond,
     GameExpansionResult,
+    OnIceInterval,
+    ShiftExpander,
     parse_game_clock_to_elapsed,
     period_to_game_second,
+    segment_rows,
+    snapshot_rows,
+    sweep_shifts,
 )
 
+HOME = 10
+AWAY = 20
+
+
+def make_shift(
+    player_id: int,
+    team_id: int,
+    period: int,
+    start: str,
+    end: str,
+    *,
+    is_goal_event: bool = False,
+) -> dict[str, Any]:
+    """Build a shift record as returned by ShiftExpander._get_game_shifts."""
+    return {
+        "player_id": player_id,
+        "team_id": team_id,
+        "period": period,
+        "start_time": start,
+        "end_time": end,
+        "is_goal_event": is_goal_event,
+    }
+
+
+def expand_per_second(
+    shifts: Iterable[dict[str, Any]], home_team_id: int
+) -> dict[tuple[int, int], tuple[frozenset[int], frozenset[int]]]:
+    """Expand shifts by visiting every second of every shift.
+
+    This is the original expansion algorithm, kept here as the reference
+    that sweep_shifts is checked against.
+
+    Args:
+        shifts: Shift records (see sweep_shifts).
+        home_team_id: Home team ID.
+
+    Returns:
+        Map of (period, period_second) to (home skaters, away skaters).
+    """
+    presence_map: dict[tuple[int, int], dict[str, set[int]]] = {}
+
+    for shift in shifts:
+        if shift["is_goal_event"]:
+            continue
+
+        period = shift["period"]
+        start_elapsed = parse_game_clock_to_elapsed(shift["start_time"], period)
+        end_elapsed = parse_game_clock_to_elapsed(shift["end_time"], period)
+        if start_elapsed > end_elapsed:
+            start_elapsed, end_elapsed = end_elapsed, start_elapsed
+
+        team_key = (
+            "home_skaters" if shift["team_id"] == home_team_id else "away_skaters"
+        )
+        for sec in range(start_elapsed, end_elapsed + 1):
+            key = (period, sec)
+            if key not in presence_map:
+                presence_map[key] = {"home_skaters": set(), "away_skaters": set()}
+            presence_map[key][team_key].add(shift["player_id"])
+
+    return {
+        key: (frozenset(players["home_skaters"]), frozenset(players["away_skaters"]))
+        for key, players in sorted(presence_map.items())
+    }
+
+
+def clock(elapsed: int, period: int = 1) -> str:
+    """Convert elapsed period seconds to a MM:SS game clock string."""
+    remaining = (OT_SECONDS if period >= 4 else PERIOD_SECONDS) - elapsed
+    return f"{remaining // 60:02d}:{remaining % 60:02d}"
+
+
+def random_game_shifts(seed: int) -> list[dict[str, Any]]:
+    """Generate a synthetic game with overlapping, gapped and odd shifts."""
+    rng = random.Random(seed)
+    shifts = []
+    for period in (1, 2, 3, 4):
+        length = OT_SECONDS if period == 4 else PERIOD_SECONDS
+        for team_id, base in ((HOME, 100), (AWAY, 200)):
+            for player in range(base, base + 18):
+                t = rng.randint(0, 60)
+                while t < length:
+                    duration = rng.randint(0, 70)
+                    start, end = t, min(length, t + duration)
+                    if rng.random() < 0.05:
+                        start, end = end, start  # reversed data quirk
+                    shifts.append(
+                        make_shift(
+                            player,
+                            team_id,
+                            period,
+                            clock(start, period),
+                            clock(end, period),
+                            is_goal_event=rng.random() < 0.02,
+                        )
+                    )
+                    t += duration + rng.randint(-5, 240)
+    rng.shuffle(shifts)
+    return shifts
+
 
 class TestParseGameClockToElapsed:
     """Tests for parse_game_clock_to_elapsed function."""
@@ -228,3 +339,245 @@ class TestGameExpansionResult:
             away_team_id=2,
         )
         assert not result.success
+
+
+class TestSweepShifts:
+    """Tests for the interval-sweep expansion engine."""
+
+    def test_single_shift(self) -> None:
+        """One shift becomes one inclusive interval."""
+        intervals = sweep_shifts([make_shift(1, HOME, 1, "20:00", "19:30")], HOME)
+
+        assert intervals == [
+            OnIceInterval(
+                period=1,
+                start_second=0,
+                end_second=30,
+                home_skaters=frozenset({1}),
+                away_skaters=frozenset(),
+            )
+        ]
+        assert intervals[0].duration == 31
+
+    def test_lineup_changes_split_intervals(self) -> None:
+        """A player joining mid-shift starts a new interval."""
+        intervals = sweep_shifts(
+            [
+                make_shift(1, HOME, 1, "20:00", "19:00"),
+                make_shift(2, AWAY, 1, "19:40", "19:00"),
+            ],
+            HOME,
+        )
+
+        assert [(i.start_second, i.end_second) for i in intervals] == [
+            (0, 19),
+            (20, 60),
+        ]
+        assert intervals[1].away_skaters == frozenset({2})
+
+    def test_back_to_back_shifts_merge(self) -> None:
+        """Consecutive shifts for the same lineup collapse into one run."""
+        intervals = sweep_shifts(
+            [
+                make_shift(1, HOME, 1, "20:00", "19:30"),
+                make_shift(1, HOME, 1, "19:29", "19:00"),
+            ],
+            HOME,
+        )
+
+        assert len(intervals) == 1
+        assert (intervals[0].start_second, intervals[0].end_second) == (0, 60)
+
+    def test_gap_is_omitted(self) -> None:
+        """Seconds with nobody on ice produce no interval."""
+        intervals = sweep_shifts(
+            [
+                make_shift(1, HOME, 1, "20:00", "19:50"),
+                make_shift(1, HOME, 1, "19:00", "18:50"),
+            ],
+            HOME,
+        )
+
+        assert [(i.start_second, i.end_second) for i in intervals] == [
+            (0, 10),
+            (60, 70),
+        ]
+
+    def test_overlapping_shifts_same_player(self) -> None:
+        """Duplicate overlapping records keep the player on ice throughout."""
+        intervals = sweep_shifts(
+            [
+                make_shift(1, HOME, 1, "20:00", "19:00"),
+                make_shift(1, HOME, 1, "19:30", "18:30"),
+            ],
+            HOME,
+        )
+
+        assert len(intervals) == 1
+        assert (intervals[0].start_second, intervals[0].end_second) == (0, 90)
+
+    def test_goal_events_skipped(self) -> None:
+        """Goal event records are not shifts."""
+        intervals = sweep_shifts(
+            [make_shift(1, HOME, 1, "10:00", "10:00", is_goal_event=True)], HOME
+        )
+
+        assert intervals == []
+
+    @pytest.mark.parametrize("seed", [1, 2, 3, 4, 5])
+    def test_matches_per_second_expansion(self, seed: int) -> None:
+        """Intervals expand to exactly the per-second reference output."""
+        shifts = random_game_shifts(seed)
+
+        expected = expand_per_second(shifts, HOME)
+        intervals = sweep_shifts(shifts, HOME)
+
+        expanded = {
+            (interval.period, sec): (interval.home_skaters, interval.away_skaters)
+            for interval in intervals
+            for sec in range(interval.start_second, interval.end_second + 1)
+        }
+        assert list(expanded) == list(expected)
+        assert expanded == expected
+        # Runs are maximal: neighbours always differ or are not contiguous
+        for prev, cur in zip(intervals, intervals[1:], strict=False):
+            assert (prev.period, prev.end_second + 1) != (
+                cur.period,
+                cur.start_second,
+            ) or (prev.home_skaters, prev.away_skaters) != (
+                cur.home_skaters,
+                cur.away_skaters,
+            )
+
+
+class TestExpandShifts:
+    """Tests for ShiftExpander.expand_shifts and snapshot rows."""
+
+    GAME_INFO = {
+        "game_id": 2024020500,
+        "season_id": 20242025,
+        "home_team_id": HOME,
+        "away_team_id": AWAY,
+        "period": 4,
+    }
+
+    def test_lazy_and_materialized_seconds_agree(self) -> None:
+        """iter_seconds over intervals equals the materialized seconds."""
+        shifts = random_game_shifts(7)
+
+        eager = ShiftExpander.expand_shifts(self.GAME_INFO, shifts)
+        lazy = ShiftExpander.expand_shifts(
+            self.GAME_INFO, shifts, materialize_seconds=False
+        )
+
+        assert lazy.seconds == []
+        assert lazy.success
+        assert list(lazy.iter_seconds()) == eager.seconds
+        assert lazy.total_seconds == eager.total_seconds == len(eager.seconds)
+
+    def test_seconds_match_reference(self) -> None:
+        """Materialized seconds carry the reference lineups and game seconds."""
+        shifts = random_game_shifts(8)
+
+        result = ShiftExpander.expand_shifts(self.GAME_INFO, shifts)
+        expected = expand_per_second(shifts, HOME)
+
+        assert [(s.period, s.period_second) for s in result.seconds] == list(expected)
+        for sec in result.seconds:
+            home, away = expected[(sec.period, sec.period_second)]
+            assert sec.home_skaters == home
+            assert sec.away_skaters == away
+            assert sec.game_second == period_to_game_second(
+                sec.period, sec.period_second
+            )
+
+    def test_snapshot_rows_identical_for_both_paths(self) -> None:
+        """Rows built from intervals equal rows built from seconds."""
+        shifts = random_game_shifts(9)
+
+        eager = ShiftExpander.expand_shifts(self.GAME_INFO, shifts)
+        lazy = ShiftExpander.expand_shifts(
+            self.GAME_INFO, shifts, materialize_seconds=False
+        )
+
+        assert list(snapshot_rows(lazy)) == list(snapshot_rows(eager))
+
+    def test_no_shifts(self) -> None:
+        """Missing shifts are reported as an error."""
+        result = ShiftExpander.expand_shifts(self.GAME_INFO, [])
+
+        assert not result.success
+        assert result.errors == ["No shifts found for game 2024020500"]
+
+
+class TestSegmentRows:
+    """Tests for run-length encoding snapshot rows into lineup segments."""
+
+    GAME_INFO = TestExpandShifts.GAME_INFO
+
+    @staticmethod
+    def per_second(rows: list[tuple[Any, ...]]) -> dict[int, tuple[Any, ...]]:
+        """Map game_second to state, keeping the last row per second."""
+        return {row[4]: (row[2], *row[5:]) for row in rows}
+
+    @staticmethod
+    def expand(segments: list[tuple[Any, ...]]) -> dict[int, tuple[Any, ...]]:
+        """Expand segments back to game_second -> state."""
+        seconds = {}
+        for seg in segments:
+            assert seg[7] == seg[6] - seg[5] + 1
+            for game_second in range(seg[5], seg[6] + 1):
+                seconds[game_second] = (seg[2], *seg[8:])
+        return seconds
+
+    def test_segments_reproduce_snapshots(self) -> None:
+        """Expanding segments gives back every deduplicated snapshot second."""
+        for seed in range(5):
+            result = ShiftExpander.expand_shifts(
+                self.GAME_INFO, random_game_shifts(seed), materialize_seconds=False
+            )
+            rows = list(snapshot_rows(result))
+            segments = list(segment_rows(rows))
+
+            assert all(len(seg) == len(SEGMENT_COLUMNS) for seg in segments)
+            assert self.expand(segments) == self.per_second(rows)
+            assert len(segments) < len(rows)
+
+    def test_stoppage_splits_segment(self) -> None:
+        """A change in any state column starts a new segment."""
+        is_stoppage = SNAPSHOT_COLUMNS.index("is_stoppage")
+        rows = [
+            (1, 2, 1, sec, sec, "5v5", 1, 1, [1], [2], None, None, False, False, True)
+            for sec in range(10)
+        ]
+        rows[4] = (*rows[4][:is_stoppage], True, *rows[4][is_stoppage + 1 :])
+
+        segments = list(segment_rows(rows))
+
+        assert [(seg[5], seg[6], seg[7]) for seg in segments] == [
+            (0, 3, 4),
+            (4, 4, 1),
+            (5, 9, 5),
+        ]
+
+    def test_period_boundary_keeps_later_row(self) -> None:
+        """Period N second 1200 and period N+1 second 0 share a game second."""
+        end_of_first = (1, 2, 1, 1200, 1200, "5v5", 1, 1, [1], [2], None, None)
+        start_of_second = (1, 2, 2, 0, 1200, "5v5", 1, 1, [3], [4], None, None)
+        flags = (False, False, True)
+        rows = [
+            (1, 2, 1, 1199, 1199, "5v5", 1, 1, [1], [2], None, None, *flags),
+            (*end_of_first, *flags),
+            (*start_of_second, *flags),
+            (1, 2, 2, 1, 1201, "5v5", 1, 1, [3], [4], None, None, *flags),
+        ]
+
+        segments = list(segment_rows(rows))
+
+        assert [(seg[2], seg[3], seg[4], seg[7]) for seg in segments] == [
+            (1, 1199, 1199, 1),
+            (2, 0, 1, 2),
+        ]
+
+    def test_empty(self) -> None:
+        assert list(segment_rows([])) == []
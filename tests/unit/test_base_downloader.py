@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import AsyncGenerator
 from datetime import UTC, datetime
+from pathlib import Path
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -19,9 +21,18 @@ from nhl_api.downloaders.base.protocol import (
     DownloadStatus,
     HealthCheckError,
 )
-from nhl_api.downloaders.base.rate_limiter import RateLimiter
+from nhl_api.downloaders.base.rate_limiter import (
+    RateLimiter,
+    clear_shared_rate_limiters,
+)
 from nhl_api.downloaders.base.retry_handler import RetryHandler
-from nhl_api.utils.http_client import HTTPClient, HTTPResponse
+from nhl_api.utils.http_client import (
+    COMPLETED_GAME_POLICY,
+    ContentType,
+    HTTPClient,
+    HTTPResponse,
+    clear_shared_response_caches,
+)
 
 
 class TestDownloaderConfig:
@@ -37,6 +48,8 @@ class TestDownloaderConfig:
         assert config.retry_base_delay == 1.0
         assert config.http_timeout == 30.0
         assert config.health_check_url == ""
+        assert config.max_concurrency == 1
+        assert config.completion_order is False
 
     def test_custom_values(self) -> None:
         """Test custom configuration values."""
@@ -468,6 +481,157 @@ class TestBaseDownloaderDownloadSeason:
         assert downloader.progress is None
 
 
+class SlowDownloader(ConcreteDownloader):
+    """Downloader whose games finish after per-game delays."""
+
+    def __init__(
+        self,
+        config: DownloaderConfig,
+        delays: dict[int, float],
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(
+            config,
+            game_data={game_id: {"game": game_id} for game_id in delays},
+            season_games=list(delays),
+            **kwargs,
+        )
+        self._delays = delays
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.cancelled: list[int] = []
+
+    async def _fetch_game(self, game_id: int) -> dict[str, Any]:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self._delays[game_id])
+        except asyncio.CancelledError:
+            self.cancelled.append(game_id)
+            raise
+        finally:
+            self.in_flight -= 1
+        return await super()._fetch_game(game_id)
+
+
+@pytest.mark.asyncio
+class TestBaseDownloaderConcurrentSeason:
+    """Tests for concurrent BaseDownloader.download_season."""
+
+    @staticmethod
+    def _config(**kwargs: Any) -> DownloaderConfig:
+        return DownloaderConfig(base_url="https://api.test.com", **kwargs)
+
+    async def test_preserves_schedule_order(self, mock_http_client: AsyncMock) -> None:
+        """Test concurrent results are yielded in schedule order by default."""
+        delays = {2024020001: 0.03, 2024020002: 0.01, 2024020003: 0.0}
+        downloader = SlowDownloader(
+            self._config(max_concurrency=3),
+            delays,
+            http_client=mock_http_client,
+        )
+
+        async with downloader:
+            results = [r async for r in downloader.download_season(20242025)]
+
+        assert [r.game_id for r in results] == list(delays)
+        assert downloader.max_in_flight == 3
+
+    async def test_completion_order(self, mock_http_client: AsyncMock) -> None:
+        """Test completion_order yields games as they finish."""
+        delays = {2024020001: 0.05, 2024020002: 0.02, 2024020003: 0.0}
+        downloader = SlowDownloader(
+            self._config(max_concurrency=3, completion_order=True),
+            delays,
+            http_client=mock_http_client,
+        )
+
+        async with downloader:
+            results = [r async for r in downloader.download_season(20242025)]
+
+        assert [r.game_id for r in results] == [2024020003, 2024020002, 2024020001]
+
+    async def test_bounded_in_flight(self, mock_http_client: AsyncMock) -> None:
+        """Test no more than max_concurrency games run at once."""
+        delays = {2024020000 + i: 0.005 for i in range(1, 11)}
+        downloader = SlowDownloader(
+            self._config(max_concurrency=2),
+            delays,
+            http_client=mock_http_client,
+        )
+
+        async with downloader:
+            results = [r async for r in downloader.download_season(20242025)]
+
+        assert len(results) == 10
+        assert downloader.max_in_flight == 2
+
+    async def test_progress_counts_with_failures(
+        self, mock_http_client: AsyncMock
+    ) -> None:
+        """Test progress counters stay correct under concurrency."""
+        delays = {2024020001: 0.01, 2024020002: 0.0, 2024020003: 0.0}
+        callback = MagicMock()
+        downloader = SlowDownloader(
+            self._config(max_concurrency=3),
+            delays,
+            http_client=mock_http_client,
+            progress_callback=callback,
+        )
+        del downloader._game_data[2024020002]
+
+        processed: list[int] = []
+        async with downloader:
+            async for _ in downloader.download_season(20242025):
+                assert downloader.progress is not None
+                processed.append(downloader.progress.processed_items)
+
+        assert processed[-1] == 3
+        assert downloader.progress is None
+        assert callback.call_count == 3
+        assert [c.kwargs["current"] for c in callback.call_args_list] == [1, 2, 3]
+
+    async def test_failed_game_yields_failed_result(
+        self, mock_http_client: AsyncMock
+    ) -> None:
+        """Test a failing game produces a FAILED result, not an exception."""
+        delays = {2024020001: 0.0, 2024020002: 0.0}
+        downloader = SlowDownloader(
+            self._config(max_concurrency=2),
+            delays,
+            http_client=mock_http_client,
+        )
+        del downloader._game_data[2024020001]
+
+        async with downloader:
+            results = [r async for r in downloader.download_season(20242025)]
+
+        assert results[0].status == DownloadStatus.FAILED
+        assert results[0].error_message is not None
+        assert results[1].is_successful
+
+    async def test_early_exit_cancels_pending(
+        self, mock_http_client: AsyncMock
+    ) -> None:
+        """Test stopping iteration cancels games still in flight."""
+        delays = {2024020001: 0.0, 2024020002: 1.0, 2024020003: 1.0}
+        downloader = SlowDownloader(
+            self._config(max_concurrency=3, completion_order=True),
+            delays,
+            http_client=mock_http_client,
+        )
+
+        async with downloader:
+            season = downloader.download_season(20242025)
+            async for result in season:
+                assert result.game_id == 2024020001
+                break
+            await season.aclose()
+
+        assert sorted(downloader.cancelled) == [2024020002, 2024020003]
+        assert downloader.progress is None
+
+
 @pytest.mark.asyncio
 class TestBaseDownloaderHealthCheck:
     """Tests for BaseDownloader.health_check."""
@@ -583,6 +747,38 @@ class TestBaseDownloaderGet:
         assert response is mock_response
         mock_rate_limiter.wait.assert_called()
 
+    @pytest.mark.parametrize("from_cache", [False, True])
+    async def test_get_records_only_network_responses(
+        self,
+        from_cache: bool,
+        downloader_config: DownloaderConfig,
+        mock_http_client: AsyncMock,
+        mock_rate_limiter: MagicMock,
+        mock_retry_handler: MagicMock,
+    ) -> None:
+        """Cache hits served by the client do not feed the adaptive limiter."""
+        mock_http_client.get = AsyncMock(
+            return_value=HTTPResponse(
+                status=200,
+                headers={},
+                content=b"{}",
+                url="https://api.test.com/test/path",
+                from_cache=from_cache,
+            )
+        )
+
+        downloader = ConcreteDownloader(
+            downloader_config,
+            http_client=mock_http_client,
+            rate_limiter=mock_rate_limiter,
+            retry_handler=mock_retry_handler,
+        )
+
+        async with downloader:
+            await downloader._get("/test/path")
+
+        assert mock_rate_limiter.record_response.called is not from_cache
+
     async def test_get_requires_client(
         self,
         downloader_config: DownloaderConfig,
@@ -593,6 +789,160 @@ class TestBaseDownloaderGet:
         with pytest.raises(RuntimeError, match="HTTP client not initialized"):
             await downloader._get("/test/path")
 
+    async def test_get_records_and_replays_raw_archive(
+        self,
+        tmp_path: Path,
+        mock_http_client: AsyncMock,
+        mock_rate_limiter: MagicMock,
+        mock_retry_handler: MagicMock,
+    ) -> None:
+        """Archived responses are replayed without touching the network."""
+        response = HTTPResponse(
+            status=200,
+            headers={"ETag": '"v1"'},
+            content=b'{"id": 2024020500}',
+            url="https://api.test.com/gamecenter/2024020500/boxscore",
+            content_type=ContentType.JSON,
+        )
+        mock_http_client.get = AsyncMock(return_value=response)
+        record_config = DownloaderConfig(
+            base_url="https://api.test.com", raw_archive_dir=str(tmp_path)
+        )
+
+        async with ConcreteDownloader(
+            record_config,
+            http_client=mock_http_client,
+            rate_limiter=mock_rate_limiter,
+            retry_handler=mock_retry_handler,
+        ) as downloader:
+            await downloader._get("/gamecenter/2024020500/boxscore")
+
+        assert (tmp_path / "test_source.pack").exists()
+
+        replay_config = DownloaderConfig(
+            base_url="https://api.test.com",
+            raw_archive_dir=str(tmp_path),
+            replay=True,
+        )
+        downloader = ConcreteDownloader(replay_config, rate_limiter=mock_rate_limiter)
+        mock_rate_limiter.wait.reset_mock()
+
+        replayed = await downloader._get("/gamecenter/2024020500/boxscore")
+
+        assert replayed == response
+        mock_rate_limiter.wait.assert_not_called()
+
+        with pytest.raises(DownloadError, match="No archived response"):
+            await downloader._get("/gamecenter/2024020501/boxscore")
+
+    async def test_replay_requires_archive_dir(
+        self, downloader_config: DownloaderConfig
+    ) -> None:
+        """Replay mode without an archive directory fails clearly."""
+        downloader_config.replay = True
+        downloader = ConcreteDownloader(downloader_config)
+
+        with pytest.raises(DownloadError, match="raw_archive_dir"):
+            await downloader._get("/test/path")
+
+    async def test_cache_hits_skip_rate_limiter(
+        self,
+        tmp_path: Path,
+        mock_rate_limiter: MagicMock,
+        mock_retry_handler: MagicMock,
+    ) -> None:
+        """Fresh cached responses are served without spending a token."""
+
+        class CompletedGameDownloader(ConcreteDownloader):
+            cache_policy = COMPLETED_GAME_POLICY
+
+        clear_shared_response_caches()
+        config = DownloaderConfig(
+            base_url="https://api.test.com", cache_dir=str(tmp_path)
+        )
+        response = HTTPResponse(
+            status=200,
+            headers={},
+            content=b'{"gameState": "OFF"}',
+            url="https://api.test.com/gamecenter/2024020500/boxscore",
+            content_type=ContentType.JSON,
+        )
+        try:
+            first = CompletedGameDownloader(
+                config,
+                rate_limiter=mock_rate_limiter,
+                retry_handler=mock_retry_handler,
+            )
+            async with first:
+                assert first._http_client is not None
+                with patch.object(
+                    first._http_client, "_request", AsyncMock(return_value=response)
+                ):
+                    await first._get("/gamecenter/2024020500/boxscore")
+
+            rerun = CompletedGameDownloader(
+                config,
+                rate_limiter=mock_rate_limiter,
+                retry_handler=mock_retry_handler,
+            )
+            mock_rate_limiter.wait.reset_mock()
+            async with rerun:
+                assert rerun._http_client is not None
+                request = AsyncMock()
+                with patch.object(rerun._http_client, "_request", request):
+                    cached = await rerun._get("/gamecenter/2024020500/boxscore")
+                cache = rerun._http_client.cache
+                assert first._http_client is None  # closed on exit
+        finally:
+            clear_shared_response_caches()
+
+        assert cached.json() == {"gameState": "OFF"}
+        request.assert_not_awaited()
+        mock_rate_limiter.wait.assert_not_called()
+        # Both downloaders used the same shared cache
+        assert cache is not None
+        assert cache.stats.misses == 1
+        assert cache.stats.hits == 1
+
+    async def test_adaptive_limiter_shared_and_fed(
+        self,
+        mock_http_client: AsyncMock,
+        mock_retry_handler: MagicMock,
+    ) -> None:
+        """Adaptive downloaders share a domain limiter that sees responses."""
+        clear_shared_rate_limiters()
+        mock_http_client.get = AsyncMock(
+            return_value=HTTPResponse(
+                status=503,
+                headers={},
+                content=b"",
+                url="https://api.test.com/test/path",
+                content_type=ContentType.JSON,
+            )
+        )
+        config = DownloaderConfig(
+            base_url="https://api.test.com",
+            requests_per_second=8.0,
+            adaptive_rate_limit=True,
+        )
+        try:
+            first = ConcreteDownloader(
+                config,
+                http_client=mock_http_client,
+                retry_handler=mock_retry_handler,
+            )
+            second = ConcreteDownloader(config)
+            async with first:
+                with pytest.raises(DownloadError, match="Server error 503"):
+                    await first._get("/test/path")
+        finally:
+            clear_shared_rate_limiters()
+
+        assert first._rate_limiter is second._rate_limiter
+        stats = first._rate_limiter.get_stats()
+        assert stats.throttled == 1
+        assert stats.requests_per_second == 4.0
+
 
 class TestSetTotalItems:
     """Tests for set_total_items method."""
@@ -0,0 +1,100 @@
+"""Unit tests for COPY-based bulk upsert helpers."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from nhl_api.services.db.bulk import copy_upsert, dedupe_rows
+
+
+class TestDedupeRows:
+    """Tests for dedupe_rows."""
+
+    def test_keeps_last_occurrence(self) -> None:
+        """Test duplicate keys keep the last row, in first-seen order."""
+        rows = [(1, 10, "a"), (2, 10, "b"), (1, 10, "c")]
+
+        result = dedupe_rows(("id", "game", "val"), rows, ("id", "game"))
+
+        assert result == [(1, 10, "c"), (2, 10, "b")]
+
+    def test_composite_key(self) -> None:
+        """Test rows differing in any key column are kept."""
+        rows = [(1, 10, "a"), (1, 11, "b")]
+
+        result = dedupe_rows(("id", "game", "val"), rows, ("id", "game"))
+
+        assert len(result) == 2
+
+
+@pytest.mark.asyncio
+class TestCopyUpsert:
+    """Tests for copy_upsert."""
+
+    async def test_empty_rows_skip_database(self) -> None:
+        """Test no statements are issued for an empty batch."""
+        conn = AsyncMock()
+
+        count = await copy_upsert(
+            conn,
+            "game_shifts",
+            ("shift_id", "duration_seconds"),
+            [],
+            key_columns=("shift_id",),
+            update_columns=("duration_seconds",),
+        )
+
+        assert count == 0
+        conn.execute.assert_not_called()
+        conn.copy_records_to_table.assert_not_called()
+
+    async def test_stages_and_merges(self) -> None:
+        """Test rows are copied to a staging table and merged once."""
+        conn = AsyncMock()
+        rows = [(1, 30), (2, 45), (1, 40)]
+
+        count = await copy_upsert(
+            conn,
+            "game_shifts",
+            ("shift_id", "duration_seconds"),
+            rows,
+            key_columns=("shift_id",),
+            update_columns=("duration_seconds",),
+            touch_updated_at=True,
+        )
+
+        assert count == 2
+        conn.copy_records_to_table.assert_awaited_once_with(
+            "_stage_game_shifts",
+            records=[(1, 40), (2, 45)],
+            columns=["shift_id", "duration_seconds"],
+        )
+
+        statements = [c.args[0] for c in conn.execute.call_args_list]
+        assert len(statements) == 3
+        assert "CREATE TEMP TABLE IF NOT EXISTS _stage_game_shifts" in statements[0]
+        assert "ON COMMIT DROP" in statements[0]
+        merge = statements[1]
+        assert "INSERT INTO game_shifts (shift_id, duration_seconds)" in merge
+        assert "ON CONFLICT (shift_id)" in merge
+        assert "duration_seconds = EXCLUDED.duration_seconds" in merge
+        assert "updated_at = CURRENT_TIMESTAMP" in merge
+        assert "TRUNCATE _stage_game_shifts" in statements[2]
+
+    async def test_no_update_columns_does_nothing(self) -> None:
+        """Test an empty update list turns the merge into DO NOTHING."""
+        conn = AsyncMock()
+
+        await copy_upsert(
+            conn,
+            "game_events",
+            ("game_id", "event_idx"),
+            [(2024020001, 1)],
+            key_columns=("game_id", "event_idx"),
+            update_columns=(),
+        )
+
+        merge = conn.execute.call_args_list[1].args[0]
+        assert "ON CONFLICT (game_id, event_idx) DO NOTHING" in merge
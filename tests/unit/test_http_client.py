@@ -9,19 +9,25 @@ import aiohttp
 import pytest
 
 from nhl_api.utils.http_client import (
+    COMPLETED_GAME_POLICY,
+    CachePolicy,
     ConnectionError,
     ContentType,
     HTTPClient,
     HTTPClientConfig,
     HTTPClientError,
     HTTPResponse,
+    ResponseCache,
     TimeoutError,
+    clear_shared_response_caches,
     create_nhl_api_client,
     create_nhl_html_client,
+    is_completed_game,
+    shared_response_cache,
 )
 
 if TYPE_CHECKING:
-    pass
+    from pathlib import Path
 
 
 class TestHTTPClientConfig:
@@ -599,3 +605,199 @@ class TestHTTPResponseFromAiohttp:
         response = await HTTPResponse.from_aiohttp_response(mock_response)
 
         assert response.content_type == ContentType.HTML
+
+
+def _json_response(
+    body: bytes, status: int = 200, headers: dict[str, str] | None = None
+) -> HTTPResponse:
+    return HTTPResponse(
+        status=status,
+        headers={"Content-Type": "application/json", **(headers or {})},
+        content=body,
+        url="https://api.example.com/game",
+        content_type=ContentType.JSON,
+    )
+
+
+class TestResponseCache:
+    """Tests for the on-disk response cache."""
+
+    async def test_revalidates_with_etag(self, tmp_path: Path) -> None:
+        """A stored ETag is sent back and a 304 serves the cached body."""
+        cache = ResponseCache(tmp_path)
+        client = HTTPClient(cache=cache)
+        responses = [
+            _json_response(b'{"gameState": "LIVE"}', headers={"ETag": '"v1"'}),
+            _json_response(b"", status=304),
+        ]
+
+        with patch.object(
+            client, "_request", AsyncMock(side_effect=responses)
+        ) as mock_request:
+            first = await client.get("https://api.example.com/game")
+            second = await client.get("https://api.example.com/game")
+
+        assert first.json() == second.json() == {"gameState": "LIVE"}
+        assert second.status == 200
+        sent = mock_request.call_args_list[1].kwargs["headers"]
+        assert sent["If-None-Match"] == '"v1"'
+        assert cache.stats.misses == 1
+        assert cache.stats.revalidations == 1
+
+    async def test_revalidates_with_lowercase_validators(self, tmp_path: Path) -> None:
+        """Validators are found whatever casing the server uses."""
+        cache = ResponseCache(tmp_path)
+        client = HTTPClient(cache=cache)
+        responses = [
+            _json_response(
+                b'{"gameState": "LIVE"}',
+                headers={"etag": '"v1"', "last-modified": "Sat, 01 Mar 2025"},
+            ),
+            _json_response(b"", status=304, headers={"etag": '"v2"'}),
+            _json_response(b"", status=304),
+        ]
+
+        with patch.object(
+            client, "_request", AsyncMock(side_effect=responses)
+        ) as mock_request:
+            for _ in responses:
+                await client.get("https://api.example.com/game")
+
+        sent = [call.kwargs["headers"] for call in mock_request.call_args_list]
+        assert sent[1]["If-None-Match"] == '"v1"'
+        assert sent[1]["If-Modified-Since"] == "Sat, 01 Mar 2025"
+        assert sent[2]["If-None-Match"] == '"v2"'
+        assert cache.stats.revalidations == 2
+
+    async def test_completed_game_is_immutable(self, tmp_path: Path) -> None:
+        """Completed games are served from disk without a request."""
+        client = HTTPClient(
+            cache=ResponseCache(tmp_path), cache_policy=COMPLETED_GAME_POLICY
+        )
+        mock_request = AsyncMock(return_value=_json_response(b'{"gameState": "OFF"}'))
+
+        with patch.object(client, "_request", mock_request):
+            await client.get("https://api.example.com/game", params={"a": "1"})
+            response = await client.get(
+                "https://api.example.com/game", params={"a": "1"}
+            )
+
+        assert response.json() == {"gameState": "OFF"}
+        assert mock_request.await_count == 1
+        assert client.cache_stats is not None
+        assert client.cache_stats.hits == 1
+
+    async def test_cache_persists_across_instances(self, tmp_path: Path) -> None:
+        """A new cache over the same directory sees earlier entries."""
+        client = HTTPClient(
+            cache=ResponseCache(tmp_path), cache_policy=COMPLETED_GAME_POLICY
+        )
+        with patch.object(
+            client,
+            "_request",
+            AsyncMock(return_value=_json_response(b'{"gameState": "FINAL"}')),
+        ):
+            await client.get("https://api.example.com/game")
+
+        rerun = HTTPClient(
+            cache=ResponseCache(tmp_path), cache_policy=COMPLETED_GAME_POLICY
+        )
+        mock_request = AsyncMock()
+        with patch.object(rerun, "_request", mock_request):
+            response = await rerun.get("https://api.example.com/game")
+
+        assert response.json() == {"gameState": "FINAL"}
+        mock_request.assert_not_awaited()
+
+    async def test_errors_are_not_cached(self, tmp_path: Path) -> None:
+        """Only 200 responses are stored."""
+        cache = ResponseCache(tmp_path)
+        client = HTTPClient(cache=cache)
+        with patch.object(
+            client, "_request", AsyncMock(return_value=_json_response(b"", 404))
+        ):
+            await client.get("https://api.example.com/game")
+
+        assert cache.stats.stores == 0
+        assert cache.total_bytes == 0
+
+    def test_evicts_least_recently_used(self, tmp_path: Path) -> None:
+        """Storing past max_bytes removes the oldest entries."""
+        cache = ResponseCache(tmp_path, max_bytes=10)
+        policy = CachePolicy()
+        for i in range(3):
+            cache.store(str(i) * 64, _json_response(b"12345"), policy)
+
+        assert cache.total_bytes == 10
+        assert cache.stats.evictions == 1
+        assert cache.lookup("0" * 64) is None
+        assert cache.lookup("2" * 64) is not None
+
+    def test_key_ignores_param_order(self) -> None:
+        """Query parameter order does not change the key."""
+        url = "https://api.example.com/game"
+        assert ResponseCache.make_key(url, {"a": "1", "b": "2"}) == (
+            ResponseCache.make_key(url, {"b": "2", "a": "1"})
+        )
+        assert ResponseCache.make_key(url) != ResponseCache.make_key(url, {"a": "1"})
+
+    def test_is_completed_game(self) -> None:
+        """Only OFF/FINAL JSON payloads count as completed."""
+        assert is_completed_game(_json_response(b'{"gameState": "OFF"}'))
+        assert not is_completed_game(_json_response(b'{"gameState": "LIVE"}'))
+        assert not is_completed_game(_json_response(b"not json"))
+
+    def test_is_completed_game_html_report(self) -> None:
+        """HTML reports count as completed once their header reads Final."""
+
+        def report(status: bytes) -> HTTPResponse:
+            return HTTPResponse(
+                status=200,
+                headers={"Content-Type": "text/html"},
+                content=b'<td style="font-weight:bold">' + status + b"</td>",
+                url="https://www.nhl.com/scores/htmlreports/20242025/GS020500.HTM",
+                content_type=ContentType.HTML,
+            )
+
+        assert is_completed_game(report(b"Final"))
+        assert not is_completed_game(report(b"End of 2nd Period"))
+
+    async def test_cached_response_only_serves_fresh_entries(
+        self, tmp_path: Path
+    ) -> None:
+        """Stale entries are left for revalidation over the network."""
+        cache = ResponseCache(tmp_path)
+        url = "https://api.example.com/game"
+        cache.store(
+            cache.make_key(url),
+            _json_response(b'{"gameState": "OFF"}'),
+            COMPLETED_GAME_POLICY,
+        )
+        cache.store(
+            cache.make_key(url, {"live": "1"}),
+            _json_response(b'{"gameState": "LIVE"}'),
+            COMPLETED_GAME_POLICY,
+        )
+        client = HTTPClient(cache=cache, cache_policy=COMPLETED_GAME_POLICY)
+
+        assert await client.cached_response(url, params={"live": "1"}) is None
+        cached = await client.cached_response(url)
+        assert cached is not None
+        assert cached.json() == {"gameState": "OFF"}
+        assert cached.from_cache is True
+        assert cache.stats.hits == 1
+        assert await HTTPClient().cached_response(url) is None
+
+    def test_shared_response_cache_per_directory(self, tmp_path: Path) -> None:
+        """Downloaders caching into one directory share one cache."""
+        clear_shared_response_caches()
+        try:
+            first = shared_response_cache(tmp_path / "http")
+            second = shared_response_cache(str(tmp_path / "http"), max_bytes=1)
+            other = shared_response_cache(tmp_path / "other")
+        finally:
+            clear_shared_response_caches()
+
+        assert first is second
+        assert first.max_bytes == 1024**3
+        assert other is not first
@@ -11,7 +11,11 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from nhl_api.services.db.connection import DatabaseService
-from nhl_api.services.db.progress_repo import ProgressEntry, ProgressRepository
+from nhl_api.services.db.progress_repo import (
+    ProgressEntry,
+    ProgressRepository,
+    ProgressUpdate,
+)
 
 
 def create_mock_pool() -> tuple[MagicMock, AsyncMock]:
@@ -242,6 +246,45 @@ class TestUpsertProgress:
         assert progress_id == 45
 
 
+class TestUpsertProgressMany:
+    """Tests for upsert_progress_many method."""
+
+    @pytest.mark.asyncio
+    async def test_single_statement_for_all_keys(self) -> None:
+        """Test that all keys are upserted in one statement."""
+        db = DatabaseService()
+        mock_pool, mock_conn = create_mock_pool()
+        mock_conn.fetch.return_value = [
+            {"item_key": "game_1", "progress_id": 10},
+            {"item_key": "game_2", "progress_id": 11},
+        ]
+        db._pool = mock_pool
+
+        repo = ProgressRepository(db)
+        result = await repo.upsert_progress_many(
+            1, ["game_1", "game_2", "game_1"], season_id=20242025
+        )
+
+        assert result == {"game_1": 10, "game_2": 11}
+        mock_conn.fetch.assert_called_once()
+        call_args = mock_conn.fetch.call_args[0]
+        assert "unnest($3::text[])" in call_args[0]
+        assert "ON CONFLICT" in call_args[0]
+        # Duplicate keys are dropped before the statement
+        assert call_args[3] == ["game_1", "game_2"]
+
+    @pytest.mark.asyncio
+    async def test_empty_keys_skip_query(self) -> None:
+        """Test that no query is issued without keys."""
+        db = DatabaseService()
+        mock_pool, mock_conn = create_mock_pool()
+        db._pool = mock_pool
+
+        repo = ProgressRepository(db)
+        assert await repo.upsert_progress_many(1, []) == {}
+        mock_conn.fetch.assert_not_called()
+
+
 class TestGetById:
     """Tests for get_by_id method."""
 
@@ -543,6 +586,69 @@ class TestIncrementAttempts:
         assert "last_attempt_at = CURRENT_TIMESTAMP" in call_args[0][0]
 
 
+class TestProgressUpdate:
+    """Tests for ProgressUpdate.combine."""
+
+    def test_later_status_wins_and_attempts_add(self) -> None:
+        """Test combining a start with a later failure."""
+        started = ProgressUpdate(42, attempts_added=1)
+        failed = ProgressUpdate(42, status="failed", error_message="timeout")
+
+        combined = started.combine(failed)
+
+        assert combined == ProgressUpdate(
+            42, status="failed", attempts_added=1, error_message="timeout"
+        )
+
+    def test_status_kept_when_later_has_none(self) -> None:
+        """Test that a retry start keeps the earlier failure."""
+        failed = ProgressUpdate(42, status="failed", error_message="timeout")
+
+        combined = failed.combine(ProgressUpdate(42, attempts_added=1))
+
+        assert combined.status == "failed"
+        assert combined.error_message == "timeout"
+        assert combined.attempts_added == 1
+
+
+class TestApplyUpdates:
+    """Tests for apply_updates method."""
+
+    @pytest.mark.asyncio
+    async def test_single_statement_for_all_updates(self) -> None:
+        """Test that updates are applied with one unnest statement."""
+        db = DatabaseService()
+        mock_pool, mock_conn = create_mock_pool()
+        mock_conn.execute.return_value = "UPDATE 2"
+        db._pool = mock_pool
+
+        repo = ProgressRepository(db)
+        count = await repo.apply_updates(
+            [
+                ProgressUpdate(1, status="success", attempts_added=1),
+                ProgressUpdate(2, status="failed", error_message="boom"),
+            ]
+        )
+
+        assert count == 2
+        mock_conn.execute.assert_called_once()
+        call_args = mock_conn.execute.call_args[0]
+        assert "FROM unnest(" in call_args[0]
+        assert call_args[1:4] == ([1, 2], ["success", "failed"], [1, 0])
+        assert call_args[4] == [None, "boom"]
+
+    @pytest.mark.asyncio
+    async def test_empty_updates_skip_query(self) -> None:
+        """Test that no query is issued without updates."""
+        db = DatabaseService()
+        mock_pool, mock_conn = create_mock_pool()
+        db._pool = mock_pool
+
+        repo = ProgressRepository(db)
+        assert await repo.apply_updates([]) == 0
+        mock_conn.execute.assert_not_called()
+
+
 class TestGetBatchStats:
     """Tests for get_batch_stats method."""
 
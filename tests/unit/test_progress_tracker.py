@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -12,13 +13,23 @@ from nhl_api.downloaders.progress.tracker import (
     ProgressStats,
     ProgressTracker,
 )
-from nhl_api.services.db.progress_repo import ProgressEntry, ProgressRepository
+from nhl_api.services.db.progress_repo import (
+    ProgressEntry,
+    ProgressRepository,
+    ProgressUpdate,
+)
 
 
 def create_mock_repo() -> MagicMock:
     """Create a mock ProgressRepository."""
     repo = MagicMock(spec=ProgressRepository)
     repo.upsert_progress = AsyncMock(return_value=1)
+    repo.upsert_progress_many = AsyncMock(
+        side_effect=lambda source_id, keys, **kwargs: {
+            key: i for i, key in enumerate(keys, start=1)
+        }
+    )
+    repo.apply_updates = AsyncMock(side_effect=lambda updates: len(updates))
     repo.get_incomplete = AsyncMock(return_value=[])
     repo.increment_attempts = AsyncMock(return_value=1)
     repo.mark_success = AsyncMock()
@@ -318,7 +329,20 @@ class TestRegisterItems:
         await tracker.register_items(["game_1", "game_2", "game_3"])
 
         assert tracker.stats.pending == 3
-        assert repo.upsert_progress.call_count == 3
+        repo.upsert_progress_many.assert_called_once()
+        repo.upsert_progress.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_skips_already_registered(self) -> None:
+        """Test that items with a progress_id are not upserted again."""
+        repo = create_mock_repo()
+        tracker = ProgressTracker(repo, source_id=1)
+        await tracker.register_item("game_1")
+
+        await tracker.register_items(["game_1", "game_2"])
+
+        assert repo.upsert_progress_many.call_args.args[1] == ["game_2"]
+        assert tracker.stats.pending == 2
 
     @pytest.mark.asyncio
     async def test_sets_total_if_not_set(self) -> None:
@@ -775,3 +799,128 @@ class TestIsComplete:
         await tracker.complete_item("game_1")
 
         assert tracker.is_complete is False
+
+
+class TestWriteBehind:
+    """Tests for write-behind mode."""
+
+    @pytest.mark.asyncio
+    async def test_buffers_until_flush(self) -> None:
+        """Test that transitions are not written until flushed."""
+        repo = create_mock_repo()
+        tracker = ProgressTracker(repo, source_id=1, write_behind=True)
+        await tracker.register_item("game_1")
+
+        await tracker.start_item("game_1")
+        await tracker.complete_item("game_1", response_time_ms=120)
+
+        repo.increment_attempts.assert_not_called()
+        repo.mark_success.assert_not_called()
+        assert tracker.pending_writes == 1
+
+        assert await tracker.flush() == 1
+        repo.apply_updates.assert_called_once_with(
+            [
+                ProgressUpdate(
+                    1, status="success", attempts_added=1, response_time_ms=120
+                )
+            ]
+        )
+        assert tracker.pending_writes == 0
+
+    @pytest.mark.asyncio
+    async def test_flushes_at_size_threshold(self) -> None:
+        """Test that a full buffer is flushed in one batch."""
+        repo = create_mock_repo()
+        tracker = ProgressTracker(repo, source_id=1, write_behind=True, flush_size=3)
+        await tracker.register_items(["a", "b", "c", "d"])
+
+        for key in ("a", "b", "c"):
+            await tracker.start_item(key)
+
+        repo.apply_updates.assert_called_once()
+        assert len(repo.apply_updates.call_args.args[0]) == 3
+
+        await tracker.start_item("d")
+        assert tracker.pending_writes == 1
+
+    @pytest.mark.asyncio
+    async def test_flushes_at_time_threshold(self) -> None:
+        """Test that a flush happens once the interval has passed."""
+        repo = create_mock_repo()
+        tracker = ProgressTracker(
+            repo, source_id=1, write_behind=True, flush_interval=0.0
+        )
+        await tracker.register_item("game_1")
+
+        await tracker.start_item("game_1")
+
+        repo.apply_updates.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_idle_tracker_flushes_after_interval(self) -> None:
+        """Test that buffered updates are flushed without further calls."""
+        repo = create_mock_repo()
+        tracker = ProgressTracker(
+            repo, source_id=1, write_behind=True, flush_interval=0.05
+        )
+        await tracker.register_item("game_1")
+        await tracker.start_item("game_1")
+        repo.apply_updates.assert_not_called()
+
+        await asyncio.sleep(0.15)
+
+        repo.apply_updates.assert_called_once()
+        assert tracker.pending_writes == 0
+        await tracker.close()
+
+    @pytest.mark.asyncio
+    async def test_context_exit_flushes(self) -> None:
+        """Test that leaving the context writes buffered updates."""
+        repo = create_mock_repo()
+        async with ProgressTracker(repo, source_id=1, write_behind=True) as tracker:
+            await tracker.register_item("game_1")
+            await tracker.skip_item("game_1", "exists")
+
+        repo.apply_updates.assert_called_once_with(
+            [ProgressUpdate(1, status="skipped", error_message="exists")]
+        )
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_updates(self) -> None:
+        """Test that a failed flush is retried with merged updates."""
+        repo = create_mock_repo()
+        repo.apply_updates = AsyncMock(side_effect=[OSError("db down"), 1])
+        tracker = ProgressTracker(repo, source_id=1, write_behind=True)
+        await tracker.register_item("game_1")
+        await tracker.start_item("game_1")
+        await tracker.fail_item("game_1", "timeout")
+
+        with pytest.raises(OSError):
+            await tracker.flush()
+        assert tracker.pending_writes == 1
+
+        await tracker.start_item("game_1")
+        await tracker.flush()
+
+        assert repo.apply_updates.call_args.args[0] == [
+            ProgressUpdate(
+                1, status="failed", attempts_added=2, error_message="timeout"
+            )
+        ]
+
+    @pytest.mark.asyncio
+    async def test_reset_failed_flushes_first(self) -> None:
+        """Test that buffered failures are written before a reset."""
+        repo = create_mock_repo()
+        calls: list[str] = []
+        repo.apply_updates = AsyncMock(side_effect=lambda u: calls.append("apply"))
+        repo.reset_failed = AsyncMock(side_effect=lambda *a: calls.append("reset") or 1)
+        tracker = ProgressTracker(repo, source_id=1, write_behind=True)
+        await tracker.register_item("game_1")
+        await tracker.start_item("game_1")
+        await tracker.fail_item("game_1", "timeout")
+
+        await tracker.reset_failed()
+
+        assert calls == ["apply", "reset"]
@@ -8,8 +8,12 @@ import time
 import pytest
 
 from nhl_api.downloaders.base.rate_limiter import (
+    AdaptiveRateConfig,
     RateLimiter,
     TokenBucket,
+    clear_shared_rate_limiters,
+    shared_rate_limiter,
+    shared_rate_stats,
 )
 
 
@@ -374,3 +378,135 @@ class TestTokenBucketEdgeCases:
 
         # Need 1 token at 0.1/sec = 10 seconds
         assert wait_time == pytest.approx(10.0, abs=0.1)
+
+
+class TestAdaptiveRateLimiter:
+    """Tests for adaptive (AIMD) rate limiting."""
+
+    def test_healthy_responses_raise_rate(self) -> None:
+        """About one second of healthy requests adds additive_increase."""
+        limiter = RateLimiter(
+            requests_per_second=4.0,
+            adaptive=AdaptiveRateConfig(additive_increase=1.0),
+        )
+
+        for _ in range(4):
+            limiter.record_response(latency=0.1)
+
+        rate = limiter.get_stats().requests_per_second
+        assert 4.9 < rate < 5.0
+
+    def test_rate_capped_at_max(self) -> None:
+        """The rate never exceeds max_rate."""
+        limiter = RateLimiter(
+            requests_per_second=4.0,
+            adaptive=AdaptiveRateConfig(max_rate=4.5, additive_increase=10.0),
+        )
+
+        for _ in range(10):
+            limiter.record_response()
+
+        assert limiter.get_stats().requests_per_second == 4.5
+
+    def test_throttle_cuts_rate_once_per_cooldown(self) -> None:
+        """A burst of 429s halves the rate only once."""
+        limiter = RateLimiter(
+            requests_per_second=8.0,
+            adaptive=AdaptiveRateConfig(decrease_cooldown=60.0),
+        )
+
+        for _ in range(3):
+            limiter.record_response(throttled=True)
+
+        stats = limiter.get_stats()
+        assert stats.requests_per_second == 4.0
+        assert stats.throttled == 3
+
+    def test_rate_floor(self) -> None:
+        """The rate never drops below min_rate."""
+        limiter = RateLimiter(
+            requests_per_second=1.0,
+            adaptive=AdaptiveRateConfig(min_rate=0.8, decrease_cooldown=0.0),
+        )
+
+        for _ in range(5):
+            limiter.record_response(throttled=True)
+
+        assert limiter.get_stats().requests_per_second == 0.8
+
+    def test_retry_after_pauses_bucket(self) -> None:
+        """Retry-After holds back the next request for that long."""
+        limiter = RateLimiter(requests_per_second=10.0, adaptive=AdaptiveRateConfig())
+
+        limiter.record_response(retry_after=2.0)
+
+        assert limiter._global_bucket.time_until_available() >= 1.9
+
+    def test_non_adaptive_tracks_stats_only(self) -> None:
+        """Without adaptive config the rate is fixed but latency is tracked."""
+        limiter = RateLimiter(requests_per_second=5.0, per_domain=True)
+
+        limiter.record_response("https://a.com/x", latency=0.1)
+        limiter.record_response("https://a.com/y", latency=0.3, throttled=True)
+
+        stats = limiter.get_stats("a.com")
+        assert stats.requests_per_second == 5.0
+        assert stats.requests == 2
+        assert stats.throttled == 1
+        assert stats.latency_ms == pytest.approx(140.0)
+        assert limiter.get_stats("b.com").requests == 0
+
+    def test_invalid_config(self) -> None:
+        """Invalid AIMD settings are rejected."""
+        with pytest.raises(ValueError):
+            AdaptiveRateConfig(multiplicative_decrease=1.5)
+        with pytest.raises(ValueError):
+            AdaptiveRateConfig(min_rate=2.0, max_rate=1.0)
+
+
+class TestSharedRateLimiter:
+    """Tests for process-wide shared limiters."""
+
+    def setup_method(self) -> None:
+        """Start each test without shared limiters."""
+        clear_shared_rate_limiters()
+
+    def teardown_method(self) -> None:
+        """Do not leak shared limiters into other tests."""
+        clear_shared_rate_limiters()
+
+    def test_same_domain_shares_limiter(self) -> None:
+        """Downloaders hitting one host get one limiter."""
+        first = shared_rate_limiter("https://api-web.nhle.com/v1", 5.0)
+        second = shared_rate_limiter("https://api-web.nhle.com/v1/schedule", 9.0)
+        other = shared_rate_limiter("https://api.nhle.com/stats/rest", 5.0)
+
+        assert first is second
+        assert first is not other
+        assert first.requests_per_second == 5.0
+        assert first.adaptive is not None
+
+    def test_shared_limiter_survives_event_loops(self) -> None:
+        """A shared limiter works under each asyncio.run() that uses it."""
+        limiter = shared_rate_limiter("https://api-web.nhle.com/v1", 1000.0)
+
+        async def contend() -> None:
+            # A waiter queued on a held lock binds the lock to this loop
+            async with limiter._lock:
+                waiter = asyncio.create_task(limiter.wait())
+                await asyncio.sleep(0)
+            await waiter
+
+        asyncio.run(contend())
+        asyncio.run(contend())
+
+    def test_stats_by_domain(self) -> None:
+        """Shared stats are keyed by domain."""
+        shared_rate_limiter("https://api-web.nhle.com/v1", 5.0).record_response(
+            throttled=True
+        )
+
+        stats = shared_rate_stats()
+
+        assert list(stats) == ["api-web.nhle.com"]
+        assert stats["api-web.nhle.com"].requests_per_second == 2.5
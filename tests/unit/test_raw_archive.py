@@ -0,0 +1,68 @@
+"""Tests for the raw response archive."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from nhl_api.downloaders.base.raw_archive import RawResponseArchive
+from nhl_api.utils.http_client import ContentType, HTTPResponse
+
+
+def _response(body: bytes) -> HTTPResponse:
+    return HTTPResponse(
+        status=200,
+        headers={"Content-Type": "application/json"},
+        content=body,
+        url="https://api-web.nhle.com/v1/standings/2024-11-01",
+        content_type=ContentType.JSON,
+    )
+
+
+class TestRawResponseArchive:
+    """Tests for RawResponseArchive."""
+
+    def test_round_trip_preserves_bytes(self, tmp_path: Path) -> None:
+        """Replayed responses match the recorded ones exactly."""
+        archive = RawResponseArchive(tmp_path, "nhl_json_standings")
+        body = b'{"standings": []}\n\x00trailing'
+        archive.record("https://x/standings", None, _response(body))
+
+        replayed = archive.replay("https://x/standings")
+
+        assert replayed == _response(body)
+        assert archive.path == tmp_path / "nhl_json_standings.pack"
+
+    def test_params_are_part_of_key(self, tmp_path: Path) -> None:
+        """Query parameters select distinct entries regardless of order."""
+        archive = RawResponseArchive(tmp_path, "src")
+        archive.record("https://x/a", {"b": "2", "a": "1"}, _response(b"one"))
+
+        assert archive.replay("https://x/a", {"a": "1", "b": "2"}) is not None
+        assert archive.replay("https://x/a") is None
+        assert archive.replay("https://x/a", {"a": "9", "b": "2"}) is None
+
+    def test_reopen_and_overwrite(self, tmp_path: Path) -> None:
+        """A later recording of the same request supersedes the first."""
+        archive = RawResponseArchive(tmp_path, "src")
+        archive.record("https://x/a", None, _response(b"old"))
+        archive.record("https://x/a", None, _response(b"new"))
+        archive.close()
+
+        reopened = RawResponseArchive(tmp_path, "src")
+        replayed = reopened.replay("https://x/a")
+
+        assert replayed is not None
+        assert replayed.content == b"new"
+        assert len(reopened) == 1
+
+    def test_rerecording_unchanged_response_does_not_grow(self, tmp_path: Path) -> None:
+        """Re-downloads with the same body only differ in headers; skip them."""
+        archive = RawResponseArchive(tmp_path, "src")
+        archive.record("https://x/a", None, _response(b"same"))
+        size = archive.path.stat().st_size
+
+        rerun = _response(b"same")
+        rerun.headers["Date"] = "Fri, 16 Oct 2026 21:00:00 GMT"
+        archive.record("https://x/a", None, rerun)
+
+        assert archive.path.stat().st_size == size
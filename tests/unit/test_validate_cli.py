@@ -0,0 +1,168 @@
+"""Unit tests for season reconciliation in the validate CLI."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from nhl_api.cli.validate import (
+    ReconciliationResult,
+    _JsonResultsWriter,
+    _reconcile_season,
+    generate_report,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+SEASON = 20242025
+
+# game_id -> (home_score, away_score, pbp home goals, pbp away goals, html)
+GAMES: dict[int, tuple[int, int, int, int, tuple[int, int] | None]] = {
+    2024020001: (3, 2, 3, 2, (3, 2)),
+    2024020002: (4, 1, 4, 0, (4, 1)),
+    2024020003: (2, 5, 2, 5, None),
+    2024020004: (1, 0, 1, 0, (2, 0)),
+}
+
+
+class FakeDB:
+    """Answers the per-game and bulk reconciliation queries from GAMES."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.queries: list[str] = []
+
+    async def _enter(self, query: str) -> None:
+        self.queries.append(query)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+
+    async def fetchval(self, query: str, *args: Any) -> Any:
+        await self._enter(query)
+        return SEASON
+
+    async def fetch(self, query: str, *args: Any) -> list[dict[str, Any]]:
+        await self._enter(query)
+        if "html_game_summary" in query:
+            return [
+                {"game_id": gid, "home_goals": g[4][0], "away_goals": g[4][1]}
+                for gid, g in GAMES.items()
+                if g[4]
+            ]
+        if "GROUP BY" in query:
+            return [
+                {
+                    "game_id": gid,
+                    "season_id": SEASON,
+                    "home_score": g[0],
+                    "away_score": g[1],
+                    "home_goals": g[2],
+                    "away_goals": g[3],
+                }
+                for gid, g in GAMES.items()
+            ]
+        return [{"game_id": gid} for gid in GAMES]
+
+    async def fetchrow(self, query: str, *args: Any) -> dict[str, Any] | None:
+        await self._enter(query)
+        game = GAMES[args[0]]
+        if "FROM games" in query and "game_events" not in query:
+            return {
+                "game_id": args[0],
+                "season_id": SEASON,
+                "home_score": game[0],
+                "away_score": game[1],
+            }
+        if "game_events" in query:
+            return {"home_goals": game[2], "away_goals": game[3]}
+        html = game[4]
+        return {"home_goals": html[0], "away_goals": html[1]} if html else None
+
+
+def _as_tuples(results: list[ReconciliationResult]) -> list[tuple[Any, ...]]:
+    return [
+        (r.game_id, r.passed, r.html_home_goals, tuple(r.discrepancies))
+        for r in results
+    ]
+
+
+@pytest.mark.asyncio
+class TestReconcileSeason:
+    """Serial, concurrent and prefetched season reconciliation."""
+
+    async def test_serial_summary(self) -> None:
+        seen: list[ReconciliationResult] = []
+        summary = await _reconcile_season(FakeDB(), str(SEASON), on_result=seen.append)
+
+        assert summary.total_games == 4
+        assert summary.reconciled_games == 2
+        assert [r.game_id for r in summary.failed_results] == [2024020002, 2024020004]
+        assert summary.total_goals == 17
+        assert summary.source_accuracy["html_game_summary"]["total_games"] == 3
+        assert [r.game_id for r in seen] == sorted(GAMES)
+
+    async def test_concurrent_matches_serial_in_order(self) -> None:
+        serial: list[ReconciliationResult] = []
+        await _reconcile_season(FakeDB(), str(SEASON), on_result=serial.append)
+
+        db = FakeDB(delay=0.01)
+        concurrent: list[ReconciliationResult] = []
+        summary = await _reconcile_season(
+            db, str(SEASON), workers=3, on_result=concurrent.append
+        )
+
+        assert _as_tuples(concurrent) == _as_tuples(serial)
+        assert summary.failed_games == 2
+        assert 1 < db.max_in_flight <= 3
+
+    async def test_prefetch_uses_bulk_queries(self) -> None:
+        serial: list[ReconciliationResult] = []
+        await _reconcile_season(FakeDB(), str(SEASON), on_result=serial.append)
+
+        db = FakeDB()
+        prefetched: list[ReconciliationResult] = []
+        summary = await _reconcile_season(
+            db, str(SEASON), prefetch=True, on_result=prefetched.append
+        )
+
+        assert _as_tuples(prefetched) == _as_tuples(serial)
+        assert summary.reconciled_games == 2
+        # Season lookup plus one bulk query per source
+        assert len(db.queries) == 3
+
+
+@pytest.mark.asyncio
+async def test_streamed_json_report(tmp_path: Path) -> None:
+    """Results streamed through the writer form the JSON report."""
+    path = tmp_path / "report.json"
+    writer = _JsonResultsWriter(path)
+    summary = await _reconcile_season(
+        FakeDB(), str(SEASON), on_result=writer.write_result
+    )
+    writer.close(summary)
+
+    data = json.loads(path.read_text())
+    assert [r["game_id"] for r in data["results"]] == sorted(GAMES)
+    assert data["results"][1]["discrepancies"] == [
+        "Away goals mismatch: JSON=0, HTML=1",
+        "Away goals vs record: JSON=0, Record=1",
+    ]
+    assert data["failed_games"] == 2
+    assert data["common_discrepancies"]["Away goals mismatch"] == 1
+    assert "Game 2024020004:" in generate_report(summary)
+
+
+def test_writer_closes_without_summary(tmp_path: Path) -> None:
+    """An interrupted run still leaves valid JSON."""
+    path = tmp_path / "report.json"
+    _JsonResultsWriter(path).close()
+
+    assert json.loads(path.read_text()) == {"results": []}
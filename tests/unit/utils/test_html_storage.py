@@ -4,7 +4,10 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from nhl_api.utils.html_storage import HTMLStorageManager
+import pytest
+
+from nhl_api.utils.html_storage import HTMLStorageManager, migrate_html_directory
+from nhl_api.utils.pack_archive import PackArchive
 
 
 class TestHTMLStorageManagerInit:
@@ -317,3 +320,87 @@ class TestHTMLStorageManagerEdgeCases:
         loaded = manager.load_html("20242025", "ES", 2024020001)
 
         assert loaded == ""
+
+
+class TestHTMLStorageManagerArchiveBackend:
+    """Tests for the archive storage backend."""
+
+    def test_invalid_backend(self) -> None:
+        """Unknown backends are rejected."""
+        with pytest.raises(ValueError, match="backend"):
+            HTMLStorageManager(backend="s3")
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """save_html/load_html keep their API with the archive backend."""
+        manager = HTMLStorageManager(base_dir=tmp_path, backend="archive")
+        path = manager.save_html("20242025", "GS", 2024020001, "<html>é</html>")
+
+        assert path == tmp_path / "20242025" / "GS.pack"
+        assert manager.exists("20242025", "GS", 2024020001)
+        assert manager.load_html("20242025", "GS", 2024020001) == "<html>é</html>"
+        assert manager.load_html("20242025", "GS", 2024020002) is None
+
+    def test_delete(self, tmp_path: Path) -> None:
+        """Deleted reports are no longer listed or loaded."""
+        manager = HTMLStorageManager(base_dir=tmp_path, backend="archive")
+        manager.save_html("20242025", "ES", 2024020001, b"<html></html>")
+
+        assert manager.delete("20242025", "ES", 2024020001)
+        assert not manager.delete("20242025", "ES", 2024020001)
+        assert manager.list_reports() == []
+
+    def test_list_and_iterate(self, tmp_path: Path) -> None:
+        """Reports are listed and iterated from the archives."""
+        manager = HTMLStorageManager(base_dir=tmp_path, backend="archive")
+        manager.save_html("20242025", "GS", 2024020002, "b")
+        manager.save_html("20242025", "GS", 2024020001, "a")
+        manager.save_html("20232024", "ES", 2023020001, "c")
+
+        assert manager.list_reports() == [
+            ("20232024", "ES", 2023020001),
+            ("20242025", "GS", 2024020001),
+            ("20242025", "GS", 2024020002),
+        ]
+        assert manager.list_reports("20242025", "ES") == []
+        assert list(manager.iter_reports("20242025", "GS")) == [
+            (2024020001, "a"),
+            (2024020002, "b"),
+        ]
+        manager.close()
+
+    def test_iter_reports_files_backend(self, tmp_path: Path) -> None:
+        """iter_reports also works with per-file storage."""
+        manager = HTMLStorageManager(base_dir=tmp_path)
+        manager.save_html("20242025", "GS", 2024020001, "a")
+
+        assert list(manager.iter_reports("20242025", "GS")) == [(2024020001, "a")]
+
+
+class TestMigrateHTMLDirectory:
+    """Tests for migrate_html_directory."""
+
+    def _write(self, base: Path, season: str, report: str, game_id: int) -> None:
+        path = base / season / report / f"{game_id:010d}.HTM"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(f"<html>{report}{game_id}</html>".encode())
+
+    def test_migrates_and_is_rerunnable(self, tmp_path: Path) -> None:
+        """Files are packed once; a second run adds nothing."""
+        self._write(tmp_path, "20242025", "GS", 2024020001)
+        self._write(tmp_path, "20242025", "GS", 2024020002)
+        self._write(tmp_path, "20242025", "ES", 2024020001)
+
+        assert migrate_html_directory(tmp_path) == 3
+        assert migrate_html_directory(tmp_path) == 0
+
+        archive = PackArchive(tmp_path / "20242025" / "GS.pack")
+        assert archive.load(2024020002) == b"<html>GS2024020002</html>"
+
+    def test_remove_files(self, tmp_path: Path) -> None:
+        """Archived files and emptied directories are removed."""
+        self._write(tmp_path, "20242025", "PL", 2024020001)
+
+        migrate_html_directory(tmp_path, "20242025", remove_files=True)
+
+        assert not (tmp_path / "20242025" / "PL").exists()
+        assert (tmp_path / "20242025" / "PL.pack").exists()
@@ -0,0 +1,116 @@
+"""Unit tests for the pack archive."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from nhl_api.utils.pack_archive import (
+    ARCHIVE_MAGIC,
+    PackArchive,
+    PackArchiveError,
+)
+
+
+class TestPackArchive:
+    """Tests for PackArchive."""
+
+    def test_save_and_load(self, tmp_path: Path) -> None:
+        """Saved HTML is read back unchanged."""
+        archive = PackArchive(tmp_path / "GS.pack")
+        archive.save(2024020001, b"<html>one</html>")
+        archive.save(2024020002, b"<html>two</html>")
+
+        assert archive.load(2024020001) == b"<html>one</html>"
+        assert archive.load(2024020002) == b"<html>two</html>"
+        assert archive.load(2024020003) is None
+        assert len(archive) == 2
+
+    def test_entries_are_compressed(self, tmp_path: Path) -> None:
+        """Repetitive HTML takes far less space than its raw size."""
+        html = b"<tr><td>72 T.THOMPSON</td></tr>" * 2000
+        archive = PackArchive(tmp_path / "PL.pack")
+        archive.save(2024020001, html)
+        archive.close()
+
+        assert archive.path.stat().st_size < len(html) // 10
+
+    def test_resave_supersedes_and_delete_hides(self, tmp_path: Path) -> None:
+        """Later entries win and tombstones remove games."""
+        archive = PackArchive(tmp_path / "ES.pack")
+        archive.save(2024020001, b"old")
+        archive.save(2024020001, b"new")
+        archive.save(2024020002, b"gone")
+
+        assert archive.delete(2024020002)
+        assert not archive.delete(2024020002)
+        assert archive.load(2024020001) == b"new"
+        assert 2024020002 not in archive
+
+    def test_reopen_rebuilds_index(self, tmp_path: Path) -> None:
+        """A new instance sees the entries written by an earlier one."""
+        path = tmp_path / "RO.pack"
+        writer = PackArchive(path)
+        writer.save(2024020002, b"b")
+        writer.save(2024020001, b"a")
+        writer.close()
+
+        reader = PackArchive(path)
+        assert list(reader.iter_entries()) == [(2024020001, b"a"), (2024020002, b"b")]
+
+    def test_compact_drops_superseded_entries(self, tmp_path: Path) -> None:
+        """Compaction keeps live entries and shrinks the file."""
+        archive = PackArchive(tmp_path / "SS.pack")
+        for i in range(5):
+            archive.save(2024020001, f"<html>{i}</html>".encode() * 50)
+        archive.save(2024020002, b"keep")
+        archive.close()
+        before = archive.path.stat().st_size
+
+        archive.compact()
+
+        assert archive.path.stat().st_size < before
+        assert archive.keys() == [2024020001, 2024020002]
+        assert archive.load(2024020001) == b"<html>4</html>" * 50
+
+    def test_truncated_tail_is_ignored(self, tmp_path: Path) -> None:
+        """A partially written last entry does not break reads."""
+        archive = PackArchive(tmp_path / "FS.pack")
+        archive.save(2024020001, b"complete")
+        archive.close()
+        with archive.path.open("ab") as f:
+            f.write(b"\x01\x02\x03")
+
+        reopened = PackArchive(archive.path)
+        assert reopened.keys() == [2024020001]
+
+        reopened.save(2024020002, b"after")
+        assert PackArchive(archive.path).load(2024020002) == b"after"
+
+    def test_rejects_foreign_file(self, tmp_path: Path) -> None:
+        """Files without the archive header are rejected."""
+        path = tmp_path / "GS.pack"
+        path.write_bytes(b"not an archive")
+
+        with pytest.raises(PackArchiveError):
+            PackArchive(path).keys()
+
+    def test_unchanged_payload_is_not_appended(self, tmp_path: Path) -> None:
+        """Re-saving identical bytes leaves the file as it was."""
+        archive = PackArchive(tmp_path / "GS.pack")
+        assert archive.save(2024020001, b"<html>same</html>")
+        size = archive.path.stat().st_size
+
+        assert not archive.save(2024020001, b"<html>same</html>")
+        assert archive.path.stat().st_size == size
+        assert archive.save(2024020001, b"<html>changed</html>")
+        assert archive.path.stat().st_size > size
+
+    def test_new_file_has_magic(self, tmp_path: Path) -> None:
+        """Archives start with the format marker."""
+        archive = PackArchive(tmp_path / "nested" / "GS.pack")
+        archive.save(1, b"x")
+        archive.close()
+
+        assert archive.path.read_bytes().startswith(ARCHIVE_MAGIC)
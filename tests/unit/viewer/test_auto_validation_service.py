@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import asyncio
+import json
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -14,6 +17,8 @@ from nhl_api.viewer.services.auto_validation_service import (
     get_auto_validation_service,
 )
 
+MODULE = "nhl_api.viewer.services.auto_validation_service"
+
 
 @pytest.fixture
 def service() -> AutoValidationService:
@@ -212,6 +217,22 @@ class TestQueueValidation:
             item = await asyncio.wait_for(service._queue.get(), timeout=1.0)
             assert item.validator_types == ["json_cross_source"]
 
+    @pytest.mark.asyncio
+    async def test_queue_validation_coalesces_duplicates(
+        self, service: AutoValidationService, mock_db: MagicMock
+    ) -> None:
+        """A game already waiting is merged instead of queued twice."""
+        with patch(f"{MODULE}.VALIDATION_AUTO_RUN", True):
+            await service.queue_validation(mock_db, 2024020001, 20242025)
+            await service.queue_validation(
+                mock_db, 2024020001, 20242025, ["json_vs_html"]
+            )
+
+        assert service._queue.qsize() == 1
+        item = service._queue.get_nowait()
+        assert item.validator_types == ["json_cross_source", "json_vs_html"]
+        assert service.get_stats().coalesced == 1
+
 
 # =============================================================================
 # Pending Games Tests
@@ -273,38 +294,58 @@ class TestServiceLifecycle:
 
     @pytest.mark.asyncio
     async def test_start_creates_worker(self, service: AutoValidationService) -> None:
-        """start should create worker task."""
-        assert service._worker_task is None
+        """start should create the worker pool."""
+        assert service._worker_tasks == []
         assert service._running is False
 
         await service.start()
 
         assert service._running is True
-        assert service._worker_task is not None
+        assert len(service._worker_tasks) == service.workers
 
         # Cleanup
         await service.stop()
 
     @pytest.mark.asyncio
     async def test_stop_cancels_worker(self, service: AutoValidationService) -> None:
-        """stop should cancel worker task."""
+        """stop should cancel worker tasks."""
         await service.start()
         assert service._running is True
+        tasks = list(service._worker_tasks)
 
         await service.stop()
 
         assert service._running is False
+        assert all(task.done() for task in tasks)
+
+    @pytest.mark.asyncio
+    async def test_stop_requeues_settling_items(
+        self, service: AutoValidationService
+    ) -> None:
+        """Items taken by a worker that is stopped mid-settle stay queued."""
+        service.workers = 1
+        item = ValidationQueueItem(2024020001, 20242025, ["json_cross_source"])
+        service._enqueue(item)
+
+        with patch(f"{MODULE}.VALIDATION_DELAY_SECONDS", 60):
+            await service.start()
+            await asyncio.sleep(0.01)
+            assert service._queue.empty()
+            await service.stop()
+
+        assert service._queue.get_nowait() is item
+        assert service._pending[item.game_id] is item
 
     @pytest.mark.asyncio
     async def test_start_idempotent(self, service: AutoValidationService) -> None:
-        """Multiple starts should not create multiple workers."""
+        """Multiple starts should not create more workers."""
         await service.start()
-        task1 = service._worker_task
+        tasks1 = list(service._worker_tasks)
 
         await service.start()
-        task2 = service._worker_task
+        tasks2 = list(service._worker_tasks)
 
-        assert task1 is task2
+        assert tasks1 == tasks2
 
         # Cleanup
         await service.stop()
@@ -319,27 +360,168 @@ class TestGetOrCreateRule:
     """Test rule lookup/creation."""
 
     @pytest.mark.asyncio
-    async def test_returns_existing_rule_id(
+    async def test_upserts_rule(
         self, service: AutoValidationService, mock_db: MagicMock
     ) -> None:
-        """Should return existing rule_id if found."""
+        """Should get or create the rule in a single upsert."""
         mock_db.fetchval = AsyncMock(return_value=42)
 
         rule_id = await service._get_or_create_rule(mock_db, "test_rule", "cross_file")
 
         assert rule_id == 42
-        # Should only call fetchval once (not insert)
-        assert mock_db.fetchval.call_count == 1
+        mock_db.fetchval.assert_awaited_once()
+        query = mock_db.fetchval.await_args.args[0]
+        assert "ON CONFLICT (name)" in query
+        assert "RETURNING rule_id" in query
+
+
+# =============================================================================
+# Worker Pool Tests
+# =============================================================================
+
+
+def _batch_db() -> MagicMock:
+    """Mock DB that returns one run per inserted game and no source data."""
+    db = MagicMock()
+    db.fetchval = AsyncMock(return_value=7)
+    db.execute = AsyncMock(return_value="OK")
+
+    async def fetch(query: str, *args: object) -> list[dict[str, object]]:
+        game_ids = args[0] if args and isinstance(args[0], list) else []
+        if 2024020001 not in game_ids:
+            return []
+        if "FROM game_skater_stats" in query:
+            return [{"game_id": 2024020001, "home_goals": 3, "away_goals": 2}]
+        if "FROM games g" in query:
+            return [{"game_id": 2024020001, "home_goals": 3, "away_goals": 1}]
+        return []
+
+    async def insert_runs(query: str, *args: object) -> list[dict[str, object]]:
+        metadata = args[5]
+        assert isinstance(metadata, list)
+        return [
+            {"run_id": 100 + i, "game_id": json.loads(m)["game_id"]}
+            for i, m in enumerate(metadata)
+        ]
+
+    db.fetch = AsyncMock(side_effect=fetch)
+    db.conn = MagicMock()
+    db.conn.fetch = AsyncMock(side_effect=insert_runs)
+    db.conn.execute = AsyncMock(return_value="OK")
+
+    @asynccontextmanager
+    async def transaction() -> AsyncIterator[MagicMock]:
+        yield db.conn
+
+    db.transaction = transaction
+    return db
+
+
+class TestWorkerPool:
+    """Test batched validation by the worker pool."""
 
     @pytest.mark.asyncio
-    async def test_creates_rule_if_not_exists(
-        self, service: AutoValidationService, mock_db: MagicMock
+    async def test_run_batch_uses_set_based_queries(
+        self, service: AutoValidationService
+    ) -> None:
+        """A batch of games costs the same number of queries as one game."""
+        db = _batch_db()
+        items = [
+            ValidationQueueItem(game_id, 20242025, ["json_cross_source"])
+            for game_id in (2024020001, 2024020002, 2024020003)
+        ]
+
+        await service._run_batch(db, items)
+
+        # Boxscore + PBP + shifts
+        assert db.fetch.await_count == 3
+        # Run insert + results insert, both in the batch transaction
+        db.conn.fetch.assert_awaited_once()
+        run_args = db.conn.fetch.await_args.args
+        assert run_args[2:4] == ([2, 0, 0], [1, 0, 0])  # rules checked, passed
+        db.conn.execute.assert_awaited_once()
+        results_args = db.conn.execute.await_args.args
+        assert results_args[1] == [100, 100]  # run_id column
+        assert results_args[3] == [2024020001, 2024020001]  # game_id column
+        assert results_args[5] == [True, False]  # home matches, away does not
+        db.execute.assert_not_called()
+        # Rule IDs are looked up once each and then cached
+        assert db.fetchval.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_run_batch_records_failed_runs(
+        self, service: AutoValidationService
     ) -> None:
-        """Should create rule if not found."""
-        # First call returns None (not found), second returns new ID
-        mock_db.fetchval = AsyncMock(side_effect=[None, 99])
+        """A failed batch writes no results, only failed run records."""
+        db = _batch_db()
+        db.fetch = AsyncMock(side_effect=RuntimeError("db down"))
+        items = [
+            ValidationQueueItem(game_id, 20242025, ["json_cross_source"])
+            for game_id in (2024020001, 2024020002)
+        ]
+
+        with pytest.raises(RuntimeError, match="db down"):
+            await service._run_batch(db, items)
+
+        db.conn.fetch.assert_not_called()
+        db.conn.execute.assert_not_called()
+        failed_args = db.execute.await_args.args
+        assert "'failed'" in failed_args[0]
+        assert failed_args[1] == [20242025, 20242025]
+        assert json.loads(failed_args[4]) == {"error": "db down"}
 
-        rule_id = await service._get_or_create_rule(mock_db, "new_rule", "internal")
+    @pytest.mark.asyncio
+    async def test_workers_share_db_and_report_stats(
+        self, service: AutoValidationService
+    ) -> None:
+        """Workers reuse the given pool and record throughput and latency."""
+        db = _batch_db()
+        with (
+            patch(f"{MODULE}.VALIDATION_AUTO_RUN", True),
+            patch(f"{MODULE}.VALIDATION_DELAY_SECONDS", 0),
+            patch("nhl_api.services.db.DatabaseService") as db_cls,
+        ):
+            await service.start(db)
+            for game_id in range(2024020001, 2024020011):
+                await service.queue_validation(db, game_id, 20242025)
+            await asyncio.wait_for(service._queue.join(), timeout=5.0)
+            await service.stop()
+
+        db_cls.assert_not_called()
+        stats = service.get_stats()
+        assert stats.completed == 10
+        assert stats.failed == 0
+        assert stats.queue_depth == 0
+        assert stats.games_per_second > 0
+        assert stats.avg_latency_seconds is not None
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_retried_per_game(
+        self, service: AutoValidationService
+    ) -> None:
+        """One bad game does not fail the rest of its batch."""
+        service._db = MagicMock()
+        items = [
+            ValidationQueueItem(game_id, 20242025, ["json_cross_source"])
+            for game_id in (1, 2, 3)
+        ]
+        for item in items:
+            service._queue.put_nowait(item)
+            service._queue.get_nowait()
+
+        async def run_batch(db: MagicMock, batch: list[ValidationQueueItem]) -> None:
+            if any(item.game_id == 2 for item in batch):
+                raise RuntimeError("bad game")
+
+        loop = asyncio.get_running_loop()
+        with (
+            patch.object(service, "_run_batch", side_effect=run_batch),
+            patch.object(loop, "call_later") as call_later,
+        ):
+            await service._process_batch(items)
 
-        assert rule_id == 99
-        assert mock_db.fetchval.call_count == 2
+        stats = service.get_stats()
+        assert stats.completed == 2
+        # The bad game is queued again after a backoff, without a worker waiting
+        call_later.assert_called_once_with(5, service._enqueue, items[1])
+        assert items[1].attempts == 1
@@ -0,0 +1,135 @@
+"""Tests for download service helpers."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from nhl_api.viewer.services.download_service import StreamingPersister
+
+
+def _mock_db() -> MagicMock:
+    db = MagicMock()
+    db.execute = AsyncMock()
+    return db
+
+
+class TestStreamingPersister:
+    """Tests for StreamingPersister micro-batching."""
+
+    @pytest.mark.asyncio
+    async def test_flushes_in_micro_batches(self) -> None:
+        """Results are persisted every max_items, with counters per batch."""
+        db = _mock_db()
+        batches: list[list[Any]] = []
+
+        async def persist(results: list[Any]) -> int:
+            batches.append(results)
+            return len(results) * 10
+
+        async with StreamingPersister(db, 7, persist, max_items=2) as persister:
+            for game in range(5):
+                await persister.add_success({"game": game})
+            await persister.add_failure()
+
+        assert [len(b) for b in batches] == [2, 2, 1]
+        assert persister.success_count == 5
+        assert persister.persisted_count == 50
+        counters = [call.args[1:] for call in db.execute.call_args_list]
+        assert counters == [(2, 0, 7), (2, 0, 7), (1, 1, 7)]
+
+    @pytest.mark.asyncio
+    async def test_flushes_on_interval(self) -> None:
+        """A time threshold flushes small batches too."""
+        db = _mock_db()
+        persist = AsyncMock(return_value=1)
+
+        persister = StreamingPersister(db, 1, persist, max_seconds=0.0)
+        await persister.add_success("a")
+        await persister.close()
+
+        persist.assert_awaited_once_with(["a"])
+
+    @pytest.mark.asyncio
+    async def test_at_most_one_write_in_flight(self) -> None:
+        """Buffering continues during a write, but writes never overlap."""
+        db = _mock_db()
+        in_flight = 0
+        peak = 0
+
+        async def persist(results: list[Any]) -> int:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return len(results)
+
+        async with StreamingPersister(db, 1, persist, max_items=1) as persister:
+            for game in range(4):
+                await persister.add_success(game)
+
+        assert peak == 1
+        assert persister.persisted_count == 4
+
+    @pytest.mark.asyncio
+    async def test_write_error_surfaces(self) -> None:
+        """A failed write is raised on the next flush."""
+        db = _mock_db()
+        persist = AsyncMock(side_effect=RuntimeError("db down"))
+
+        persister = StreamingPersister(db, 1, persist, max_items=1)
+        await persister.add_success("a")
+
+        with pytest.raises(RuntimeError, match="db down"):
+            await persister.add_success("b")
+
+    @pytest.mark.asyncio
+    async def test_error_exit_skips_buffered_results(self) -> None:
+        """On error only the in-flight write completes."""
+        db = _mock_db()
+        persist = AsyncMock(return_value=1)
+
+        with pytest.raises(RuntimeError):
+            async with StreamingPersister(db, 1, persist, max_items=2) as persister:
+                await persister.add_success("a")
+                await persister.add_success("b")
+                await persister.add_success("c")
+                raise RuntimeError("download failed")
+
+        persist.assert_awaited_once_with(["a", "b"])
+
+    @pytest.mark.asyncio
+    async def test_cancelled_download_stops_writer(self) -> None:
+        """Cancelling the download cancels and awaits the in-flight write."""
+        db = _mock_db()
+        started = asyncio.Event()
+        write_cancelled = False
+
+        async def persist(results: list[Any]) -> int:
+            nonlocal write_cancelled
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                write_cancelled = True
+                raise
+            return len(results)
+
+        async def download() -> None:
+            async with StreamingPersister(db, 1, persist, max_items=1) as persister:
+                await persister.add_success("a")
+                await asyncio.sleep(10)
+
+        task = asyncio.create_task(download())
+        await started.wait()
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert write_cancelled
+        assert asyncio.all_tasks() == {asyncio.current_task()}
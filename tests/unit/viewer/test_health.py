@@ -6,6 +6,12 @@ from unittest.mock import AsyncMock, MagicMock
 
 from fastapi.testclient import TestClient
 
+from nhl_api.downloaders.base.rate_limiter import (
+    clear_shared_rate_limiters,
+    shared_rate_limiter,
+)
+from nhl_api.viewer.services.auto_validation_service import AutoValidationService
+
 
 class TestHealthEndpoint:
     """Tests for /health endpoint."""
@@ -94,3 +100,44 @@ class TestReadinessProbe:
         response = test_client.get("/health/ready")
 
         assert response.status_code == 503
+
+
+class TestRateLimitsEndpoint:
+    """Tests for /health/rate-limits endpoint."""
+
+    def test_reports_shared_limiters(self, test_client: TestClient) -> None:
+        """Test that each shared limiter's rate and latency is reported."""
+        clear_shared_rate_limiters()
+        try:
+            limiter = shared_rate_limiter("https://api-web.nhle.com/v1", 5.0)
+            limiter.record_response(latency=0.25)
+
+            response = test_client.get("/health/rate-limits")
+        finally:
+            clear_shared_rate_limiters()
+
+        assert response.status_code == 200
+        [entry] = response.json()
+        assert entry["domain"] == "api-web.nhle.com"
+        assert entry["requests_per_second"] > 5.0
+        assert entry["latency_ms"] == 250.0
+        assert entry["requests"] == 1
+        assert entry["throttled"] == 0
+
+
+class TestValidationQueueEndpoint:
+    """Tests for /health/validation-queue endpoint."""
+
+    def test_reports_worker_pool_stats(self, test_client: TestClient) -> None:
+        """Test that queue depth and counters are reported."""
+        AutoValidationService._instance = AutoValidationService()
+        try:
+            response = test_client.get("/health/validation-queue")
+        finally:
+            AutoValidationService._instance = None
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["queue_depth"] == 0
+        assert data["completed"] == 0
+        assert data["avg_latency_ms"] is None
@@ -53,6 +53,32 @@ class TestSingleton:
         ReconciliationService._instance = None
 
 
+def game_totals(**overrides: int) -> dict[str, int]:
+    """Build a per-game totals row as returned by the reconcile query."""
+    row = {
+        "game_id": 2024020001,
+        "pbp_goals": 5,
+        "pbp_penalties": 3,
+        "pbp_shots": 25,
+        "boxscore_goals": 5,
+        "team_pim": 8,
+        "team_shots": 30,
+        "player_goals": 5,
+    }
+    row.update(overrides)
+    return row
+
+
+def toi_row(shift_toi: int, boxscore_toi: int) -> dict[str, int]:
+    """Build a per-player TOI row as returned by the reconcile query."""
+    return {
+        "game_id": 2024020001,
+        "player_id": 8471214,
+        "shift_toi": shift_toi,
+        "boxscore_toi": boxscore_toi,
+    }
+
+
 # =============================================================================
 # Goal Reconciliation Tests
 # =============================================================================
@@ -61,42 +87,20 @@ class TestSingleton:
 class TestGoalReconciliation:
     """Test goal count reconciliation logic."""
 
-    @pytest.mark.asyncio
-    async def test_goals_match_all_sources(
-        self, service: ReconciliationService, mock_db: MagicMock
-    ) -> None:
+    def test_goals_match_all_sources(self, service: ReconciliationService) -> None:
         """All three sources agree on goal count."""
-        # PBP goals, boxscore goals, player goals all = 5
-        mock_db.fetchval = AsyncMock(return_value=5)
-
-        checks = await service._check_game_goals(mock_db, 2024020001, 20242025)
+        checks = service._goal_checks(game_totals())
 
         assert len(checks) == 2
         assert all(c.passed for c in checks)
         assert checks[0].rule_name == "goal_count_pbp_vs_boxscore"
         assert checks[1].rule_name == "goal_count_boxscore_vs_players"
 
-    @pytest.mark.asyncio
-    async def test_goals_pbp_boxscore_mismatch(
-        self, service: ReconciliationService, mock_db: MagicMock
-    ) -> None:
+    def test_goals_pbp_boxscore_mismatch(self, service: ReconciliationService) -> None:
         """PBP and boxscore disagree on goal count."""
-        # Return different values for each query
-        call_count = 0
-
-        async def side_effect(*args: Any) -> int:
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:  # PBP goals
-                return 5
-            elif call_count == 2:  # Boxscore goals
-                return 6
-            else:  # Player goals
-                return 6
-
-        mock_db.fetchval = AsyncMock(side_effect=side_effect)
-
-        checks = await service._check_game_goals(mock_db, 2024020001, 20242025)
+        checks = service._goal_checks(
+            game_totals(pbp_goals=5, boxscore_goals=6, player_goals=6)
+        )
 
         assert len(checks) == 2
         # First check (PBP vs Boxscore) should fail
@@ -105,26 +109,12 @@ class TestGoalReconciliation:
         assert checks[0].source_a_value == 5
         assert checks[0].source_b_value == 6
 
-    @pytest.mark.asyncio
-    async def test_goals_boxscore_player_mismatch(
-        self, service: ReconciliationService, mock_db: MagicMock
+    def test_goals_boxscore_player_mismatch(
+        self, service: ReconciliationService
     ) -> None:
         """Boxscore and player stats sum disagree."""
-        call_count = 0
-
-        async def side_effect(*args: Any) -> int:
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:  # PBP goals
-                return 5
-            elif call_count == 2:  # Boxscore goals
-                return 5
-            else:  # Player goals
-                return 4  # Missing a goal in player stats
-
-        mock_db.fetchval = AsyncMock(side_effect=side_effect)
-
-        checks = await service._check_game_goals(mock_db, 2024020001, 20242025)
+        # Missing a goal in player stats
+        checks = service._goal_checks(game_totals(player_goals=4))
 
         assert len(checks) == 2
         # First check passes, second fails
@@ -141,80 +131,27 @@ class TestGoalReconciliation:
 class TestTOIReconciliation:
     """Test time-on-ice reconciliation logic."""
 
-    @pytest.mark.asyncio
-    async def test_toi_matches_within_tolerance(
-        self, service: ReconciliationService, mock_db: MagicMock
-    ) -> None:
+    def test_toi_matches_within_tolerance(self, service: ReconciliationService) -> None:
         """TOI matches within 5 second tolerance."""
-        # One player with TOI data
-        mock_db.fetch = AsyncMock(return_value=[{"player_id": 8471214}])
-
-        call_count = 0
-
-        async def fetchval_side_effect(*args: Any) -> int:
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:  # Shift TOI
-                return 1200  # 20 minutes
-            else:  # Boxscore TOI
-                return 1203  # 20:03 - within tolerance
-
-        mock_db.fetchval = AsyncMock(side_effect=fetchval_side_effect)
+        # 20:00 from shifts, 20:03 in the boxscore
+        check = service._toi_check(toi_row(1200, 1203))
 
-        checks = await service._check_game_toi(mock_db, 2024020001, 20242025)
+        assert check.passed
+        assert check.rule_name == "toi_shifts_vs_boxscore"
+        assert check.entity_id == "2024020001"
 
-        assert len(checks) == 1
-        assert checks[0].passed
-        assert checks[0].rule_name == "toi_shifts_vs_boxscore"
-
-    @pytest.mark.asyncio
-    async def test_toi_exceeds_tolerance(
-        self, service: ReconciliationService, mock_db: MagicMock
-    ) -> None:
+    def test_toi_exceeds_tolerance(self, service: ReconciliationService) -> None:
         """TOI difference exceeds 5 second tolerance."""
-        mock_db.fetch = AsyncMock(return_value=[{"player_id": 8471214}])
-
-        call_count = 0
-
-        async def fetchval_side_effect(*args: Any) -> int:
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:  # Shift TOI
-                return 1200  # 20 minutes
-            else:  # Boxscore TOI
-                return 1210  # 10 seconds difference > 5 second tolerance
+        check = service._toi_check(toi_row(1200, 1210))
 
-        mock_db.fetchval = AsyncMock(side_effect=fetchval_side_effect)
+        assert not check.passed
+        assert check.difference == 10
 
-        checks = await service._check_game_toi(mock_db, 2024020001, 20242025)
-
-        assert len(checks) == 1
-        assert not checks[0].passed
-        assert checks[0].difference == 10
-
-    @pytest.mark.asyncio
-    async def test_toi_exact_tolerance_boundary(
-        self, service: ReconciliationService, mock_db: MagicMock
-    ) -> None:
+    def test_toi_exact_tolerance_boundary(self, service: ReconciliationService) -> None:
         """TOI at exactly 5 second tolerance should pass."""
-        mock_db.fetch = AsyncMock(return_value=[{"player_id": 8471214}])
+        check = service._toi_check(toi_row(1200, 1200 + TOI_TOLERANCE_SECONDS))
 
-        call_count = 0
-
-        async def fetchval_side_effect(*args: Any) -> int:
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                return 1200
-            else:
-                return 1200 + TOI_TOLERANCE_SECONDS  # Exactly at tolerance
-
-        mock_db.fetchval = AsyncMock(side_effect=fetchval_side_effect)
-
-        checks = await service._check_game_toi(mock_db, 2024020001, 20242025)
-
-        assert len(checks) == 1
-        assert checks[0].passed  # Exactly at tolerance should pass
+        assert check.passed  # Exactly at tolerance should pass
 
     @pytest.mark.asyncio
     async def test_toi_no_players(
@@ -223,9 +160,9 @@ class TestTOIReconciliation:
         """No players with TOI data returns empty checks."""
         mock_db.fetch = AsyncMock(return_value=[])
 
-        checks = await service._check_game_toi(mock_db, 2024020001, 20242025)
+        checks = await service.reconcile(mock_db, 20242025, check_types=["toi"])
 
-        assert len(checks) == 0
+        assert checks == {"toi": []}
 
 
 # =============================================================================
@@ -236,84 +173,35 @@ class TestTOIReconciliation:
 class TestPenaltyReconciliation:
     """Test penalty reconciliation logic."""
 
-    @pytest.mark.asyncio
-    async def test_penalties_both_zero(
-        self, service: ReconciliationService, mock_db: MagicMock
-    ) -> None:
+    def test_penalties_both_zero(self, service: ReconciliationService) -> None:
         """No penalties in either source passes."""
-        mock_db.fetchval = AsyncMock(return_value=0)
+        check = service._penalty_check(game_totals(pbp_penalties=0, team_pim=0))
 
-        checks = await service._check_game_penalties(mock_db, 2024020001, 20242025)
+        assert check.passed
+        assert check.rule_name == "penalty_consistency"
 
-        assert len(checks) == 1
-        assert checks[0].passed
-        assert checks[0].rule_name == "penalty_consistency"
-
-    @pytest.mark.asyncio
-    async def test_penalties_both_nonzero(
-        self, service: ReconciliationService, mock_db: MagicMock
-    ) -> None:
+    def test_penalties_both_nonzero(self, service: ReconciliationService) -> None:
         """Both sources have penalties passes."""
-        call_count = 0
-
-        async def side_effect(*args: Any) -> int:
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:  # PBP penalty count
-                return 5
-            else:  # Team PIM
-                return 14  # 5 penalties with various durations
-
-        mock_db.fetchval = AsyncMock(side_effect=side_effect)
+        # 5 penalties with various durations
+        check = service._penalty_check(game_totals(pbp_penalties=5, team_pim=14))
 
-        checks = await service._check_game_penalties(mock_db, 2024020001, 20242025)
+        assert check.passed
 
-        assert len(checks) == 1
-        assert checks[0].passed
-
-    @pytest.mark.asyncio
-    async def test_penalties_inconsistent_pbp_zero(
-        self, service: ReconciliationService, mock_db: MagicMock
+    def test_penalties_inconsistent_pbp_zero(
+        self, service: ReconciliationService
     ) -> None:
         """PBP shows 0 penalties but team stats has PIM - fails."""
-        call_count = 0
-
-        async def side_effect(*args: Any) -> int:
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:  # PBP penalty count
-                return 0
-            else:  # Team PIM
-                return 4  # 2 minor penalties
-
-        mock_db.fetchval = AsyncMock(side_effect=side_effect)
+        check = service._penalty_check(game_totals(pbp_penalties=0, team_pim=4))
 
-        checks = await service._check_game_penalties(mock_db, 2024020001, 20242025)
+        assert not check.passed
 
-        assert len(checks) == 1
-        assert not checks[0].passed
-
-    @pytest.mark.asyncio
-    async def test_penalties_inconsistent_pim_zero(
-        self, service: ReconciliationService, mock_db: MagicMock
+    def test_penalties_inconsistent_pim_zero(
+        self, service: ReconciliationService
     ) -> None:
         """PBP shows penalties but team stats has 0 PIM - fails."""
-        call_count = 0
+        check = service._penalty_check(game_totals(pbp_penalties=3, team_pim=0))
 
-        async def side_effect(*args: Any) -> int:
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:  # PBP penalty count
-                return 3
-            else:  # Team PIM
-                return 0
-
-        mock_db.fetchval = AsyncMock(side_effect=side_effect)
-
-        checks = await service._check_game_penalties(mock_db, 2024020001, 20242025)
-
-        assert len(checks) == 1
-        assert not checks[0].passed
+        assert not check.passed
 
 
 # =============================================================================
@@ -324,56 +212,97 @@ class TestPenaltyReconciliation:
 class TestShotReconciliation:
     """Test shot count reconciliation logic."""
 
-    @pytest.mark.asyncio
-    async def test_shots_match(
-        self, service: ReconciliationService, mock_db: MagicMock
-    ) -> None:
+    def test_shots_match(self, service: ReconciliationService) -> None:
         """Shot counts match (shots + goals = total)."""
-        call_count = 0
+        check = service._shot_check(
+            game_totals(pbp_shots=25, pbp_goals=5, team_shots=30)
+        )
 
-        async def side_effect(*args: Any) -> int:
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:  # PBP shots on goal
-                return 25
-            elif call_count == 2:  # Team shots from boxscore
-                return 30
-            else:  # PBP goals
-                return 5  # 25 + 5 = 30
+        assert check.passed
+        assert check.source_a_value == 30  # shots + goals
+        assert check.source_b_value == 30
 
-        mock_db.fetchval = AsyncMock(side_effect=side_effect)
+    def test_shots_mismatch(self, service: ReconciliationService) -> None:
+        """Shot counts don't match."""
+        check = service._shot_check(
+            game_totals(pbp_shots=25, pbp_goals=5, team_shots=32)
+        )
 
-        checks = await service._check_game_shots(mock_db, 2024020001, 20242025)
+        assert not check.passed
+        assert check.difference == 2.0  # |30 - 32| = 2
 
-        assert len(checks) == 1
-        assert checks[0].passed
-        assert checks[0].source_a_value == 30  # shots + goals
-        assert checks[0].source_b_value == 30
+
+# =============================================================================
+# Set-Based Engine Tests
+# =============================================================================
+
+
+class TestReconcile:
+    """Test the set-based check engine."""
+
+    @pytest.fixture
+    def season_db(self, mock_db: MagicMock) -> MagicMock:
+        """Mock DB returning totals for two games and TOI for one player."""
+
+        async def fetch(query: str, *args: Any) -> list[dict[str, Any]]:
+            if "game_shifts" in query:
+                return [toi_row(1200, 1230)]
+            return [
+                game_totals(),
+                game_totals(game_id=2024020002, boxscore_goals=4),
+            ]
+
+        mock_db.fetch = AsyncMock(side_effect=fetch)
+        return mock_db
 
     @pytest.mark.asyncio
-    async def test_shots_mismatch(
-        self, service: ReconciliationService, mock_db: MagicMock
+    async def test_season_runs_two_grouped_queries(
+        self, service: ReconciliationService, season_db: MagicMock
     ) -> None:
-        """Shot counts don't match."""
-        call_count = 0
+        """Every check for the season comes from two queries."""
+        checks = await service.reconcile(season_db, 20242025)
+
+        assert season_db.fetch.await_count == 2
+        season_db.fetchval.assert_not_awaited()
+        assert [len(checks[t]) for t in ("goal", "toi", "penalty", "shot")] == [
+            4,
+            1,
+            2,
+            2,
+        ]
+        assert [c.entity_id for c in checks["goal"] if not c.passed] == [
+            "2024020002",
+            "2024020002",
+        ]
+        assert not checks["toi"][0].passed
+
+        query, *params = season_db.fetch.await_args_list[0].args
+        assert "game_state = 'OFF'" in query
+        assert params == [20242025]
 
-        async def side_effect(*args: Any) -> int:
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:  # PBP shots on goal
-                return 25
-            elif call_count == 2:  # Team shots from boxscore
-                return 32  # Different from PBP
-            else:  # PBP goals
-                return 5
+    @pytest.mark.asyncio
+    async def test_game_ids_restrict_target_games(
+        self, service: ReconciliationService, season_db: MagicMock
+    ) -> None:
+        """Explicit game IDs replace the completed-games filter."""
+        await service.reconcile(season_db, 20242025, game_ids=[2024020002])
 
-        mock_db.fetchval = AsyncMock(side_effect=side_effect)
+        for call in season_db.fetch.await_args_list:
+            query, *params = call.args
+            assert "game_id = ANY($2::bigint[])" in query
+            assert "game_state" not in query
+            assert params == [20242025, [2024020002]]
 
-        checks = await service._check_game_shots(mock_db, 2024020001, 20242025)
+    @pytest.mark.asyncio
+    async def test_check_types_skip_unneeded_queries(
+        self, service: ReconciliationService, season_db: MagicMock
+    ) -> None:
+        """Only the queries needed for the requested checks run."""
+        checks = await service.reconcile(season_db, 20242025, check_types=["shot"])
 
-        assert len(checks) == 1
-        assert not checks[0].passed
-        assert checks[0].difference == 2.0  # |30 - 32| = 2
+        assert list(checks) == ["shot"]
+        assert season_db.fetch.await_count == 1
+        assert "game_shifts" not in season_db.fetch.await_args.args[0]
 
 
 # =============================================================================
@@ -424,6 +353,47 @@ class TestDashboardSummary:
         assert result.summary.season_id == 20242025
         assert result.timestamp is not None
 
+    @pytest.mark.asyncio
+    async def test_dashboard_problem_games_single_lookup(
+        self, service: ReconciliationService, mock_db: MagicMock
+    ) -> None:
+        """Problem games are loaded with one query, not one per game."""
+
+        async def fetch_side_effect(query: str, *args: Any) -> list[dict[str, Any]]:
+            if "game_shifts" in query:
+                return []
+            if "FROM games g" in query:
+                return [
+                    {
+                        "game_id": game_id,
+                        "game_date": date(2024, 10, 8),
+                        "home_team": "BOS",
+                        "away_team": "FLA",
+                    }
+                    for game_id in args[0]
+                ]
+            return [
+                game_totals(),
+                game_totals(game_id=2024020002, pbp_goals=4, team_shots=31),
+                game_totals(game_id=2024020003, team_pim=0),
+            ]
+
+        mock_db.fetch = AsyncMock(side_effect=fetch_side_effect)
+        mock_db.fetchval = AsyncMock(return_value=3)
+
+        result = await service.get_dashboard_summary(mock_db, 20242025)
+
+        assert result.summary.total_checks == 12
+        assert result.summary.failed_checks == 3
+        assert result.summary.games_with_discrepancies == 2
+        assert result.summary.goal_reconciliation_rate == 5 / 6
+        assert [g.game_id for g in result.summary.problem_games] == [
+            2024020002,
+            2024020003,
+        ]
+        assert result.summary.problem_games[0].checks_failed == 2
+        assert mock_db.fetch.await_count == 3
+
 
 # =============================================================================
 # Game Reconciliation Detail Tests
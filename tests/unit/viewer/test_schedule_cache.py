@@ -0,0 +1,241 @@
+"""Tests for the shared season schedule cache."""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from nhl_api.downloaders.sources.nhl_json.schedule import GameInfo
+from nhl_api.viewer.services.schedule_cache import (
+    ScheduleCache,
+    is_season_finished,
+)
+
+MODULE = "nhl_api.viewer.services.schedule_cache"
+
+# Full-schedule sync recorded after both test seasons ended
+SYNCED_AT = datetime(2025, 7, 15, tzinfo=UTC)
+
+
+def _record(game_id: int, game_date: date, state: str = "OFF") -> dict[str, Any]:
+    return {
+        "game_id": game_id,
+        "season_id": 20242025,
+        "game_type": "R",
+        "game_date": game_date,
+        "home_team_id": 6,
+        "home_abbrev": "BOS",
+        "home_score": 3,
+        "away_team_id": 3,
+        "away_abbrev": "NYR",
+        "away_score": 2,
+        "period": 3,
+        "game_state": state,
+        "is_overtime": False,
+        "is_shootout": False,
+    }
+
+
+def _game(game_id: int, game_date: date, state: str = "OFF") -> GameInfo:
+    return GameInfo(
+        game_id=game_id,
+        season_id=20242025,
+        game_type=2,
+        game_date=game_date,
+        start_time_utc=None,
+        venue_name=None,
+        home_team_id=6,
+        home_team_abbrev="BOS",
+        home_score=4,
+        away_team_id=3,
+        away_team_abbrev="NYR",
+        away_score=1,
+        game_state=state,
+        period=3,
+        is_overtime=False,
+        is_shootout=False,
+    )
+
+
+def _mock_db(
+    records: list[dict[str, Any]], synced_at: datetime | None = SYNCED_AT
+) -> MagicMock:
+    db = MagicMock()
+    db.fetch = AsyncMock(return_value=records)
+    db.fetchval = AsyncMock(return_value=synced_at)
+    db.execute = AsyncMock()
+    return db
+
+
+def _mock_downloader(fetched: list[GameInfo]) -> MagicMock:
+    downloader = MagicMock()
+    downloader.__aenter__ = AsyncMock(return_value=downloader)
+    downloader.__aexit__ = AsyncMock(return_value=None)
+    downloader.get_season_schedule = AsyncMock(return_value=fetched)
+    downloader.persist = AsyncMock(return_value=len(fetched))
+    downloader.missing_weeks = []
+    return downloader
+
+
+class TestIsSeasonFinished:
+    """Tests for is_season_finished."""
+
+    def test_finished_after_playoffs(self) -> None:
+        """A season is finished once its last playoff date has passed."""
+        assert is_season_finished(20232024, date(2024, 7, 1))
+        assert not is_season_finished(20242025, date(2025, 6, 30))
+
+
+class TestScheduleCache:
+    """Tests for ScheduleCache."""
+
+    @pytest.mark.asyncio
+    async def test_finished_season_served_from_table(self) -> None:
+        """Stored finished seasons never hit the schedule API."""
+        db = _mock_db([_record(2023020001, date(2023, 10, 10))])
+        cache = ScheduleCache()
+
+        with patch(f"{MODULE}.ScheduleDownloader") as downloader_cls:
+            first = await cache.get_season_games(db, 20232024)
+            second = await cache.get_season_games(db, 20232024)
+
+        downloader_cls.assert_not_called()
+        db.fetch.assert_awaited_once()
+        assert first is second
+        assert first[0].game_id == 2023020001
+        assert first[0].game_type == 2
+        assert first[0].home_team_abbrev == "BOS"
+        assert first[0].start_time_utc is None
+
+    @pytest.mark.asyncio
+    async def test_live_season_refreshes_from_first_unfinished_game(self) -> None:
+        """Live seasons fetch only weeks that may have changed and merge them."""
+        db = _mock_db(
+            [
+                _record(2024020001, date(2024, 10, 8)),
+                _record(2024020002, date(2024, 10, 9), state="FUT"),
+            ]
+        )
+        fetched = [
+            _game(2024020002, date(2024, 10, 9)),
+            _game(2024020003, date(2024, 10, 10), state="FUT"),
+        ]
+        downloader = _mock_downloader(fetched)
+        cache = ScheduleCache()
+
+        with (
+            patch(f"{MODULE}.ScheduleDownloader", return_value=downloader),
+            patch(f"{MODULE}.is_season_finished", return_value=False),
+        ):
+            games = await cache.get_season_games(db, 20242025)
+            await cache.get_season_games(db, 20242025)
+
+        downloader.get_season_schedule.assert_awaited_once_with(
+            20242025, since=date(2024, 10, 9)
+        )
+        downloader.persist.assert_awaited_once_with(db, fetched)
+        assert [g.game_id for g in games] == [2024020001, 2024020002, 2024020003]
+        assert games[1].game_state == "OFF"
+
+    @pytest.mark.asyncio
+    async def test_finished_season_without_full_sync_is_fetched(self) -> None:
+        """Rows from a filtered sync are not trusted to hold every game type."""
+        db = _mock_db([_record(2023020001, date(2023, 10, 10))], synced_at=None)
+        playoff = _game(2023030111, date(2024, 4, 20))
+        downloader = _mock_downloader([playoff])
+        cache = ScheduleCache()
+
+        with patch(f"{MODULE}.ScheduleDownloader", return_value=downloader):
+            games = await cache.get_season_games(db, 20232024)
+            await cache.get_season_games(db, 20232024)
+
+        downloader.get_season_schedule.assert_awaited_once_with(20232024, since=None)
+        assert [g.game_id for g in games] == [2023020001, 2023030111]
+        sync_args = db.execute.await_args.args
+        assert "source_sync_timestamps" in sync_args[0]
+        # The marker counts every stored game, not just those fetched now
+        assert sync_args[1:] == (1, 20232024, 0, 2)
+
+    @pytest.mark.asyncio
+    async def test_finished_season_synced_while_live_is_refreshed(self) -> None:
+        """A full sync from before the season ended is refreshed once more."""
+        db = _mock_db(
+            [_record(2023020001, date(2023, 10, 10), state="FUT")],
+            synced_at=datetime(2023, 10, 1, tzinfo=UTC),
+        )
+        downloader = _mock_downloader([_game(2023020001, date(2023, 10, 10))])
+        cache = ScheduleCache()
+
+        with patch(f"{MODULE}.ScheduleDownloader", return_value=downloader):
+            games = await cache.get_season_games(db, 20232024)
+
+        downloader.get_season_schedule.assert_awaited_once_with(
+            20232024, since=date(2023, 10, 10)
+        )
+        assert games[0].game_state == "OFF"
+
+    @pytest.mark.asyncio
+    async def test_missing_weeks_are_not_trusted(self) -> None:
+        """A refresh with failed weeks is retried and not marked as full."""
+        db = _mock_db([], synced_at=None)
+        downloader = _mock_downloader([_game(2023020001, date(2023, 10, 10))])
+        downloader.missing_weeks = [date(2023, 11, 1)]
+        cache = ScheduleCache(live_ttl=0.0)
+
+        with patch(f"{MODULE}.ScheduleDownloader", return_value=downloader):
+            await cache.get_season_games(db, 20232024)
+            await cache.get_season_games(db, 20232024)
+
+        assert downloader.get_season_schedule.await_count == 2
+        db.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_live_season_expires_after_ttl(self) -> None:
+        """Live schedules are refreshed once the TTL has elapsed."""
+        db = _mock_db([], synced_at=None)
+        downloader = _mock_downloader([_game(2024020001, date(2024, 10, 8))])
+        cache = ScheduleCache(live_ttl=0.0)
+
+        with (
+            patch(f"{MODULE}.ScheduleDownloader", return_value=downloader),
+            patch(f"{MODULE}.is_season_finished", return_value=False),
+        ):
+            await cache.get_season_games(db, 20242025)
+            await cache.get_season_games(db, 20242025)
+
+        assert downloader.get_season_schedule.await_count == 2
+        # Without a full sync the whole season is fetched
+        assert downloader.get_season_schedule.await_args_list[0].kwargs == {
+            "since": None
+        }
+
+    @pytest.mark.asyncio
+    async def test_persist_failure_still_returns_games(self) -> None:
+        """A failed write-back does not fail game-ID discovery."""
+        db = _mock_db([])
+        downloader = _mock_downloader([_game(2024020001, date(2024, 10, 8))])
+        downloader.persist.side_effect = RuntimeError("db down")
+        cache = ScheduleCache()
+
+        with (
+            patch(f"{MODULE}.ScheduleDownloader", return_value=downloader),
+            patch(f"{MODULE}.is_season_finished", return_value=False),
+        ):
+            games = await cache.get_season_games(db, 20242025)
+
+        assert [g.game_id for g in games] == [2024020001]
+
+    @pytest.mark.asyncio
+    async def test_invalidate(self) -> None:
+        """Invalidated seasons are reloaded on the next lookup."""
+        db = _mock_db([_record(2023020001, date(2023, 10, 10))])
+        cache = ScheduleCache()
+
+        await cache.get_season_games(db, 20232024)
+        cache.invalidate(20232024)
+        await cache.get_season_games(db, 20232024)
+
+        assert db.fetch.await_count == 2